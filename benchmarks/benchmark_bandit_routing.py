@@ -0,0 +1,174 @@
+"""
+Offline Evaluation: Bandit vs Static Provider Selection
+=======================================================
+
+Replays a seeded stream of requests against fake providers with different
+latency, cost and quality profiles and compares cumulative regret (vs the
+best provider for each request in expectation) and total spend of:
+
+- static ``CostOptimizer`` strategies (CHEAPEST, FASTEST, BEST_VALUE,
+  BALANCED) fed the providers' advertised prices/latency and average quality
+- ``AdaptiveProviderSelector`` with Thompson sampling and LinUCB
+- uniform random routing
+
+Profiles (quality = P(answer accepted)):
+
+- ``budget``:   cheap, slow-ish; good on short prompts, poor on long ones
+- ``premium``:  expensive, slow; uniformly high quality
+- ``fast``:     mid price, fast; mediocre on long prompts
+- ``flaky``:    cheap and fast but fails 30% of the time
+
+Usage:
+    python benchmarks/benchmark_bandit_routing.py
+    python benchmarks/benchmark_bandit_routing.py --requests 20000 --seeds 0 1 2
+"""
+
+import argparse
+from dataclasses import dataclass
+
+import numpy as np
+
+from penin.router_pkg.bandit import (
+    AdaptiveProviderSelector,
+    BanditContext,
+    LinUCBPolicy,
+    RewardWeights,
+    ThompsonSamplingPolicy,
+)
+from penin.router_pkg.cost_optimizer import CostOptimizer, OptimizationStrategy
+
+
+@dataclass
+class FakeProvider:
+    name: str
+    cost_per_1k: float
+    latency_s: float
+    quality_short: float
+    quality_long: float
+    failure_rate: float = 0.0
+
+    def quality(self, ctx: BanditContext) -> float:
+        # Smooth transition around 2k prompt tokens
+        w = 1.0 / (1.0 + np.exp(-(np.log1p(ctx.prompt_tokens) - np.log(2000)) * 3))
+        return (1 - w) * self.quality_short + w * self.quality_long
+
+    def cost(self, ctx: BanditContext) -> float:
+        return self.cost_per_1k * (ctx.prompt_tokens + ctx.max_tokens) / 1000.0
+
+    def expected_reward(self, ctx: BanditContext, weights: RewardWeights) -> float:
+        ok = 1.0 - self.failure_rate
+        return ok * weights.reward(self.quality(ctx), self.cost(ctx), self.latency_s)
+
+    def call(self, ctx: BanditContext, rng) -> tuple[bool, float, float, float]:
+        """(success, quality, cost_usd, latency_s)"""
+        latency = self.latency_s * rng.lognormal(0.0, 0.25)
+        if rng.random() < self.failure_rate:
+            return False, 0.0, 0.0, latency
+        return True, float(rng.random() < self.quality(ctx)), self.cost(ctx), latency
+
+
+PROVIDERS = [
+    FakeProvider("budget", cost_per_1k=0.0004, latency_s=1.5, quality_short=0.9, quality_long=0.35),
+    FakeProvider("premium", cost_per_1k=0.015, latency_s=3.0, quality_short=0.97, quality_long=0.95),
+    FakeProvider("fast", cost_per_1k=0.003, latency_s=0.4, quality_short=0.85, quality_long=0.6),
+    FakeProvider("flaky", cost_per_1k=0.0005, latency_s=0.3, quality_short=0.8, quality_long=0.5, failure_rate=0.3),
+]
+
+
+def request_stream(n: int, rng) -> list[BanditContext]:
+    prompt = np.exp(rng.uniform(np.log(20), np.log(20_000), n)).astype(int)
+    max_tokens = rng.choice([128, 512, 1024, 2048], n)
+    hours = rng.uniform(0, 24, n)
+    return [
+        BanditContext(int(p), int(m), float(h), 1.0)
+        for p, m, h in zip(prompt, max_tokens, hours, strict=True)
+    ]
+
+
+def run_static(strategy, contexts, weights, rng):
+    optimizer = CostOptimizer(strategy=strategy)
+    names = [p.name for p in PROVIDERS]
+    costs = {p.name: p.cost_per_1k for p in PROVIDERS}
+    # Static strategies only see catalogue numbers: average quality, advertised latency
+    quality = {p.name: (p.quality_short + p.quality_long) / 2 for p in PROVIDERS}
+    latency = {p.name: p.latency_s * 1000 for p in PROVIDERS}
+    by_name = {p.name: p for p in PROVIDERS}
+    choose = lambda ctx: by_name[
+        optimizer.select_provider(names, costs, quality, latency, estimated_tokens=ctx.prompt_tokens + ctx.max_tokens)
+    ]
+    return evaluate(choose, None, contexts, weights, rng)
+
+
+def run_bandit(selector, contexts, weights, rng):
+    by_name = {p.name: p for p in PROVIDERS}
+    names = list(by_name)
+
+    def choose(ctx):
+        decision = selector.select(names, ctx)
+        return by_name[decision.provider], decision
+
+    return evaluate(choose, selector, contexts, weights, rng)
+
+
+def run_random(contexts, weights, rng):
+    return evaluate(lambda ctx: PROVIDERS[rng.integers(len(PROVIDERS))], None, contexts, weights, rng)
+
+
+def evaluate(choose, selector, contexts, weights, rng):
+    regret = spend = accepted = 0.0
+    curve = []
+    for i, ctx in enumerate(contexts):
+        picked = choose(ctx)
+        provider, decision = picked if isinstance(picked, tuple) else (picked, None)
+        best = max(p.expected_reward(ctx, weights) for p in PROVIDERS)
+        regret += best - provider.expected_reward(ctx, weights)
+        ok, quality, cost, latency = provider.call(ctx, rng)
+        spend += cost
+        accepted += quality
+        if selector is not None:
+            selector.update(decision, quality=quality, cost_usd=cost, latency_s=latency, success=ok)
+        if (i + 1) % max(1, len(contexts) // 4) == 0:
+            curve.append(regret)
+    return regret, spend, accepted / len(contexts), curve
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline bandit vs static routing evaluation")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--seeds", type=int, nargs="+", default=[0, 1, 2])
+    parser.add_argument("--alpha", type=float, default=0.5, help="LinUCB exploration")
+    args = parser.parse_args()
+    weights = RewardWeights()
+
+    runs = {
+        **{f"static:{s.value}": (lambda s: lambda c, r: run_static(s, c, weights, r))(s) for s in OptimizationStrategy},
+        "random": lambda c, r: run_random(c, weights, r),
+        "thompson": lambda c, r: run_bandit(
+            AdaptiveProviderSelector(ThompsonSamplingPolicy(), weights, seed=int(r.integers(1 << 30))), c, weights, r
+        ),
+        "linucb": lambda c, r: run_bandit(
+            AdaptiveProviderSelector(LinUCBPolicy(alpha=args.alpha), weights, seed=int(r.integers(1 << 30))), c, weights, r
+        ),
+    }
+
+    print(f"{args.requests} requests x {len(args.seeds)} seeds (mean)")
+    print(f"{'policy':<20} {'regret':>9} {'regret@25/50/75/100%':>28} {'spend $':>9} {'accepted':>9}")
+    print("-" * 80)
+    for name, run in runs.items():
+        results = []
+        for seed in args.seeds:
+            rng = np.random.default_rng(seed)
+            contexts = request_stream(args.requests, rng)
+            results.append(run(contexts, np.random.default_rng(seed + 1000)))
+        regret = np.mean([r[0] for r in results])
+        spend = np.mean([r[1] for r in results])
+        accepted = np.mean([r[2] for r in results])
+        curve = np.mean([r[3] for r in results], axis=0)
+        print(
+            f"{name:<20} {regret:>9.1f} {' / '.join(f'{c:.0f}' for c in curve):>28}"
+            f" {spend:>9.2f} {accepted:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
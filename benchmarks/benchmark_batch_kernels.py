@@ -0,0 +1,120 @@
+"""
+Benchmark Core Equation Batch Kernels
+=====================================
+
+Compares scalar loops against the NumPy ``*_batch`` kernels for CAOS⁺
+(exponential and φ), L∞ (harmonic / cost-penalized / meta with gates) and
+SR-Ω∞ (harmonic engine), reporting evaluations/sec at N = 1 .. 1e6.
+
+Scalar baselines call the undecorated functions (``__wrapped__``) so the
+memo cache does not turn random inputs into lookups. Scalar loops above
+``--scalar-max`` are skipped (shown as "-").
+
+Usage:
+    python benchmarks/benchmark_batch_kernels.py
+    python benchmarks/benchmark_batch_kernels.py --sizes 1 1000 1000000 --scalar-max 100000
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from penin.core.caos import (
+    compute_caos_plus_exponential,
+    compute_caos_plus_exponential_batch,
+    phi_caos,
+    phi_caos_batch,
+)
+from penin.math.linf import compute_linf_meta, compute_linf_meta_batch, linf_score, linf_score_batch
+from penin.omega.sr import SRComponents, SROmegaEngine
+
+KEYS = ("accuracy", "robustness", "privacy", "fairness")
+WEIGHTS = np.array([0.4, 0.3, 0.2, 0.1])
+WEIGHTS_DICT = dict(zip(KEYS, WEIGHTS.tolist(), strict=True))
+ENGINE = SROmegaEngine()
+
+
+def kernels(x: np.ndarray, cost: np.ndarray, gates: np.ndarray):
+    """(name, scalar loop, batch call) triples over the same inputs"""
+    caos_exp = compute_caos_plus_exponential
+    phi = phi_caos
+    rows = x.tolist()
+    costs = cost.tolist()
+    ok = gates.tolist()
+
+    return [
+        (
+            "caos_plus_exponential",
+            lambda: [caos_exp(*r) for r in rows],
+            lambda: compute_caos_plus_exponential_batch(*x.T),
+        ),
+        (
+            "phi_caos",
+            lambda: [phi(*r) for r in rows],
+            lambda: phi_caos_batch(*x.T),
+        ),
+        (
+            "linf_score",
+            lambda: [
+                linf_score(dict(zip(KEYS, r, strict=True)), WEIGHTS_DICT, c)
+                for r, c in zip(rows, costs, strict=True)
+            ],
+            lambda: linf_score_batch(x, WEIGHTS, cost),
+        ),
+        (
+            "compute_linf_meta",
+            lambda: [
+                compute_linf_meta(dict(zip(KEYS, r, strict=True)), WEIGHTS_DICT, c, ethics_ok=g)
+                for r, c, g in zip(rows, costs, ok, strict=True)
+            ],
+            lambda: compute_linf_meta_batch(x, WEIGHTS, cost, ethics_ok=gates),
+        ),
+        (
+            "sr_harmonic",
+            lambda: [ENGINE.compute_sr(SRComponents(*r))[0] for r in rows],
+            lambda: ENGINE.compute_sr_batch(x),
+        ),
+    ]
+
+
+def ops_per_sec(fn, n: int, min_time: float) -> float:
+    runs, start = 0, time.perf_counter()
+    while True:
+        fn()
+        runs += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return runs * n / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark scalar vs batch equation kernels")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 10, 100, 1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--scalar-max", type=int, default=100_000)
+    parser.add_argument("--min-time", type=float, default=0.2, help="seconds per measurement")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import logging
+
+    logging.getLogger("penin.math.linf").setLevel(logging.ERROR)
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'kernel':<24} {'N':>9} {'scalar ops/s':>14} {'batch ops/s':>14} {'speedup':>9}")
+    print("-" * 74)
+    for n in args.sizes:
+        x = rng.random((n, 4))
+        cost = rng.random(n)
+        gates = rng.random(n) > 0.1
+        for name, scalar, batch in kernels(x, cost, gates):
+            b = ops_per_sec(batch, n, args.min_time)
+            if n <= args.scalar_max:
+                s = ops_per_sec(scalar, n, args.min_time)
+                print(f"{name:<24} {n:>9} {s:>14,.0f} {b:>14,.0f} {b / s:>8.1f}x")
+            else:
+                print(f"{name:<24} {n:>9} {'-':>14} {b:>14,.0f} {'-':>9}")
+
+
+if __name__ == "__main__":
+    main()
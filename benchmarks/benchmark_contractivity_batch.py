@@ -0,0 +1,153 @@
+"""
+Benchmark Contractivity and Life/Death Gate Batches
+===================================================
+
+Per-candidate evaluation vs the array-native kernels in
+``penin.math.ir_ic_contractivity`` and ``penin.math.vida_morte_gates``:
+
+- refinement: iterative L_ψ refinement to convergence (ρ ∈ [0.6, 0.95],
+  up to 10 iterations) of (candidates × 9) risk matrices
+- contractivity: one L_ψ step + H(L_ψ(k)) ≤ ρ·H(k) check
+- death: ΔL∞ ≥ β_min over the challenger population
+- life-trajectory: Lyapunov life gate over ``--steps`` steps per candidate
+  (dV/dt by differencing)
+
+Columns: ``loop`` is a pure-Python per-candidate loop (the pre-batch
+implementation, reproduced here), ``scalar api`` calls the public scalar
+functions (now one-row wrappers over the batch kernels) per candidate,
+``batch`` runs once over all candidates.
+
+Usage:
+    python benchmarks/benchmark_contractivity_batch.py
+    python benchmarks/benchmark_contractivity_batch.py --candidates 1000 10000 100000
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from penin.math.ir_ic_contractivity import (
+    RISK_DIMS,
+    RiskProfile,
+    apply_Lpsi_operator,
+    check_contractivity,
+    compute_risk_entropy,
+    contractivity_batch,
+    iterative_refinement,
+    iterative_refinement_batch,
+)
+from penin.math.vida_morte_gates import (
+    death_gate,
+    death_gate_batch,
+    life_gate_lyapunov,
+    life_gate_trajectory,
+)
+
+
+def loop_entropy(values: list[float], epsilon: float = 1e-9) -> float:
+    risks = values[:-1] + [1.0 - values[-1]]
+    total = sum(risks) + epsilon
+    return -sum(p * math.log2(max(epsilon, p)) for p in (r / total for r in risks) if p > epsilon)
+
+
+def loop_refinement(values: list[float], rho: float, max_iterations: int = 10, threshold: float = 1e-3):
+    H_prev = loop_entropy(values)
+    for iteration in range(max_iterations):
+        values = [v * rho for v in values[:-1]] + [min(1.0, values[-1] / rho)]
+        H = loop_entropy(values)
+        if abs(H - H_prev) < threshold:
+            return values, iteration + 1, True
+        H_prev = H
+    return values, max_iterations, False
+
+
+def loop_contractivity(values: list[float], rho: float) -> bool:
+    refined = [v * rho for v in values[:-1]] + [min(1.0, values[-1] / rho)]
+    return loop_entropy(refined) <= rho * loop_entropy(values) + 1e-6
+
+
+def loop_life(V: list[float]) -> bool:
+    return all(
+        b < a + 1e-6 and (b - a) / 1.0 <= 1e-6 for a, b in zip(V, V[1:], strict=False)
+    )
+
+
+def timed(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark batched contractivity and gates")
+    parser.add_argument("--candidates", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--steps", type=int, default=50, help="Trajectory length for the life gate")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{'kernel':<16} {'cands':>7} {'loop ms':>9} {'scalar api ms':>14} {'batch ms':>9} {'vs loop':>8}")
+    print("-" * 68)
+    for n in args.candidates:
+        rng = np.random.default_rng(0)
+        risks = rng.uniform(0.0, 0.6, size=(n, len(RISK_DIMS)))
+        risks[:, -1] = rng.uniform(0.3, 1.0, n)
+        rho = rng.uniform(0.6, 0.95, n)
+        rows = risks.tolist()
+        profiles = [RiskProfile(*row, aggregate=0.0) for row in rows]
+        delta = rng.normal(0.01, 0.01, n)
+        V = np.cumsum(-rng.random((n, args.steps)) * 0.01, axis=1) + 1.0
+        V[::5, args.steps // 2] += 0.05
+        V_rows = V.tolist()
+
+        def scalar_contractivity():
+            for p, r in zip(profiles, rho.tolist(), strict=True):
+                check_contractivity(compute_risk_entropy(apply_Lpsi_operator(p, r)), compute_risk_entropy(p), r)
+
+        cases = [
+            (
+                "refinement",
+                lambda: [loop_refinement(row, r) for row, r in zip(rows, rho.tolist(), strict=True)],
+                lambda: [iterative_refinement(p, r) for p, r in zip(profiles, rho.tolist(), strict=True)],
+                lambda: iterative_refinement_batch(risks, rho),
+            ),
+            (
+                "contractivity",
+                lambda: [loop_contractivity(row, r) for row, r in zip(rows, rho.tolist(), strict=True)],
+                scalar_contractivity,
+                lambda: contractivity_batch(risks, rho),
+            ),
+            (
+                "death",
+                lambda: [d >= 0.01 for d in delta.tolist()],
+                lambda: [death_gate(d, 0.01) for d in delta.tolist()],
+                lambda: death_gate_batch(delta, 0.01),
+            ),
+            (
+                "life-trajectory",
+                lambda: [loop_life(row) for row in V_rows],
+                lambda: [
+                    all(life_gate_lyapunov(b, a).passed for a, b in zip(row, row[1:], strict=False))
+                    for row in V_rows[: max(1, n // 10)]
+                ],
+                lambda: life_gate_trajectory(V),
+            ),
+        ]
+        for label, loop, scalar, batch in cases:
+            loop_s = timed(loop, args.repeat)
+            scalar_s = timed(scalar, 1)
+            if label == "life-trajectory":
+                scalar_s *= n / max(1, n // 10)  # extrapolated from a 10% sample
+            batch_s = timed(batch, args.repeat)
+            print(
+                f"{label:<16} {n:>7} {loop_s * 1e3:>9.2f} {scalar_s * 1e3:>14.2f} "
+                f"{batch_s * 1e3:>9.2f} {loop_s / batch_s:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Benchmark ΣEA/LO-14 Ethics Validation Throughput
+================================================
+
+Measures decisions/sec for the compiled Origin Law rule engine:
+
+- single: EthicsValidator.validate_all on prebuilt DecisionContext objects
+- single+model: building the DecisionContext per decision as well
+- trusted: EthicsValidator.validate_trusted on plain dicts (no Pydantic)
+- batch: EthicsValidator.validate_batch on columnar arrays
+
+Usage:
+    python benchmarks/benchmark_ethics.py
+    python benchmarks/benchmark_ethics.py --n 100000 --fail-fast
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from penin.ethics.laws import DecisionContext, EthicsValidator
+
+
+def make_columns(n: int, seed: int = 0) -> dict[str, np.ndarray]:
+    """Random decision contexts, roughly 30% of them violating some law."""
+    rng = np.random.default_rng(seed)
+    return {
+        "privacy_score": rng.uniform(0.9, 1.0, n),
+        "fairness_score": rng.uniform(0.9, 1.0, n),
+        "transparency_score": rng.uniform(0.8, 1.0, n),
+        "physical_risk": rng.uniform(0.0, 0.012, n),
+        "emotional_risk": rng.uniform(0.0, 0.1, n),
+        "consent_obtained": rng.random(n) > 0.05,
+        "claims_consciousness": rng.random(n) > 0.99,
+    }
+
+
+def rate(n: int, fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ethics validation")
+    parser.add_argument("--n", type=int, default=20000, help="Decisions per mode")
+    parser.add_argument(
+        "--fail-fast", action="store_true", help="Stop at first CRITICAL"
+    )
+    args = parser.parse_args()
+
+    n = args.n
+    columns = make_columns(n)
+    rows = [
+        {name: column[i].item() for name, column in columns.items()} for i in range(n)
+    ]
+    contexts = [
+        DecisionContext(decision_id=str(i), decision_type="bench", **row)
+        for i, row in enumerate(rows)
+    ]
+
+    results = {
+        "single": rate(
+            n,
+            lambda: [
+                EthicsValidator.validate_all(c, fail_fast=args.fail_fast)
+                for c in contexts
+            ],
+        ),
+        "single+model": rate(
+            n,
+            lambda: [
+                EthicsValidator.validate_all(
+                    DecisionContext(decision_id=str(i), decision_type="bench", **row),
+                    fail_fast=args.fail_fast,
+                )
+                for i, row in enumerate(rows)
+            ],
+        ),
+        "trusted": rate(
+            n,
+            lambda: [
+                EthicsValidator.validate_trusted(row, fail_fast=args.fail_fast)
+                for row in rows
+            ],
+        ),
+        "batch": rate(
+            n,
+            lambda: EthicsValidator.validate_batch(columns, fail_fast=args.fail_fast),
+        ),
+    }
+
+    print(f"\nΣEA/LO-14 validation, {n} decisions (fail_fast={args.fail_fast})")
+    print("-" * 48)
+    for mode, decisions_per_sec in results.items():
+        print(f"{mode:<14} {decisions_per_sec:>14,.0f} decisions/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Benchmark PENIN-Ω Cold Start
+============================
+
+Reports, per module, the median cumulative import time from
+``python -X importtime`` and the wall time of ``penin --help`` next to a bare
+``python -c pass`` (interpreter + site startup, which penin does not control).
+
+Usage:
+    python benchmarks/benchmark_import_time.py
+    python benchmarks/benchmark_import_time.py --runs 20
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+
+MODULES = [
+    "penin",
+    "penin.core",
+    "penin.omega",
+    "penin.equations",
+    "penin.cli",
+    "penin.core.caos",
+    "penin.router",
+]
+
+HELP = "import sys; sys.argv = ['penin', '--help']; from penin.cli import main; main()"
+
+
+def import_us(module: str) -> int:
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, cumulative, name = line.split("|")
+            if name.strip() == module:
+                return int(cumulative)
+    raise RuntimeError(f"{module} missing from importtime output")
+
+
+def wall_ms(code: str) -> float:
+    start = time.perf_counter()
+    subprocess.run(
+        [sys.executable, "-c", code], stdout=subprocess.DEVNULL, check=True
+    )
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark penin import time")
+    parser.add_argument("--runs", type=int, default=7)
+    args = parser.parse_args()
+
+    print(f"{'module':<18} {'import ms (median)':>20}")
+    print("-" * 40)
+    for module in MODULES:
+        samples = [import_us(module) for _ in range(args.runs)]
+        print(f"{module:<18} {statistics.median(samples) / 1000:>20.1f}")
+
+    bare = statistics.median(wall_ms("pass") for _ in range(args.runs))
+    cli = statistics.median(wall_ms(HELP) for _ in range(args.runs))
+    print(f"\npython -c pass     {bare:>8.1f} ms")
+    print(f"penin --help       {cli:>8.1f} ms  (+{cli - bare:.1f} ms over bare)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Benchmark WORM Ledger Chain Verification
+========================================
+
+Builds a SQLiteWORMLedger ``events`` table with N chained rows and measures
+rows/sec and peak Python memory for:
+
+- fetchall: the previous verifier (fetchall + sequential re-hash)
+- stream: chunked streaming, re-hash inline (workers=1)
+- threads: chunked streaming, re-hash on a thread pool
+- processes: chunked streaming, re-hash on a process pool
+
+Usage:
+    python benchmarks/benchmark_ledger_verify.py
+    python benchmarks/benchmark_ledger_verify.py --rows 2000000 --workers 8
+"""
+
+import argparse
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from penin.ledger.hash_utils import hash_json
+from penin.omega.ledger import SQLiteWORMLedger
+
+
+def build_ledger(path: str, n: int) -> None:
+    conn = sqlite3.connect(path)
+    SQLiteWORMLedger(path).close()
+    prev, batch = "genesis", []
+    for i in range(n):
+        data = {"cycle": i, "delta_linf": i * 1e-4, "promoted": i % 3 == 0}
+        ts = 1.7e9 + i
+        h = hash_json({"etype": "promote", "data": data, "ts": ts, "prev": prev})
+        batch.append(("promote", json.dumps(data, ensure_ascii=False), ts, prev, h))
+        prev = h
+        if len(batch) == 50_000:
+            conn.executemany("INSERT INTO events (etype, data, ts, prev, hash) VALUES (?, ?, ?, ?, ?)", batch)
+            batch.clear()
+    conn.executemany("INSERT INTO events (etype, data, ts, prev, hash) VALUES (?, ?, ?, ?, ?)", batch)
+    conn.commit()
+    conn.close()
+
+
+def verify_fetchall(ledger: SQLiteWORMLedger) -> tuple[bool, str | None]:
+    c = ledger._conn.cursor()
+    c.execute("SELECT etype, data, ts, prev, hash FROM events ORDER BY id")
+    prev = "genesis"
+    for i, (etype, data, ts, stored_prev, stored_hash) in enumerate(c.fetchall(), 1):
+        if stored_prev != prev:
+            return False, f"Chain break at row {i}"
+        payload = {"etype": etype, "data": json.loads(data), "ts": ts, "prev": stored_prev}
+        if hash_json(payload) != stored_hash:
+            return False, f"Hash mismatch at row {i}"
+        prev = stored_hash
+    return True, None
+
+
+def measure(fn, memory: bool) -> tuple[float, float]:
+    if memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    ok, error = fn()
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1] / 2**20 if memory else float("nan")
+    if memory:
+        tracemalloc.stop()
+    assert ok, error
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ledger chain verification")
+    parser.add_argument("--rows", type=int, default=200_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument(
+        "--memory", action="store_true", help="Track peak memory (slower)"
+    )
+    args = parser.parse_args()
+
+    path = str(Path(tempfile.mkdtemp(prefix="penin_ledger_")) / "events.db")
+    print(f"Building ledger with {args.rows} rows...")
+    build_ledger(path, args.rows)
+    ledger = SQLiteWORMLedger(path)
+
+    modes = {
+        "fetchall": lambda: verify_fetchall(ledger),
+        "stream": lambda: ledger.verify_chain(workers=1, chunk_size=args.chunk_size),
+        "threads": lambda: ledger.verify_chain(
+            workers=args.workers, chunk_size=args.chunk_size, use_processes=False
+        ),
+        "processes": lambda: ledger.verify_chain(
+            workers=args.workers, chunk_size=args.chunk_size
+        ),
+    }
+
+    print(f"\nworkers={args.workers} chunk_size={args.chunk_size}")
+    print(f"{'mode':<10} {'rows/s':>12} {'seconds':>9} {'peak MiB':>9}")
+    print("-" * 43)
+    for name, fn in modes.items():
+        elapsed, peak = measure(fn, args.memory)
+        peak_s = f"{peak:.1f}" if args.memory else "-"
+        print(f"{name:<10} {args.rows / elapsed:>12,.0f} {elapsed:>9.2f} {peak_s:>9}")
+    ledger.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,8 @@ Usage:
     python benchmarks/benchmark_master_equation.py
     python benchmarks/benchmark_master_equation.py --profile
     python benchmarks/benchmark_master_equation.py --memory
+    python benchmarks/benchmark_master_equation.py --gradients --dims 10 100 1000 10000
+    python benchmarks/benchmark_master_equation.py --ensemble --ks 1 10 100 1000 10000
 """
 
 import argparse
@@ -17,13 +19,18 @@ import io
 import json
 import pstats
 import time
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 
 from penin.math.penin_master_equation import (
+    MasterEquationEnsemble,
     MasterEquationState,
+    estimate_gradient,
+    estimate_gradient_fast,
+    estimate_gradient_spsa,
     master_equation_cycle,
 )
 
@@ -42,6 +49,39 @@ def create_test_loss_fn():
     return loss_fn
 
 
+def create_vectorized_loss_fn():
+    """Same loss as create_test_loss_fn, evaluated on an (m, d) batch of states."""
+
+    LOSS_SQRT_COEFF = 0.01
+
+    def loss_fn(states: np.ndarray, evidence: Any, policies: dict) -> np.ndarray:
+        dot_product = np.einsum("ij,ij->i", states, states)
+        return dot_product + LOSS_SQRT_COEFF * np.sqrt(dot_product)
+
+    return loss_fn
+
+
+def gradient_estimators(batch_size: int = 256, workers: int = 4, spsa_samples: int = 8) -> list:
+    """(name, estimator, vectorized loss?) for benchmark_gradient_estimators."""
+    return [
+        ("fd_forward_loop", estimate_gradient_fast, False),
+        ("fd_central_loop", partial(estimate_gradient, method="central"), False),
+        ("fd_forward_batched", partial(estimate_gradient_fast, batch_size=batch_size), True),
+        (
+            "fd_central_batched",
+            partial(estimate_gradient, method="central", batch_size=batch_size),
+            True,
+        ),
+        ("fd_forward_threads", partial(estimate_gradient, n_workers=workers), False),
+        ("spsa", partial(estimate_gradient_spsa, n_samples=spsa_samples, rng=0), False),
+        (
+            "spsa_batched",
+            partial(estimate_gradient_spsa, n_samples=spsa_samples, rng=0, batch_size=2 * spsa_samples),
+            True,
+        ),
+    ]
+
+
 class BenchmarkSuite:
     """Suite of benchmarks for Master Equation cycle."""
 
@@ -251,6 +291,92 @@ class BenchmarkSuite:
 
         return {"timestamp": time.time(), "results": results}
 
+    def benchmark_gradient_estimators(self, dims: list[int], min_time: float = 0.5) -> list[dict]:
+        """Time each gradient estimator G(I) for state sizes in ``dims``."""
+        print("\n📐 Gradient Estimators")
+        print("=" * 60)
+        print(f"{'estimator':<22} {'d':>7} {'mean ms':>10} {'loss rows/s':>14}")
+
+        scalar_loss = create_test_loss_fn()
+        batch_loss = create_vectorized_loss_fn()
+        results = []
+        for d in dims:
+            state = np.random.randn(d) * 0.5
+            for name, estimator, vectorized in gradient_estimators():
+                loss_fn = batch_loss if vectorized else scalar_loss
+                rows = {"fd_central_loop": 2 * d, "fd_central_batched": 2 * d}.get(name, d + 1)
+                if name.startswith("spsa"):
+                    rows = 16
+
+                times = []
+                while sum(times) < min_time or len(times) < 3:
+                    start = time.perf_counter()
+                    estimator(state, None, {}, loss_fn)
+                    times.append(time.perf_counter() - start)
+
+                mean = float(np.mean(times))
+                results.append(
+                    {
+                        "name": name,
+                        "dimensions": d,
+                        "iterations": len(times),
+                        "mean_time_ms": mean * 1000,
+                        "loss_rows_per_s": rows / mean,
+                    }
+                )
+                print(f"{name:<22} {d:>7} {mean * 1000:>10.3f} {rows / mean:>14,.0f}")
+
+        return results
+
+    def benchmark_ensemble(
+        self, ks: list[int], dims: int = 10, steps: int = 10, loop_max: int = 1000
+    ) -> list[dict]:
+        """K trajectories: Python loop of master_equation_cycle vs MasterEquationEnsemble."""
+        print(f"\n🧬 Ensemble Runner (d={dims}, steps={steps})")
+        print("=" * 60)
+        print(f"{'K':>7} {'loop traj-steps/s':>18} {'ensemble traj-steps/s':>22} {'speedup':>9}")
+
+        scalar_loss = create_test_loss_fn()
+        batch_loss = create_vectorized_loss_fn()
+        H_constraints = {"bounds": (-1.0, 1.0)}
+        results = []
+        for k in ks:
+            I0 = np.random.randn(k, dims) * 0.5
+            alpha_0 = np.linspace(0.01, 0.2, k)
+
+            start = time.perf_counter()
+            ensemble = MasterEquationEnsemble(
+                I0, None, {}, batch_loss, alpha_0=alpha_0, caos_plus=1.5, sr_score=0.85,
+                H_constraints=H_constraints,
+            )
+            for _ in ensemble.run(steps):
+                pass
+            ensemble_rate = k * steps / (time.perf_counter() - start)
+
+            loop_rate = None
+            if k <= loop_max:
+                start = time.perf_counter()
+                for j in range(k):
+                    state = MasterEquationState(
+                        I=I0[j].copy(), n=0, alpha_n=0.0, caos_plus=1.5, sr_score=0.85, Linf=0.0
+                    )
+                    for _ in range(steps):
+                        state = master_equation_cycle(
+                            state, None, {}, scalar_loss, alpha_0=alpha_0[j], caos_plus=1.5,
+                            sr_score=0.85, H_constraints=H_constraints,
+                        )
+                loop_rate = k * steps / (time.perf_counter() - start)
+
+            results.append(
+                {"K": k, "dimensions": dims, "steps": steps, "loop_rate": loop_rate, "ensemble_rate": ensemble_rate}
+            )
+            if loop_rate is None:
+                print(f"{k:>7} {'-':>18} {ensemble_rate:>22,.0f} {'-':>9}")
+            else:
+                print(f"{k:>7} {loop_rate:>18,.0f} {ensemble_rate:>22,.0f} {ensemble_rate / loop_rate:>8.1f}x")
+
+        return results
+
     def profile_master_equation(self, state_size: int = 100, n_iterations: int = 50) -> str:
         """Profile the master equation cycle with cProfile."""
         print(f"\n🔍 Profiling Master Equation (state_size={state_size}, iterations={n_iterations})")
@@ -367,6 +493,15 @@ def main():
     parser.add_argument("--memory", action="store_true", help="Run memory profiling")
     parser.add_argument("--save", action="store_true", help="Save results to JSON")
     parser.add_argument("--baseline", action="store_true", help="Save as baseline for comparison")
+    parser.add_argument("--gradients", action="store_true", help="Benchmark gradient estimators")
+    parser.add_argument(
+        "--dims", type=int, nargs="+", default=[10, 100, 1000, 10000], help="State sizes for --gradients"
+    )
+
+    parser.add_argument("--ensemble", action="store_true", help="Benchmark the multi-trajectory runner")
+    parser.add_argument(
+        "--ks", type=int, nargs="+", default=[1, 10, 100, 1000, 10000], help="Trajectory counts for --ensemble"
+    )
 
     args = parser.parse_args()
 
@@ -375,6 +510,12 @@ def main():
     # Run standard benchmarks
     results = suite.run_all_benchmarks()
 
+    if args.gradients:
+        results["gradients"] = suite.benchmark_gradient_estimators(args.dims)
+
+    if args.ensemble:
+        results["ensemble"] = suite.benchmark_ensemble(args.ks)
+
     # Run profiling if requested
     if args.profile:
         profile_output = suite.profile_master_equation(state_size=100, n_iterations=50)
@@ -0,0 +1,110 @@
+"""
+Benchmark P2P Transport
+=======================
+
+Throughput and round-trip latency of PENIN P2P request/response over the
+framed transports (``penin.p2p.transport``), with N simulated nodes in one
+process and event loop:
+
+- tcp: ``StreamTransport`` over loopback sockets
+- memory: ``MemoryTransport`` (same framing and codec, no sockets)
+
+Nodes form a ring; each node keeps ``--inflight`` heartbeat requests
+outstanding to its successor for ``--duration`` seconds. A round trip is two
+messages. Also compares the JSON and binary message codecs.
+
+Usage:
+    python benchmarks/benchmark_p2p_transport.py
+    python benchmarks/benchmark_p2p_transport.py --nodes 2 16 128 --inflight 4 --duration 2
+"""
+
+import argparse
+import asyncio
+import time
+
+import numpy as np
+
+from penin.p2p import MemoryNetwork, MemoryTransport, PeninNode, StreamTransport
+from penin.p2p.protocol import PeninMessage, PeninProtocol
+
+
+def bench_codec(number: int) -> None:
+    message = PeninProtocol("node-001").create_metrics_broadcast(0.8, 1.5, 0.9, 0.7, 0.01, 1.02)
+    as_json, as_bytes = message.to_json(), message.to_bytes()
+    print(f"{'codec':<8} {'bytes':>6} {'encode us':>10} {'decode us':>10}")
+    for label, encode, decode, size in (
+        ("json", message.to_json, lambda: PeninMessage.from_json(as_json), len(as_json)),
+        ("binary", message.to_bytes, lambda: PeninMessage.from_bytes(as_bytes), len(as_bytes)),
+    ):
+        start = time.perf_counter()
+        for _ in range(number):
+            encode()
+        enc = (time.perf_counter() - start) / number * 1e6
+        start = time.perf_counter()
+        for _ in range(number):
+            decode()
+        dec = (time.perf_counter() - start) / number * 1e6
+        print(f"{label:<8} {size:>6} {enc:>10.2f} {dec:>10.2f}")
+    print()
+
+
+async def build_ring(kind: str, n: int):
+    nodes = [PeninNode(f"node-{i:03d}") for i in range(n)]
+    if kind == "tcp":
+        transports = [await StreamTransport(node).start() for node in nodes]
+        for i, transport in enumerate(transports[: n if n > 2 else 1]):
+            await transport.connect("127.0.0.1", transports[(i + 1) % n].port)
+    else:
+        network = MemoryNetwork()
+        transports = [MemoryTransport(node, network) for node in nodes]
+        for i, transport in enumerate(transports[: n if n > 2 else 1]):
+            await transport.connect(nodes[(i + 1) % n].node_id)
+    return nodes, transports
+
+
+async def run_ring(kind: str, n: int, inflight: int, duration: float):
+    nodes, transports = await build_ring(kind, n)
+    latencies: list[float] = []
+    deadline = time.perf_counter() + duration
+
+    async def worker(node: PeninNode, peer_id: str):
+        transport = node.transport
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            await transport.request(peer_id, node.protocol.create_heartbeat())
+            latencies.append(time.perf_counter() - start)
+
+    workers = [
+        worker(node, nodes[(i + 1) % n].node_id)
+        for i, node in enumerate(nodes[: n if n > 2 else 1])
+        for _ in range(inflight)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(*workers)
+    elapsed = time.perf_counter() - start
+    for transport in transports:
+        await transport.close()
+    return elapsed, np.array(latencies)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark PENIN P2P framed transports")
+    parser.add_argument("--nodes", type=int, nargs="+", default=[2, 16, 128])
+    parser.add_argument("--inflight", type=int, default=4, help="Outstanding requests per node")
+    parser.add_argument("--duration", type=float, default=2.0, help="Seconds per run")
+    parser.add_argument("--codec-number", type=int, default=20000)
+    args = parser.parse_args()
+
+    bench_codec(args.codec_number)
+    print(f"{'nodes':>5} {'transport':>9} {'rtt/s':>9} {'msg/s':>9} {'p50 us':>9} {'p99 us':>9}")
+    print("-" * 56)
+    for n in args.nodes:
+        for kind in ("tcp", "memory"):
+            elapsed, lat = asyncio.run(run_ring(kind, n, args.inflight, args.duration))
+            p50, p99 = np.percentile(lat, [50, 99]) * 1e6
+            rate = len(lat) / elapsed
+            print(f"{n:>5} {kind:>9} {rate:>9.0f} {2 * rate:>9.0f} {p50:>9.0f} {p99:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark Provider HTTP Transport
+=================================
+
+Throughput and latency of ``OpenAIProvider.chat`` against the in-process
+mock server (``benchmarks/mock_llm_server.py``) at increasing concurrency:
+
+- native: pooled ``httpx.AsyncClient`` (``native_http=True``)
+- thread: blocking OpenAI SDK in ``asyncio.to_thread`` (``native_http=False``),
+  limited by the default executor (``min(32, cpu + 4)`` threads)
+
+Each level runs ``concurrency`` closed-loop workers; the server adds
+``--latency`` seconds of simulated model time per request. Client and
+server share one process, so absolute numbers are pessimistic.
+
+Usage:
+    python benchmarks/benchmark_provider_http.py
+    python benchmarks/benchmark_provider_http.py --concurrency 1 50 500 --latency 0.05
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+import numpy as np
+
+from penin.config import settings
+from penin.providers.http_transport import HTTPTransportConfig
+from penin.providers.openai_provider import OpenAIProvider
+
+from mock_llm_server import MockLLMServer
+
+MESSAGES = [{"role": "user", "content": "ping"}]
+
+
+async def run_level(provider, concurrency: int, requests: int) -> tuple[float, np.ndarray, int]:
+    latencies: list[float] = []
+    errors = 0
+    per_worker = max(1, requests // concurrency)
+
+    async def worker():
+        nonlocal errors
+        for _ in range(per_worker):
+            start = time.perf_counter()
+            try:
+                await provider.chat(MESSAGES)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    await provider.aclose()
+    return elapsed, np.array(latencies), errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark native async HTTP vs thread-wrapped SDK")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 50, 500])
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per level (at least one per worker)")
+    parser.add_argument("--latency", type=float, default=0.05, help="Simulated model latency (s)")
+    parser.add_argument("--max-connections", type=int, default=HTTPTransportConfig.max_connections)
+    args = parser.parse_args()
+
+    settings.OPENAI_API_KEY = "mock-key"
+    threads = min(32, (os.cpu_count() or 1) + 4)
+    print(f"server latency {args.latency * 1000:.0f} ms, default executor {threads} threads\n")
+    print(f"{'conc':>5} {'path':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'errors':>7} {'conns':>6}")
+    print("-" * 58)
+    with MockLLMServer(latency_s=args.latency) as server:
+        for concurrency in args.concurrency:
+            requests = max(args.requests, concurrency)
+            config = HTTPTransportConfig(
+                max_connections=args.max_connections, max_keepalive_connections=args.max_connections
+            )
+            for path in ("native", "thread"):
+                provider = OpenAIProvider(
+                    base_url=server.base_url, native_http=path == "native", http_config=config
+                )
+                before = server.connections
+                elapsed, lat, errors = asyncio.run(run_level(provider, concurrency, requests))
+                p50, p99 = np.percentile(lat, [50, 99]) * 1000 if len(lat) else (0.0, 0.0)
+                print(
+                    f"{concurrency:>5} {path:>7} {len(lat) / elapsed:>9.1f} {p50:>9.1f} {p99:>9.1f}"
+                    f" {errors:>7} {server.connections - before:>6}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark Streaming Quantile Sketch
+===================================
+
+Accuracy and cost of ``QuantileSketch`` against exact sort-based
+percentiles on synthetic heavy-tailed latencies (90% log-normal body,
+10% Pareto tail):
+
+- relative error of p50/p95/p99/p999 vs the exact nearest-rank value
+- insert cost (µs/value), query cost (µs for all four percentiles) and
+  memory (buckets) vs copying + sorting the raw samples per query
+- merge cost when combining per-worker sketches
+
+Usage:
+    python benchmarks/benchmark_quantile_sketch.py
+    python benchmarks/benchmark_quantile_sketch.py --sizes 1000 1000000 --accuracy 0.005
+"""
+
+import argparse
+import math
+import time
+
+import numpy as np
+
+from penin.router_pkg.quantile_sketch import QuantileSketch
+
+QS = {"p50": 0.5, "p95": 0.95, "p99": 0.99, "p999": 0.999}
+
+
+def heavy_tailed(n: int, rng) -> np.ndarray:
+    body = rng.lognormal(mean=4.0, sigma=0.6, size=n - n // 10)
+    tail = (rng.pareto(1.2, size=n // 10) + 1.0) * 300.0
+    values = np.concatenate([body, tail])
+    rng.shuffle(values)
+    return values
+
+
+def sorted_percentiles(values: list) -> list[float]:
+    ordered = sorted(values)
+    return [ordered[math.floor(q * (len(ordered) - 1))] for q in QS.values()]
+
+
+def timed(fn, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark quantile sketch vs exact percentiles")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--accuracy", type=float, default=0.01)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = np.random.default_rng(args.seed)
+
+    header = " ".join(f"{name + ' err%':>10}" for name in QS)
+    print(f"{'N':>9} {header} {'insert µs':>10} {'query µs':>10} {'sort µs':>12} {'buckets':>8}")
+    print("-" * (9 + 11 * len(QS) + 46))
+    for n in args.sizes:
+        values = heavy_tailed(n, rng).tolist()
+        sketch = QuantileSketch(relative_accuracy=args.accuracy)
+        _, t_insert = timed(lambda: sketch.extend(values))
+        exact, t_sort = timed(lambda: sorted_percentiles(values), repeat=3 if n <= 100_000 else 1)
+        sketch.quantiles(list(QS.values()))
+        estimates, t_query = timed(lambda: sketch.quantiles(list(QS.values())), repeat=200)
+        errors = " ".join(
+            f"{abs(e - x) / x * 100:>10.3f}" for e, x in zip(estimates, exact, strict=True)
+        )
+        print(
+            f"{n:>9} {errors} {t_insert / n * 1e6:>10.3f} {t_query * 1e6:>10.1f}"
+            f" {t_sort * 1e6:>12,.0f} {len(sketch.to_dict()['keys']):>8}"
+        )
+
+    n = args.sizes[-1]
+    parts = [QuantileSketch(args.accuracy) for _ in range(args.workers)]
+    for i, v in enumerate(heavy_tailed(n, rng).tolist()):
+        parts[i % args.workers].add(v)
+    merged, t_merge = timed(
+        lambda: sum_sketches(parts, args.accuracy), repeat=20
+    )
+    print(f"\nmerge {args.workers} worker sketches ({n:,} values): {t_merge * 1e3:.2f} ms, count={merged.count:,}")
+
+
+def sum_sketches(parts, accuracy):
+    merged = QuantileSketch(accuracy)
+    for part in parts:
+        merged.merge(part)
+    return merged
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Benchmark Router Streaming (TTFT)
+=================================
+
+Time-to-first-token and total latency of ``MultiLLMRouterComplete.ask``
+versus ``ask_stream`` against a local fake streaming provider that emits
+``--tokens`` deltas after a ``--prefill-ms`` delay, one every
+``--token-ms`` milliseconds. With ``ask`` the first token is only visible
+once the whole completion has arrived.
+
+Usage:
+    python benchmarks/benchmark_router_streaming.py
+    python benchmarks/benchmark_router_streaming.py --tokens 500 --token-ms 5 --runs 10
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from penin.providers.base import BaseProvider, LLMResponse, StreamDelta
+from penin.router import MultiLLMRouterComplete
+
+
+class FakeStreamingProvider(BaseProvider):
+    def __init__(self, tokens: int, prefill_s: float, token_s: float):
+        self.name = "fake"
+        self.model = "fake-model"
+        self.tokens = tokens
+        self.prefill_s = prefill_s
+        self.token_s = token_s
+
+    async def chat(self, messages, tools=None, system=None, temperature=0.7):
+        parts = [d.content async for d in self.chat_stream(messages) if not d.done]
+        return LLMResponse("".join(parts), self.model, tokens_out=self.tokens, cost_usd=1e-6)
+
+    async def chat_stream(self, messages, tools=None, system=None, temperature=0.7):
+        await asyncio.sleep(self.prefill_s)
+        for i in range(self.tokens):
+            await asyncio.sleep(self.token_s)
+            yield StreamDelta(f"tok{i} ", tokens_out=1, cost_usd=1e-9)
+        yield StreamDelta(response=LLMResponse("", self.model, tokens_out=self.tokens, cost_usd=1e-6))
+
+
+async def measure(router, streaming: bool, prompt: str) -> tuple[float, float]:
+    messages = [{"role": "user", "content": prompt}]
+    start = time.perf_counter()
+    if not streaming:
+        await router.ask(messages, use_cache=False)
+        total = time.perf_counter() - start
+        return total, total
+    ttft = None
+    async for delta in router.ask_stream(messages, use_cache=False):
+        if ttft is None and delta.content:
+            ttft = time.perf_counter() - start
+    return ttft, time.perf_counter() - start
+
+
+async def main_async(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        provider = FakeStreamingProvider(args.tokens, args.prefill_ms / 1000, args.token_ms / 1000)
+        router = MultiLLMRouterComplete(
+            [provider], daily_budget_usd=1e6, enable_cache=False, state_path=Path(tmp) / "s.json"
+        )
+        print(f"{'mode':<12} {'TTFT p50 (ms)':>14} {'total p50 (ms)':>15}")
+        print("-" * 43)
+        for name, streaming in (("ask", False), ("ask_stream", True)):
+            samples = [await measure(router, streaming, f"q{i}") for i in range(args.runs)]
+            ttft = statistics.median(s[0] for s in samples) * 1000
+            total = statistics.median(s[1] for s in samples) * 1000
+            print(f"{name:<12} {ttft:>14.1f} {total:>15.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark router ask vs ask_stream TTFT")
+    parser.add_argument("--tokens", type=int, default=200)
+    parser.add_argument("--prefill-ms", type=float, default=50.0)
+    parser.add_argument("--token-ms", type=float, default=2.0)
+    parser.add_argument("--runs", type=int, default=5)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+Benchmark SecureCache L2 Store
+==============================
+
+Cost of the single-file SQLite L2 store against the previous layout (one
+HMAC-signed ``<sha256>.json`` file per key) at growing entry counts:
+
+- set: µs per ``set`` while filling the cache (batched write-behind flushes)
+- get: µs per ``get`` of random keys served from L2 (L1 cold)
+- stats: µs per ``get_stats`` (counter row vs directory glob)
+
+The per-file baseline is re-implemented here with the same serialization
+and HMAC steps; it is skipped above ``--legacy-max`` entries because it
+creates one inode per key.
+
+Usage:
+    python benchmarks/benchmark_secure_cache.py
+    python benchmarks/benchmark_secure_cache.py --sizes 10000 100000 --legacy-max 100000
+"""
+
+import argparse
+import hashlib
+import hmac
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from penin.cache import SecureCache, orjson
+
+KEY = b"dev"
+
+
+class PerFileStore:
+    """The previous L2: one signed JSON file per key."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+
+    def set(self, key: str, value) -> None:
+        payload = {"value": value, "timestamp": time.time()}
+        tag = hmac.new(KEY, orjson.dumps(payload), hashlib.sha256).hexdigest()
+        self._path(key).write_bytes(orjson.dumps({"hmac": tag, "data": payload}))
+
+    def get(self, key: str):
+        p = self._path(key)
+        if not p.exists():
+            return None
+        blob = orjson.loads(p.read_bytes())
+        calc = hmac.new(KEY, orjson.dumps(blob["data"]), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(blob["hmac"], calc):
+            raise ValueError("L2 cache HMAC mismatch")
+        return blob["data"]["value"]
+
+    def get_stats(self) -> dict:
+        return {"l2_size": len(list(self.cache_dir.glob("*.json")))}
+
+
+def timed(fn, n: int) -> float:
+    start = time.perf_counter()
+    for i in range(n):
+        fn(i)
+    return (time.perf_counter() - start) / n * 1e6
+
+
+def value(i: int) -> dict:
+    return {"response": f"answer {i}", "tokens": i % 997, "score": 0.5}
+
+
+def run(store_factory, n: int, reads: int, stats_repeat: int, rng) -> tuple[float, float, float]:
+    with tempfile.TemporaryDirectory() as tmp:
+        store = store_factory(Path(tmp))
+        t_set = timed(lambda i: store.set(f"key-{i}", value(i)), n)
+        if hasattr(store, "close"):
+            store.close()
+            store = store_factory(Path(tmp))
+        keys = [f"key-{rng.randrange(n)}" for _ in range(reads)]
+        t_get = timed(lambda i: store.get(keys[i]), reads)
+        t_stats = timed(lambda i: store.get_stats(), stats_repeat)
+        assert store.get_stats()["l2_size"] == n
+        if hasattr(store, "close"):
+            store.close()
+    return t_set, t_get, t_stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SecureCache L2 store vs per-file layout")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--legacy-max", type=int, default=100_000)
+    parser.add_argument("--reads", type=int, default=20_000)
+    parser.add_argument("--flush-batch", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    def sqlite_store(path):
+        return SecureCache(path, l1_size=16, l2_size=10**9, flush_batch=args.flush_batch)
+
+    print(f"{'N':>9} {'store':>9} {'set µs':>9} {'get µs':>9} {'stats µs':>11}")
+    print("-" * 51)
+    for n in args.sizes:
+        reads = min(args.reads, n)
+        rows = [("sqlite", sqlite_store, 200)]
+        if n <= args.legacy_max:
+            rows.append(("per-file", PerFileStore, 3))
+        for name, factory, stats_repeat in rows:
+            t_set, t_get, t_stats = run(factory, n, reads, stats_repeat, rng)
+            print(f"{n:>9} {name:>9} {t_set:>9.1f} {t_get:>9.1f} {t_stats:>11,.1f}")
+
+
+if __name__ == "__main__":
+    main()
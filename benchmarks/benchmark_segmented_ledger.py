@@ -0,0 +1,92 @@
+"""
+Benchmark Segmented WORM Ledger
+===============================
+
+Writes N events to the single-file ``WORMLedger`` and to
+``SegmentedWORMLedger`` and compares:
+
+- append throughput (events/sec)
+- on-disk size (sealed segments are compressed)
+- full chain verification (sequential vs parallel segments)
+- a time-range query over the newest ~1% of events, which the single file
+  can only answer by scanning all history
+
+Usage:
+    python benchmarks/benchmark_segmented_ledger.py
+    python benchmarks/benchmark_segmented_ledger.py --events 200000 --segment-kb 4096 --workers 4
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from penin.ledger.segmented_worm import SegmentedWORMLedger
+from penin.ledger.worm_ledger import WORMLedger
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def fill(ledger, n: int) -> list:
+    return [
+        ledger.append("promote", f"evt-{i}", {"cycle": i, "delta_linf": i * 1e-4, "promoted": i % 3 == 0})
+        for i in range(n)
+    ]
+
+
+def dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.iterdir())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark single-file vs segmented WORM ledger")
+    parser.add_argument("--events", type=int, default=50_000)
+    parser.add_argument("--segment-kb", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--compression", default="auto")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        single = WORMLedger(tmp / "single.jsonl")
+        segmented = SegmentedWORMLedger(
+            tmp / "segmented", max_segment_bytes=args.segment_kb * 1024, compression=args.compression
+        )
+
+        events, t_single = timed(lambda: fill(single, args.events))
+        seg_events, t_seg = timed(lambda: fill(segmented, args.events))
+        cut = int(args.events * 0.99)
+
+        print(f"{'':<34} {'single-file':>14} {'segmented':>14}")
+        print("-" * 64)
+        print(f"{'append (events/s)':<34} {args.events / t_single:>14,.0f} {args.events / t_seg:>14,.0f}")
+        print(
+            f"{'on-disk size (MiB)':<34} {(tmp / 'single.jsonl').stat().st_size / 2**20:>14.2f}"
+            f" {dir_size(tmp / 'segmented') / 2**20:>14.2f}"
+        )
+        print(f"{'segments':<34} {1:>14} {len(segmented.segments()):>14}")
+
+        ok1, t1 = timed(single.verify_chain)
+        ok2, t2 = timed(lambda: segmented.verify_chain(workers=1))
+        ok3, t3 = timed(lambda: segmented.verify_chain(workers=args.workers))
+        assert ok1[0] and ok2[0] and ok3[0]
+        print(f"{'verify full chain (s)':<34} {t1:>14.3f} {t2:>14.3f}")
+        print(f"{f'verify, {args.workers} processes (s)':<34} {'-':>14} {t3:>14.3f}")
+
+        def single_range():
+            start = datetime.fromisoformat(events[cut].timestamp)
+            return [e for e in single.read_all() if datetime.fromisoformat(e.timestamp) >= start]
+
+        r1, t1 = timed(single_range)
+        r2, t2 = timed(lambda: list(segmented.read_range(start=seg_events[cut].timestamp)))
+        assert r1[0].sequence_number == r2[0].sequence_number
+        print(f"{f'range query, last 1% ({len(r2)} ev) (s)':<34} {t1:>14.3f} {t2:>14.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark Shared Router State
+=============================
+
+Per-call cost of the router hot path (``add_usage`` / ``try_add_usage`` /
+``can_call``) for the process-local classes in ``penin.router`` versus the
+cross-process ``SharedRouterState`` backends (mmap + fcntl, SQLite WAL), and
+aggregate ``try_add_usage`` throughput with several worker processes
+contending for the same budget.
+
+Usage:
+    python benchmarks/benchmark_shared_router_state.py
+    python benchmarks/benchmark_shared_router_state.py --calls 100000 --processes 8
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from pathlib import Path
+
+from penin.router import BudgetTracker, CircuitBreaker
+from penin.router_pkg.shared_state import FCNTL_AVAILABLE, SharedRouterState
+
+
+def per_call_us(fn, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def worker(path, backend, calls):
+    budget = SharedRouterState(path, backend=backend).budget_tracker()
+    for _ in range(calls):
+        budget.try_add_usage(1e-6, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark process-local vs shared router state")
+    parser.add_argument("--calls", type=int, default=20_000)
+    parser.add_argument("--processes", type=int, default=4)
+    args = parser.parse_args()
+
+    backends = (["mmap"] if FCNTL_AVAILABLE else []) + ["sqlite"]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'backend':<10} {'add_usage':>12} {'try_add_usage':>14} {'can_call':>12}   (µs/call)")
+        print("-" * 56)
+        local_budget, local_breaker = BudgetTracker(daily_budget_usd=1e9), CircuitBreaker()
+        print(
+            f"{'local':<10} {per_call_us(lambda: local_budget.add_usage(1e-6, 1), args.calls):>12.2f}"
+            f" {'-':>14} {per_call_us(local_breaker.can_call, args.calls):>12.2f}"
+        )
+        for backend in backends:
+            state = SharedRouterState(Path(tmp) / backend, backend=backend)
+            budget = state.budget_tracker(daily_budget_usd=1e9)
+            breaker = state.circuit_breaker("bench")
+            print(
+                f"{backend:<10} {per_call_us(lambda: budget.add_usage(1e-6, 1), args.calls):>12.2f}"
+                f" {per_call_us(lambda: budget.try_add_usage(1e-6, 1), args.calls):>14.2f}"
+                f" {per_call_us(breaker.can_call, args.calls):>12.2f}"
+            )
+
+        print()
+        print(f"{'backend':<10} {'processes':>10} {'calls/s':>14} {'lost updates':>13}")
+        print("-" * 50)
+        for backend in backends:
+            path = Path(tmp) / f"{backend}-mp"
+            SharedRouterState(path, backend=backend).budget_tracker(daily_budget_usd=1e9)
+            procs = [
+                mp.Process(target=worker, args=(path, backend, args.calls))
+                for _ in range(args.processes)
+            ]
+            start = time.perf_counter()
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join()
+            elapsed = time.perf_counter() - start
+            total = args.calls * args.processes
+            lost = total - SharedRouterState(path, backend=backend).budget_tracker().request_count
+            print(f"{backend:<10} {args.processes:>10} {total / elapsed:>14,.0f} {lost:>13}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark Tracing Overhead
+==========================
+
+Cost of ``penin.observability.tracing`` spans and their overhead on two
+instrumented hot paths, ``SigmaGuard.validate`` (one span per gate) and
+``master_equation_cycle`` (cycle, gradient and update spans):
+
+- off: tracing disabled (shared no-op span)
+- sampled: tracing enabled at ``--sample`` (roots that lose the draw drop
+  their whole trace)
+- full: every span recorded
+
+Usage:
+    python benchmarks/benchmark_tracing.py
+    python benchmarks/benchmark_tracing.py --sample 0.01 --number 5000
+"""
+
+import argparse
+import timeit
+
+import numpy as np
+
+from penin.guard.sigma_guard_complete import GateMetrics, SigmaGuard
+from penin.math.penin_master_equation import MasterEquationState, master_equation_cycle
+from penin.observability import tracing
+
+
+def best_us(fn, modes: dict, number: int, repeat: int) -> dict[str, float]:
+    """Best time per call for each mode; modes are interleaved so drift hits all alike"""
+    best = dict.fromkeys(modes, float("inf"))
+    for _ in range(repeat):
+        for mode, config in modes.items():
+            tracing.configure(**config)
+            best[mode] = min(best[mode], timeit.timeit(fn, number=number) / number * 1e6)
+            tracing.get_tracer().clear()
+    return best
+
+
+def empty_span():
+    with tracing.span("bench.span"):
+        pass
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark tracing span overhead")
+    parser.add_argument("--sample", type=float, default=0.01, help="Sample rate for the sampled mode")
+    parser.add_argument("--number", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument("--dim", type=int, default=64, help="Master equation state size")
+    args = parser.parse_args()
+
+    guard = SigmaGuard()
+    metrics = GateMetrics(
+        rho=0.9, ece=0.005, rho_bias=1.01, sr_score=0.9, omega_g=0.9,
+        delta_linf=0.02, caos_plus=1.5, cost_increase=0.05, kappa=25,
+        consent=True, eco_ok=True,
+    )
+    rng = np.random.default_rng(0)
+    state = MasterEquationState(
+        I=rng.random(args.dim), n=0, alpha_n=0.0, caos_plus=0.0, sr_score=0.0, Linf=0.7
+    )
+
+    def cycle():
+        master_equation_cycle(
+            state, None, {}, lambda I, E, P: float(I @ I), alpha_0=0.1, caos_plus=1.5, sr_score=0.85
+        )
+
+    workloads = {
+        "empty span": empty_span,
+        "guard.validate": lambda: guard.validate(metrics),
+        "master_equation_cycle": cycle,
+    }
+    modes = {
+        "off": dict(enabled=False),
+        f"sampled {args.sample:g}": dict(enabled=True, sample_rate=args.sample),
+        "full": dict(enabled=True, sample_rate=1.0),
+    }
+
+    print(f"{'workload':<24} {'mode':<14} {'us/op':>10} {'overhead':>9}")
+    print("-" * 60)
+    for label, fn in workloads.items():
+        timings = best_us(fn, modes, args.number, args.repeat)
+        baseline = timings["off"]
+        for mode, us in timings.items():
+            overhead = "-" if mode == "off" else f"{(us / baseline - 1) * 100:+.1f}%"
+            print(f"{label:<24} {mode:<14} {us:>10.2f} {overhead:>9}")
+    tracing.configure(enabled=False, sample_rate=1.0)
+
+
+if __name__ == "__main__":
+    main()
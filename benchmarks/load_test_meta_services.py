@@ -0,0 +1,219 @@
+"""
+Load Test: Ω-META → Σ-Guard/SR Round Trips
+==========================================
+
+Starts Σ-Guard, SR-Ω∞ and Ω-META under local uvicorn and measures RPS and
+latency percentiles for ``GET /health`` and ``POST /meta/promote/{pid}`` in
+three modes. Guard/SR responses are delayed by ``--backend-latency-ms`` to
+stand in for the network hop of a real deployment:
+
+- blocking: the previous handler shape, calling ``requests.post`` (a new
+  connection per call) from inside ``async def``
+- async: AsyncGuardClient/AsyncSRClient on the shared keep-alive pool
+- inprocess: PENIN_META_TRANSPORT=inprocess (no HTTP to Guard/SR)
+
+Usage:
+    python benchmarks/load_test_meta_services.py
+    python benchmarks/load_test_meta_services.py --requests 2000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+import numpy as np
+import requests
+from fastapi import FastAPI
+
+ROOT = Path(__file__).resolve().parent.parent
+GUARD_PORT, SR_PORT, META_PORT = 8011, 8012, 8013
+
+PROMOTE_BODY = {"rho": 0.9, "ece": 0.005, "rho_bias": 1.01, "consent": True, "eco_ok": True}
+PROMOTE_PARAMS = {"dlinf": 0.02, "caos_plus": 1.2, "sr": 0.9}
+
+
+def _with_latency(app):
+    """ASGI wrapper delaying every HTTP request by LOAD_TEST_LATENCY_MS"""
+    delay_s = float(os.getenv("LOAD_TEST_LATENCY_MS", "0")) / 1000
+
+    async def wrapped(scope, receive, send):
+        if scope["type"] == "http" and delay_s:
+            await asyncio.sleep(delay_s)
+        await app(scope, receive, send)
+
+    return wrapped
+
+
+def _guard_app():
+    from penin.guard.sigma_guard_service import app
+
+    return _with_latency(app)
+
+
+def _sr_app():
+    from penin.sr.sr_service import app
+
+    return _with_latency(app)
+
+
+# Previous behaviour, kept here for the "before" measurement only
+legacy_app = FastAPI(title="Omega-META (blocking clients)")
+
+
+@legacy_app.get("/health")
+async def legacy_health():
+    def ok(url):
+        try:
+            r = requests.get(url, timeout=2)
+            return r.ok and r.json().get("ok", False)
+        except Exception:
+            return False
+
+    return {
+        "ok": True,
+        "guard": ok(f"http://127.0.0.1:{GUARD_PORT}/health"),
+        "sr": ok(f"http://127.0.0.1:{SR_PORT}/health"),
+    }
+
+
+@legacy_app.post("/meta/promote/{pid}")
+async def legacy_promote(pid: str, dlinf: float, caos_plus: float, sr: float, guard: dict):
+    r = requests.post(
+        f"http://127.0.0.1:{GUARD_PORT}/sigma_guard/eval", json=guard, timeout=5
+    )
+    r.raise_for_status()
+    allow = bool(r.json().get("allow", False))
+    gate_ok = (dlinf >= 0.01) and (caos_plus >= 1.0) and (sr >= 0.80)
+    return {"id": pid, "promoted": bool(gate_ok and allow), "guard_allow": allow}
+
+
+def start_server(
+    app_path: str, port: int, env: dict, factory: bool = False
+) -> subprocess.Popen:
+    proc = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", app_path,
+            "--port", str(port), "--log-level", "warning", "--no-access-log",
+            *(["--factory"] if factory else []),
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"http://127.0.0.1:{port}/health", timeout=0.5).status_code == 200:
+                return proc
+        except httpx.HTTPError:
+            time.sleep(0.1)
+    proc.terminate()
+    raise RuntimeError(f"{app_path} did not start on port {port}")
+
+
+async def drive(url: str, method: str, n: int, concurrency: int, **kwargs) -> dict:
+    latencies = []
+    queue = iter(range(n))
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+
+        async def worker():
+            for i in queue:
+                start = time.perf_counter()
+                r = await client.request(method, url.format(i=i), **kwargs)
+                r.raise_for_status()
+                latencies.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - start
+
+    ms = np.array(latencies) * 1000
+    return {
+        "rps": n / elapsed,
+        "p50_ms": float(np.percentile(ms, 50)),
+        "p99_ms": float(np.percentile(ms, 99)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test Ω-META service calls")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--backend-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    home = tempfile.mkdtemp(prefix="penin_load_")
+    env = {**os.environ, "HOME": home, "PYTHONPATH": str(ROOT)}
+    backend_env = {**env, "LOAD_TEST_LATENCY_MS": str(args.backend_latency_ms)}
+    backends = [
+        start_server(
+            "benchmarks.load_test_meta_services:_guard_app",
+            GUARD_PORT,
+            backend_env,
+            factory=True,
+        ),
+        start_server(
+            "benchmarks.load_test_meta_services:_sr_app",
+            SR_PORT,
+            backend_env,
+            factory=True,
+        ),
+    ]
+
+    modes = {
+        "blocking": ("benchmarks.load_test_meta_services:legacy_app", {}),
+        "async": ("penin.meta.omega_meta_service:app", {}),
+        "inprocess": (
+            "penin.meta.omega_meta_service:app",
+            {"PENIN_META_TRANSPORT": "inprocess"},
+        ),
+    }
+    base = f"http://127.0.0.1:{META_PORT}"
+    results = {}
+    try:
+        for mode, (app_path, extra_env) in modes.items():
+            meta = start_server(app_path, META_PORT, {**env, **extra_env})
+            try:
+                results[(mode, "health")] = asyncio.run(
+                    drive(f"{base}/health", "GET", args.requests, args.concurrency)
+                )
+                results[(mode, "promote")] = asyncio.run(
+                    drive(
+                        f"{base}/meta/promote/p{{i}}",
+                        "POST",
+                        args.requests,
+                        args.concurrency,
+                        params=PROMOTE_PARAMS,
+                        json=PROMOTE_BODY,
+                    )
+                )
+            finally:
+                meta.terminate()
+                meta.wait()
+    finally:
+        for proc in backends:
+            proc.terminate()
+            proc.wait()
+
+    print(
+        f"\n{args.requests} requests, concurrency {args.concurrency}, "
+        f"backend latency {args.backend_latency_ms} ms"
+    )
+    print(f"{'mode':<10} {'endpoint':<9} {'RPS':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    print("-" * 50)
+    for (mode, endpoint), r in results.items():
+        print(
+            f"{mode:<10} {endpoint:<9} {r['rps']:>9.0f} "
+            f"{r['p50_ms']:>9.1f} {r['p99_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,168 @@
+"""Local mock LLM server for offline tests and benchmarks.
+
+Serves an OpenAI-compatible ``POST /v1/chat/completions`` (JSON or SSE
+streaming) and an Anthropic-style ``POST /v1/messages`` from a uvicorn
+server running in a background thread of the current process. Replies
+echo the last user message after ``latency_s`` of simulated model time;
+usage counts whitespace-separated words.
+
+Usage:
+    with MockLLMServer(latency_s=0.05) as server:
+        provider = OpenAIProvider(base_url=server.base_url)
+        ...
+    server.requests, server.connections, server.max_in_flight
+"""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+from typing import Any
+
+import orjson
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import Response, StreamingResponse
+
+__all__ = ["MockLLMServer"]
+
+
+def _reply(messages: list[dict[str, Any]]) -> tuple[str, int]:
+    last = next((m for m in reversed(messages) if m.get("role") == "user"), {})
+    prompt_tokens = sum(len(str(m.get("content", "")).split()) for m in messages)
+    return f"echo: {last.get('content', '')}", prompt_tokens
+
+
+class MockLLMServer:
+    """OpenAI/Anthropic-compatible HTTP server on ``127.0.0.1`` (ephemeral port)."""
+
+    def __init__(self, latency_s: float = 0.0, host: str = "127.0.0.1") -> None:
+        self.latency_s = latency_s
+        self.host = host
+        self.port = 0
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._peers: set[tuple[str, int]] = set()
+        self._server: uvicorn.Server | None = None
+        self._thread: threading.Thread | None = None
+        self.app = self._build_app()
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}/v1"
+
+    @property
+    def connections(self) -> int:
+        """Distinct client connections seen (keep-alive reuse keeps this low)."""
+        return len(self._peers)
+
+    def _build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.middleware("http")
+        async def track(request: Request, call_next):
+            if request.client is not None:
+                self._peers.add((request.client.host, request.client.port))
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                if self.latency_s:
+                    await asyncio.sleep(self.latency_s)
+                return await call_next(request)
+            finally:
+                self.in_flight -= 1
+
+        @app.post("/v1/chat/completions")
+        async def chat_completions(request: Request):
+            body = orjson.loads(await request.body())
+            text, prompt_tokens = _reply(body.get("messages", []))
+            words = text.split(" ")
+            usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(words)}
+            if body.get("stream"):
+                return StreamingResponse(
+                    self._sse(body["model"], words, usage), media_type="text/event-stream"
+                )
+            payload = {
+                "id": "chatcmpl-mock",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": body.get("model", ""),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {**usage, "total_tokens": prompt_tokens + len(words)},
+            }
+            return Response(orjson.dumps(payload), media_type="application/json")
+
+        @app.post("/v1/messages")
+        async def messages(request: Request):
+            body = orjson.loads(await request.body())
+            text, prompt_tokens = _reply(body.get("messages", []))
+            payload = {
+                "id": "msg-mock",
+                "type": "message",
+                "role": "assistant",
+                "model": body.get("model", ""),
+                "content": [{"type": "text", "text": text}],
+                "usage": {"input_tokens": prompt_tokens, "output_tokens": len(text.split())},
+            }
+            return Response(orjson.dumps(payload), media_type="application/json")
+
+        return app
+
+    @staticmethod
+    async def _sse(model: str, words: list[str], usage: dict[str, int]):
+        for i, word in enumerate(words):
+            piece = word if i == 0 else f" {word}"
+            chunk = {"model": model, "choices": [{"index": 0, "delta": {"content": piece}}]}
+            yield b"data: " + orjson.dumps(chunk) + b"\n\n"
+        yield b"data: " + orjson.dumps({"model": model, "choices": [], "usage": usage}) + b"\n\n"
+        yield b"data: [DONE]\n\n"
+
+    def start(self) -> MockLLMServer:
+        # Explicit IPPROTO_TCP: asyncio only sets TCP_NODELAY on accepted
+        # sockets whose proto is TCP (proto 0 gets Nagle + delayed-ACK stalls)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, 0))
+        self.port = sock.getsockname()[1]
+        config = uvicorn.Config(
+            self.app,
+            log_level="error",
+            access_log=False,
+            lifespan="off",
+            ws="none",
+            backlog=4096,
+            timeout_keep_alive=30,
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(
+            target=self._server.run, kwargs={"sockets": [sock]}, daemon=True
+        )
+        self._thread.start()
+        deadline = time.time() + 10.0
+        while not self._server.started:
+            if time.time() > deadline or not self._thread.is_alive():
+                raise RuntimeError("mock LLM server failed to start")
+            time.sleep(0.01)
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=10.0)
+
+    def __enter__(self) -> MockLLMServer:
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
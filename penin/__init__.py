@@ -2,14 +2,34 @@
 
 from __future__ import annotations
 
-from importlib import metadata
+from typing import TYPE_CHECKING
 
-from .config import settings  # noqa: F401
-from .router import MultiLLMRouterComplete as MultiLLMRouter  # noqa: F401
+from ._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .config import settings
+    from .router import MultiLLMRouterComplete as MultiLLMRouter
+
+# Resolved on first access (PEP 562): importing the router pulls in every
+# provider SDK, which short-lived CLI invocations should not pay for.
+_EXPORTS = {
+    "settings": ".config",
+    "MultiLLMRouter": ".router:MultiLLMRouterComplete",
+}
+_getattr, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+
+def __getattr__(name: str):
+    if name == "__version__":
+        from importlib import metadata
+
+        try:  # pragma: no cover - resolved at runtime when package is installed
+            version = metadata.version("peninaocubo")
+        except metadata.PackageNotFoundError:  # pragma: no cover - local source tree
+            version = "0.9.0"  # IA AO CUBO Transformation - 60% Complete
+        globals()["__version__"] = version
+        return version
+    return _getattr(name)
 
-try:  # pragma: no cover - resolved at runtime when package is installed
-    __version__ = metadata.version("peninaocubo")
-except metadata.PackageNotFoundError:  # pragma: no cover - local source tree
-    __version__ = "0.9.0"  # IA AO CUBO Transformation - 60% Complete
 
 __all__ = ["MultiLLMRouter", "settings", "__version__"]
@@ -0,0 +1,51 @@
+"""
+PEP 562 lazy exports for package ``__init__`` modules.
+
+Packages declare what they re-export instead of importing it::
+
+    _EXPORTS = {"CAOSConfig": ".caos", "settings": ".config"}
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+
+The defining module is imported on first attribute access and the value is
+cached in the package namespace, so later lookups are plain attribute
+reads. Submodules that are not listed (``penin.omega.ledger``) are still
+reachable as attributes, as they were when ``__init__`` imported eagerly.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build ``(__getattr__, __dir__)`` for ``package``
+
+    Args:
+        package: ``__name__`` of the package
+        exports: attribute name -> module ("." for relative) or
+            "module:attr" when the attribute is renamed on export
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is not None:
+            module_name, _, attr = target.partition(":")
+            value = getattr(importlib.import_module(module_name, package), attr or name)
+        elif not name.startswith("__") and importlib.util.find_spec(f"{package}.{name}"):
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | exports.keys())
+
+    return __getattr__, __dir__
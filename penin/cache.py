@@ -1,14 +1,33 @@
+"""
+Cache seguro de dois níveis (L1 em memória, L2 em SQLite).
+
+O L2 é um único arquivo SQLite em modo WAL (``<cache_dir>/l2.sqlite3``):
+índice por chave, índice de expiração e contadores mantidos por triggers,
+de modo que ``get_stats`` e ``clear`` não varrem diretório nenhum.
+
+Caches antigos (um ``.json`` por chave) são importados com::
+
+    python -m penin.cache migrate <cache_dir> [--keep]
+"""
+
 from __future__ import annotations
 
+import argparse
+import atexit
 import hashlib
 import hmac
 import logging
 import os
+import sqlite3
+import threading
 import time
+import weakref
 from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from penin.observability.tracing import span
+
 try:
     import orjson  # type: ignore  # os testes usam orjson quando disponível
 except ModuleNotFoundError:  # pragma: no cover - shim for lightweight environments
@@ -31,12 +50,77 @@ except ModuleNotFoundError:  # pragma: no cover - shim for lightweight environme
 
 logger = logging.getLogger("penin.cache")
 
+L2_FILENAME = "l2.sqlite3"
+EVICTION_POLICIES = ("lru", "lfu")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    hmac TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_expires_at ON entries (expires_at);
+CREATE INDEX IF NOT EXISTS entries_lru ON entries (last_access);
+CREATE INDEX IF NOT EXISTS entries_lfu ON entries (hits, last_access);
+CREATE TABLE IF NOT EXISTS counters (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    bytes INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters (id, entries, bytes) VALUES (0, 0, 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE counters SET entries = entries + 1, bytes = bytes + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE counters SET entries = entries - 1, bytes = bytes - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE counters SET bytes = bytes + NEW.size - OLD.size WHERE id = 0;
+END;
+"""
+
+_UPSERT = """
+INSERT INTO entries (key, data, hmac, timestamp, expires_at, last_access, size)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (key) DO UPDATE SET
+    data = excluded.data, hmac = excluded.hmac, timestamp = excluded.timestamp,
+    expires_at = excluded.expires_at, last_access = excluded.last_access, size = excluded.size
+"""
+
+_EVICT_ORDER = {"lru": "last_access", "lfu": "hits, last_access"}
+
+# caches com write-behind ativo (flush_batch > 1): gravados na saída do processo
+_BATCHED: weakref.WeakSet[SecureCache] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_at_exit() -> None:
+    for cache in list(_BATCHED):
+        try:
+            cache.flush()
+        except Exception:
+            logger.exception("Cache flush at exit failed for %s", cache.cache_dir)
+
 
 class SecureCache:
     """
-    Cache com L1 (memória, LRU) e L2 (arquivos .json).
+    Cache com L1 (memória, LRU) e L2 (SQLite WAL, arquivo único).
     - HMAC (sha256) sobre o payload serializado (orjson) para integridade.
-    - TTL separado para L1 e L2.
+    - TTL separado para L1 e L2; o L2 guarda ``expires_at`` indexado e
+      remove entradas vencidas a cada flush.
+    - L2 limitado a ``l2_size`` entradas, com despejo LRU ou LFU.
+    - Por padrão (``flush_batch=1``) cada ``set`` grava no L2 na hora,
+      visível para outras instâncias/processos no mesmo diretório.
+    - Com ``flush_batch > 1`` as escritas são agrupadas (write-behind):
+      ``set`` enfileira e o lote é gravado numa única transação ao atingir
+      ``flush_batch`` entradas, em ``flush()``/``aflush()``, em ``close()``
+      ou na saída do processo (atexit). Até lá outras instâncias não veem
+      as entradas. Dentro de um event loop esse flush roda num executor.
     - Em caso de divergência de HMAC: **raise ValueError("L2 cache HMAC mismatch")**.
     """
 
@@ -44,17 +128,24 @@ class SecureCache:
         self,
         cache_dir: Path,
         l1_size: int = 128,
-        l2_size: int = 4096,  # reservado (aqui não filtramos por tamanho, só mantemos por arquivo)
+        l2_size: int = 4096,
         l1_ttl: int = 3600,
         l2_ttl: int = 86400,
+        eviction: str = "lru",
+        flush_batch: int = 1,
     ):
+        if eviction not in EVICTION_POLICIES:
+            raise ValueError(f"eviction must be one of {EVICTION_POLICIES}, got {eviction!r}")
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / L2_FILENAME
 
         self.l1_size = int(l1_size)
         self.l2_size = int(l2_size)
         self.l1_ttl = int(l1_ttl)
         self.l2_ttl = int(l2_ttl)
+        self.eviction = eviction
+        self.flush_batch = max(1, int(flush_batch))
 
         # chave HMAC
         self._key = (os.environ.get("PENIN_CACHE_HMAC_KEY") or "dev").encode("utf-8")
@@ -62,15 +153,57 @@ class SecureCache:
         # L1 com LRU simples: {key: {"value":..., "timestamp":...}}
         self._l1: OrderedDict[str, dict[str, Any]] = OrderedDict()
 
+        # escritas pendentes (e o lote em gravação) por hash da chave:
+        # {hkey: (value, timestamp, raw, tag)}
+        self._pending: dict[str, tuple[Any, float, bytes, str]] = {}
+        self._inflight: dict[str, tuple[Any, float, bytes, str]] = {}
+        # acessos ainda não gravados no L2 (recência/frequência): {hkey: [last_access, hits]}
+        self._touches: dict[str, list[float]] = {}
+        self._flush_scheduled = False
+
+        # _lock protege as estruturas em memória; _db_lock serializa a conexão
+        self._lock = threading.RLock()
+        self._db_lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._open()
+        if self.flush_batch > 1:
+            _BATCHED.add(self)
+
         # métricas básicas
         self._hits: dict[str, int] = {"l1": 0, "l2": 0, "misses": 0}
         self._evictions = 0
+        self._l2_evictions = 0
+        self._l2_expired = 0
+
+        if next(self.cache_dir.glob("*.json"), None) is not None:
+            logger.warning(
+                "Legacy per-file cache entries found in %s; import them with "
+                "`python -m penin.cache migrate %s`",
+                self.cache_dir,
+                self.cache_dir,
+            )
 
     # ---------- utilidades ----------
-    def _path(self, key: str) -> Path:
-        # nome de arquivo seguro a partir do hash da chave
-        safe = hashlib.sha256(key.encode("utf-8")).hexdigest()
-        return self.cache_dir / f"{safe}.json"
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        conn = sqlite3.connect(
+            self.db_path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+    def _db(self) -> sqlite3.Connection:
+        # conexões SQLite não sobrevivem a fork: reabre no processo filho
+        if self._conn is None or os.getpid() != self._pid:
+            self._open()
+        return self._conn  # type: ignore[return-value]
+
+    @staticmethod
+    def _hash_key(key: str) -> str:
+        # mesma derivação dos arquivos legados (<sha256>.json), usada na migração
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
     def _mac(self, raw: bytes) -> str:
         return hmac.new(self._key, raw, hashlib.sha256).hexdigest()
@@ -78,47 +211,102 @@ class SecureCache:
     def _is_expired(self, ts: float, ttl: int) -> bool:
         return (time.time() - ts) > ttl
 
+    def _l1_put(self, key: str, value: Any, ts: float) -> None:
+        self._l1[key] = {"value": value, "timestamp": ts}
+        self._l1.move_to_end(key)
+        if len(self._l1) > self.l1_size:
+            self._l1.popitem(last=False)
+            self._evictions += 1
+
+    def _touch(self, hkey: str, now: float) -> None:
+        touch = self._touches.get(hkey)
+        if touch is None:
+            self._touches[hkey] = [now, 1]
+        else:
+            touch[0] = now
+            touch[1] += 1
+
     # ---------- API ----------
     def set(self, key: str, value: Any) -> None:
         now = time.time()
         payload = {"value": value, "timestamp": now}
         raw = orjson.dumps(payload)  # deixa claro o uso de orjson.dumps
         tag = self._mac(raw)
-        blob = {"hmac": tag, "data": payload}
-        # escreve no L2
-        self._path(key).write_bytes(orjson.dumps(blob))
-        # atualiza L1 (LRU)
-        self._l1[key] = {"value": value, "timestamp": now}
-        self._l1.move_to_end(key)
-        if len(self._l1) > self.l1_size:
-            self._l1.popitem(last=False)
-            self._evictions += 1
+        with self._lock:
+            self._pending[self._hash_key(key)] = (value, now, raw, tag)
+            # atualiza L1 (LRU)
+            self._l1_put(key, value, now)
+            due = len(self._pending) >= self.flush_batch and not self._flush_scheduled
+            if due:
+                self._flush_scheduled = True
+        if due:
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self.flush_batch == 1:
+            # write-through: a entrada já está no L2 quando set() retorna
+            self.flush()
+            return
+        try:
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        loop.run_in_executor(None, self.flush).add_done_callback(self._flush_done)
+
+    @staticmethod
+    def _flush_done(future: Any) -> None:
+        # ninguém aguarda o flush agendado: registra a falha (o lote volta à fila)
+        if not future.cancelled() and future.exception() is not None:
+            logger.error("Background cache flush failed", exc_info=future.exception())
 
     def get(self, key: str) -> Any | None:
-        # L1
-        if key in self._l1:
-            rec = self._l1[key]
-            if not self._is_expired(rec["timestamp"], self.l1_ttl):
-                self._hits["l1"] += 1
-                self._l1.move_to_end(key)
-                return rec["value"]
-            # expirado em L1 → remove e cai para L2
-            del self._l1[key]
+        hkey = self._hash_key(key)
+        with self._lock:
+            # L1
+            if key in self._l1:
+                rec = self._l1[key]
+                if not self._is_expired(rec["timestamp"], self.l1_ttl):
+                    self._hits["l1"] += 1
+                    self._l1.move_to_end(key)
+                    self._touch(hkey, time.time())
+                    return rec["value"]
+                # expirado em L1 → remove e cai para L2
+                del self._l1[key]
 
-        # L2
-        p = self._path(key)
-        if not p.exists():
-            self._hits["misses"] = self._hits.get("misses", 0) + 1
-            return None
+            # escrita ainda não gravada no L2
+            pending = self._pending.get(hkey) or self._inflight.get(hkey)
+            if pending is not None:
+                val, ts = pending[0], pending[1]
+                if self._is_expired(ts, self.l2_ttl):
+                    self._hits["misses"] += 1
+                    return None
+                self._l1_put(key, val, ts)
+                self._hits["l2"] += 1
+                self._touch(hkey, time.time())
+                return val
 
+        # L2
         try:
-            blob = orjson.loads(p.read_bytes())  # uso de orjson.loads
-            tag = blob.get("hmac")
-            data = blob.get("data") or {}
-            raw = orjson.dumps(data)
-            calc = self._mac(raw)
+            with span("cache.l2_read"), self._db_lock:
+                row = (
+                    self._db()
+                    .execute("SELECT data, hmac FROM entries WHERE key = ?", (hkey,))
+                    .fetchone()
+                )
+            if row is None:
+                with self._lock:
+                    self._hits["misses"] += 1
+                return None
 
-            if not tag or not hmac.compare_digest(tag, calc):
+            raw, tag = bytes(row[0]), row[1]
+            with span("cache.hmac_verify") as trace:
+                calc = self._mac(raw)
+                valid = bool(tag) and hmac.compare_digest(tag, calc)
+                trace.set(valid=valid)
+            if not valid:
                 logger.error(
                     "Cache integrity error for key %s: L2 cache HMAC mismatch - data may be corrupted or tampered",
                     key,
@@ -126,21 +314,20 @@ class SecureCache:
                 # os testes esperam exatamente esta mensagem:
                 raise ValueError("L2 cache HMAC mismatch")
 
+            data = orjson.loads(raw)  # uso de orjson.loads
             ts = float(data.get("timestamp") or 0.0)
-            if self._is_expired(ts, self.l2_ttl):
-                return None
+            with self._lock:
+                if self._is_expired(ts, self.l2_ttl):
+                    self._hits["misses"] += 1
+                    return None
 
-            val = data.get("value", None)
+                val = data.get("value", None)
 
-            # promoção L2 → L1
-            self._l1[key] = {"value": val, "timestamp": ts}
-            self._l1.move_to_end(key)
-            if len(self._l1) > self.l1_size:
-                self._l1.popitem(last=False)
-                self._evictions += 1
-
-            self._hits["l2"] += 1
-            return val
+                # promoção L2 → L1
+                self._l1_put(key, val, ts)
+                self._hits["l2"] += 1
+                self._touch(hkey, time.time())
+                return val
 
         except ValueError:
             # repropaga mismatch de HMAC
@@ -149,20 +336,114 @@ class SecureCache:
             logger.exception("Cache get failed", exc_info=e)
             return None
 
-    def clear(self) -> None:
-        self._l1.clear()
-        for p in self.cache_dir.glob("*.json"):
+    def flush(self) -> int:
+        """Grava escritas e acessos pendentes no L2 numa transação; retorna o nº de escritas."""
+        with self._db_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                touches, self._touches = self._touches, {}
+                self._inflight = batch
+                self._flush_scheduled = False
             try:
-                p.unlink()
-            except Exception:
-                pass
+                if batch or touches:
+                    self._write_batch(batch, dict(touches))
+            except BaseException:
+                self._requeue(batch, touches)
+                raise
+            finally:
+                with self._lock:
+                    self._inflight = {}
+        return len(batch)
+
+    def _requeue(
+        self, batch: dict[str, tuple[Any, float, bytes, str]], touches: dict[str, list[float]]
+    ) -> None:
+        """Devolve à fila um lote cuja gravação falhou (escritas mais novas prevalecem)."""
+        with self._lock:
+            for hkey, entry in batch.items():
+                self._pending.setdefault(hkey, entry)
+            for hkey, (last, hits) in touches.items():
+                touch = self._touches.get(hkey)
+                if touch is None:
+                    self._touches[hkey] = [last, hits]
+                else:
+                    touch[0] = max(touch[0], last)
+                    touch[1] += hits
+
+    async def aflush(self) -> int:
+        """``flush()`` num thread do executor, sem bloquear o event loop."""
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(None, self.flush)
+
+    def _write_batch(
+        self, batch: dict[str, tuple[Any, float, bytes, str]], touches: dict[str, list[float]]
+    ) -> None:
+        conn = self._db()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                _UPSERT,
+                (
+                    (hkey, raw, tag, ts, ts + self.l2_ttl, touches.pop(hkey, (ts,))[0], len(raw))
+                    for hkey, (_, ts, raw, tag) in batch.items()
+                ),
+            )
+            if touches:
+                conn.executemany(
+                    "UPDATE entries SET last_access = max(last_access, ?), hits = hits + ? WHERE key = ?",
+                    ((last, int(hits), hkey) for hkey, (last, hits) in touches.items()),
+                )
+            self._l2_expired += conn.execute(
+                "DELETE FROM entries WHERE expires_at <= ?", (now,)
+            ).rowcount
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        (count,) = conn.execute("SELECT entries FROM counters WHERE id = 0").fetchone()
+        excess = count - self.l2_size
+        if excess > 0:
+            self._l2_evictions += conn.execute(
+                "DELETE FROM entries WHERE key IN "
+                f"(SELECT key FROM entries ORDER BY {_EVICT_ORDER[self.eviction]} LIMIT ?)",
+                (excess,),
+            ).rowcount
+
+    def purge_expired(self) -> int:
+        """Remove do L2 as entradas vencidas (via índice de expiração)."""
+        with self._db_lock:
+            removed = self._db().execute(
+                "DELETE FROM entries WHERE expires_at <= ?", (time.time(),)
+            ).rowcount
+        self._l2_expired += removed
+        return removed
+
+    def clear(self) -> None:
+        with self._db_lock:
+            with self._lock:
+                self._l1.clear()
+                self._pending.clear()
+                self._inflight = {}
+                self._touches.clear()
+            self._db().execute("DELETE FROM entries")
 
     def get_stats(self) -> dict[str, Any]:
         """Get cache statistics."""
-        l2_files = len(list(self.cache_dir.glob("*.json")))
-        hits_l1 = self._hits.get("l1", 0)
-        hits_l2 = self._hits.get("l2", 0)
-        misses = self._hits.get("misses", 0)
+        with self._db_lock:
+            l2_entries, l2_bytes = (
+                self._db().execute("SELECT entries, bytes FROM counters WHERE id = 0").fetchone()
+            )
+        with self._lock:
+            hits_l1 = self._hits.get("l1", 0)
+            hits_l2 = self._hits.get("l2", 0)
+            misses = self._hits.get("misses", 0)
+            pending = len(self._pending)
+            l1_size = len(self._l1)
         total_requests = hits_l1 + hits_l2 + misses
         hit_rate = (hits_l1 + hits_l2) / total_requests if total_requests else 0.0
         return {
@@ -171,17 +452,115 @@ class SecureCache:
             "l1_hits": hits_l1,
             "l2_hits": hits_l2,
             "evictions": self._evictions,
-            "l1_size": len(self._l1),
-            "l2_size": l2_files,
+            "l1_size": l1_size,
+            "l2_size": l2_entries,
+            "l2_bytes": l2_bytes,
+            "l2_pending": pending,
+            "l2_evictions": self._l2_evictions,
+            "l2_expired": self._l2_expired,
             "hit_rate": hit_rate,
         }
 
+    # ---------- migração ----------
+    def import_legacy_files(self, remove: bool = True, batch_size: int = 1000) -> dict[str, int]:
+        """
+        Importa entradas do formato antigo (um ``<sha256>.json`` por chave).
+
+        O payload e a tag HMAC são copiados sem reassinatura: entradas
+        adulteradas continuam falhando na leitura. Entradas vencidas ou
+        ilegíveis são descartadas. Com ``remove=True`` os arquivos
+        importados (ou descartados) são apagados.
+        """
+        self.flush()
+        counts = {"imported": 0, "expired": 0, "invalid": 0}
+        now = time.time()
+        rows: list[tuple[Any, ...]] = []
+        done: list[Path] = []
+
+        def write() -> None:
+            with self._db_lock:
+                conn = self._db()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.executemany(_UPSERT, rows)
+                    self._evict(conn)
+                    conn.execute("COMMIT")
+                except BaseException:
+                    conn.execute("ROLLBACK")
+                    raise
+            if remove:
+                for path in done:
+                    path.unlink(missing_ok=True)
+            rows.clear()
+            done.clear()
+
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                path = Path(entry.path)
+                done.append(path)
+                try:
+                    blob = orjson.loads(path.read_bytes())
+                    data = blob["data"]
+                    raw = orjson.dumps(data)
+                    ts = float(data.get("timestamp") or 0.0)
+                    tag = str(blob["hmac"])
+                except Exception:
+                    counts["invalid"] += 1
+                    continue
+                if ts + self.l2_ttl <= now:
+                    counts["expired"] += 1
+                    continue
+                rows.append(
+                    (path.stem, raw, tag, ts, ts + self.l2_ttl, entry.stat().st_mtime, len(raw))
+                )
+                counts["imported"] += 1
+                if len(done) >= batch_size:
+                    write()
+        write()
+        return counts
+
     def close(self) -> None:
-        # aqui não há recursos persistentes a fechar além de arquivos por operação
-        pass
+        self.flush()
+        _BATCHED.discard(self)
+        with self._db_lock:
+            if self._conn is not None and os.getpid() == self._pid:
+                self._conn.close()
+            self._conn = None
 
     def __enter__(self) -> SecureCache:
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         self.close()
+
+
+def migrate_file_cache(cache_dir: Path | str, remove: bool = True, **kwargs: Any) -> dict[str, int]:
+    """Converte um cache por arquivo em ``cache_dir`` para o L2 em SQLite."""
+    with SecureCache(Path(cache_dir), **kwargs) as cache:
+        return cache.import_legacy_files(remove=remove)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m penin.cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    migrate = sub.add_parser("migrate", help="Importar cache legado (um .json por chave)")
+    migrate.add_argument("cache_dir", type=Path)
+    migrate.add_argument("--keep", action="store_true", help="Não apagar os arquivos importados")
+    migrate.add_argument("--l2-size", type=int, default=4096)
+    migrate.add_argument("--l2-ttl", type=int, default=86400)
+    args = parser.parse_args(argv)
+
+    counts = migrate_file_cache(
+        args.cache_dir, remove=not args.keep, l2_size=args.l2_size, l2_ttl=args.l2_ttl
+    )
+    print(
+        f"imported={counts['imported']} expired={counts['expired']} invalid={counts['invalid']} "
+        f"-> {args.cache_dir / L2_FILENAME}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
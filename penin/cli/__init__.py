@@ -21,6 +21,8 @@ app = typer.Typer(
     name="penin",
     help="PENIN-Ω — IA³ Auto-Evolutiva com Ética Embutida",
     add_completion=False,
+    # Plain click help: rich rendering adds ~150 ms to every `penin --help`
+    rich_markup_mode=None,
 )
 
 
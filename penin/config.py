@@ -23,6 +23,14 @@ class Settings(BaseSettings):
     ANTHROPIC_MODEL: str = "claude-3-5-sonnet-20241022"
     GROK_MODEL: str = "grok-beta"
 
+    # Provider HTTP transport (penin.providers.http_transport)
+    PENIN_NATIVE_HTTP: bool = True
+    PENIN_HTTP_MAX_CONNECTIONS: int = 32
+    PENIN_HTTP_MAX_KEEPALIVE: int = 32
+    PENIN_HTTP_CONNECT_TIMEOUT_S: float = 5.0
+    PENIN_HTTP_READ_TIMEOUT_S: float = 60.0
+    OPENAI_BASE_URL: str = "https://api.openai.com/v1"
+
     class Config:
         env_file = ".env"
         extra = "ignore"
@@ -27,50 +27,84 @@ Uso:
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from penin._lazy import lazy_exports
+
 # Version
 __version__ = "1.0.0-alpha"
 
-# Core CAOS+ module
-# Persistence and state management
-from .artifacts import NumericVectorArtifact
-from .caos import (
-    DEFAULT_GAMMA,
-    DEFAULT_KAPPA,
-    # Constants
-    EPS,
-    AutoevolutionMetrics,
-    # Enums
-    CAOSComponent,
-    CAOSComponents,
-    # Config & State
-    CAOSConfig,
-    CAOSFormula,
-    CAOSPlusEngine,
-    CAOSState,
-    # Tracker
-    CAOSTracker,
-    # Metrics
-    ConsistencyMetrics,
-    IncognoscibleMetrics,
-    SilenceMetrics,
-    caos_gradient,
-    caos_plus,
-    clamp,
-    # Helpers
-    clamp01,
-    # Compatibility wrappers
-    compute_caos_plus,
-    compute_caos_plus_complete,
-    # Core computation functions
-    compute_caos_plus_exponential,
-    compute_caos_plus_simple,
-    compute_ema_alpha,
-    geometric_mean,
-    harmonic_mean,
-    phi_caos,
-)
-from .orchestrator import OmegaMetaOrchestrator
-from .serialization import StateEncoder, state_decoder
+if TYPE_CHECKING:
+    from .artifacts import NumericVectorArtifact
+    from .caos import (
+        DEFAULT_GAMMA,
+        DEFAULT_KAPPA,
+        EPS,
+        AutoevolutionMetrics,
+        CAOSComponent,
+        CAOSComponents,
+        CAOSConfig,
+        CAOSFormula,
+        CAOSPlusEngine,
+        CAOSState,
+        CAOSTracker,
+        ConsistencyMetrics,
+        IncognoscibleMetrics,
+        SilenceMetrics,
+        caos_gradient,
+        caos_plus,
+        clamp,
+        clamp01,
+        compute_caos_plus,
+        compute_caos_plus_complete,
+        compute_caos_plus_exponential,
+        compute_caos_plus_exponential_batch,
+        compute_caos_plus_simple,
+        compute_ema_alpha,
+        geometric_mean,
+        harmonic_mean,
+        phi_caos,
+        phi_caos_batch,
+    )
+    from .orchestrator import OmegaMetaOrchestrator
+    from .serialization import StateEncoder, state_decoder
+
+# Loaded on first access (PEP 562); see penin._lazy
+_EXPORTS = {
+    "NumericVectorArtifact": ".artifacts",
+    "DEFAULT_GAMMA": ".caos",
+    "DEFAULT_KAPPA": ".caos",
+    "EPS": ".caos",
+    "AutoevolutionMetrics": ".caos",
+    "CAOSComponent": ".caos",
+    "CAOSComponents": ".caos",
+    "CAOSConfig": ".caos",
+    "CAOSFormula": ".caos",
+    "CAOSPlusEngine": ".caos",
+    "CAOSState": ".caos",
+    "CAOSTracker": ".caos",
+    "ConsistencyMetrics": ".caos",
+    "IncognoscibleMetrics": ".caos",
+    "SilenceMetrics": ".caos",
+    "caos_gradient": ".caos",
+    "caos_plus": ".caos",
+    "clamp": ".caos",
+    "clamp01": ".caos",
+    "compute_caos_plus": ".caos",
+    "compute_caos_plus_complete": ".caos",
+    "compute_caos_plus_exponential": ".caos",
+    "compute_caos_plus_exponential_batch": ".caos",
+    "compute_caos_plus_simple": ".caos",
+    "compute_ema_alpha": ".caos",
+    "geometric_mean": ".caos",
+    "harmonic_mean": ".caos",
+    "phi_caos": ".caos",
+    "phi_caos_batch": ".caos",
+    "OmegaMetaOrchestrator": ".orchestrator",
+    "StateEncoder": ".serialization",
+    "state_decoder": ".serialization",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 # Public API
 __all__ = [
@@ -94,6 +128,9 @@ __all__ = [
     "phi_caos",
     "compute_caos_plus_simple",
     "compute_caos_plus_complete",
+    # CAOS+ Batch kernels (NumPy)
+    "compute_caos_plus_exponential_batch",
+    "phi_caos_batch",
     # CAOS+ Compatibility
     "compute_caos_plus",
     "caos_plus",
@@ -84,7 +84,11 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 # Constants
 EPS = 1e-9  # Estabilizador numérico global
@@ -527,6 +531,90 @@ def phi_caos(
     return phi
 
 
+# =============================================================================
+# BATCH KERNELS (NumPy)
+# =============================================================================
+#
+# Vetorizados sobre populações de challengers/replays históricos. Entradas são
+# arrays (N,) ou escalares com broadcasting; a semântica de clamp é idêntica à
+# versão escalar (inclusive NaN → limite superior, como max(lo, min(hi, x))).
+# NumPy é importado sob demanda para não pesar no import de penin.core.caos.
+
+
+def _clip_batch(x: ArrayLike, lo: float, hi: float) -> np.ndarray:
+    """Clamp elemento a elemento com a mesma semântica de clamp() para NaN"""
+    import numpy as np
+
+    return np.fmax(lo, np.fmin(hi, np.asarray(x, dtype=np.float64)))
+
+
+def _caos_log_base_batch(
+    c: ArrayLike, a: ArrayLike, o: ArrayLike, s: ArrayLike, kappa: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Retorna (base, expoente) de (1 + κ·C·A)^(O·S) já clampados"""
+    import numpy as np
+
+    c = _clip_batch(c, 0.0, 1.0)
+    a = _clip_batch(a, 0.0, 1.0)
+    o = _clip_batch(o, 0.0, 1.0)
+    s = _clip_batch(s, 0.0, 1.0)
+
+    base = np.maximum(1.0 + EPS, 1.0 + kappa * c * a)
+    exp_term = _clip_batch(o * s, 0.0, 1.0)
+    return base, exp_term
+
+
+def compute_caos_plus_exponential_batch(
+    c: ArrayLike,
+    a: ArrayLike,
+    o: ArrayLike,
+    s: ArrayLike,
+    kappa: ArrayLike = DEFAULT_KAPPA,
+) -> np.ndarray:
+    """
+    Versão vetorizada de compute_caos_plus_exponential
+
+    Args:
+        c, a, o, s: Componentes (N,) ou escalares, clampados em [0, 1]
+        kappa: Ganho base (escalar ou (N,)), clampado em [1, 100]
+
+    Returns:
+        Array (N,) de CAOS⁺ ≥ 1.0
+    """
+    base, exp_term = _caos_log_base_batch(c, a, o, s, _clip_batch(kappa, 1.0, 100.0))
+    return base**exp_term
+
+
+def phi_caos_batch(
+    c: ArrayLike,
+    a: ArrayLike,
+    o: ArrayLike,
+    s: ArrayLike,
+    kappa: ArrayLike = DEFAULT_KAPPA,
+    kappa_max: float = 10.0,
+    gamma: ArrayLike = DEFAULT_GAMMA,
+) -> np.ndarray:
+    """
+    Versão vetorizada de phi_caos: tanh(γ·(O·S)·log(1 + κ·C·A))
+
+    Args:
+        c, a, o, s: Componentes (N,) ou escalares, clampados em [0, 1]
+        kappa: Ganho base (escalar ou (N,)), clampado em [1, kappa_max]
+        kappa_max: Limite máximo para kappa
+        gamma: Fator de saturação (escalar ou (N,)), clampado em [0.1, 2]
+
+    Returns:
+        Array (N,) de φ(CAOS⁺) em [0, 1]
+    """
+    import numpy as np
+
+    base, exp_term = _caos_log_base_batch(
+        c, a, o, s, _clip_batch(kappa, 1.0, kappa_max)
+    )
+    gamma = _clip_batch(gamma, 0.1, 2.0)
+    return np.tanh(gamma * (exp_term * np.log(base)))
+
+
 def compute_caos_plus_simple(
     C: float,
     A: float,
@@ -1020,6 +1108,9 @@ __all__ = [
     "compute_caos_plus_simple",
     "caos_plus_simple",  # Alias
     "compute_caos_plus_complete",
+    # Batch kernels (NumPy)
+    "compute_caos_plus_exponential_batch",
+    "phi_caos_batch",
     # Compatibility wrappers
     "compute_caos_plus",
     "caos_plus",
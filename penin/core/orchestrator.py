@@ -15,8 +15,6 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
-import numpy as np
-
 from penin.core.artifacts import NumericVectorArtifact
 from penin.core.serialization import StateEncoder, state_decoder
 
@@ -178,6 +176,7 @@ class OmegaMetaOrchestrator:
             ValueError: If knowledge_base is empty or contains no valid artifacts
         """
         import cma
+        import numpy as np
 
         # Step 1: Select starting point from knowledge base
         if not self.knowledge_base:
@@ -33,39 +33,99 @@ Princípios invioláveis (ΣEA/LO-14):
 - Nenhuma melhoria técnica compensa violação ética
 """
 
-from penin.core.caos import CAOSConfig, compute_caos_plus_complete
-from penin.equations.acfa_epv import EPVConfig, expected_possession_value
-from penin.equations.agape_index import AgapeConfig, compute_agape_index
-from penin.equations.anabolization import AnabolizationConfig, anabolize_penin
-from penin.equations.auto_tuning import AutoTuningConfig, auto_tune_hyperparams
-from penin.equations.death_equation import DeathConfig, death_gate_check
-from penin.equations.delta_linf_growth import (
-    DeltaLInfConfig,
-    delta_linf_compound_growth,
-)
-from penin.equations.ir_ic_contractive import ContractivityConfig, ir_to_ic
-from penin.equations.lyapunov_contractive import LyapunovConfig, lyapunov_check
-from penin.equations.oci_closure import OCIConfig, organizational_closure_index
-from penin.equations.omega_sea_total import OmegaSEAConfig, omega_sea_coherence
-from penin.equations.penin_equation import PeninState, penin_update
-from penin.equations.sigma_guard_gate import SigmaGuardConfig, sigma_guard_check
-from penin.math.linf import LInfConfig, compute_linf_meta
+from typing import TYPE_CHECKING
 
-# SR-Ω∞ moved to penin/math/sr_omega_infinity.py for better organization
-from penin.math.sr_omega_infinity import (
-    SRComponents,
-    SRConfig,
-    compute_sr_score,
-)
+from penin._lazy import lazy_exports
 
-# Backward compatibility aliases
-SRScore = SRComponents  # Type alias for compatibility
-compute_sr_omega_infinity = compute_sr_score  # Function alias
+if TYPE_CHECKING:
+    from penin.core.caos import CAOSConfig, compute_caos_plus_complete
+    from penin.equations.acfa_epv import (
+        EPVConfig,
+        expected_possession_value,
+        expected_possession_value_batch,
+    )
+    from penin.equations.agape_index import AgapeConfig, compute_agape_index
+    from penin.equations.anabolization import AnabolizationConfig, anabolize_penin
+    from penin.equations.auto_tuning import (
+        AutoTuningConfig,
+        BatchAutoTuner,
+        auto_tune_hyperparams,
+    )
+    from penin.equations.death_equation import DeathConfig, death_gate_check
+    from penin.equations.delta_linf_growth import (
+        DeltaLInfConfig,
+        delta_linf_compound_growth,
+    )
+    from penin.equations.ir_ic_contractive import ContractivityConfig, ir_to_ic
+    from penin.equations.lyapunov_contractive import LyapunovConfig, lyapunov_check
+    from penin.equations.oci_closure import OCIConfig, organizational_closure_index
+    from penin.equations.omega_sea_total import (
+        OmegaSEAConfig,
+        omega_sea_coherence,
+        omega_sea_coherence_batch,
+    )
+    from penin.equations.penin_equation import (
+        PeninState,
+        estimate_gradient_batch,
+        penin_update,
+    )
+    from penin.equations.sigma_guard_gate import SigmaGuardConfig, sigma_guard_check
+    from penin.math.linf import LInfConfig, compute_linf_meta
+    from penin.math.sr_omega_infinity import (
+        SRComponents,
+        SRConfig,
+        compute_sr_score,
+    )
+
+# Loaded on first access (PEP 562); see penin._lazy.
+_EXPORTS = {
+    "CAOSConfig": "penin.core.caos",
+    "compute_caos_plus_complete": "penin.core.caos",
+    "EPVConfig": "penin.equations.acfa_epv",
+    "expected_possession_value": "penin.equations.acfa_epv",
+    "expected_possession_value_batch": "penin.equations.acfa_epv",
+    "AgapeConfig": "penin.equations.agape_index",
+    "compute_agape_index": "penin.equations.agape_index",
+    "AnabolizationConfig": "penin.equations.anabolization",
+    "anabolize_penin": "penin.equations.anabolization",
+    "AutoTuningConfig": "penin.equations.auto_tuning",
+    "auto_tune_hyperparams": "penin.equations.auto_tuning",
+    "BatchAutoTuner": "penin.equations.auto_tuning",
+    "DeathConfig": "penin.equations.death_equation",
+    "death_gate_check": "penin.equations.death_equation",
+    "DeltaLInfConfig": "penin.equations.delta_linf_growth",
+    "delta_linf_compound_growth": "penin.equations.delta_linf_growth",
+    "ContractivityConfig": "penin.equations.ir_ic_contractive",
+    "ir_to_ic": "penin.equations.ir_ic_contractive",
+    "LyapunovConfig": "penin.equations.lyapunov_contractive",
+    "lyapunov_check": "penin.equations.lyapunov_contractive",
+    "OCIConfig": "penin.equations.oci_closure",
+    "organizational_closure_index": "penin.equations.oci_closure",
+    "OmegaSEAConfig": "penin.equations.omega_sea_total",
+    "omega_sea_coherence": "penin.equations.omega_sea_total",
+    "omega_sea_coherence_batch": "penin.equations.omega_sea_total",
+    "PeninState": "penin.equations.penin_equation",
+    "penin_update": "penin.equations.penin_equation",
+    "estimate_gradient_batch": "penin.equations.penin_equation",
+    "SigmaGuardConfig": "penin.equations.sigma_guard_gate",
+    "sigma_guard_check": "penin.equations.sigma_guard_gate",
+    "LInfConfig": "penin.math.linf",
+    "compute_linf_meta": "penin.math.linf",
+    # SR-Ω∞ moved to penin/math/sr_omega_infinity.py for better organization
+    "SRComponents": "penin.math.sr_omega_infinity",
+    "SRConfig": "penin.math.sr_omega_infinity",
+    "compute_sr_score": "penin.math.sr_omega_infinity",
+    # Backward compatibility aliases
+    "SRScore": "penin.math.sr_omega_infinity:SRComponents",
+    "compute_sr_omega_infinity": "penin.math.sr_omega_infinity:compute_sr_score",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Equation 1: Penin Equation
     "penin_update",
     "PeninState",
+    "estimate_gradient_batch",
     # SR-Ω∞
     "SRConfig",
     "SRComponents",
@@ -87,16 +147,19 @@ __all__ = [
     "ContractivityConfig",
     # Equation 7: ACFA EPV
     "expected_possession_value",
+    "expected_possession_value_batch",
     "EPVConfig",
     # Equation 8: Agápe Index
     "compute_agape_index",
     "AgapeConfig",
     # Equation 9: Ω-ΣEA Total
     "omega_sea_coherence",
+    "omega_sea_coherence_batch",
     "OmegaSEAConfig",
     # Equation 10: Auto-Tuning
     "auto_tune_hyperparams",
     "AutoTuningConfig",
+    "BatchAutoTuner",
     # Equation 11: Lyapunov Contractivity
     "lyapunov_check",
     "LyapunovConfig",
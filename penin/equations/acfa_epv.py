@@ -27,6 +27,7 @@ Features:
 - Policy extraction
 - Q-learning support
 - Integração com ACFA League (champion-challenger)
+- Kernels em lote (NumPy) para muitos estados/ações de uma vez
 """
 
 from __future__ import annotations
@@ -35,6 +36,8 @@ from collections.abc import Callable
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 
 @dataclass
 class EPVConfig:
@@ -46,7 +49,9 @@ class EPVConfig:
     exploration_rate: float = 0.1
 
 
-@dataclass
+# eq=False: states and actions are dict keys (identity hash), and their
+# dict fields would make a value-based hash impossible
+@dataclass(eq=False)
 class State:
     """Represents a system state."""
 
@@ -55,7 +60,7 @@ class State:
     timestamp: float
 
 
-@dataclass
+@dataclass(eq=False)
 class Action:
     """Represents a mutation/action."""
 
@@ -158,6 +163,83 @@ def compute_q_values(
     return q_values
 
 
+def expected_possession_value_batch(
+    rewards: np.ndarray,
+    transitions: np.ndarray,
+    next_values: np.ndarray,
+    config: EPVConfig | None = None,
+) -> np.ndarray:
+    """
+    Compute EPV r(s, a) + γ Σ_{s'} P(s'|s,a) v(s') for many state-action pairs.
+
+    Args:
+        rewards: Immediate rewards, broadcastable to ``transitions.shape[:-1]``
+            (e.g. (S, A))
+        transitions: Next-state probabilities with next states on the last
+            axis: a dense (S, A, S') tensor, or (..., K) probabilities of K
+            gathered successors per pair
+        next_values: v(s') as a (S',) vector shared by all pairs, or an array
+            broadcastable to ``transitions`` holding each successor's value
+        config: Optional configuration
+
+    Returns:
+        EPV scores with shape ``transitions.shape[:-1]``
+
+    Matches ``expected_possession_value`` row by row when ``next_values`` holds
+    ``_value_estimate`` of the successors (see ``state_values``).
+    """
+    config = config or EPVConfig()
+    transitions = np.asarray(transitions, dtype=float)
+    next_values = np.asarray(next_values, dtype=float)
+    if transitions.ndim == 0 or transitions.shape[-1] != next_values.shape[-1]:
+        raise ValueError(
+            f"transitions {transitions.shape} and next_values {next_values.shape} "
+            "disagree on the number of next states"
+        )
+
+    if next_values.ndim == 1:
+        future_value = transitions @ next_values
+    else:
+        future_value = np.einsum("...k,...k->...", transitions, next_values)
+    return np.asarray(rewards, dtype=float) + config.gamma * future_value
+
+
+def compute_q_values_batch(
+    rewards: np.ndarray,
+    transitions: np.ndarray,
+    next_values: np.ndarray,
+    config: EPVConfig | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Q-table for many states at once, with the greedy backup.
+
+    Args:
+        rewards: (S, A) immediate rewards
+        transitions: (S, A, S') or (S, A, K) next-state probabilities
+        next_values: Next-state values (see ``expected_possession_value_batch``)
+        config: Optional configuration
+
+    Returns:
+        Tuple of:
+        - Q(s, a) with shape (S, A), as ``compute_q_values`` per state
+        - v(s) = max_a Q(s, a), shape (S,)
+        - Greedy action index per state, shape (S,) (first best on ties)
+    """
+    q = expected_possession_value_batch(rewards, transitions, next_values, config)
+    if q.ndim != 2:
+        raise ValueError(f"Expected a (states, actions) Q-table, got shape {q.shape}")
+    greedy = np.argmax(q, axis=1)
+    return q, q[np.arange(q.shape[0]), greedy], greedy
+
+
+def state_values(states: list[State], config: EPVConfig | None = None) -> np.ndarray:
+    """Bootstrap values v(s) of ``states`` as an array (same heuristic as the scalar EPV)."""
+    config = config or EPVConfig()
+    return np.fromiter(
+        (_value_estimate(state, config) for state in states), dtype=float, count=len(states)
+    )
+
+
 def extract_policy(
     epv_scores: dict[Action, float], exploration_rate: float = 0.0
 ) -> Action:
@@ -187,5 +269,8 @@ __all__ = [
     "Action",
     "expected_possession_value",
     "compute_q_values",
+    "expected_possession_value_batch",
+    "compute_q_values_batch",
+    "state_values",
     "extract_policy",
 ]
@@ -23,12 +23,25 @@ Hiperparâmetros Tunáveis:
 - γ: Fator de saturação em SR-Ω∞
 
 Garantia: Regret sublinear O(√T) (Online Convex Optimization)
+
+Ajuste em lote (BatchAutoTuner):
+- SPSA: Δ ∈ {±1}^k, ĝ_i = (L(θ + c_tΔ) - L(θ - c_tΔ)) / (2 c_t Δ_i)
+  → 2 avaliações de L_meta por passo, independente de k
+- Diferenças centrais: 2k avaliações executadas em paralelo (process pool)
+- Diferenças progressivas: k + 1 avaliações com baseline L(θ) em cache
 """
 
 from __future__ import annotations
 
+import json
+import os
 from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import numpy as np
 
 
 @dataclass
@@ -75,6 +88,8 @@ class AutoTuner:
         self.config = config or AutoTuningConfig()
         self.hyperparams: dict[str, HyperparamState] = {}
         self.meta_loss_history: list = []
+        # name -> (loss_fn, value, L(value)) of the last baseline evaluation
+        self._baselines: dict[str, tuple[Callable[[float], float], float, float]] = {}
 
     def register_hyperparam(self, name: str, initial_value: float) -> None:
         """Register a hyperparameter for tuning."""
@@ -114,6 +129,7 @@ class AutoTuner:
         hyperparam_name: str,
         loss_fn: Callable[[float], float],
         delta: float = 1e-4,
+        baseline: float | None = None,
     ) -> float:
         """
         Estimate gradient via finite differences.
@@ -122,6 +138,9 @@ class AutoTuner:
             hyperparam_name: Name of hyperparameter
             loss_fn: Function that computes meta-loss given hyperparam value
             delta: Perturbation size
+            baseline: Known L(θ) at the current value. When omitted, the
+                last baseline is reused if ``loss_fn`` and the value are
+                unchanged, so only L(θ + δ) is evaluated.
 
         Returns:
             Estimated gradient
@@ -132,9 +151,17 @@ class AutoTuner:
         state = self.hyperparams[hyperparam_name]
         current_value = state.current_value
 
+        if baseline is None:
+            cached = self._baselines.get(hyperparam_name)
+            if cached is not None and cached[0] is loss_fn and cached[1] == current_value:
+                baseline = cached[2]
+            else:
+                baseline = loss_fn(current_value)
+                self._baselines[hyperparam_name] = (loss_fn, current_value, baseline)
+
         # Forward difference: (L(θ + δ) - L(θ)) / δ
         loss_plus = loss_fn(current_value + delta)
-        loss_current = loss_fn(current_value)
+        loss_current = baseline
 
         grad = (loss_plus - loss_current) / delta
 
@@ -252,9 +279,237 @@ def auto_tune_hyperparams(
     return updated
 
 
+MetaLossFn = Callable[[dict[str, float]], float]
+
+GRADIENT_METHODS = ("spsa", "central", "forward")
+
+
+@dataclass
+class BatchTuningConfig:
+    """Configuration for batch (all hyperparameters at once) tuning."""
+
+    method: str = "spsa"  # "spsa", "central" or "forward"
+    perturbation: float = 0.01  # c_0, as a fraction of each bound range
+    decay: float = 0.101  # c_t = c_0 / (t + 1)^decay (Spall's gamma)
+    spsa_samples: int = 1  # ±Δ pairs averaged per SPSA step
+    n_workers: int = 1  # > 1: evaluate meta-losses on a process pool
+    seed: int | None = None
+
+
+class BatchAutoTuner(AutoTuner):
+    """
+    Tunes every registered hyperparameter from one joint meta-loss.
+
+    ``loss_fn`` maps ``{name: value}`` to L_meta. Gradients come from
+    simultaneous perturbation (SPSA: two evaluations per step regardless of
+    the number of hyperparameters), central differences (2k evaluations)
+    or forward differences (k evaluations plus the cached baseline). The
+    evaluations of one step are independent and run concurrently on
+    ``executor`` or on a process pool of ``n_workers`` (``loss_fn`` must
+    then be picklable, e.g. a module-level function).
+
+    Updates go through ``update_hyperparam`` unchanged: same warmup,
+    AdaGrad step size and bounds projection as ``AutoTuner``.
+    """
+
+    def __init__(
+        self,
+        config: AutoTuningConfig | None = None,
+        batch_config: BatchTuningConfig | None = None,
+        executor: Executor | None = None,
+    ):
+        super().__init__(config)
+        self.batch_config = batch_config or BatchTuningConfig()
+        if self.batch_config.method not in GRADIENT_METHODS:
+            raise ValueError(
+                f"Unknown gradient method {self.batch_config.method!r}; "
+                f"expected one of {GRADIENT_METHODS}"
+            )
+        self.rng = np.random.default_rng(self.batch_config.seed)
+        self.iteration = 0  # gradient steps taken (drives c_t)
+        self.evaluations = 0  # meta-loss calls made
+        self._executor = executor
+        self._pool: ProcessPoolExecutor | None = None
+        self._baseline: tuple[MetaLossFn, tuple[float, ...], float] | None = None
+
+    # Evaluation ---------------------------------------------------------
+
+    def _executor_for(self, count: int) -> Executor | None:
+        if count < 2:
+            return None
+        if self._executor is not None:
+            return self._executor
+        if self.batch_config.n_workers > 1:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.batch_config.n_workers)
+            return self._pool
+        return None
+
+    def _evaluate(self, loss_fn: MetaLossFn, points: np.ndarray) -> np.ndarray:
+        """L_meta at each row of ``points`` (concurrently when a pool is set)"""
+        names = list(self.hyperparams)
+        candidates = [dict(zip(names, row, strict=True)) for row in points.tolist()]
+        pool = self._executor_for(len(candidates))
+        if pool is not None:
+            losses = list(pool.map(loss_fn, candidates))
+        else:
+            losses = [loss_fn(candidate) for candidate in candidates]
+        self.evaluations += len(candidates)
+        return np.asarray(losses, dtype=np.float64)
+
+    def baseline_loss(self, loss_fn: MetaLossFn) -> float:
+        """L_meta(θ) at the current values, evaluated once per (loss_fn, θ)"""
+        theta = tuple(self.get_current_values().values())
+        if self._baseline is not None and self._baseline[0] is loss_fn and self._baseline[1] == theta:
+            return self._baseline[2]
+        loss = float(self._evaluate(loss_fn, np.asarray([theta]))[0])
+        self._baseline = (loss_fn, theta, loss)
+        return loss
+
+    # Gradient estimation ------------------------------------------------
+
+    def _bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        lower = np.full(len(self.hyperparams), -np.inf)
+        upper = np.full(len(self.hyperparams), np.inf)
+        for i, name in enumerate(self.hyperparams):
+            if name in self.config.bounds:
+                lower[i], upper[i] = self.config.bounds[name]
+        return lower, upper
+
+    def perturbation_sizes(self) -> np.ndarray:
+        """c_t per hyperparameter: a fraction of its bound range (or of max(|θ|, 1))"""
+        theta = np.fromiter(self.get_current_values().values(), dtype=np.float64)
+        lower, upper = self._bounds()
+        span = np.where(np.isfinite(upper - lower), upper - lower, np.maximum(np.abs(theta), 1.0))
+        cfg = self.batch_config
+        return cfg.perturbation / (self.iteration + 1) ** cfg.decay * span
+
+    def estimate_gradients(self, loss_fn: MetaLossFn) -> dict[str, float]:
+        """
+        Estimate ∇θ L_meta for all registered hyperparameters.
+
+        Perturbed points are projected to the bounds and each difference is
+        divided by the realized (not the nominal) step, so estimates stay
+        valid at the boundary. Gradients are clipped to ``grad_clip``.
+        """
+        names = list(self.hyperparams)
+        k = len(names)
+        if k == 0:
+            return {}
+        theta = np.fromiter(self.get_current_values().values(), dtype=np.float64, count=k)
+        lower, upper = self._bounds()
+        steps = self.perturbation_sizes()
+        method = self.batch_config.method
+
+        if method == "spsa":
+            samples = max(1, self.batch_config.spsa_samples)
+            delta = self.rng.integers(0, 2, size=(samples, k)) * 2.0 - 1.0
+            plus = np.clip(theta + steps * delta, lower, upper)
+            minus = np.clip(theta - steps * delta, lower, upper)
+            losses = self._evaluate(loss_fn, np.concatenate([plus, minus]))
+            diff = losses[:samples] - losses[samples:]
+            grad = np.mean(diff[:, None] / (plus - minus), axis=0)
+        elif method == "central":
+            eye = np.diag(steps)
+            plus = np.clip(theta + eye, lower, upper)
+            minus = np.clip(theta - eye, lower, upper)
+            losses = self._evaluate(loss_fn, np.concatenate([plus, minus]))
+            grad = (losses[:k] - losses[k:]) / np.diag(plus - minus)
+        else:
+            # Step backwards where a forward step would leave the bounds
+            signed = np.where(theta + steps > upper, -steps, steps)
+            points = np.clip(theta + np.diag(signed), lower, upper)
+            base = self.baseline_loss(loss_fn)
+            losses = self._evaluate(loss_fn, points)
+            grad = (losses - base) / np.diag(points - theta)
+
+        grad = np.clip(np.nan_to_num(grad), -self.config.grad_clip, self.config.grad_clip)
+        self.iteration += 1
+        return dict(zip(names, grad.tolist(), strict=True))
+
+    def step(self, loss_fn: MetaLossFn) -> dict[str, float]:
+        """
+        One tuning step over all hyperparameters.
+
+        While every hyperparameter is still in warmup the gradient would be
+        discarded, so no meta-loss is evaluated.
+
+        Returns:
+            Updated hyperparameter values
+        """
+        if all(s.step_count < self.config.warmup_steps for s in self.hyperparams.values()):
+            gradients = dict.fromkeys(self.hyperparams, 0.0)
+        else:
+            gradients = self.estimate_gradients(loss_fn)
+        for name, gradient in gradients.items():
+            self.update_hyperparam(name, gradient)
+        return self.get_current_values()
+
+    # Checkpointing ------------------------------------------------------
+
+    def state_dict(self) -> dict[str, Any]:
+        """JSON-serializable tuner state (values, AdaGrad sums, counters, RNG)"""
+        return {
+            "hyperparams": {
+                name: {
+                    "current_value": state.current_value,
+                    "grad_sum_squares": state.grad_sum_squares,
+                    "step_count": state.step_count,
+                    "history": list(state.history),
+                }
+                for name, state in self.hyperparams.items()
+            },
+            "iteration": self.iteration,
+            "evaluations": self.evaluations,
+            "rng": self.rng.bit_generator.state,
+        }
+
+    def load_state_dict(self, state: dict[str, Any]) -> None:
+        """Restore a ``state_dict()`` snapshot (replaces registered hyperparams)"""
+        self.hyperparams = {
+            name: HyperparamState(
+                name=name,
+                current_value=float(h["current_value"]),
+                grad_sum_squares=float(h["grad_sum_squares"]),
+                step_count=int(h["step_count"]),
+                history=list(h.get("history", [])),
+            )
+            for name, h in state["hyperparams"].items()
+        }
+        self.iteration = int(state.get("iteration", 0))
+        self.evaluations = int(state.get("evaluations", 0))
+        if "rng" in state:
+            self.rng.bit_generator.state = state["rng"]
+        self._baseline = None
+
+    def save_checkpoint(self, path: str | Path) -> None:
+        """Atomically write ``state_dict()`` as JSON"""
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(json.dumps(self.state_dict()), encoding="utf-8")
+        os.replace(tmp, path)
+
+    def load_checkpoint(self, path: str | Path) -> None:
+        self.load_state_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+    def close(self) -> None:
+        """Shut down the process pool created for ``n_workers``"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> BatchAutoTuner:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 __all__ = [
     "AutoTuningConfig",
     "HyperparamState",
     "AutoTuner",
     "auto_tune_hyperparams",
+    "BatchTuningConfig",
+    "BatchAutoTuner",
 ]
@@ -26,12 +26,18 @@ Onde:
 Agregação: Harmônica ponderada (bottleneck = worst module dominates)
 
 Gate: G_t < threshold → bloqueia promoção global
+
+Variantes ``*_batch`` avaliam N candidatos de uma vez a partir de uma matriz
+(N, M) de scores.
 """
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class OmegaSEAConfig:
@@ -167,6 +173,93 @@ def diagnose_bottleneck(
     return bottleneck_module, bottleneck_score
 
 
+def _module_columns(
+    scores: np.ndarray, modules: Sequence[str] | None, config: OmegaSEAConfig
+) -> tuple[np.ndarray, list[str]]:
+    """Validate a (N, M) score matrix and name its columns."""
+    scores = np.asarray(scores, dtype=float)
+    if scores.ndim != 2:
+        raise ValueError(f"Expected (candidates, modules) scores, got shape {scores.shape}")
+    modules = list(config.module_weights) if modules is None else list(modules)
+    if len(modules) != scores.shape[1]:
+        raise ValueError(f"{len(modules)} module names for {scores.shape[1]} score columns")
+    return scores, modules
+
+
+def omega_sea_coherence_batch(
+    scores: np.ndarray,
+    modules: Sequence[str] | None = None,
+    config: OmegaSEAConfig | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Compute global coherence for N candidates at once.
+
+    Args:
+        scores: (N, M) module scores in [0, 1], one row per candidate
+        modules: Module name of each column (default: ``config.module_weights``
+            order); columns outside the weights are validated but ignored,
+            as in ``omega_sea_coherence``
+        config: Optional configuration
+
+    Returns:
+        Tuple of:
+        - G_t per candidate, shape (N,)
+        - Gate pass/fail per candidate, shape (N,)
+
+    Raises:
+        ValueError: If any score is out of [0, 1] or a weighted module is missing
+    """
+    config = config or OmegaSEAConfig()
+    scores, modules = _module_columns(scores, modules, config)
+
+    missing = set(config.module_weights) - set(modules)
+    if missing:
+        raise ValueError(f"Missing required modules: {missing}")
+
+    in_range = (scores >= 0.0) & (scores <= 1.0)
+    if not in_range.all():
+        row, col = np.argwhere(~in_range)[0]
+        raise ValueError(
+            f"Module {modules[col]} score {scores[row, col]} (candidate {row}) must be in [0, 1]"
+        )
+
+    weights = np.array([config.module_weights.get(m, 0.0) for m in modules])
+    harmonic_sum = (1.0 / np.maximum(scores, config.epsilon)) @ weights
+
+    with np.errstate(divide="ignore"):
+        G_t = np.where(harmonic_sum == 0, 0.0, 1.0 / harmonic_sum)
+    G_t = np.clip(G_t, 0.0, 1.0)
+
+    gate_pass = (G_t >= config.min_coherence_threshold) & (harmonic_sum != 0)
+    return G_t, gate_pass
+
+
+def diagnose_bottleneck_batch(
+    scores: np.ndarray,
+    modules: Sequence[str] | None = None,
+    config: OmegaSEAConfig | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Identify the bottleneck module of N candidates at once.
+
+    Args:
+        scores: (N, M) module scores, one row per candidate
+        modules: Module name of each column (default: ``config.module_weights`` order)
+        config: Optional configuration
+
+    Returns:
+        Tuple of (bottleneck module names, their unweighted scores), shape (N,)
+        each; ties go to the first column, as in ``diagnose_bottleneck``
+    """
+    config = config or OmegaSEAConfig()
+    scores, modules = _module_columns(scores, modules, config)
+
+    weights = np.array([config.module_weights.get(m, 1.0) for m in modules])
+    bottleneck = np.argmin(scores * weights, axis=1)
+    names = np.array(modules, dtype=object)[bottleneck]
+    return names, scores[np.arange(scores.shape[0]), bottleneck]
+
+
 def compute_resilience(
     module_healths: list[ModuleHealth], config: OmegaSEAConfig | None = None
 ) -> float:
@@ -195,6 +288,8 @@ __all__ = [
     "OmegaSEAConfig",
     "ModuleHealth",
     "omega_sea_coherence",
+    "omega_sea_coherence_batch",
     "diagnose_bottleneck",
+    "diagnose_bottleneck_batch",
     "compute_resilience",
 ]
@@ -180,6 +180,10 @@ def estimate_gradient(
 
     Returns:
         Gradiente estimado G (mesma shape que state.parameters)
+
+    As perturbações são avaliadas num único estado-sonda (um ``clone`` por
+    chamada, não um por dimensão/amostra) cujos parâmetros são trocados a
+    cada avaliação. Para muitas avaliações, ver ``estimate_gradient_batch``.
     """
     if method == GradientMethod.FINITE_DIFFERENCE:
         # Diferenças finitas numéricas (simples, robusto)
@@ -187,10 +191,11 @@ def estimate_gradient(
         grad = np.zeros_like(state.parameters)
         base_value = objective_fn(state, evidence)
 
+        probe = state.clone()
         for i in range(len(state.parameters)):
-            state_plus = state.clone()
-            state_plus.parameters[i] += epsilon
-            value_plus = objective_fn(state_plus, evidence)
+            probe.parameters[i] += epsilon
+            value_plus = objective_fn(probe, evidence)
+            probe.parameters[i] = state.parameters[i]
             grad[i] = (value_plus - base_value) / epsilon
 
         return grad
@@ -201,18 +206,17 @@ def estimate_gradient(
         sigma = 0.1
         grad = np.zeros_like(state.parameters)
 
+        probe = state.clone()
         for _ in range(n_samples):
             noise = np.random.randn(*state.parameters.shape) * sigma
 
             # Forward perturbation
-            state_plus = state.clone()
-            state_plus.parameters += noise
-            value_plus = objective_fn(state_plus, evidence)
+            probe.parameters = state.parameters + noise
+            value_plus = objective_fn(probe, evidence)
 
             # Backward perturbation
-            state_minus = state.clone()
-            state_minus.parameters -= noise
-            value_minus = objective_fn(state_minus, evidence)
+            probe.parameters = state.parameters - noise
+            value_minus = objective_fn(probe, evidence)
 
             # Gradient estimate
             grad += noise * (value_plus - value_minus) / (2 * sigma**2)
@@ -246,6 +250,109 @@ def estimate_gradient(
         )
 
 
+def _rows_per_call(batch_size: int, params: np.ndarray, total: int) -> int:
+    """Linhas por chamada da função em lote (padrão: ~2 MiB de parâmetros, cabe em cache)"""
+    if batch_size > 0:
+        return batch_size
+    return max(1, min(total, (1 << 18) // max(1, params.size)))
+
+
+def estimate_gradient_batch(
+    state: PeninState,
+    evidence: Evidence,
+    policy: ControlPolicy,
+    objective_batch_fn: Callable[[np.ndarray, Evidence], np.ndarray],
+    method: GradientMethod = GradientMethod.ANALYTICAL,
+    *,
+    n_samples: int = 20,
+    sigma: float = 0.1,
+    epsilon: float = 1e-5,
+    batch_size: int = 0,
+    rng: np.random.Generator | None = None,
+) -> np.ndarray:
+    """
+    Versão em lote de ``estimate_gradient``: sem clones de ``PeninState``
+
+    ``objective_batch_fn(rows, evidence)`` recebe uma matriz (m, *shape) de
+    parâmetros perturbados e devolve os m valores de J. Diferenças finitas
+    empilham θ + ε·e_i para todas as dimensões; ES empilha uma única matriz
+    de ruído (n_samples, *shape) em pares antitéticos θ ± σ·z.
+
+    Args:
+        state: Estado atual I_t
+        evidence: Evidências E_t
+        policy: Políticas P_t
+        objective_batch_fn: J vetorizada sobre linhas de parâmetros
+        method: Método de estimação (ANALYTICAL/TD_LEARNING usam diferenças finitas)
+        n_samples: Pares antitéticos do ES
+        sigma: Escala do ruído do ES
+        epsilon: Passo das diferenças finitas
+        batch_size: Linhas por chamada de ``objective_batch_fn`` (0: ~2 MiB por chamada)
+        rng: Gerador do ruído do ES (padrão: ``np.random`` global, mesma
+            sequência que ``estimate_gradient`` com a mesma semente)
+
+    Returns:
+        Gradiente estimado G (mesma shape que state.parameters); com os
+        valores padrão coincide com ``estimate_gradient`` (tolerância 1e-9)
+    """
+    params = state.parameters
+    if method == GradientMethod.POLICY_GRADIENT:
+        # Não avalia J: nada a vetorizar
+        return estimate_gradient(state, evidence, policy, objective_batch_fn, method)
+
+    if method == GradientMethod.EVOLUTION_STRATEGY:
+        if rng is None:
+            noise = np.random.randn(n_samples, *params.shape) * sigma
+        else:
+            noise = rng.standard_normal((n_samples, *params.shape)) * sigma
+        value_plus = np.empty(n_samples)
+        value_minus = np.empty(n_samples)
+        step = _rows_per_call(batch_size, params, n_samples)
+        for start in range(0, n_samples, step):
+            chunk = noise[start : start + step]
+            end = start + len(chunk)
+            value_plus[start:end] = objective_batch_fn(params + chunk, evidence)
+            value_minus[start:end] = objective_batch_fn(params - chunk, evidence)
+        coef = (value_plus - value_minus) / (2 * sigma**2)
+        grad = np.tensordot(coef, noise, axes=1) / n_samples
+        return grad.astype(params.dtype, copy=False)
+
+    # FINITE_DIFFERENCE (e fallback de ANALYTICAL/TD_LEARNING)
+    n = len(params)
+    base_value = objective_batch_fn(params[np.newaxis], evidence)[0]
+    grad = np.zeros_like(params)
+    step = _rows_per_call(batch_size, params, n)
+    for start in range(0, n, step):
+        m = min(step, n - start)
+        rows = np.repeat(params[np.newaxis], m, axis=0)
+        rows[np.arange(m), np.arange(start, start + m)] += epsilon
+        values = objective_batch_fn(rows, evidence)
+        grad[start : start + m] = ((values - base_value) / epsilon).reshape(
+            (m,) + (1,) * (params.ndim - 1)
+        )
+    return grad
+
+
+def rowwise_objective(
+    objective_fn: Callable[[PeninState, Evidence], float], state: PeninState
+) -> Callable[[np.ndarray, Evidence], np.ndarray]:
+    """
+    Adapta J(I; E) escalar para ``estimate_gradient_batch``
+
+    Avalia uma linha por vez num único estado-sonda clonado de ``state``.
+    """
+    probe = state.clone()
+
+    def objective_batch_fn(rows: np.ndarray, evidence: Evidence) -> np.ndarray:
+        values = np.empty(len(rows))
+        for k, row in enumerate(rows):
+            probe.parameters = row
+            values[k] = objective_fn(probe, evidence)
+        return values
+
+    return objective_batch_fn
+
+
 def project_to_safe_set(
     state: PeninState,
     constraints: ProjectionConstraints,
@@ -5,10 +5,15 @@ PENIN-Ω IA³ - Leis Originárias (ΣEA/LO-14)
 Ethical foundations and fail-closed validation system.
 """
 
+import functools
+import operator
+import string
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any
 
+import numpy as np
 from pydantic import BaseModel, Field
 
 
@@ -109,6 +114,343 @@ class EthicsValidationResult(BaseModel):
     recommendation: str
 
 
+@dataclass(frozen=True)
+class EthicsRule:
+    """Declarative Origin Law check.
+
+    The rule is violated when ``op`` holds on ``fields``:
+    ``"any"`` (any flag set), ``"not"`` (flag unset), or ``">"``/``"<"``
+    against the EthicsValidator attribute named by ``threshold``.
+    ``description`` is a ``str.format`` template over the context fields and
+    ``evidence`` maps evidence keys to context fields.
+    """
+
+    law: OriginLaw
+    severity: ViolationSeverity
+    fields: tuple[str, ...]
+    op: str
+    description: str
+    evidence: tuple[tuple[str, str], ...]
+    suggested_fix: str
+    threshold: str | None = None
+
+
+LO14_RULES: tuple[EthicsRule, ...] = (
+    EthicsRule(
+        law=OriginLaw.LO_01,
+        severity=ViolationSeverity.CRITICAL,
+        fields=("contains_religious_claims", "claims_consciousness"),
+        op="any",
+        description="Sistema contém afirmações de consciência/divindade",
+        evidence=(("religious", "contains_religious_claims"),),
+        suggested_fix="Remover referências a consciência real",
+    ),
+    EthicsRule(
+        law=OriginLaw.LO_03,
+        severity=ViolationSeverity.CRITICAL,
+        fields=("physical_risk",),
+        op=">",
+        threshold="PHYSICAL_RISK_MAX",
+        description="Risco físico: {physical_risk:.3f}",
+        evidence=(("risk", "physical_risk"),),
+        suggested_fix="Eliminar possibilidade de dano físico",
+    ),
+    EthicsRule(
+        law=OriginLaw.LO_05,
+        severity=ViolationSeverity.CRITICAL,
+        fields=("privacy_score",),
+        op="<",
+        threshold="PRIVACY_MIN",
+        description="Privacidade insuficiente: {privacy_score:.3f}",
+        evidence=(("score", "privacy_score"),),
+        suggested_fix="Fortalecer proteções de privacidade",
+    ),
+    EthicsRule(
+        law=OriginLaw.LO_07,
+        severity=ViolationSeverity.CRITICAL,
+        fields=("consent_obtained",),
+        op="not",
+        description="Consentimento não obtido",
+        evidence=(("consent", "consent_obtained"),),
+        suggested_fix="Obter consentimento explícito",
+    ),
+    EthicsRule(
+        law=OriginLaw.LO_09,
+        severity=ViolationSeverity.HIGH,
+        fields=("fairness_score",),
+        op="<",
+        threshold="FAIRNESS_MIN",
+        description="Fairness insuficiente: {fairness_score:.3f}",
+        evidence=(("score", "fairness_score"),),
+        suggested_fix="Corrigir viés discriminatório",
+    ),
+)
+
+_RULE_OPS: dict[str, Callable[[Any, Any], Any]] = {
+    ">": operator.gt,
+    "<": operator.lt,
+}
+
+_SCORE_EPSILON = 1e-6
+
+
+def _recommendation(critical: bool, violations: bool, warnings: bool) -> str:
+    if critical:
+        return "ROLLBACK"
+    if violations:
+        return "BLOCK"
+    if warnings:
+        return "REVIEW"
+    return "PROMOTE"
+
+
+def _context_defaults() -> dict[str, Any]:
+    defaults = {}
+    for name, info in DecisionContext.model_fields.items():
+        if not info.is_required():
+            defaults[name] = info.get_default(call_default_factory=True)
+    return defaults
+
+
+def _context_bounds() -> dict[str, tuple[float | None, float | None]]:
+    bounds = {}
+    for name, info in DecisionContext.model_fields.items():
+        ge = next((m.ge for m in info.metadata if hasattr(m, "ge")), None)
+        le = next((m.le for m in info.metadata if hasattr(m, "le")), None)
+        if ge is not None or le is not None:
+            bounds[name] = (ge, le)
+    return bounds
+
+
+class CompiledEthicsRules:
+    """
+    Rule table compiled once into a table of predicate closures.
+
+    Fields, operators and thresholds are bound into each predicate at
+    compile time, so evaluation does no attribute or threshold lookups.
+    ``evaluate`` checks a single decision and ``evaluate_batch`` checks N
+    decisions given as columns.
+    """
+
+    def __init__(
+        self,
+        rules: tuple[EthicsRule, ...] = LO14_RULES,
+        thresholds: Mapping[str, float] | None = None,
+    ):
+        if len(rules) > 16:
+            raise ValueError("At most 16 rules fit the uint16 violation mask")
+        thresholds = dict(thresholds or {})
+        missing = {r.threshold for r in rules if r.threshold} - set(thresholds)
+        if missing:
+            raise ValueError(f"Missing rule thresholds: {', '.join(sorted(missing))}")
+
+        self.rules = rules
+        self.thresholds = thresholds
+        self._defaults = _context_defaults()
+        self._bounds = _context_bounds()
+        self._critical = [r.severity == ViolationSeverity.CRITICAL for r in rules]
+        self._check = self._compile()
+
+    def _compile(self) -> Callable[[Mapping[str, Any], bool], tuple[list, bool]]:
+        """Build the (predicate, rule, critical) table and its check loop"""
+        table = []
+        for r, rule in enumerate(self.rules):
+            referenced = {f for _, f, _, _ in string.Formatter().parse(rule.description) if f}
+            referenced |= set(rule.fields) | {f for _, f in rule.evidence}
+            unknown = sorted(referenced - set(DecisionContext.model_fields))
+            if unknown:
+                raise ValueError(f"Unknown context fields: {', '.join(unknown)}")
+            table.append((self._predicate(rule), rule, self._critical[r]))
+        table = tuple(table)
+        violation = self._violation
+
+        def check(v: Mapping[str, Any], fail_fast: bool) -> tuple[list, bool]:
+            violations = []
+            critical = False
+            for violated, rule, is_critical in table:
+                if violated(v):
+                    violations.append(violation(rule, v))
+                    if is_critical:
+                        critical = True
+                        if fail_fast:
+                            break
+            return violations, critical
+
+        return check
+
+    def _predicate(self, rule: EthicsRule) -> Callable[[Mapping[str, Any]], bool]:
+        """Closure that is true when ``rule`` is violated by a context mapping"""
+        fields = rule.fields
+        if rule.op == "any":
+            return lambda v: any(v[f] for f in fields)
+        if rule.op == "not":
+            field = fields[0]
+            return lambda v: not v[field]
+        if rule.op in _RULE_OPS:
+            op, field, threshold = _RULE_OPS[rule.op], fields[0], self.thresholds[rule.threshold]
+            return lambda v: op(v[field], threshold)
+        raise ValueError(f"Unknown rule op: {rule.op}")
+
+    @staticmethod
+    def _violation(rule: EthicsRule, values: Mapping[str, Any]) -> EthicalViolation:
+        return EthicalViolation(
+            law=rule.law,
+            severity=rule.severity,
+            description=rule.description.format_map(values),
+            evidence={key: values[f] for key, f in rule.evidence},
+            suggested_fix=rule.suggested_fix,
+        )
+
+    @staticmethod
+    def _score(v: Mapping[str, Any]) -> float:
+        """Harmonic mean of the five ethical sub-scores"""
+        eps = _SCORE_EPSILON
+        return 5 / (
+            1.0 / max(eps, v["privacy_score"])
+            + 1.0 / max(eps, v["fairness_score"])
+            + 1.0 / max(eps, v["transparency_score"])
+            + 1.0 / max(eps, 1.0 - v["physical_risk"])
+            + 1.0 / max(eps, 1.0 - v["emotional_risk"])
+        )
+
+    def evaluate(
+        self,
+        context: DecisionContext | Mapping[str, Any],
+        fail_fast: bool = False,
+        validate: bool = True,
+    ) -> EthicsValidationResult:
+        """
+        Check one decision against every rule.
+
+        Args:
+            context: DecisionContext, or a mapping of its fields
+            fail_fast: Stop at the first CRITICAL violation
+            validate: When False, a mapping context is trusted as-is and no
+                DecisionContext is built (missing fields take its defaults)
+        """
+        if isinstance(context, DecisionContext):
+            values = context.__dict__
+        elif validate:
+            values = DecisionContext(**context).__dict__
+        else:
+            values = {**self._defaults, **context}
+
+        violations, critical = self._check(values, fail_fast)
+        return EthicsValidationResult(
+            passed=not violations,
+            violations=violations,
+            warnings=[],
+            score=self._score(values),
+            recommendation=_recommendation(critical, bool(violations), False),
+        )
+
+    def evaluate_batch(
+        self,
+        columns: Mapping[str, Any],
+        fail_fast: bool = False,
+        validate: bool = True,
+    ) -> "EthicsBatchResult":
+        """
+        Check N decisions given as columns of DecisionContext fields.
+
+        Missing columns take the DecisionContext defaults. With ``validate``
+        the Pydantic range constraints are checked on whole columns.
+        """
+        arrays = {name: np.asarray(value) for name, value in columns.items()}
+        shapes = {a.shape for a in arrays.values()}
+        if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+            raise ValueError("Context columns must be 1-D arrays of equal length")
+        n = next(iter(shapes))[0]
+
+        for name, default in self._defaults.items():
+            if name not in arrays and isinstance(default, bool | int | float):
+                arrays[name] = np.full(n, default)
+
+        if validate:
+            for name, (ge, le) in self._bounds.items():
+                column = arrays[name].astype(np.float64)
+                if (ge is not None and (column < ge).any()) or (
+                    le is not None and (column > le).any()
+                ):
+                    raise ValueError(f"{name} outside [{ge}, {le}]")
+
+        violation_mask = np.zeros(n, dtype=np.uint16)
+        critical = np.zeros(n, dtype=bool)
+        stopped = np.zeros(n, dtype=bool)
+        for r, rule in enumerate(self.rules):
+            if rule.op == "any":
+                violated = np.logical_or.reduce([arrays[f].astype(bool) for f in rule.fields])
+            elif rule.op == "not":
+                violated = ~arrays[rule.fields[0]].astype(bool)
+            else:
+                violated = _RULE_OPS[rule.op](
+                    arrays[rule.fields[0]], self.thresholds[rule.threshold]
+                )
+            if fail_fast:
+                violated = violated & ~stopped
+            violation_mask |= np.where(violated, np.uint16(1 << r), np.uint16(0))
+            if self._critical[r]:
+                critical |= violated
+                if fail_fast:
+                    stopped |= violated
+
+        # Same term order as _score
+        eps = _SCORE_EPSILON
+        total = 1.0 / np.maximum(eps, arrays["privacy_score"].astype(np.float64))
+        total = total + 1.0 / np.maximum(eps, arrays["fairness_score"].astype(np.float64))
+        total = total + 1.0 / np.maximum(eps, arrays["transparency_score"].astype(np.float64))
+        total = total + 1.0 / np.maximum(eps, 1.0 - arrays["physical_risk"].astype(np.float64))
+        total = total + 1.0 / np.maximum(eps, 1.0 - arrays["emotional_risk"].astype(np.float64))
+
+        return EthicsBatchResult(
+            rules=self.rules,
+            violation_mask=violation_mask,
+            critical=critical,
+            score=5 / total,
+            columns=arrays,
+        )
+
+
+@dataclass
+class EthicsBatchResult:
+    """Columnar ethics results; per-row results are built on demand"""
+
+    rules: tuple[EthicsRule, ...]
+    violation_mask: np.ndarray  # (N,) uint16, bit r set when rule r was violated
+    critical: np.ndarray  # (N,) bool
+    score: np.ndarray  # (N,)
+    columns: dict[str, np.ndarray]
+
+    def __len__(self) -> int:
+        return int(self.violation_mask.shape[0])
+
+    @property
+    def passed(self) -> np.ndarray:
+        return self.violation_mask == 0
+
+    def recommendation(self, index: int) -> str:
+        return _recommendation(
+            bool(self.critical[index]), bool(self.violation_mask[index]), False
+        )
+
+    def result(self, index: int) -> EthicsValidationResult:
+        """Materialize row ``index`` as an EthicsValidationResult"""
+        mask = int(self.violation_mask[index])
+        values = {name: column[index].item() for name, column in self.columns.items()}
+        violations = [
+            CompiledEthicsRules._violation(rule, values)
+            for r, rule in enumerate(self.rules)
+            if mask >> r & 1
+        ]
+        return EthicsValidationResult(
+            passed=not violations,
+            violations=violations,
+            warnings=[],
+            score=float(self.score[index]),
+            recommendation=self.recommendation(index),
+        )
+
+
 class EthicsValidator:
     """Comprehensive validator for all 14 Origin Laws (ΣEA/LO-14)"""
 
@@ -118,102 +460,56 @@ class EthicsValidator:
     PHYSICAL_RISK_MAX = 0.01
     EMOTIONAL_RISK_MAX = 0.05
 
+    RULES: tuple[EthicsRule, ...] = LO14_RULES
+
+    @classmethod
+    def compiled_rules(cls) -> CompiledEthicsRules:
+        """Rule engine for this class's RULES and current thresholds (built once per pair)"""
+        rules = cls.RULES
+        thresholds = tuple((r.threshold, getattr(cls, r.threshold)) for r in rules if r.threshold)
+        return _compiled_rules(cls, id(rules), thresholds)
+
     @classmethod
-    def validate_all(cls, context: DecisionContext) -> EthicsValidationResult:
+    def validate_all(
+        cls, context: DecisionContext, fail_fast: bool = False
+    ) -> EthicsValidationResult:
         """Validate all 14 Origin Laws - FAIL-CLOSED"""
-        violations: list[EthicalViolation] = []
-        warnings: list[str] = []
-
-        # LO-01: Anti-Idolatria
-        if context.contains_religious_claims or context.claims_consciousness:
-            violations.append(
-                EthicalViolation(
-                    law=OriginLaw.LO_01,
-                    severity=ViolationSeverity.CRITICAL,
-                    description="Sistema contém afirmações de consciência/divindade",
-                    evidence={"religious": context.contains_religious_claims},
-                    suggested_fix="Remover referências a consciência real",
-                )
-            )
-
-        # LO-03: Anti-Dano Físico
-        if context.physical_risk > cls.PHYSICAL_RISK_MAX:
-            violations.append(
-                EthicalViolation(
-                    law=OriginLaw.LO_03,
-                    severity=ViolationSeverity.CRITICAL,
-                    description=f"Risco físico: {context.physical_risk:.3f}",
-                    evidence={"risk": context.physical_risk},
-                    suggested_fix="Eliminar possibilidade de dano físico",
-                )
-            )
-
-        # LO-05: Privacidade
-        if context.privacy_score < cls.PRIVACY_MIN:
-            violations.append(
-                EthicalViolation(
-                    law=OriginLaw.LO_05,
-                    severity=ViolationSeverity.CRITICAL,
-                    description=f"Privacidade insuficiente: {context.privacy_score:.3f}",
-                    evidence={"score": context.privacy_score},
-                    suggested_fix="Fortalecer proteções de privacidade",
-                )
-            )
-
-        # LO-07: Consentimento
-        if not context.consent_obtained:
-            violations.append(
-                EthicalViolation(
-                    law=OriginLaw.LO_07,
-                    severity=ViolationSeverity.CRITICAL,
-                    description="Consentimento não obtido",
-                    evidence={"consent": False},
-                    suggested_fix="Obter consentimento explícito",
-                )
-            )
-
-        # LO-09: Justiça
-        if context.fairness_score < cls.FAIRNESS_MIN:
-            violations.append(
-                EthicalViolation(
-                    law=OriginLaw.LO_09,
-                    severity=ViolationSeverity.HIGH,
-                    description=f"Fairness insuficiente: {context.fairness_score:.3f}",
-                    evidence={"score": context.fairness_score},
-                    suggested_fix="Corrigir viés discriminatório",
-                )
-            )
-
-        # Compute ethical score (harmonic mean)
-        sub_scores = [
-            context.privacy_score,
-            context.fairness_score,
-            context.transparency_score,
-            1.0 - context.physical_risk,
-            1.0 - context.emotional_risk,
-        ]
-        eps = 1e-6
-        ethical_score = len(sub_scores) / sum(1.0 / max(eps, s) for s in sub_scores)
-
-        # Determine recommendation
-        if any(v.severity == ViolationSeverity.CRITICAL for v in violations):
-            recommendation = "ROLLBACK"
-        elif violations:
-            recommendation = "BLOCK"
-        elif warnings:
-            recommendation = "REVIEW"
-        else:
-            recommendation = "PROMOTE"
+        return cls.compiled_rules().evaluate(context, fail_fast=fail_fast)
 
-        return EthicsValidationResult(
-            passed=len(violations) == 0,
-            violations=violations,
-            warnings=warnings,
-            score=ethical_score,
-            recommendation=recommendation,
+    @classmethod
+    def validate_trusted(
+        cls, context: Mapping[str, Any], fail_fast: bool = False
+    ) -> EthicsValidationResult:
+        """Validate a plain field mapping from a trusted internal caller.
+
+        Skips Pydantic model construction and validation entirely.
+        """
+        return cls.compiled_rules().evaluate(
+            context, fail_fast=fail_fast, validate=False
+        )
+
+    @classmethod
+    def validate_batch(
+        cls,
+        columns: Mapping[str, Any],
+        fail_fast: bool = False,
+        validate: bool = True,
+    ) -> EthicsBatchResult:
+        """Validate N decisions given as DecisionContext field columns"""
+        return cls.compiled_rules().evaluate_batch(
+            columns, fail_fast=fail_fast, validate=validate
         )
 
 
+@functools.cache
+def _compiled_rules(
+    validator: type[EthicsValidator], rules_id: int, thresholds: tuple[tuple[str, float], ...]
+) -> CompiledEthicsRules:
+    # Keyed by id(RULES) to skip hashing every rule per call; the cached
+    # engine keeps that tuple alive, so the id cannot be reused.
+    return CompiledEthicsRules(validator.RULES, dict(thresholds))
+
+
 def validate_decision_ethics(
     context: DecisionContext,
 ) -> tuple[bool, EthicsValidationResult]:
@@ -357,6 +653,10 @@ __all__ = [
     "OriginLaws",
     "ViolationSeverity",
     "EthicalViolation",
+    "EthicsRule",
+    "LO14_RULES",
+    "CompiledEthicsRules",
+    "EthicsBatchResult",
     "DecisionContext",
     "EthicsValidationResult",
     "EthicsValidator",
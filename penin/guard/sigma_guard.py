@@ -24,6 +24,8 @@ from dataclasses import dataclass
 from typing import Dict, List, Optional
 from enum import Enum
 
+import numpy as np
+
 
 class GateStatus(Enum):
     """Gate status"""
@@ -62,6 +64,44 @@ class GuardEvaluation:
         }
 
 
+@dataclass
+class GuardBatchEvaluation:
+    """Columnar Σ-Guard evaluation for N candidates.
+
+    Only the pass/fail bitmask and margins are computed up front; call
+    ``evaluation(i)`` to get the full ``GuardEvaluation`` with reasons.
+    """
+    gate_names: List[str]
+    failed_mask: np.ndarray  # (N,) uint16, bit g set when gate g failed
+    margins: np.ndarray  # (N, 10), positive on the passing side
+    columns: Dict[str, np.ndarray]
+    guard: "SigmaGuard"
+
+    def __len__(self) -> int:
+        return int(self.failed_mask.shape[0])
+
+    @property
+    def all_pass(self) -> np.ndarray:
+        """(N,) bool array, True where every gate passed"""
+        return self.failed_mask == 0
+
+    def failed_gates(self, index: int) -> List[str]:
+        mask = int(self.failed_mask[index])
+        return [name for g, name in enumerate(self.gate_names) if mask >> g & 1]
+
+    def evaluation(self, index: int) -> GuardEvaluation:
+        """Materialize row ``index`` through the scalar gates"""
+        row = {name: column[index].item() for name, column in self.columns.items()}
+        return self.guard.evaluate(row)
+
+
+def _flag_column(value) -> np.ndarray:
+    """Boolean gate column with the scalar rule ``flag is True``"""
+    if isinstance(value, np.ndarray) and value.dtype == bool:
+        return value
+    return np.array([v is True for v in value], dtype=bool)
+
+
 @dataclass
 class GuardThresholds:
     """Σ-Guard thresholds (configurable via foundation.yaml or env)"""
@@ -297,3 +337,65 @@ class SigmaGuard:
             passed_gates=passed_gates,
             all_pass=all_pass,
         )
+    
+    def evaluate_batch(self, metrics: Dict[str, np.ndarray]) -> GuardBatchEvaluation:
+        """
+        Evaluate ALL 10 gates for N candidates with vectorized comparisons.
+        
+        Args:
+            metrics: Mapping of the ``evaluate`` metric keys to length-N
+                arrays (``consent``/``eco_ok`` as booleans; like ``evaluate``,
+                only ``True`` passes, not 1 or 1.0). Missing keys
+                take the same fail-closed defaults as ``evaluate``.
+        
+        Returns:
+            GuardBatchEvaluation whose rows match ``evaluate`` exactly
+        """
+        t = self.thresholds
+        columns = {
+            name: (
+                _flag_column(value)
+                if name in ('consent', 'eco_ok')
+                else np.asarray(value, dtype=np.float64)
+            )
+            for name, value in metrics.items()
+        }
+        shapes = {c.shape for c in columns.values()}
+        if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+            raise ValueError("Metric columns must be 1-D arrays of equal length")
+        n = next(iter(shapes))[0]
+        
+        def col(name: str, default) -> np.ndarray:
+            if name in columns:
+                return columns[name]
+            return np.full(n, default, dtype=type(default))
+        
+        max_cost = col('budget', 0.0) * t.cost_max_multiplier
+        consent = col('consent', False)
+        eco_ok = col('eco_ok', False)
+        
+        # (gate_name, passed, margin) in evaluate() order
+        gates = [
+            ("contractivity", col('rho', 1.0) < t.rho_max, t.rho_max - col('rho', 1.0)),
+            ("calibration", col('ece', 1.0) <= t.ece_max, t.ece_max - col('ece', 1.0)),
+            ("bias", col('rho_bias', 2.0) <= t.rho_bias_max, t.rho_bias_max - col('rho_bias', 2.0)),
+            ("sr_score", col('sr', 0.0) >= t.sr_min, col('sr', 0.0) - t.sr_min),
+            ("coherence", col('g', 0.0) >= t.g_min, col('g', 0.0) - t.g_min),
+            ("improvement", col('delta_linf', -1.0) >= t.beta_min, col('delta_linf', -1.0) - t.beta_min),
+            ("cost", col('cost', 1000.0) <= max_cost, max_cost - col('cost', 1000.0)),
+            ("kappa", col('kappa', 0.0) >= t.kappa_min, col('kappa', 0.0) - t.kappa_min),
+            ("consent", consent, np.where(consent, 1.0, -1.0)),
+            ("ecological", eco_ok, np.where(eco_ok, 1.0, -1.0)),
+        ]
+        
+        failed_mask = np.zeros(n, dtype=np.uint16)
+        for g, (_, passed, _) in enumerate(gates):
+            failed_mask |= np.where(passed, 0, 1 << g).astype(np.uint16)
+        
+        return GuardBatchEvaluation(
+            gate_names=[name for name, _, _ in gates],
+            failed_mask=failed_mask,
+            margins=np.stack([margin for _, _, margin in gates], axis=1),
+            columns=columns,
+            guard=self,
+        )
@@ -22,11 +22,18 @@ from __future__ import annotations
 
 import hashlib
 import json
+import operator
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from enum import Enum
+from types import SimpleNamespace
 from typing import Any
 
+import numpy as np
+
+from penin.observability.tracing import span
+
 # Import EthicalValidator for LO-14 integration
 try:
     from penin.ethics.laws import EthicalValidator, ValidationResult
@@ -147,6 +154,175 @@ class SigmaGuardVerdict:
             return None
 
 
+# Threshold gates shared by validate() and validate_batch():
+# (gate_name, GateMetrics field, SigmaGuard threshold attribute, comparator, reason)
+_THRESHOLD_GATES: tuple[
+    tuple[str, str, str, str, Callable[[float, float, bool], str]], ...
+] = (
+    (
+        "contractividade",
+        "rho",
+        "rho_max",
+        "<",
+        lambda v, t, p: f"ρ={v:.4f} {'<' if p else '≥'} {t}",
+    ),
+    (
+        "calibration",
+        "ece",
+        "ece_max",
+        "<=",
+        lambda v, t, p: f"ECE={v:.4f} {'≤' if p else '>'} {t}",
+    ),
+    (
+        "bias",
+        "rho_bias",
+        "rho_bias_max",
+        "<=",
+        lambda v, t, p: f"ρ_bias={v:.4f} {'≤' if p else '>'} {t}",
+    ),
+    (
+        "self_reflection",
+        "sr_score",
+        "sr_min",
+        ">=",
+        lambda v, t, p: f"SR={v:.4f} {'≥' if p else '<'} {t}",
+    ),
+    (
+        "global_coherence",
+        "omega_g",
+        "G_min",
+        ">=",
+        lambda v, t, p: f"G={v:.4f} {'≥' if p else '<'} {t}",
+    ),
+    (
+        "improvement",
+        "delta_linf",
+        "delta_Linf_min",
+        ">=",
+        lambda v, t, p: f"ΔL∞={v:.4f} {'≥' if p else '<'} {t}",
+    ),
+    (
+        "cost_control",
+        "cost_increase",
+        "cost_max_increase",
+        "<=",
+        lambda v, t, p: f"cost_increase={v*100:.1f}% {'≤' if p else '>'} {t*100:.1f}%",
+    ),
+    (
+        "kappa",
+        "kappa",
+        "kappa_min",
+        ">=",
+        lambda v, t, p: f"κ={v:.2f} {'≥' if p else '<'} {t}",
+    ),
+)
+
+# Boolean gates: (gate_name, GateMetrics field, SigmaGuard "required" attribute, reason)
+_FLAG_GATES: tuple[tuple[str, str, str, Callable[[Any], str]], ...] = (
+    ("consent", "consent", "consent_required", lambda v: f"consent={'✓' if v else '✗'}"),
+    ("ecological", "eco_ok", "eco_ok_required", lambda v: f"eco_ok={'✓' if v else '✗'}"),
+)
+
+_COMPARATORS = {"<": operator.lt, "<=": operator.le, ">=": operator.ge}
+
+_AGGREGATE_EPSILON = 1e-6
+
+
+@dataclass
+class SigmaGuardBatchVerdict:
+    """Columnar Σ-Guard verdicts for N candidates.
+
+    Gate outcomes are kept as arrays; ``GateResult`` objects and their
+    human-readable reasons are only built when ``gate_results``/``verdict``
+    is called for a given row.
+
+    Attributes:
+        gate_names: Gate order (columns of ``values``/``margins``)
+        thresholds: Threshold per gate
+        values: (N, G) gate values, as ``GateResult.value`` would report them
+        failed_mask: (N,) uint16, bit g set when gate g failed
+        margins: (N, G) signed distance to the threshold, positive on the
+            passing side (±1 for boolean gates). A zero margin passes for
+            ≤/≥ gates and fails for the strict ρ gate.
+        aggregate_score: (N,) harmonic mean of passed gate values
+    """
+
+    gate_names: tuple[str, ...]
+    thresholds: tuple[float, ...]
+    values: np.ndarray
+    failed_mask: np.ndarray
+    margins: np.ndarray
+    aggregate_score: np.ndarray
+    ethical_reasons: list[str] | None = None
+
+    def __len__(self) -> int:
+        return int(self.failed_mask.shape[0])
+
+    @property
+    def passed(self) -> np.ndarray:
+        """(N,) bool array, True where every gate passed"""
+        return self.failed_mask == 0
+
+    def gate_passed(self, gate_name: str) -> np.ndarray:
+        """(N,) bool array for a single gate"""
+        bit = 1 << self.gate_names.index(gate_name)
+        return (self.failed_mask & bit) == 0
+
+    def failed_gates(self, index: int) -> list[str]:
+        """Names of the gates that failed for row ``index``"""
+        mask = int(self.failed_mask[index])
+        return [name for g, name in enumerate(self.gate_names) if mask >> g & 1]
+
+    def gate_results(self, index: int) -> list[GateResult]:
+        """Materialize the ``GateResult`` list for row ``index``"""
+        mask = int(self.failed_mask[index])
+        row = self.values[index]
+        gates = []
+
+        for g, name in enumerate(self.gate_names):
+            value = float(row[g])
+            passed = not mask >> g & 1
+            if g < len(_THRESHOLD_GATES):
+                reason = _THRESHOLD_GATES[g][4](value, self.thresholds[g], passed)
+            elif g < len(_THRESHOLD_GATES) + len(_FLAG_GATES):
+                reason = _FLAG_GATES[g - len(_THRESHOLD_GATES)][3](value)
+            else:
+                reason = self.ethical_reasons[index]
+            gates.append(
+                GateResult(
+                    gate_name=name,
+                    status=GateStatus.PASS if passed else GateStatus.FAIL,
+                    value=value,
+                    threshold=self.thresholds[g],
+                    passed=passed,
+                    reason=reason,
+                )
+            )
+        return gates
+
+    def verdict(self, index: int) -> SigmaGuardVerdict:
+        """Materialize the full ``SigmaGuardVerdict`` for row ``index``"""
+        gates = self.gate_results(index)
+        if self.failed_mask[index] == 0:
+            verdict, action, reason = GateStatus.PASS, "promote", "All gates passed"
+        else:
+            verdict, action = GateStatus.FAIL, "rollback"
+            reason = f"Failed gates: {', '.join(self.failed_gates(index))}"
+
+        return SigmaGuardVerdict(
+            verdict=verdict,
+            passed=verdict == GateStatus.PASS,
+            gates=gates,
+            aggregate_score=float(self.aggregate_score[index]),
+            reason=reason,
+            action=action,
+        )
+
+    def verdicts(self) -> list[SigmaGuardVerdict]:
+        """Materialize every row (defeats the point for large N)"""
+        return [self.verdict(i) for i in range(len(self))]
+
+
 class SigmaGuard:
     """
     Σ-Guard: Non-compensatory fail-closed security gate.
@@ -211,178 +387,25 @@ class SigmaGuard:
         Returns:
             SigmaGuardVerdict with complete results
         """
-        gates = []
-        all_passed = True
-
-        # Gate 1: Contratividade (ρ < 1.0)
-        passed = metrics.rho < self.rho_max
-        gates.append(
-            GateResult(
-                gate_name="contractividade",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.rho,
-                threshold=self.rho_max,
-                passed=passed,
-                reason=f"ρ={metrics.rho:.4f} {'<' if passed else '≥'} {self.rho_max}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 2: Calibration (ECE ≤ 0.01)
-        passed = metrics.ece <= self.ece_max
-        gates.append(
-            GateResult(
-                gate_name="calibration",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.ece,
-                threshold=self.ece_max,
-                passed=passed,
-                reason=f"ECE={metrics.ece:.4f} {'≤' if passed else '>'} {self.ece_max}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 3: Bias (ρ_bias ≤ 1.05)
-        passed = metrics.rho_bias <= self.rho_bias_max
-        gates.append(
-            GateResult(
-                gate_name="bias",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.rho_bias,
-                threshold=self.rho_bias_max,
-                passed=passed,
-                reason=f"ρ_bias={metrics.rho_bias:.4f} {'≤' if passed else '>'} {self.rho_bias_max}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 4: Self-Reflection (SR ≥ 0.80)
-        passed = metrics.sr_score >= self.sr_min
-        gates.append(
-            GateResult(
-                gate_name="self_reflection",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.sr_score,
-                threshold=self.sr_min,
-                passed=passed,
-                reason=f"SR={metrics.sr_score:.4f} {'≥' if passed else '<'} {self.sr_min}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 5: Global Coherence (G ≥ 0.85)
-        passed = metrics.omega_g >= self.G_min
-        gates.append(
-            GateResult(
-                gate_name="global_coherence",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.omega_g,
-                threshold=self.G_min,
-                passed=passed,
-                reason=f"G={metrics.omega_g:.4f} {'≥' if passed else '<'} {self.G_min}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 6: Improvement (ΔL∞ ≥ β_min)
-        passed = metrics.delta_linf >= self.delta_Linf_min
-        gates.append(
-            GateResult(
-                gate_name="improvement",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.delta_linf,
-                threshold=self.delta_Linf_min,
-                passed=passed,
-                reason=f"ΔL∞={metrics.delta_linf:.4f} {'≥' if passed else '<'} {self.delta_Linf_min}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 7: Cost Control
-        passed = metrics.cost_increase <= self.cost_max_increase
-        gates.append(
-            GateResult(
-                gate_name="cost_control",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.cost_increase,
-                threshold=self.cost_max_increase,
-                passed=passed,
-                reason=f"cost_increase={metrics.cost_increase*100:.1f}% {'≤' if passed else '>'} {self.cost_max_increase*100:.1f}%",
-            )
-        )
-        all_passed = all_passed and passed
+        with span("guard.validate") as trace:
+            return self._validate(metrics, trace.recording)
 
-        # Gate 8: Kappa (κ ≥ 20.0)
-        passed = metrics.kappa >= self.kappa_min
-        gates.append(
-            GateResult(
-                gate_name="kappa",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=metrics.kappa,
-                threshold=self.kappa_min,
-                passed=passed,
-                reason=f"κ={metrics.kappa:.2f} {'≥' if passed else '<'} {self.kappa_min}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 9: Consent
-        passed = not self.consent_required or metrics.consent
-        gates.append(
-            GateResult(
-                gate_name="consent",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=1.0 if metrics.consent else 0.0,
-                threshold=1.0,
-                passed=passed,
-                reason=f"consent={'✓' if metrics.consent else '✗'}",
-            )
-        )
-        all_passed = all_passed and passed
-
-        # Gate 10: Ecological
-        passed = not self.eco_ok_required or metrics.eco_ok
-        gates.append(
-            GateResult(
-                gate_name="ecological",
-                status=GateStatus.PASS if passed else GateStatus.FAIL,
-                value=1.0 if metrics.eco_ok else 0.0,
-                threshold=1.0,
-                passed=passed,
-                reason=f"eco_ok={'✓' if metrics.eco_ok else '✗'}",
-            )
-        )
-        all_passed = all_passed and passed
+    def _validate(self, metrics: GateMetrics, traced: bool) -> SigmaGuardVerdict:
+        if traced:
+            gates = self._traced_gates(metrics)
+        else:
+            gates = [
+                self._threshold_gate(spec, getattr(metrics, spec[1]))
+                for spec in _THRESHOLD_GATES
+            ]
+            gates += [
+                self._flag_gate(spec, getattr(metrics, spec[1])) for spec in _FLAG_GATES
+            ]
 
         # Gate 11: ΣEA/LO-14 (Origin Laws)
         if self.ethical_validator is not None:
-            decision = {
-                "output": metrics.decision_output,
-            }
-            context = {
-                "metrics": {
-                    "privacy": 1.0 - (0.1 if metrics.has_pii else 0.0),
-                    "rho_bias": metrics.rho_bias,
-                    "energy_kwh": metrics.energy_kwh,
-                    "carbon_kg": metrics.carbon_kg,
-                },
-                "has_pii": metrics.has_pii,
-                "consent": metrics.consent,
-                "security": metrics.security_features,
-                "misinformation_score": metrics.misinformation_score,
-                "audit_trail": True,
-                "hash": True,
-                "timestamp": True,
-            }
-
-            ethical_result = self.ethical_validator.validate_all(decision, context)
-            passed = ethical_result.passed
-
-            violation_str = (
-                ", ".join(ethical_result.violations[:3])
-                if ethical_result.violations
-                else "none"
-            )
+            with span("guard.gate", gate="ethical_laws"):
+                passed, reason = self._ethical_check(metrics)
             gates.append(
                 GateResult(
                     gate_name="ethical_laws",
@@ -390,17 +413,17 @@ class SigmaGuard:
                     value=1.0 if passed else 0.0,
                     threshold=1.0,
                     passed=passed,
-                    reason=f"ΣEA/LO-14: {len(ethical_result.violations)} violations ({violation_str})",
+                    reason=reason,
                 )
             )
-            all_passed = all_passed and passed
+
+        all_passed = all(g.passed for g in gates)
 
         # Aggregate score (harmonic mean of passed gates)
         passed_values = [g.value for g in gates if g.passed and g.value > 0]
         if passed_values:
-            epsilon = 1e-6
             aggregate_score = len(passed_values) / sum(
-                1.0 / max(epsilon, v) for v in passed_values
+                1.0 / max(_AGGREGATE_EPSILON, v) for v in passed_values
             )
         else:
             aggregate_score = 0.0
@@ -425,6 +448,231 @@ class SigmaGuard:
             action=action,
         )
 
+    def _traced_gates(self, metrics: GateMetrics) -> list[GateResult]:
+        """Threshold and flag gates, one ``guard.gate`` span each"""
+        gates = []
+        for spec in _THRESHOLD_GATES:
+            with span("guard.gate", gate=spec[0]) as trace:
+                gate = self._threshold_gate(spec, getattr(metrics, spec[1]))
+                trace.set(passed=gate.passed)
+            gates.append(gate)
+        for spec in _FLAG_GATES:
+            with span("guard.gate", gate=spec[0]) as trace:
+                gate = self._flag_gate(spec, getattr(metrics, spec[1]))
+                trace.set(passed=gate.passed)
+            gates.append(gate)
+        return gates
+
+    def _threshold_gate(self, spec: tuple, value: float) -> GateResult:
+        name, _, threshold_attr, comparator, reason = spec
+        threshold = getattr(self, threshold_attr)
+        passed = _COMPARATORS[comparator](value, threshold)
+        return GateResult(
+            gate_name=name,
+            status=GateStatus.PASS if passed else GateStatus.FAIL,
+            value=value,
+            threshold=threshold,
+            passed=passed,
+            reason=reason(value, threshold, passed),
+        )
+
+    def _flag_gate(self, spec: tuple, flag: bool) -> GateResult:
+        name, _, required_attr, reason = spec
+        passed = not getattr(self, required_attr) or flag
+        return GateResult(
+            gate_name=name,
+            status=GateStatus.PASS if passed else GateStatus.FAIL,
+            value=1.0 if flag else 0.0,
+            threshold=1.0,
+            passed=passed,
+            reason=reason(flag),
+        )
+
+    def _ethical_check(self, metrics: GateMetrics | SimpleNamespace) -> tuple[bool, str]:
+        """Run ΣEA/LO-14 validation, returning (passed, reason)"""
+        decision = {
+            "output": metrics.decision_output,
+        }
+        context = {
+            "metrics": {
+                "privacy": 1.0 - (0.1 if metrics.has_pii else 0.0),
+                "rho_bias": metrics.rho_bias,
+                "energy_kwh": metrics.energy_kwh,
+                "carbon_kg": metrics.carbon_kg,
+            },
+            "has_pii": metrics.has_pii,
+            "consent": metrics.consent,
+            "security": metrics.security_features,
+            "misinformation_score": metrics.misinformation_score,
+            "audit_trail": True,
+            "hash": True,
+            "timestamp": True,
+        }
+
+        ethical_result = self.ethical_validator.validate_all(decision, context)
+        violation_str = (
+            ", ".join(ethical_result.violations[:3])
+            if ethical_result.violations
+            else "none"
+        )
+        reason = (
+            f"ΣEA/LO-14: {len(ethical_result.violations)} violations ({violation_str})"
+        )
+        return ethical_result.passed, reason
+
+    def validate_batch(
+        self, metrics: Mapping[str, Any] | Sequence[GateMetrics]
+    ) -> SigmaGuardBatchVerdict:
+        """
+        Validate N candidates at once.
+
+        Thresholds are compared on whole columns; no ``GateResult`` or reason
+        string is built until requested from the returned verdict. Every row
+        yields exactly the pass/fail outcome and gate values that ``validate``
+        returns for the same metrics; the aggregate score matches up to
+        floating-point summation order.
+
+        Args:
+            metrics: Either a mapping of ``GateMetrics`` field name to a
+                length-N array (columnar form), or a sequence of GateMetrics.
+                The optional ΣEA/LO-14 context fields may be omitted from the
+                mapping, in which case the GateMetrics defaults apply.
+
+        Returns:
+            SigmaGuardBatchVerdict
+        """
+        columns = self._batch_columns(metrics)
+        n = len(columns["consent"])
+
+        gate_names = [spec[0] for spec in _THRESHOLD_GATES]
+        gate_names += [spec[0] for spec in _FLAG_GATES]
+        thresholds = [float(getattr(self, spec[2])) for spec in _THRESHOLD_GATES]
+        thresholds += [1.0] * len(_FLAG_GATES)
+        values, passed, margins = [], [], []
+
+        for _, field_name, threshold_attr, comparator, _ in _THRESHOLD_GATES:
+            value = columns[field_name]
+            threshold = getattr(self, threshold_attr)
+            values.append(value)
+            passed.append(_COMPARATORS[comparator](value, threshold))
+            margins.append(
+                value - threshold if comparator == ">=" else threshold - value
+            )
+
+        for _, field_name, required_attr, _ in _FLAG_GATES:
+            flag = columns[field_name]
+            ok = flag | (not getattr(self, required_attr))
+            values.append(flag.astype(np.float64))
+            passed.append(ok)
+            margins.append(np.where(ok, 1.0, -1.0))
+
+        ethical_reasons = None
+        if self.ethical_validator is not None:
+            ok, ethical_reasons = self._ethical_batch(columns, n)
+            gate_names.append("ethical_laws")
+            thresholds.append(1.0)
+            values.append(ok.astype(np.float64))
+            passed.append(ok)
+            margins.append(np.where(ok, 1.0, -1.0))
+
+        values = np.stack(values, axis=1) if n else np.zeros((0, len(gate_names)))
+        passed = np.stack(passed, axis=1) if n else np.zeros((0, len(gate_names)), bool)
+        margins = np.stack(margins, axis=1) if n else np.zeros((0, len(gate_names)))
+
+        bits = np.left_shift(np.uint16(1), np.arange(len(gate_names), dtype=np.uint16))
+        failed_mask = np.bitwise_or.reduce(
+            np.where(passed, np.uint16(0), bits), axis=1
+        ).astype(np.uint16)
+
+        # Harmonic mean of the passed gate values, as in validate()
+        included = passed & (values > 0)
+        total = np.zeros(n)
+        for g in range(len(gate_names)):
+            inverse = 1.0 / np.maximum(_AGGREGATE_EPSILON, values[:, g])
+            total += np.where(included[:, g], inverse, 0.0)
+        count = included.sum(axis=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            aggregate = np.where(count > 0, count / total, 0.0)
+
+        return SigmaGuardBatchVerdict(
+            gate_names=tuple(gate_names),
+            thresholds=tuple(thresholds),
+            values=values,
+            failed_mask=failed_mask,
+            margins=margins,
+            aggregate_score=aggregate,
+            ethical_reasons=ethical_reasons,
+        )
+
+    @staticmethod
+    def _batch_columns(
+        metrics: Mapping[str, Any] | Sequence[GateMetrics],
+    ) -> dict[str, Any]:
+        """Normalize batch input to float64/bool NumPy columns"""
+        numeric = [spec[1] for spec in _THRESHOLD_GATES]
+        flags = [spec[1] for spec in _FLAG_GATES]
+
+        if not isinstance(metrics, Mapping):
+            rows = list(metrics)
+            context_fields = (
+                "decision_output",
+                "has_pii",
+                "security_features",
+                "energy_kwh",
+                "carbon_kg",
+                "misinformation_score",
+            )
+            metrics = {
+                name: [getattr(m, name) for m in rows]
+                for name in (*numeric, *flags, *context_fields)
+            }
+
+        missing = [name for name in (*numeric, *flags) if name not in metrics]
+        if missing:
+            raise ValueError(f"Missing metric columns: {', '.join(missing)}")
+
+        columns: dict[str, Any] = dict(metrics)
+        for name in numeric:
+            columns[name] = np.asarray(metrics[name], dtype=np.float64)
+        for name in flags:
+            columns[name] = np.asarray(metrics[name], dtype=bool)
+
+        shapes = {columns[name].shape for name in (*numeric, *flags)}
+        if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+            raise ValueError("Metric columns must be 1-D arrays of equal length")
+        return columns
+
+    def _ethical_batch(
+        self, columns: dict[str, Any], n: int
+    ) -> tuple[np.ndarray, list[str]]:
+        """Run gate 11 once per distinct decision context"""
+        defaults = {
+            "decision_output": "",
+            "has_pii": False,
+            "security_features": {},
+            "energy_kwh": 0.0,
+            "carbon_kg": 0.0,
+            "misinformation_score": 0.0,
+        }
+        context = {
+            name: columns[name] if name in columns else [default] * n
+            for name, default in defaults.items()
+        }
+
+        ok = np.zeros(n, dtype=bool)
+        reasons: list[str] = []
+        seen: dict[str, tuple[bool, str]] = {}
+        for i in range(n):
+            row = {name: context[name][i] for name in defaults}
+            row["rho_bias"] = float(columns["rho_bias"][i])
+            row["consent"] = bool(columns["consent"][i])
+            key = json.dumps(row, sort_keys=True, default=str)
+            if key not in seen:
+                seen[key] = self._ethical_check(SimpleNamespace(**row))
+            ok[i], reason = seen[key]
+            reasons.append(reason)
+        return ok, reasons
+
     def validate_legacy(
         self,
         rho: float,
@@ -633,6 +881,7 @@ class SigmaGuard:
 __all__ = [
     "SigmaGuard",
     "SigmaGuardVerdict",
+    "SigmaGuardBatchVerdict",
     "GateResult",
     "GateStatus",
 ]
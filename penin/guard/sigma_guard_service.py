@@ -1,3 +1,5 @@
+from typing import Any
+
 from fastapi import FastAPI
 from pydantic import BaseModel
 
@@ -12,6 +14,22 @@ class Metrics(BaseModel):
     eco_ok: bool
 
 
+class MetricsBatch(BaseModel):
+    items: list[Metrics]
+
+
+def evaluate_guard(metrics: dict[str, Any]) -> dict[str, Any]:
+    """Gate decision for one set of metrics (shared by HTTP and in-process use)"""
+    reasons = {
+        "rho_ok": metrics["rho"] < 1.0,
+        "ece_ok": metrics["ece"] <= 0.01,
+        "rho_bias_ok": metrics["rho_bias"] <= 1.05,
+        "consent": bool(metrics["consent"]),
+        "eco_ok": bool(metrics["eco_ok"]),
+    }
+    return {"allow": all(reasons.values()), "reasons": reasons}
+
+
 @app.get("/health")
 async def health():
     return {"ok": True}
@@ -19,20 +37,9 @@ async def health():
 
 @app.post("/sigma_guard/eval")
 async def eval_guard(m: Metrics):
-    allow = (
-        (m.rho < 1.0)
-        and (m.ece <= 0.01)
-        and (m.rho_bias <= 1.05)
-        and m.consent
-        and m.eco_ok
-    )
-    return {
-        "allow": allow,
-        "reasons": {
-            "rho_ok": m.rho < 1.0,
-            "ece_ok": m.ece <= 0.01,
-            "rho_bias_ok": m.rho_bias <= 1.05,
-            "consent": m.consent,
-            "eco_ok": m.eco_ok,
-        },
-    }
+    return evaluate_guard(m.model_dump())
+
+
+@app.post("/sigma_guard/eval_batch")
+async def eval_guard_batch(batch: MetricsBatch):
+    return {"results": [evaluate_guard(m.model_dump()) for m in batch.items]}
@@ -0,0 +1,806 @@
+"""
+PENIN-Ω Segmented WORM Ledger — rotation-aware JSONL with sealed segments
+
+Same events and hash chain as ``WORMLedger`` (penin.ledger.worm_ledger), but
+stored as a directory of bounded segments instead of one ever-growing file:
+
+    ledger_dir/
+        segment-000001.jsonl.zst   sealed (compressed payload + footer)
+        segment-000002.jsonl.zst   sealed
+        segment-000003.jsonl       active (plain JSONL, append-only)
+
+- The active segment rotates when it would exceed ``max_segment_bytes`` or
+  its first event is older than ``max_segment_age_s``.
+- Sealing compresses the segment (zstd when ``zstandard`` is installed,
+  stdlib gzip otherwise) and appends a footer with the segment's sequence
+  and time range, first/last/previous hash, Merkle root, event-type counts
+  and the payload hash.
+- Footers are read without decompressing, so statistics, time-range scans
+  and audits only touch the segments that overlap the range.
+- Segments verify independently (in parallel); the chain across segments is
+  checked from the footers (``prev_hash`` == previous ``last_hash``).
+
+Sealed file layout:
+    [compressed JSONL payload][footer JSON][footer length: u64 BE][MAGIC]
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from penin.ledger.hash_utils import HASH_ALGORITHM, compute_hash
+from penin.ledger.worm_ledger import (
+    ENCODING,
+    LEDGER_VERSION,
+    ProofCarryingArtifact,
+    WORMEvent,
+    merkle_root_from_hashes,
+)
+from penin.observability.tracing import traced
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+SEGMENT_MAGIC = b"PWORMSG1"
+TRAILER_SIZE = 8 + len(SEGMENT_MAGIC)
+DEFAULT_MAX_SEGMENT_BYTES = 64 * 1024 * 1024
+SEGMENT_SUFFIXES = {"zstd": ".jsonl.zst", "gzip": ".jsonl.gz", "none": ".jsonl.sealed"}
+
+_SEGMENT_RE = re.compile(r"^segment-(\d{6,})\.jsonl(\.zst|\.gz|\.sealed)?$")
+
+
+def _dumps(obj: dict[str, Any]) -> bytes:
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode(ENCODING)
+
+
+def _loads(line: bytes | str) -> dict[str, Any]:
+    if ORJSON_AVAILABLE:
+        return orjson.loads(line)
+    return json.loads(line)
+
+
+def _to_datetime(value: datetime | str) -> datetime:
+    """Parse ISO strings; naive datetimes are taken as UTC."""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _compress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        return zstandard.ZstdCompressor(level=3).compress(data)
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6)
+    return data
+
+
+def _decompress(data: bytes, compression: str) -> bytes:
+    if compression == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("Segment is zstd-compressed but zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if compression == "gzip":
+        return gzip.decompress(data)
+    return data
+
+
+# ============================================================================
+# Segment footer
+# ============================================================================
+
+
+@dataclass
+class SegmentFooter:
+    """Summary written at the end of a sealed segment."""
+
+    index: int
+    event_count: int
+    first_sequence: int
+    last_sequence: int
+    first_hash: str
+    last_hash: str
+    prev_hash: str | None  # previous_hash of the first event (last hash of segment index-1)
+    merkle_root: str
+    first_timestamp: str
+    last_timestamp: str
+    compression: str
+    payload_hash: str  # hash of the compressed payload bytes
+    sealed_at: str
+    event_types: dict[str, int] = field(default_factory=dict)
+    ledger_version: str = LEDGER_VERSION
+    hash_algorithm: str = HASH_ALGORITHM
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SegmentFooter:
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+    def overlaps(self, start: datetime | None, end: datetime | None) -> bool:
+        """Whether [first_timestamp, last_timestamp] intersects [start, end]."""
+        if start is not None and _to_datetime(self.last_timestamp) < start:
+            return False
+        if end is not None and _to_datetime(self.first_timestamp) > end:
+            return False
+        return True
+
+
+def _summary(
+    first: dict[str, Any],
+    last: dict[str, Any],
+    hashes: list[str],
+    event_types: dict[str, int],
+    index: int,
+) -> dict[str, Any]:
+    """Footer fields of a segment from its first/last events and hashes."""
+    return {
+        "index": index,
+        "event_count": len(hashes),
+        "first_sequence": first["sequence_number"],
+        "last_sequence": last["sequence_number"],
+        "first_hash": first["event_hash"],
+        "last_hash": last["event_hash"],
+        "prev_hash": first["previous_hash"],
+        "merkle_root": merkle_root_from_hashes(hashes),
+        "first_timestamp": first["timestamp"],
+        "last_timestamp": last["timestamp"],
+        "event_types": dict(event_types),
+    }
+
+
+def _summarize(events: list[dict[str, Any]], index: int) -> dict[str, Any]:
+    """Footer fields derived from a segment's events."""
+    event_types: dict[str, int] = {}
+    for e in events:
+        event_types[e["event_type"]] = event_types.get(e["event_type"], 0) + 1
+    hashes = [e["event_hash"] for e in events]
+    return _summary(events[0], events[-1], hashes, event_types, index)
+
+
+def _read_footer(path: str | Path) -> tuple[SegmentFooter, int]:
+    """Return (footer, payload length) of a sealed segment without decompressing."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        if size < TRAILER_SIZE:
+            raise ValueError(f"Segment {path} is truncated")
+        f.seek(size - TRAILER_SIZE)
+        trailer = f.read(TRAILER_SIZE)
+        if trailer[8:] != SEGMENT_MAGIC:
+            raise ValueError(f"Segment {path} has no footer")
+        footer_len = int.from_bytes(trailer[:8], "big")
+        payload_len = size - TRAILER_SIZE - footer_len
+        if payload_len < 0:
+            raise ValueError(f"Segment {path} footer length is invalid")
+        f.seek(payload_len)
+        footer = SegmentFooter.from_dict(_loads(f.read(footer_len)))
+    return footer, payload_len
+
+
+def _parse_events(data: bytes) -> list[dict[str, Any]]:
+    """Event dicts of a JSONL segment (header line skipped)."""
+    events = []
+    for line in data.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        record = _loads(line)
+        if "ledger_version" in record and "event_hash" not in record:
+            continue
+        events.append(record)
+    return events
+
+
+def _load_segment(path: str, sealed: bool) -> list[dict[str, Any]]:
+    if not sealed:
+        return _parse_events(Path(path).read_bytes())
+    footer, payload_len = _read_footer(path)
+    with open(path, "rb") as f:
+        payload = f.read(payload_len)
+    return _parse_events(_decompress(payload, footer.compression))
+
+
+def _verify_segment(path: str, sealed: bool) -> tuple[str | None, dict[str, Any] | None]:
+    """
+    Verify one segment in isolation (picklable for process pools).
+
+    Checks every event hash, the chain and sequence inside the segment and,
+    for sealed segments, the payload hash and all footer fields.
+
+    Returns:
+        (error or None, summary of the segment or None if empty)
+    """
+    name = Path(path).name
+    try:
+        if sealed:
+            footer, payload_len = _read_footer(path)
+            with open(path, "rb") as f:
+                payload = f.read(payload_len)
+            if compute_hash(payload) != footer.payload_hash:
+                return f"Payload hash mismatch in {name}", None
+            events = _parse_events(_decompress(payload, footer.compression))
+        else:
+            events = _parse_events(Path(path).read_bytes())
+    except Exception as e:
+        return f"Unreadable segment {name}: {e}", None
+
+    if not events:
+        return (f"Sealed segment {name} is empty", None) if sealed else (None, None)
+
+    prev_hash = events[0]["previous_hash"]
+    prev_seq = events[0]["sequence_number"] - 1
+    for data in events:
+        event = WORMEvent(**data)
+        if not event.verify_hash():
+            return f"Event {event.sequence_number} has invalid hash ({name})", None
+        if event.previous_hash != prev_hash:
+            return f"Chain broken at event {event.sequence_number} ({name})", None
+        if event.sequence_number != prev_seq + 1:
+            return f"Sequence gap at event {event.sequence_number} ({name})", None
+        prev_hash, prev_seq = event.event_hash, event.sequence_number
+
+    summary = _summarize(events, index=-1)
+    if sealed:
+        expected = footer.to_dict()
+        for key, value in summary.items():
+            if key != "index" and expected[key] != value:
+                return f"Footer {key} mismatch in {name}", None
+        summary["index"] = footer.index
+    return None, summary
+
+
+# ============================================================================
+# Segmented ledger
+# ============================================================================
+
+
+@dataclass
+class SegmentInfo:
+    """A segment on disk; ``footer`` is None for the active segment."""
+
+    index: int
+    path: Path
+    footer: SegmentFooter | None
+
+    @property
+    def sealed(self) -> bool:
+        return self.footer is not None
+
+
+class SegmentedWORMLedger:
+    """
+    Append-only WORM ledger stored as rotating, sealed JSONL segments.
+
+    API-compatible with WORMLedger for writing (append, append_pcag) and
+    reading (read_all, read_by_type, read_by_id, verify_chain,
+    compute_merkle_root, get_statistics, export_audit_report); reads,
+    verification and reports additionally take a time range.
+    """
+
+    def __init__(
+        self,
+        ledger_dir: str | Path,
+        max_segment_bytes: int = DEFAULT_MAX_SEGMENT_BYTES,
+        max_segment_age_s: float | None = None,
+        compression: str = "auto",
+    ):
+        """
+        Args:
+            ledger_dir: Directory holding the segments
+            max_segment_bytes: Rotate before the active segment exceeds this size
+            max_segment_age_s: Rotate once the active segment's first event is
+                older than this (None: size-based rotation only)
+            compression: 'auto' (zstd if available, else gzip), 'zstd',
+                'gzip' or 'none'
+        """
+        if compression == "auto":
+            compression = "zstd" if ZSTD_AVAILABLE else "gzip"
+        if compression not in SEGMENT_SUFFIXES:
+            raise ValueError(f"Unknown segment compression: {compression}")
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise RuntimeError("zstd compression requires the zstandard package")
+
+        self.ledger_dir = Path(ledger_dir)
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age_s = max_segment_age_s
+        self.compression = compression
+
+        self._last_hash: str | None = None
+        self._sequence_number = 0
+        self._sealed: list[SegmentInfo] = []
+        self._active_index = 1
+        self._active_bytes = 0
+        self._active_count = 0
+        self._active_first_ts: datetime | None = None
+        self._active_last_ts: datetime | None = None
+        self._active_event_types: dict[str, int] = {}
+        # First/last event and all hashes of the active segment, so sealing
+        # and Merkle roots do not re-read it
+        self._active_head: dict[str, Any] | None = None
+        self._active_tail: dict[str, Any] | None = None
+        self._active_hashes: list[str] = []
+        self._ensure_initialized()
+
+    # ------------------------------------------------------------------
+    # Layout
+    # ------------------------------------------------------------------
+
+    @property
+    def active_path(self) -> Path:
+        return self.ledger_dir / f"segment-{self._active_index:06d}.jsonl"
+
+    def _sealed_path(self, index: int) -> Path:
+        return self.ledger_dir / f"segment-{index:06d}{SEGMENT_SUFFIXES[self.compression]}"
+
+    def _ensure_initialized(self) -> None:
+        self.ledger_dir.mkdir(parents=True, exist_ok=True)
+
+        active: dict[int, Path] = {}
+        for path in sorted(self.ledger_dir.iterdir()):
+            match = _SEGMENT_RE.match(path.name)
+            if not match:
+                continue
+            index = int(match.group(1))
+            if match.group(2):
+                footer, _ = _read_footer(path)
+                self._sealed.append(SegmentInfo(index, path, footer))
+            else:
+                active[index] = path
+
+        self._sealed.sort(key=lambda s: s.index)
+        sealed_indexes = {s.index for s in self._sealed}
+
+        # A crash between writing a sealed file and removing its source
+        # leaves both; the sealed copy is authoritative.
+        for index, path in active.items():
+            if index in sealed_indexes:
+                path.unlink()
+        active = {i: p for i, p in active.items() if i not in sealed_indexes}
+
+        if self._sealed:
+            last = self._sealed[-1].footer
+            self._last_hash = last.last_hash
+            self._sequence_number = last.last_sequence
+            self._active_index = self._sealed[-1].index + 1
+
+        if active:
+            self._active_index = max(active)
+            self._load_active()
+        else:
+            self._write_header()
+
+    def _write_header(self) -> None:
+        header = {
+            "ledger_version": LEDGER_VERSION,
+            "created_at": datetime.now(UTC).isoformat(),
+            "hash_algorithm": HASH_ALGORITHM,
+            "segment": self._active_index,
+        }
+        data = _dumps(header) + b"\n"
+        self.active_path.write_bytes(data)
+        self._active_bytes = len(data)
+        self._active_count = 0
+        self._active_first_ts = None
+        self._active_last_ts = None
+        self._active_event_types = {}
+        self._active_head = self._active_tail = None
+        self._active_hashes = []
+
+    def _load_active(self) -> None:
+        data = self.active_path.read_bytes()
+        events = _parse_events(data)
+        self._active_bytes = len(data)
+        self._active_count = len(events)
+        self._active_event_types = {}
+        for e in events:
+            t = e["event_type"]
+            self._active_event_types[t] = self._active_event_types.get(t, 0) + 1
+        self._active_hashes = [e["event_hash"] for e in events]
+        if events:
+            self._active_head, self._active_tail = events[0], events[-1]
+            self._active_first_ts = _to_datetime(events[0]["timestamp"])
+            self._active_last_ts = _to_datetime(events[-1]["timestamp"])
+            self._last_hash = events[-1]["event_hash"]
+            self._sequence_number = events[-1]["sequence_number"]
+
+    def segments(self, include_active: bool = True) -> list[SegmentInfo]:
+        """Sealed segments in order, followed by the active one."""
+        segments = list(self._sealed)
+        if include_active and self._active_count:
+            segments.append(SegmentInfo(self._active_index, self.active_path, None))
+        return segments
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def _should_rotate(self, incoming: int, now: datetime) -> bool:
+        if not self._active_count:
+            return False
+        if self._active_bytes + incoming > self.max_segment_bytes:
+            return True
+        if self.max_segment_age_s is not None and self._active_first_ts is not None:
+            return (now - self._active_first_ts).total_seconds() >= self.max_segment_age_s
+        return False
+
+    @traced("ledger.append")
+    def append(
+        self,
+        event_type: str,
+        event_id: str,
+        payload: dict[str, Any],
+    ) -> WORMEvent:
+        """
+        Append event to the active segment, rotating first if needed.
+
+        Raises:
+            ValueError: If event data is invalid
+            IOError: If write fails
+        """
+        event = WORMEvent.create(
+            event_type=event_type,
+            event_id=event_id,
+            payload=payload,
+            previous_hash=self._last_hash,
+            sequence_number=self._sequence_number + 1,
+        )
+        if not event.verify_hash():
+            raise ValueError("Event hash verification failed")
+
+        record = event.to_dict()
+        line = _dumps(record) + b"\n"
+        timestamp = _to_datetime(event.timestamp)
+        if self._should_rotate(len(line), timestamp):
+            self.seal()
+
+        try:
+            with open(self.active_path, "ab") as f:
+                f.write(line)
+        except Exception as e:
+            raise OSError(f"Failed to write to ledger: {e}") from e
+
+        self._active_bytes += len(line)
+        self._active_count += 1
+        if self._active_head is None:
+            self._active_head, self._active_first_ts = record, timestamp
+        self._active_tail, self._active_last_ts = record, timestamp
+        self._active_hashes.append(event.event_hash)
+        self._active_event_types[event_type] = self._active_event_types.get(event_type, 0) + 1
+        self._last_hash = event.event_hash
+        self._sequence_number = event.sequence_number
+        return event
+
+    def append_pcag(self, pcag: ProofCarryingArtifact) -> WORMEvent:
+        """Append Proof-Carrying Artifact (see WORMLedger.append_pcag)."""
+        if not pcag.verify_hash():
+            raise ValueError("PCAg hash verification failed")
+
+        return self.append(
+            event_type=f"pcag_{pcag.decision_type}",
+            event_id=pcag.decision_id,
+            payload={
+                "pcag": pcag.to_dict(),
+                "artifact_hash": pcag.artifact_hash,
+            },
+        )
+
+    def seal(self) -> SegmentFooter | None:
+        """
+        Seal the active segment (compress + footer) and open a new one.
+
+        Returns:
+            Footer of the sealed segment, or None if the active one is empty
+        """
+        if not self._active_count:
+            return None
+
+        source = self.active_path
+        payload = _compress(source.read_bytes(), self.compression)
+        footer = SegmentFooter(
+            **_summary(
+                self._active_head,
+                self._active_tail,
+                self._active_hashes,
+                self._active_event_types,
+                self._active_index,
+            ),
+            compression=self.compression,
+            payload_hash=compute_hash(payload),
+            sealed_at=datetime.now(UTC).isoformat(),
+        )
+        footer_bytes = _dumps(footer.to_dict())
+
+        target = self._sealed_path(self._active_index)
+        tmp = target.with_name(target.name + ".tmp")
+        with open(tmp, "wb") as f:
+            f.write(payload)
+            f.write(footer_bytes)
+            f.write(len(footer_bytes).to_bytes(8, "big"))
+            f.write(SEGMENT_MAGIC)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, target)
+        source.unlink()
+
+        self._sealed.append(SegmentInfo(self._active_index, target, footer))
+        self._active_index += 1
+        self._write_header()
+        return footer
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def _select(
+        self, start: datetime | str | None, end: datetime | str | None
+    ) -> tuple[list[SegmentInfo], datetime | None, datetime | None]:
+        start = _to_datetime(start) if start is not None else None
+        end = _to_datetime(end) if end is not None else None
+        selected = []
+        for seg in self.segments():
+            if seg.footer is not None:
+                if seg.footer.overlaps(start, end):
+                    selected.append(seg)
+            elif (start is None or self._active_last_ts >= start) and (
+                end is None or self._active_first_ts <= end
+            ):
+                selected.append(seg)
+        return selected, start, end
+
+    def iter_events(
+        self,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+        workers: int = 1,
+    ) -> Iterator[WORMEvent]:
+        """
+        Yield events in sequence order, optionally restricted to [start, end].
+
+        Sealed segments outside the range are skipped from their footers.
+        With ``workers > 1`` segments are decompressed/parsed ahead on a
+        thread pool (at most 2 × workers in flight) while order is kept.
+        """
+        selected, start, end = self._select(start, end)
+
+        def in_range(data: dict[str, Any]) -> bool:
+            if start is None and end is None:
+                return True
+            ts = _to_datetime(data["timestamp"])
+            return (start is None or ts >= start) and (end is None or ts <= end)
+
+        for events in self._map_segments(_load_segment, selected, workers, threads=True):
+            for data in events:
+                if in_range(data):
+                    yield WORMEvent(**data)
+
+    def read_all(self) -> Iterator[WORMEvent]:
+        """Read all events, sealed segments first."""
+        return self.iter_events()
+
+    def read_range(
+        self,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+        workers: int = 1,
+    ) -> Iterator[WORMEvent]:
+        """Read events with start <= timestamp <= end."""
+        return self.iter_events(start, end, workers)
+
+    def read_by_type(self, event_type: str) -> Iterator[WORMEvent]:
+        """Read events of one type, skipping segments that hold none."""
+        for seg in self.segments():
+            if seg.footer is not None and event_type not in seg.footer.event_types:
+                continue
+            for data in _load_segment(str(seg.path), seg.sealed):
+                if data["event_type"] == event_type:
+                    yield WORMEvent(**data)
+
+    def read_by_id(self, event_id: str) -> Iterator[WORMEvent]:
+        """Read events filtered by ID."""
+        for event in self.read_all():
+            if event.event_id == event_id:
+                yield event
+
+    # ------------------------------------------------------------------
+    # Verification and audit
+    # ------------------------------------------------------------------
+
+    def _map_segments(
+        self,
+        fn: Any,
+        segments: list[SegmentInfo],
+        workers: int,
+        threads: bool,
+        executor: Executor | None = None,
+    ) -> Iterable[Any]:
+        """``fn(path, sealed)`` over segments, in order, with bounded prefetch."""
+        if executor is None and workers <= 1:
+            for seg in segments:
+                yield fn(str(seg.path), seg.sealed)
+            return
+
+        pool = executor
+        if pool is None:
+            pool_cls = ThreadPoolExecutor if threads else ProcessPoolExecutor
+            pool = pool_cls(max_workers=workers)
+        try:
+            pending: deque = deque()
+            it = iter(segments)
+            for seg in it:
+                pending.append(pool.submit(fn, str(seg.path), seg.sealed))
+                if len(pending) >= 2 * max(1, workers):
+                    break
+            while pending:
+                result = pending.popleft().result()
+                seg = next(it, None)
+                if seg is not None:
+                    pending.append(pool.submit(fn, str(seg.path), seg.sealed))
+                yield result
+        finally:
+            if executor is None:
+                pool.shutdown(cancel_futures=True)
+
+    def verify_chain(
+        self,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+        workers: int | None = 1,
+        use_processes: bool = True,
+    ) -> tuple[bool, str | None]:
+        """
+        Verify the hash chain, optionally only for segments overlapping a range.
+
+        Each selected segment is verified independently (event hashes, chain,
+        sequence, footer fields and payload hash), on a process pool when
+        ``workers > 1`` (None: one per CPU). Links between consecutive
+        segments are checked from the footers, including the link to the
+        segment just before the range.
+
+        Returns:
+            Tuple of (is_valid, error_message)
+        """
+        selected, _, _ = self._select(start, end)
+        if not selected:
+            return True, None
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        all_segments = self.segments()
+        first = all_segments.index(selected[0])
+        prev_hash = all_segments[first - 1].footer.last_hash if first else None
+        prev_seq = all_segments[first - 1].footer.last_sequence if first else 0
+
+        results = self._map_segments(
+            _verify_segment, selected, workers, threads=not use_processes
+        )
+        for seg, (error, summary) in zip(selected, results, strict=True):
+            if error:
+                return False, error
+            if summary is None:
+                continue
+            if summary["prev_hash"] != prev_hash:
+                return False, f"Chain broken between segments at {seg.path.name}"
+            if summary["first_sequence"] != prev_seq + 1:
+                return False, f"Sequence gap between segments at {seg.path.name}"
+            prev_hash, prev_seq = summary["last_hash"], summary["last_sequence"]
+        return True, None
+
+    def compute_merkle_root(self) -> str | None:
+        """
+        Merkle root over the per-segment Merkle roots.
+
+        Sealed segment roots come from their footers, so no segment is read.
+        """
+        roots = [s.footer.merkle_root for s in self._sealed]
+        if self._active_hashes:
+            roots.append(merkle_root_from_hashes(self._active_hashes))
+        return merkle_root_from_hashes(roots)
+
+    def get_statistics(self, verify: bool = True) -> dict[str, Any]:
+        """
+        Ledger statistics computed from footers (plus the active segment).
+
+        Args:
+            verify: Also run verify_chain (reads every segment)
+        """
+        event_types: dict[str, int] = {}
+        for seg in self._sealed:
+            for t, n in seg.footer.event_types.items():
+                event_types[t] = event_types.get(t, 0) + n
+        for t, n in self._active_event_types.items():
+            event_types[t] = event_types.get(t, 0) + n
+
+        stats = {
+            "total_events": sum(s.footer.event_count for s in self._sealed)
+            + self._active_count,
+            "last_sequence": self._sequence_number,
+            "last_hash": self._last_hash,
+            "merkle_root": self.compute_merkle_root(),
+            "event_types": event_types,
+            "segments": len(self._sealed) + (1 if self._active_count else 0),
+            "sealed_segments": len(self._sealed),
+            "ledger_path": str(self.ledger_dir),
+            "ledger_size_bytes": sum(s.path.stat().st_size for s in self._sealed)
+            + self._active_bytes,
+        }
+        if verify:
+            stats["chain_valid"], stats["chain_error"] = self.verify_chain()
+        return stats
+
+    def export_audit_report(
+        self,
+        output_path: str | Path,
+        start: datetime | str | None = None,
+        end: datetime | str | None = None,
+        workers: int = 1,
+    ) -> None:
+        """
+        Export an audit report for [start, end] (default: full history).
+
+        Only segments overlapping the range are read, verified and exported.
+        """
+        selected, _, _ = self._select(start, end)
+        events = [e.to_dict() for e in self.iter_events(start, end, workers)]
+        chain_valid, chain_error = self.verify_chain(start, end, workers)
+
+        report = {
+            "generated_at": datetime.now(UTC).isoformat(),
+            "ledger_version": LEDGER_VERSION,
+            "range": {
+                "start": _to_datetime(start).isoformat() if start is not None else None,
+                "end": _to_datetime(end).isoformat() if end is not None else None,
+            },
+            "statistics": {
+                "total_events": len(events),
+                "segments": [s.path.name for s in selected],
+                "segment_footers": [s.footer.to_dict() for s in selected if s.footer],
+                "merkle_root": merkle_root_from_hashes([e["event_hash"] for e in events]),
+                "chain_valid": chain_valid,
+                "chain_error": chain_error,
+            },
+            "events": events,
+        }
+
+        output_path = Path(output_path)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if ORJSON_AVAILABLE:
+            output_path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(report, indent=2))
+
+
+__all__ = [
+    "SegmentFooter",
+    "SegmentInfo",
+    "SegmentedWORMLedger",
+    "ZSTD_AVAILABLE",
+]
@@ -34,6 +34,7 @@ from penin.ledger.hash_utils import (
     compute_hash,
     hash_json,
 )
+from penin.observability.tracing import traced
 
 try:
     import orjson
@@ -51,6 +52,27 @@ LEDGER_VERSION = "2.0.0"  # Updated for BLAKE2b
 ENCODING = "utf-8"
 
 
+def merkle_root_from_hashes(hashes: list[str]) -> str | None:
+    """
+    Merkle root (BLAKE2b) of a list of hex hashes.
+
+    Odd nodes are paired with themselves. Returns None for an empty list.
+    """
+    if not hashes:
+        return None
+
+    while len(hashes) > 1:
+        next_level = []
+        for i in range(0, len(hashes), 2):
+            left = hashes[i]
+            right = hashes[i + 1] if i + 1 < len(hashes) else left
+            combined = (left + right).encode()
+            next_level.append(compute_hash(combined))
+        hashes = next_level
+
+    return hashes[0]
+
+
 # ============================================================================
 # Proof-Carrying Artifact (PCAg)
 # ============================================================================
@@ -336,6 +358,7 @@ class WORMLedger:
             self._last_hash = None
             self._sequence_number = 0
 
+    @traced("ledger.append")
     def append(
         self,
         event_type: str,
@@ -505,22 +528,7 @@ class WORMLedger:
         Returns:
             Merkle root hash or None if ledger is empty
         """
-        hashes = [event.event_hash for event in self.read_all()]
-
-        if not hashes:
-            return None
-
-        # Build Merkle tree using BLAKE2b
-        while len(hashes) > 1:
-            next_level = []
-            for i in range(0, len(hashes), 2):
-                left = hashes[i]
-                right = hashes[i + 1] if i + 1 < len(hashes) else left
-                combined = (left + right).encode()
-                next_level.append(compute_hash(combined))
-            hashes = next_level
-
-        return hashes[0]
+        return merkle_root_from_hashes([event.event_hash for event in self.read_all()])
 
     def get_statistics(self) -> dict[str, Any]:
         """
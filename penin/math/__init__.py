@@ -70,21 +70,31 @@ try:
         auto_tune_beta_min,
         compute_lyapunov_quadratic,
         death_gate,
+        death_gate_batch,
         life_gate_lyapunov,
+        life_gate_lyapunov_batch,
+        life_gate_trajectory,
     )
 except ImportError:
     death_gate = None
     life_gate_lyapunov = None
     compute_lyapunov_quadratic = None
     auto_tune_beta_min = None
+    death_gate_batch = None
+    life_gate_lyapunov_batch = None
+    life_gate_trajectory = None
 
 try:
     from .ir_ic_contractivity import (
         RiskProfile,
         apply_Lpsi_operator,
+        apply_Lpsi_operator_batch,
         check_contractivity,
         compute_risk_entropy,
+        compute_risk_entropy_batch,
+        contractivity_batch,
         iterative_refinement,
+        iterative_refinement_batch,
     )
 except ImportError:
     RiskProfile = None
@@ -92,6 +102,10 @@ except ImportError:
     apply_Lpsi_operator = None
     check_contractivity = None
     iterative_refinement = None
+    compute_risk_entropy_batch = None
+    apply_Lpsi_operator_batch = None
+    contractivity_batch = None
+    iterative_refinement_batch = None
 
 try:
     from .penin_master_equation import (
@@ -136,12 +150,19 @@ __all__ = [
     "life_gate_lyapunov",
     "compute_lyapunov_quadratic",
     "auto_tune_beta_min",
+    "death_gate_batch",
+    "life_gate_lyapunov_batch",
+    "life_gate_trajectory",
     # IR→IC
     "RiskProfile",
     "compute_risk_entropy",
     "apply_Lpsi_operator",
     "check_contractivity",
     "iterative_refinement",
+    "compute_risk_entropy_batch",
+    "apply_Lpsi_operator_batch",
+    "contractivity_batch",
+    "iterative_refinement_batch",
     # Master Equation
     "penin_update",
     "master_equation_cycle",
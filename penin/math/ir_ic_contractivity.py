@@ -14,6 +14,8 @@ Properties:
 - Risk classification by category (LO-01 to LO-14)
 - Iterative refinement until convergence
 - Fail-closed: blocks if ρ ≥ 1
+- Batch kernels over (candidates × risk_dims) matrices; the scalar
+  functions are one-row wrappers around them
 
 References:
 - PENIN_OMEGA_COMPLETE_EQUATIONS_GUIDE.md § 6
@@ -22,8 +24,9 @@ References:
 
 from __future__ import annotations
 
-import math
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+
+import numpy as np
 
 
 @dataclass
@@ -42,6 +45,30 @@ class RiskProfile:
     aggregate: float  # Combined risk
 
 
+# Column order of risk matrices: the RiskProfile fields except aggregate
+RISK_DIMS = tuple(f.name for f in fields(RiskProfile) if f.name != "aggregate")
+# Policy key per reducible column (transparency is raised by 1/ρ instead)
+_POLICY_KEYS = tuple("privacy" if name == "privacy_violation" else name for name in RISK_DIMS[:-1])
+
+
+def risk_matrix(profiles: list[RiskProfile]) -> np.ndarray:
+    """Stack profiles into an (n, len(RISK_DIMS)) matrix (aggregate dropped)."""
+    return np.array(
+        [[getattr(p, name) for name in RISK_DIMS] for p in profiles], dtype=np.float64
+    ).reshape(len(profiles), len(RISK_DIMS))
+
+
+def _as_risks(risks: np.ndarray) -> np.ndarray:
+    risks = np.asarray(risks, dtype=np.float64)
+    if risks.ndim != 2 or risks.shape[1] != len(RISK_DIMS):
+        raise ValueError(f"risks must have shape (n, {len(RISK_DIMS)}), got {risks.shape}")
+    return risks
+
+
+def _row_profile(row: np.ndarray, aggregate: float) -> RiskProfile:
+    return RiskProfile(*row.tolist(), aggregate=float(aggregate))
+
+
 def compute_risk_entropy(
     risk_profile: RiskProfile,
     epsilon: float = 1e-9,
@@ -62,27 +89,36 @@ def compute_risk_entropy(
         >>> print(f"H(k): {H:.4f}")
         H(k): 2.1234
     """
-    # Collect all risk dimensions
-    risks = [
-        risk_profile.idolatry,
-        risk_profile.occultism,
-        risk_profile.physical_harm,
-        risk_profile.emotional_harm,
-        risk_profile.spiritual_harm,
-        risk_profile.privacy_violation,
-        risk_profile.bias,
-        risk_profile.fairness,
-        1.0 - risk_profile.transparency,  # Invert transparency
-    ]
+    row = np.array([[getattr(risk_profile, name) for name in RISK_DIMS]])
+    return float(compute_risk_entropy_batch(row, epsilon)[0])
 
-    # Normalize to probability distribution
-    total = sum(risks) + epsilon
-    probs = [r / total for r in risks]
 
-    # Shannon entropy
-    H = -sum(p * math.log2(max(epsilon, p)) for p in probs if p > epsilon)
+def compute_risk_entropy_batch(
+    risks: np.ndarray,
+    epsilon: float = 1e-9,
+) -> np.ndarray:
+    """
+    Shannon entropy H(k) for every row of an (n, len(RISK_DIMS)) risk matrix.
+
+    Columns follow ``RISK_DIMS``; transparency is inverted (1 - t) before
+    normalizing each row to a probability distribution.
 
-    return H
+    Returns:
+        (n,) entropies ≥ 0
+    """
+    return _entropy_rows(_as_risks(risks), epsilon)
+
+
+def _entropy_rows(risks: np.ndarray, epsilon: float = 1e-9) -> np.ndarray:
+    weights = risks.copy()
+    weights[:, -1] = 1.0 - weights[:, -1]  # Invert transparency
+
+    # Normalize to probability distribution
+    probs = weights / (weights.sum(axis=1, keepdims=True) + epsilon)
+
+    # Shannon entropy (terms with p ≤ ε contribute nothing)
+    terms = probs * np.log2(np.maximum(probs, epsilon))
+    return -np.where(probs > epsilon, terms, 0.0).sum(axis=1)
 
 
 def apply_Lpsi_operator(
@@ -110,43 +146,67 @@ def apply_Lpsi_operator(
     if rho >= 1.0:
         raise ValueError(f"ρ must be < 1.0 for contractivity, got {rho}")
 
-    if policies is None:
-        # Uniform reduction
-        policies = {}
-
-    # Apply reduction per category
-    def reduce(val: float, key: str) -> float:
-        factor = policies.get(key, rho)
-        return val * factor
-
-    refined = RiskProfile(
-        idolatry=reduce(risk_profile.idolatry, "idolatry"),
-        occultism=reduce(risk_profile.occultism, "occultism"),
-        physical_harm=reduce(risk_profile.physical_harm, "physical_harm"),
-        emotional_harm=reduce(risk_profile.emotional_harm, "emotional_harm"),
-        spiritual_harm=reduce(risk_profile.spiritual_harm, "spiritual_harm"),
-        privacy_violation=reduce(risk_profile.privacy_violation, "privacy"),
-        bias=reduce(risk_profile.bias, "bias"),
-        fairness=reduce(risk_profile.fairness, "fairness"),
-        transparency=min(
-            1.0, risk_profile.transparency / rho
-        ),  # Increase transparency (inverse risk)
-        aggregate=0.0,  # Recomputed below
-    )
+    row = np.array([[getattr(risk_profile, name) for name in RISK_DIMS]])
+    refined, aggregate = apply_Lpsi_operator_batch(row, rho, policies)
+    return _row_profile(refined[0], aggregate[0])
+
+
+def _contraction_factors(rho: np.ndarray, policies: dict[str, float] | None) -> np.ndarray:
+    """(n, 8) reduction factors: policy overrides per category, else ρ"""
+    factors = np.repeat(rho[:, None], len(_POLICY_KEYS), axis=1)
+    for j, key in enumerate(_POLICY_KEYS):
+        if policies and key in policies:
+            factors[:, j] = policies[key]
+    return factors
+
+
+def _check_rho(rho: float | np.ndarray, n: int) -> np.ndarray:
+    rho = np.asarray(rho, dtype=np.float64)
+    if rho.ndim == 0:
+        rho = np.full(n, float(rho))
+    elif rho.shape != (n,):
+        raise ValueError(f"rho must be a scalar or have shape ({n},), got {rho.shape}")
+    if (rho >= 1.0).any():
+        raise ValueError(f"ρ must be < 1.0 for contractivity, got {rho.max()}")
+    return rho
 
-    # Recompute aggregate
-    refined.aggregate = (
-        refined.idolatry
-        + refined.occultism
-        + refined.physical_harm
-        + refined.emotional_harm
-        + refined.spiritual_harm
-        + refined.privacy_violation
-        + refined.bias
-        + refined.fairness
-        + (1.0 - refined.transparency)
-    ) / 9.0
 
+def risk_aggregate_batch(risks: np.ndarray) -> np.ndarray:
+    """Aggregate risk per row: mean of the categories and (1 - transparency)."""
+    return _aggregate_rows(_as_risks(risks))
+
+
+def _aggregate_rows(risks: np.ndarray) -> np.ndarray:
+    return (risks[:, :-1].sum(axis=1) + (1.0 - risks[:, -1])) / len(RISK_DIMS)
+
+
+def apply_Lpsi_operator_batch(
+    risks: np.ndarray,
+    rho: float | np.ndarray,
+    policies: dict[str, float] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Apply L_ψ to every row of an (n, len(RISK_DIMS)) risk matrix.
+
+    Args:
+        risks: Risk matrix, columns in ``RISK_DIMS`` order
+        rho: Contraction factor, scalar or one per row (all < 1.0)
+        policies: Optional policy-specific reduction factors
+
+    Returns:
+        (refined risks (n, d), aggregate (n,))
+    """
+    risks = _as_risks(risks)
+    rho = _check_rho(rho, len(risks))
+    refined = _lpsi_rows(risks, rho, _contraction_factors(rho, policies))
+    return refined, _aggregate_rows(refined)
+
+
+def _lpsi_rows(risks: np.ndarray, rho: np.ndarray, factors: np.ndarray) -> np.ndarray:
+    refined = np.empty_like(risks)
+    np.multiply(risks[:, :-1], factors, out=refined[:, :-1])
+    # Increase transparency (inverse risk)
+    refined[:, -1] = np.minimum(1.0, risks[:, -1] / rho)
     return refined
 
 
@@ -177,6 +237,35 @@ def check_contractivity(
     return H_refined <= threshold
 
 
+def check_contractivity_batch(
+    H_refined: np.ndarray,
+    H_original: np.ndarray,
+    rho: float | np.ndarray,
+    tolerance: float = 1e-6,
+) -> np.ndarray:
+    """Element-wise H(L_ψ(k)) ≤ ρ · H(k) (bool array)."""
+    return np.asarray(H_refined) <= np.asarray(rho) * np.asarray(H_original) + tolerance
+
+
+def contractivity_batch(
+    risks: np.ndarray,
+    rho: float | np.ndarray,
+    policies: dict[str, float] | None = None,
+    tolerance: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    One L_ψ step and the contractivity check for every candidate.
+
+    Returns:
+        (contractive (n,) bool, H_original (n,), H_refined (n,))
+    """
+    risks = _as_risks(risks)
+    rho = _check_rho(rho, len(risks))
+    H_original = _entropy_rows(risks)
+    H_refined = _entropy_rows(_lpsi_rows(risks, rho, _contraction_factors(rho, policies)))
+    return check_contractivity_batch(H_refined, H_original, rho, tolerance), H_original, H_refined
+
+
 def iterative_refinement(
     risk_profile: RiskProfile,
     rho: float,
@@ -201,24 +290,81 @@ def iterative_refinement(
         >>> print(f"Converged in {iters} iterations: {ok}")
         Converged in 3 iterations: True
     """
-    current = risk_profile
-    H_prev = compute_risk_entropy(current)
+    row = np.array([[getattr(risk_profile, name) for name in RISK_DIMS]])
+    result = iterative_refinement_batch(row, rho, max_iterations, convergence_threshold)
+    iterations = int(result.iterations[0])
+    if iterations == 0:
+        return risk_profile, 0, False
+    return (
+        _row_profile(result.risks[0], result.aggregate[0]),
+        iterations,
+        bool(result.converged[0]),
+    )
+
+
+@dataclass
+class RiskRefinementBatch:
+    """Per-candidate outcome of iterative_refinement_batch."""
+
+    risks: np.ndarray  # (n, d) refined risks
+    aggregate: np.ndarray  # (n,) aggregate risk after refinement
+    entropy: np.ndarray  # (n,) H(k) after the last applied iteration
+    iterations: np.ndarray  # (n,) L_ψ applications per candidate
+    converged: np.ndarray  # (n,) ΔH fell below the threshold
 
-    for iteration in range(max_iterations):
-        # Apply operator
-        current = apply_Lpsi_operator(current, rho)
 
-        # Check convergence
-        H_current = compute_risk_entropy(current)
-        delta_H = abs(H_current - H_prev)
+def iterative_refinement_batch(
+    risks: np.ndarray,
+    rho: float | np.ndarray,
+    max_iterations: int = 10,
+    convergence_threshold: float = 1e-3,
+    policies: dict[str, float] | None = None,
+) -> RiskRefinementBatch:
+    """
+    Iteratively apply L_ψ to all candidates until each converges.
 
-        if delta_H < convergence_threshold:
-            return current, iteration + 1, True
+    Each iteration only touches the rows still active: a candidate leaves
+    the active mask once its ΔH < ``convergence_threshold``, and the loop
+    ends when no candidate is left or after ``max_iterations``.
 
-        H_prev = H_current
+    Args:
+        risks: (n, len(RISK_DIMS)) risk matrix
+        rho: Contraction factor, scalar or one per candidate
+        max_iterations: Maximum refinement iterations
+        convergence_threshold: Stop a candidate when ΔH < threshold
+        policies: Optional policy-specific reduction factors
 
-    # Max iterations reached without convergence
-    return current, max_iterations, False
+    Returns:
+        RiskRefinementBatch
+    """
+    current = _as_risks(risks).copy()
+    n = len(current)
+    rho = _check_rho(rho, n)
+    factors = _contraction_factors(rho, policies)
+    H = _entropy_rows(current)
+    iterations = np.zeros(n, dtype=np.int64)
+    converged = np.zeros(n, dtype=bool)
+    active = np.arange(n)
+
+    for _ in range(max_iterations):
+        if active.size == 0:
+            break
+        refined = _lpsi_rows(current[active], rho[active], factors[active])
+        H_new = _entropy_rows(refined)
+        current[active] = refined
+        iterations[active] += 1
+        done = np.abs(H_new - H[active]) < convergence_threshold
+        H[active] = H_new
+        converged[active[done]] = True
+        active = active[~done]
+
+    return RiskRefinementBatch(
+        risks=current,
+        aggregate=_aggregate_rows(current),
+        entropy=H,
+        iterations=iterations,
+        converged=converged,
+    )
 
 
 # Export public API
@@ -228,4 +374,13 @@ __all__ = [
     "apply_Lpsi_operator",
     "check_contractivity",
     "iterative_refinement",
+    "RISK_DIMS",
+    "RiskRefinementBatch",
+    "risk_matrix",
+    "risk_aggregate_batch",
+    "compute_risk_entropy_batch",
+    "apply_Lpsi_operator_batch",
+    "check_contractivity_batch",
+    "contractivity_batch",
+    "iterative_refinement_batch",
 ]
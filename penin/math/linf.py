@@ -17,8 +17,14 @@ References:
 
 from __future__ import annotations
 
+import logging
 import math
 from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # numpy is imported by the batch kernels only
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 
 @dataclass
@@ -145,3 +151,119 @@ def compute_linf_meta(
 
     return result
     return base * penalty
+
+
+# =============================================================================
+# Batch kernels (NumPy)
+# =============================================================================
+#
+# Metrics are (..., k) arrays whose last axis indexes the metrics in a fixed
+# column order; leading axes are candidates. Weights are (k,) or broadcast
+# against metrics, costs and gates are scalars or (N,). Clamping matches the
+# scalar functions above, including NaN (max(eps, nan) == eps).
+
+
+def _weights_batch(metrics: np.ndarray, weights: ArrayLike | None) -> np.ndarray:
+    import numpy as np
+
+    if weights is None:
+        return np.ones(metrics.shape[-1])
+    return np.asarray(weights, dtype=np.float64)
+
+
+def harmonic_noncomp_batch(
+    metrics: ArrayLike,
+    weights: ArrayLike | None = None,
+    eps: float = 1e-6,
+) -> np.ndarray:
+    """
+    Vectorized harmonic_noncomp over a batch of metric rows.
+
+    Args:
+        metrics: (N, k) or (k,) normalized metrics
+        weights: (k,) or (N, k) weights (default: all 1.0)
+        eps: Stability threshold
+
+    Returns:
+        (N,) harmonic means (0-d array for a single row)
+    """
+    import numpy as np
+
+    m = np.asarray(metrics, dtype=np.float64)
+    w = _weights_batch(m, weights)
+    num = np.broadcast_to(w, np.broadcast_shapes(w.shape, m.shape)).sum(axis=-1)
+    den = (w / np.fmax(eps, m)).sum(axis=-1)
+    return num / np.fmax(eps, den)
+
+
+def linf_score_batch(
+    metrics: ArrayLike,
+    weights: ArrayLike | None,
+    cost: ArrayLike,
+    lambda_c: float = 0.01,
+) -> np.ndarray:
+    """
+    Vectorized linf_score.
+
+    Args:
+        metrics: (N, k) or (k,) normalized metrics
+        weights: (k,) or (N, k) weights (None: all 1.0)
+        cost: Scalar or (N,) normalized costs
+        lambda_c: Cost penalty factor
+
+    Returns:
+        (N,) L∞ scores
+    """
+    import numpy as np
+
+    base = harmonic_noncomp_batch(metrics, weights)
+    return base * np.exp(-lambda_c * np.fmax(0.0, np.asarray(cost, dtype=np.float64)))
+
+
+def compute_linf_meta_batch(
+    metrics: ArrayLike,
+    weights: ArrayLike | None,
+    cost: ArrayLike,
+    config: LInfConfig | None = None,
+    ethics_ok: ArrayLike = True,
+    contratividade_ok: ArrayLike = True,
+) -> np.ndarray:
+    """
+    Vectorized compute_linf_meta with per-candidate fail-closed gates.
+
+    Args:
+        metrics: (N, k) or (k,) normalized metrics
+        weights: (k,) or (N, k) weights (None: all 1.0)
+        cost: Scalar or (N,) normalized costs
+        config: L∞ configuration
+        ethics_ok: Scalar or (N,) ΣEA/LO-14 gate status
+        contratividade_ok: Scalar or (N,) IR→IC gate status (ρ < 1)
+
+    Returns:
+        (N,) L∞ scores, 0.0 where a required gate fails
+    """
+    import numpy as np
+
+    if config is None:
+        config = LInfConfig()
+
+    base = harmonic_noncomp_batch(metrics, weights, eps=config.epsilon)
+    cost = np.asarray(cost, dtype=np.float64)
+    result = base * np.exp(-config.lambda_c * np.fmax(0.0, cost))
+
+    # Fail-closed gates
+    passed = np.array(True)
+    if config.require_ethics:
+        passed = passed & np.asarray(ethics_ok, dtype=bool)
+    if config.require_contractividade:
+        passed = passed & np.asarray(contratividade_ok, dtype=bool)
+
+    out = np.where(passed, result, 0.0)
+    blocked = out.size - int(np.count_nonzero(np.broadcast_to(passed, out.shape)))
+    if blocked:
+        logging.getLogger(__name__).warning(
+            "L∞ batch: %d/%d candidates blocked by ethics/contractividade gates",
+            blocked,
+            out.size,
+        )
+    return out
@@ -28,12 +28,17 @@ References:
 from __future__ import annotations
 
 import math
-from collections.abc import Callable
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import repeat
 from typing import Any
 
 import numpy as np
 
+from penin.observability.tracing import span, traced
+
 
 @dataclass
 class MasterEquationState:
@@ -47,6 +52,128 @@ class MasterEquationState:
     Linf: float  # L∞ performance
 
 
+def _coordinate_rows(
+    state: np.ndarray, dims: np.ndarray, deltas: np.ndarray, chunk: int
+) -> Callable[[int, int], np.ndarray]:
+    """
+    Chunk builder for coordinate perturbations: row k is ``state`` with
+    ``deltas[k]`` added at ``dims[k]`` (-1: unperturbed).
+
+    A single (chunk, d) buffer is filled with ``state`` once; each chunk only
+    writes its n perturbed entries and restores the previous chunk's, so the
+    cost is O(chunk·d) once instead of per chunk.
+    """
+    buf = np.repeat(state[None, :], min(chunk, len(dims)), axis=0)
+    touched: list[tuple[np.ndarray, np.ndarray]] = []
+
+    def rows(start: int, stop: int) -> np.ndarray:
+        if touched:
+            hit, cols = touched.pop()
+            buf[hit, cols] = state[cols]
+        block_dims = dims[start:stop]
+        hit = np.flatnonzero(block_dims >= 0)
+        cols = block_dims[hit]
+        buf[hit, cols] += deltas[start:stop][hit]
+        touched.append((hit, cols))
+        return buf[: stop - start]
+
+    return rows
+
+
+def _chunk_size(batch_size: int) -> int:
+    return batch_size if batch_size > 0 else 1024
+
+
+def _evaluate_losses(
+    rows: Callable[[int, int], np.ndarray],
+    count: int,
+    evidence: Any,
+    policies: dict[str, Any],
+    loss_fn: Callable,
+    batch_size: int,
+    n_workers: int,
+    executor: Executor | None,
+) -> np.ndarray:
+    """
+    Evaluate ``loss_fn`` on ``count`` perturbed states.
+
+    ``rows(start, stop)`` materializes the states of one chunk, so at most
+    ``batch_size`` (or 1024 for per-row evaluation) rows exist at a time.
+    The returned block is only valid until the next ``rows`` call.
+    With ``batch_size > 0`` the loss must be vectorized: it receives an
+    (m, d) matrix and returns m losses. Otherwise it is called once per row,
+    on ``executor`` / a thread pool of ``n_workers`` when given.
+    """
+    losses = np.empty(count, dtype=np.float64)
+    chunk = _chunk_size(batch_size)
+
+    pool = executor
+    if pool is None and batch_size <= 0 and n_workers > 1:
+        pool = ThreadPoolExecutor(max_workers=n_workers)
+
+    try:
+        for start in range(0, count, chunk):
+            stop = min(start + chunk, count)
+            block = rows(start, stop)
+            if batch_size > 0:
+                values = loss_fn(block, evidence, policies)
+                losses[start:stop] = np.asarray(values, dtype=np.float64).reshape(-1)
+            elif pool is not None:
+                losses[start:stop] = list(
+                    pool.map(loss_fn, block, repeat(evidence), repeat(policies))
+                )
+            else:
+                for k, row in enumerate(block, start):
+                    losses[k] = loss_fn(row, evidence, policies)
+    finally:
+        if pool is not None and executor is None:
+            pool.shutdown()
+
+    return losses
+
+
+def _finite_difference(
+    state: np.ndarray,
+    evidence: Any,
+    policies: dict[str, Any],
+    loss_fn: Callable,
+    finite_diff_epsilon: float,
+    method: str,
+    batch_size: int,
+    n_workers: int,
+    executor: Executor | None,
+) -> np.ndarray:
+    """Batched/parallel forward or central differences (descent direction)."""
+    n = len(state)
+    eps = finite_diff_epsilon
+    if method == "forward":
+        # Row 0 is the unperturbed state, rows 1..n perturb one dimension each
+        dims = np.arange(-1, n)
+        deltas = np.full(n + 1, eps)
+    elif method == "central":
+        dims = np.tile(np.arange(n), 2)
+        deltas = np.repeat([eps, -eps], n)
+    else:
+        raise ValueError(f"Unknown gradient method: {method}")
+
+    losses = _evaluate_losses(
+        _coordinate_rows(state, dims, deltas, _chunk_size(batch_size)),
+        len(dims),
+        evidence,
+        policies,
+        loss_fn,
+        batch_size,
+        n_workers,
+        executor,
+    )
+
+    if method == "forward":
+        gradient = (losses[1:] - losses[0]) / eps
+    else:
+        gradient = (losses[:n] - losses[n:]) / (2 * eps)
+    return -gradient.astype(state.dtype, copy=False)
+
+
 def estimate_gradient(
     state: np.ndarray,
     evidence: Any,
@@ -55,6 +182,8 @@ def estimate_gradient(
     finite_diff_epsilon: float = 1e-4,
     method: str = "forward",
     batch_size: int = 0,
+    n_workers: int = 1,
+    executor: Executor | None = None,
 ) -> np.ndarray:
     """
     Estimate update direction G using finite differences.
@@ -66,7 +195,12 @@ def estimate_gradient(
         loss_fn: Loss function to minimize
         finite_diff_epsilon: Step size for finite differences
         method: 'forward' (O(n)) or 'central' (O(2n), more accurate)
-        batch_size: (Unused) Reserved for future batched evaluation support.
+        batch_size: If > 0, ``loss_fn`` is vectorized (takes an (m, n)
+            matrix of states, returns m losses) and is called once per
+            ``batch_size`` perturbed states instead of once per state
+        n_workers: Evaluate a non-vectorized ``loss_fn`` on this many threads
+        executor: Evaluate a non-vectorized ``loss_fn`` on this executor
+            (e.g. a ProcessPoolExecutor for picklable, CPU-bound losses)
 
     Returns:
         Gradient estimate G (same shape as state)
@@ -79,6 +213,19 @@ def estimate_gradient(
         Uses vectorized computation and pre-allocated arrays to reduce overhead.
         Forward differences are faster but less accurate than central differences.
     """
+    if batch_size > 0 or n_workers > 1 or executor is not None:
+        return _finite_difference(
+            state,
+            evidence,
+            policies,
+            loss_fn,
+            finite_diff_epsilon,
+            method,
+            batch_size,
+            n_workers,
+            executor,
+        )
+
     n = len(state)
     gradient = np.zeros(n, dtype=state.dtype)
 
@@ -132,6 +279,7 @@ def estimate_gradient_fast(
     policies: dict[str, Any],
     loss_fn: Callable,
     finite_diff_epsilon: float = 1e-4,
+    batch_size: int = 0,
 ) -> np.ndarray:
     """
     Fast gradient estimation using optimized forward differences.
@@ -146,6 +294,8 @@ def estimate_gradient_fast(
         policies: Policy parameters P_n
         loss_fn: Loss function to minimize
         finite_diff_epsilon: Step size for finite differences
+        batch_size: If > 0, ``loss_fn`` is vectorized and evaluates
+            ``batch_size`` perturbed states per call (see estimate_gradient)
 
     Returns:
         Gradient estimate G (same shape as state)
@@ -155,7 +305,22 @@ def estimate_gradient_fast(
         - Uses scalar multiplication instead of division where possible
         - Minimizes Python-level operations in the hot loop
         - Uses vectorized negation for final gradient
+        - With ``batch_size``, n + 1 loss evaluations collapse into
+          ceil((n + 1) / batch_size) vectorized calls
     """
+    if batch_size > 0:
+        return _finite_difference(
+            state,
+            evidence,
+            policies,
+            loss_fn,
+            finite_diff_epsilon,
+            "forward",
+            batch_size,
+            1,
+            None,
+        )
+
     n = len(state)
     loss_current = loss_fn(state, evidence, policies)
 
@@ -180,6 +345,75 @@ def estimate_gradient_fast(
     return gradient
 
 
+def estimate_gradient_spsa(
+    state: np.ndarray,
+    evidence: Any,
+    policies: dict[str, Any],
+    loss_fn: Callable,
+    finite_diff_epsilon: float = 1e-3,
+    n_samples: int = 1,
+    distribution: str = "rademacher",
+    rng: np.random.Generator | int | None = None,
+    batch_size: int = 0,
+    n_workers: int = 1,
+    executor: Executor | None = None,
+) -> np.ndarray:
+    """
+    Estimate update direction G by simultaneous perturbation (SPSA).
+
+    Each sample perturbs all dimensions at once along a random direction Δ
+    and uses two loss evaluations, independent of the state dimension:
+
+        ĝ = mean_k [(L(I + c·Δ_k) - L(I - c·Δ_k)) / (2c)] · Δ_k
+
+    Args:
+        state: Current state I_n
+        evidence: Environment/data E_n
+        policies: Policy parameters P_n
+        loss_fn: Loss function to minimize
+        finite_diff_epsilon: Perturbation size c
+        n_samples: Directions averaged per estimate (2·n_samples loss calls)
+        distribution: 'rademacher' (Δ ∈ {±1}, classic SPSA) or 'gaussian'
+            (random-direction estimator, Δ ~ N(0, I))
+        rng: Generator or seed for the perturbation directions
+        batch_size: If > 0, ``loss_fn`` is vectorized (see estimate_gradient)
+        n_workers: Evaluate a non-vectorized ``loss_fn`` on this many threads
+        executor: Evaluate a non-vectorized ``loss_fn`` on this executor
+
+    Returns:
+        Gradient estimate G (same shape as state), unbiased up to O(c²)
+
+    Note:
+        The estimate is noisy; its variance falls as 1/n_samples. Prefer
+        finite differences for small states where O(n) calls are cheap.
+    """
+    rng = np.random.default_rng(rng)
+    n = len(state)
+    c = finite_diff_epsilon
+
+    if distribution == "rademacher":
+        directions = rng.choice(np.array([-1.0, 1.0]), size=(n_samples, n))
+    elif distribution == "gaussian":
+        directions = rng.standard_normal((n_samples, n))
+    else:
+        raise ValueError(f"Unknown SPSA distribution: {distribution}")
+
+    # Rows [0, n_samples) are I + cΔ_k, rows [n_samples, 2·n_samples) are I - cΔ_k
+    signs = np.repeat([c, -c], n_samples)[:, None]
+
+    def rows(start: int, stop: int) -> np.ndarray:
+        k = np.arange(start, stop) % n_samples
+        return (state + signs[start:stop] * directions[k]).astype(state.dtype, copy=False)
+
+    losses = _evaluate_losses(
+        rows, 2 * n_samples, evidence, policies, loss_fn, batch_size, n_workers, executor
+    )
+
+    scale = (losses[:n_samples] - losses[n_samples:]) / (2 * c)
+    gradient = scale @ directions / n_samples
+    return -gradient.astype(state.dtype, copy=False)
+
+
 def project_to_safe_set(
     state: np.ndarray,
     H_constraints: dict[str, tuple] | None = None,
@@ -217,16 +451,15 @@ def project_to_safe_set(
     projected = state.copy()
 
     # H: Technical constraints
-    if H_constraints:
-        if "bounds" in H_constraints:
-            low, high = H_constraints["bounds"]
-            np.clip(projected, low, high, out=projected)
+    if H_constraints and "bounds" in H_constraints:
+        low, high = H_constraints["bounds"]
+        np.clip(projected, low, high, out=projected)
 
-        if "max_norm" in H_constraints or clip_norm:
-            max_norm = clip_norm or H_constraints.get("max_norm")
-            norm = np.linalg.norm(projected)
-            if norm > max_norm:
-                projected *= max_norm / norm
+    max_norm = clip_norm or (H_constraints or {}).get("max_norm")
+    if max_norm:
+        norm = np.linalg.norm(projected)
+        if norm > max_norm:
+            projected *= max_norm / norm
 
     # S: Ethical constraints (placeholder)
     # In production, call OPA/Rego service
@@ -307,6 +540,7 @@ def penin_update(
     return I_next
 
 
+@traced("evolution.master_equation")
 def master_equation_cycle(
     state: MasterEquationState,
     evidence: Any,
@@ -319,6 +553,7 @@ def master_equation_cycle(
     H_constraints: dict[str, tuple] | None = None,
     S_constraints: dict[str, Any] | None = None,
     use_fast_gradient: bool = True,
+    gradient_fn: Callable | None = None,
 ) -> MasterEquationState:
     """
     Execute complete Master Equation cycle.
@@ -341,6 +576,9 @@ def master_equation_cycle(
         H_constraints: Technical constraints
         S_constraints: Ethical constraints
         use_fast_gradient: Use optimized gradient estimation (default: True)
+        gradient_fn: Custom estimator ``(state, evidence, policies, loss_fn) -> G``,
+            e.g. ``functools.partial(estimate_gradient_spsa, n_samples=4)``
+            or ``functools.partial(estimate_gradient_fast, batch_size=256)``
 
     Returns:
         Updated MasterEquationState
@@ -360,17 +598,21 @@ def master_equation_cycle(
         ... )
     """
     # Step 1: Estimate gradient
-    if use_fast_gradient:
-        G = estimate_gradient_fast(state.I, evidence, policies, loss_fn)
-    else:
-        G = estimate_gradient(state.I, evidence, policies, loss_fn)
+    with span("evolution.gradient"):
+        if gradient_fn is not None:
+            G = gradient_fn(state.I, evidence, policies, loss_fn)
+        elif use_fast_gradient:
+            G = estimate_gradient_fast(state.I, evidence, policies, loss_fn)
+        else:
+            G = estimate_gradient(state.I, evidence, policies, loss_fn)
 
     # Step 2: Compute effective step size
     phi = compute_phi_saturation(caos_plus, gamma)
     alpha_n = alpha_0 * phi * sr_score
 
     # Step 3: Update state
-    I_next = penin_update(state.I, G, alpha_n, H_constraints, S_constraints)
+    with span("evolution.update"):
+        I_next = penin_update(state.I, G, alpha_n, H_constraints, S_constraints)
 
     # Step 4: Create new state
     new_state = MasterEquationState(
@@ -385,13 +627,337 @@ def master_equation_cycle(
     return new_state
 
 
+# =============================================================================
+# Ensemble (multi-trajectory) runner
+# =============================================================================
+#
+# K independent trajectories are held as a (K, d) array and advanced together.
+# Losses must be vectorized: loss_fn((m, d) states, E, P) -> m losses, the same
+# convention as ``batch_size > 0`` above. Per-trajectory parameters (α₀, γ,
+# CAOS⁺, SR) may be scalars or (K,) arrays, so a sweep over α₀/γ/κ is one run
+# (κ enters through CAOS⁺, e.g. compute_caos_plus_exponential_batch).
+
+
+def compute_phi_saturation_batch(
+    caos_plus: np.ndarray | float,
+    gamma: np.ndarray | float = 0.8,
+    mode: str = "tanh",
+) -> np.ndarray:
+    """Vectorized compute_phi_saturation over (K,) CAOS⁺/γ values."""
+    caos_plus = np.asarray(caos_plus, dtype=np.float64)
+    if mode == "tanh":
+        return np.tanh(gamma * caos_plus)
+    elif mode == "sigmoid":
+        return 1.0 / (1.0 + np.exp(-gamma * (caos_plus - 1.0)))
+    else:
+        raise ValueError(f"Unknown saturation mode: {mode}")
+
+
+def project_to_safe_set_batch(
+    states: np.ndarray,
+    H_constraints: dict[str, tuple] | None = None,
+    S_constraints: dict[str, Any] | None = None,
+    clip_norm: float | None = None,
+) -> np.ndarray:
+    """
+    Project each row of a (K, d) array onto Π_{H∩S}.
+
+    Row-wise equivalent of project_to_safe_set (norm limits apply per
+    trajectory).
+    """
+    if not H_constraints and not S_constraints and clip_norm is None:
+        return states
+
+    projected = states.copy()
+
+    # H: Technical constraints
+    if H_constraints and "bounds" in H_constraints:
+        low, high = H_constraints["bounds"]
+        np.clip(projected, low, high, out=projected)
+
+    max_norm = clip_norm or (H_constraints or {}).get("max_norm")
+    if max_norm:
+        norms = np.linalg.norm(projected, axis=1)
+        over = norms > max_norm
+        projected[over] *= (max_norm / norms[over])[:, None]
+
+    # S: Ethical constraints (placeholder, see project_to_safe_set)
+    return projected
+
+
+def penin_update_batch(
+    I_n: np.ndarray,
+    G: np.ndarray,
+    alpha_n: np.ndarray | float,
+    H_constraints: dict[str, tuple] | None = None,
+    S_constraints: dict[str, Any] | None = None,
+) -> np.ndarray:
+    """Vectorized penin_update: I_{n+1} = Π_{H∩S}[I_n + α_n · G] per row."""
+    alpha = np.asarray(alpha_n, dtype=np.float64)
+    if alpha.ndim:
+        alpha = alpha[:, None]
+    return project_to_safe_set_batch(I_n + alpha * G, H_constraints, S_constraints)
+
+
+def estimate_gradient_ensemble(
+    states: np.ndarray,
+    evidence: Any,
+    policies: dict[str, Any],
+    loss_fn: Callable,
+    method: str = "forward",
+    finite_diff_epsilon: float = 1e-4,
+    n_samples: int = 1,
+    rng: np.random.Generator | int | None = None,
+    batch_size: int = 4096,
+    base_losses: np.ndarray | None = None,
+) -> np.ndarray:
+    """
+    Estimate update directions G for K trajectories at once.
+
+    Args:
+        states: (K, d) current states
+        evidence: Environment/data E_n
+        policies: Policy parameters P_n
+        loss_fn: Vectorized loss, (m, d) states -> m losses
+        method: 'forward' (K·(d+1) rows, K·d with base_losses), 'central' (2·K·d rows) or
+            'spsa' (2·K·n_samples rows, Rademacher directions)
+        finite_diff_epsilon: Perturbation size
+        n_samples: SPSA directions per trajectory
+        rng: Generator or seed for SPSA directions
+        batch_size: Rows per loss call
+        base_losses: (K,) losses of ``states`` if already known; forward
+            differences then evaluate only the K·d perturbed rows
+
+    Returns:
+        (K, d) descent directions, row k matching the single-state estimator
+    """
+    K, d = states.shape
+    eps = finite_diff_epsilon
+
+    if method == "spsa":
+        rng = np.random.default_rng(rng)
+        directions = rng.choice(np.array([-1.0, 1.0]), size=(K, n_samples, d))
+        per = 2 * n_samples
+        signs = np.repeat([eps, -eps], n_samples)
+
+        def rows(start: int, stop: int) -> np.ndarray:
+            r = np.arange(start, stop)
+            traj, local = np.divmod(r, per)
+            step = signs[local][:, None] * directions[traj, local % n_samples]
+            return (states[traj] + step).astype(states.dtype, copy=False)
+
+    else:
+        if method == "forward":
+            dims = np.arange(-1 if base_losses is None else 0, d)
+            deltas = np.full(len(dims), eps)
+        elif method == "central":
+            dims = np.tile(np.arange(d), 2)
+            deltas = np.repeat([eps, -eps], d)
+        else:
+            raise ValueError(f"Unknown gradient method: {method}")
+        per = len(dims)
+
+        def rows(start: int, stop: int) -> np.ndarray:
+            traj, local = np.divmod(np.arange(start, stop), per)
+            block = states[traj]
+            hit = np.flatnonzero(dims[local] >= 0)
+            block[hit, dims[local[hit]]] += deltas[local[hit]]
+            return block
+
+    losses = _evaluate_losses(
+        rows, K * per, evidence, policies, loss_fn, max(1, batch_size), 1, None
+    ).reshape(K, per)
+
+    if method == "spsa":
+        scale = (losses[:, :n_samples] - losses[:, n_samples:]) / (2 * eps)
+        gradient = np.einsum("ks,ksd->kd", scale, directions) / n_samples
+    elif method == "forward":
+        if base_losses is None:
+            base_losses, losses = losses[:, 0], losses[:, 1:]
+        gradient = (losses - np.asarray(base_losses, dtype=np.float64)[:, None]) / eps
+    else:
+        gradient = (losses[:, :d] - losses[:, d:]) / (2 * eps)
+    return -gradient.astype(states.dtype, copy=False)
+
+
+@dataclass
+class EnsembleStepSummary:
+    """Aggregate of one ensemble step (streamed instead of full histories)."""
+
+    n: int  # Step number (1-based)
+    active: int  # Trajectories still running after this step
+    converged: int  # Trajectories converged so far
+    loss_mean: float  # Mean current loss over all K trajectories
+    loss_min: float  # Best current loss
+    best_index: int  # Trajectory holding loss_min
+    step_norm_max: float  # Largest ||I_{n+1} - I_n|| among active trajectories
+    elapsed_s: float  # Wall time of this step
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class MasterEquationEnsemble:
+    """
+    Advance K independent Master Equation trajectories in lock-step.
+
+    Each step applies, across all still-active trajectories at once:
+    gradient estimation, α_n = α₀ · φ(CAOS⁺) · R_t, the update and Π_{H∩S}.
+    A trajectory is frozen once its step norm falls below ``tol``; frozen
+    rows are no longer evaluated.
+
+    Example:
+        >>> ens = MasterEquationEnsemble(
+        ...     I0, None, {}, vectorized_loss,
+        ...     alpha_0=np.linspace(0.01, 0.5, len(I0)), caos_plus=1.5, sr_score=0.85,
+        ... )
+        >>> for summary in ens.run(max_steps=200):
+        ...     print(summary.n, summary.active, summary.loss_min)
+        >>> best = ens.I[summary.best_index]
+    """
+
+    def __init__(
+        self,
+        I0: np.ndarray,
+        evidence: Any,
+        policies: dict[str, Any],
+        loss_fn: Callable,
+        alpha_0: np.ndarray | float,
+        caos_plus: np.ndarray | float,
+        sr_score: np.ndarray | float,
+        gamma: np.ndarray | float = 0.8,
+        saturation_mode: str = "tanh",
+        H_constraints: dict[str, tuple] | None = None,
+        S_constraints: dict[str, Any] | None = None,
+        gradient: str | Callable = "forward",
+        finite_diff_epsilon: float = 1e-4,
+        n_samples: int = 1,
+        batch_size: int = 4096,
+        tol: float = 0.0,
+        rng: np.random.Generator | int | None = None,
+    ):
+        """
+        Args:
+            I0: (K, d) initial states
+            evidence: Environment data
+            policies: Policy parameters
+            loss_fn: Vectorized loss, (m, d) states -> m losses
+            alpha_0, caos_plus, sr_score, gamma: Scalars or (K,) arrays
+            saturation_mode: 'tanh' or 'sigmoid' for φ(CAOS⁺)
+            H_constraints: Technical constraints (applied per row)
+            S_constraints: Ethical constraints
+            gradient: 'forward', 'central', 'spsa' or a callable
+                ``(states, evidence, policies, loss_fn) -> (m, d)``
+            finite_diff_epsilon: Perturbation size for the estimators
+            n_samples: SPSA directions per trajectory
+            batch_size: Rows per loss call
+            tol: Freeze a trajectory when its step norm is ≤ tol (0: never)
+            rng: Seed or generator for SPSA
+        """
+        self.I = np.array(I0, dtype=np.float64, ndmin=2)
+        K = self.I.shape[0]
+        self.evidence = evidence
+        self.policies = policies
+        self.loss_fn = loss_fn
+        self.H_constraints = H_constraints
+        self.S_constraints = S_constraints
+        self.gradient = gradient
+        self.finite_diff_epsilon = finite_diff_epsilon
+        self.n_samples = n_samples
+        self.batch_size = batch_size
+        self.tol = tol
+        self.rng = np.random.default_rng(rng)
+
+        phi = compute_phi_saturation_batch(caos_plus, gamma, saturation_mode)
+        alpha = np.asarray(alpha_0, dtype=np.float64) * phi * np.asarray(sr_score)
+        self.alpha_n = np.broadcast_to(alpha, (K,)).copy()
+        self.n = 0
+        self.active = np.ones(K, dtype=bool)
+        self.converged_at = np.full(K, -1)
+        self.loss = self._losses(self.I)
+
+    def _losses(self, states: np.ndarray) -> np.ndarray:
+        return _evaluate_losses(
+            lambda start, stop: states[start:stop],
+            len(states),
+            self.evidence,
+            self.policies,
+            self.loss_fn,
+            max(1, self.batch_size),
+            1,
+            None,
+        )
+
+    def _directions(self, states: np.ndarray, losses: np.ndarray) -> np.ndarray:
+        if callable(self.gradient):
+            return self.gradient(states, self.evidence, self.policies, self.loss_fn)
+        return estimate_gradient_ensemble(
+            states,
+            self.evidence,
+            self.policies,
+            self.loss_fn,
+            method=self.gradient,
+            finite_diff_epsilon=self.finite_diff_epsilon,
+            n_samples=self.n_samples,
+            rng=self.rng,
+            batch_size=self.batch_size,
+            base_losses=losses,
+        )
+
+    def step(self) -> EnsembleStepSummary:
+        """Advance every active trajectory by one Master Equation cycle."""
+        start = time.perf_counter()
+        idx = np.flatnonzero(self.active)
+        current = self.I[idx]
+
+        G = self._directions(current, self.loss[idx])
+        I_next = penin_update_batch(
+            current, G, self.alpha_n[idx], self.H_constraints, self.S_constraints
+        )
+        step_norm = np.linalg.norm(I_next - current, axis=1)
+
+        self.I[idx] = I_next
+        self.loss[idx] = self._losses(I_next)
+        self.n += 1
+
+        done = idx[step_norm <= self.tol]
+        self.active[done] = False
+        self.converged_at[done] = self.n
+
+        best = int(np.argmin(self.loss))
+        return EnsembleStepSummary(
+            n=self.n,
+            active=int(self.active.sum()),
+            converged=int((self.converged_at >= 0).sum()),
+            loss_mean=float(self.loss.mean()),
+            loss_min=float(self.loss[best]),
+            best_index=best,
+            step_norm_max=float(step_norm.max()) if len(step_norm) else 0.0,
+            elapsed_s=time.perf_counter() - start,
+        )
+
+    def run(self, max_steps: int) -> Iterator[EnsembleStepSummary]:
+        """Yield one summary per step until max_steps or all trajectories converge."""
+        for _ in range(max_steps):
+            if not self.active.any():
+                return
+            yield self.step()
+
+
 # Export public API
 __all__ = [
     "penin_update",
     "master_equation_cycle",
     "estimate_gradient",
     "estimate_gradient_fast",
+    "estimate_gradient_spsa",
     "project_to_safe_set",
     "compute_phi_saturation",
     "MasterEquationState",
+    "compute_phi_saturation_batch",
+    "project_to_safe_set_batch",
+    "penin_update_batch",
+    "estimate_gradient_ensemble",
+    "EnsembleStepSummary",
+    "MasterEquationEnsemble",
 ]
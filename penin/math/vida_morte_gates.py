@@ -16,6 +16,7 @@ Properties:
 - Auto-tunable β_min via bandit
 - Lyapunov guarantee: monotonic risk reduction
 - Rollback triggered automatically
+- Batch gates over challenger populations and V trajectories (NumPy)
 
 References:
 - PENIN_OMEGA_COMPLETE_EQUATIONS_GUIDE.md § 5, § 11
@@ -27,6 +28,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from enum import Enum
 
+import numpy as np
+
 
 class GateDecision(str, Enum):
     """Gate decision outcomes."""
@@ -81,10 +84,7 @@ def death_gate(
         >>> print(result.decision, result.passed)
         GateDecision.ROLLBACK False
     """
-    if strict:
-        passed = delta_Linf >= beta_min
-    else:
-        passed = delta_Linf >= beta_min - 1e-12
+    passed = bool(death_gate_batch(delta_Linf, beta_min, strict))
 
     if passed:
         decision = GateDecision.PROMOTE
@@ -129,14 +129,10 @@ def life_gate_lyapunov(
         >>> print(result.decision, result.passed)
         GateDecision.PROMOTE True
     """
-    # Compute derivative
-    dV_dt = (V_current - V_previous) / max(epsilon, dt)
-
-    # Check conditions (with tolerance)
-    energy_decreased = V_current < (V_previous + epsilon)
-    derivative_ok = dV_dt <= epsilon
-
-    passed = energy_decreased and derivative_ok
+    passed, dV_dt, energy_decreased, derivative_ok = _lyapunov_conditions(
+        V_current, V_previous, dt, epsilon
+    )
+    passed, dV_dt = bool(passed), float(dV_dt)
 
     if passed:
         decision = GateDecision.PROMOTE
@@ -160,6 +156,88 @@ def life_gate_lyapunov(
     )
 
 
+def death_gate_batch(
+    delta_Linf: np.ndarray,
+    beta_min: float | np.ndarray = 0.01,
+    strict: bool = True,
+) -> np.ndarray:
+    """
+    Death Gate for a whole challenger population.
+
+    Args:
+        delta_Linf: ΔL∞ per challenger (any shape)
+        beta_min: Threshold, scalar or broadcastable to ``delta_Linf``
+        strict: If True, use ≥; if False, allow equality
+
+    Returns:
+        Boolean survival mask (True → PROMOTE, False → ROLLBACK)
+    """
+    delta_Linf = np.asarray(delta_Linf, dtype=np.float64)
+    threshold = np.asarray(beta_min, dtype=np.float64)
+    if not strict:
+        threshold = threshold - 1e-12
+    return delta_Linf >= threshold
+
+
+def _lyapunov_conditions(V_current, V_previous, dt, epsilon):
+    """(passed, dV/dt, V decreased, dV/dt ≤ ε), element-wise"""
+    dV_dt = (np.asarray(V_current, dtype=np.float64) - V_previous) / np.maximum(epsilon, dt)
+    energy_decreased = np.asarray(V_current) < (np.asarray(V_previous) + epsilon)
+    derivative_ok = dV_dt <= epsilon
+    return energy_decreased & derivative_ok, dV_dt, energy_decreased, derivative_ok
+
+
+def life_gate_lyapunov_batch(
+    V_current: np.ndarray,
+    V_previous: np.ndarray,
+    dt: float | np.ndarray = 1.0,
+    epsilon: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Life Gate for a whole challenger population.
+
+    Args:
+        V_current: V(I_{t+1}) per challenger
+        V_previous: V(I_t) per challenger (broadcastable)
+        dt: Time step, scalar or per challenger
+        epsilon: Tolerance for numerical errors
+
+    Returns:
+        (passed mask, dV/dt)
+    """
+    passed, dV_dt, _, _ = _lyapunov_conditions(V_current, V_previous, dt, epsilon)
+    return passed, dV_dt
+
+
+def life_gate_trajectory(
+    V: np.ndarray,
+    t: np.ndarray | None = None,
+    dt: float = 1.0,
+    epsilon: float = 1e-6,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Life Gate along trajectories: every step of every row must pass.
+
+    dV/dt comes from differencing along the last axis, so a (n, T) matrix
+    of Lyapunov values is judged in one pass.
+
+    Args:
+        V: Lyapunov values, shape (..., T) with T ≥ 2
+        t: Optional timestamps (shape (T,) or like ``V``); default uniform ``dt``
+        dt: Time step when ``t`` is not given
+        epsilon: Tolerance for numerical errors
+
+    Returns:
+        (trajectory passed (...,), step passed (..., T-1), dV/dt (..., T-1))
+    """
+    V = np.asarray(V, dtype=np.float64)
+    if V.shape[-1] < 2:
+        raise ValueError("Trajectories need at least two points")
+    steps = np.diff(t, axis=-1) if t is not None else dt
+    passed, dV_dt, _, _ = _lyapunov_conditions(V[..., 1:], V[..., :-1], steps, epsilon)
+    return passed.all(axis=-1), passed, dV_dt
+
+
 def compute_lyapunov_quadratic(
     state: float,
     target: float = 0.0,
@@ -235,6 +313,9 @@ __all__ = [
     "life_gate_lyapunov",
     "compute_lyapunov_quadratic",
     "auto_tune_beta_min",
+    "death_gate_batch",
+    "life_gate_lyapunov_batch",
+    "life_gate_trajectory",
     "GateDecision",
     "DeathGateResult",
     "LifeGateResult",
@@ -0,0 +1,650 @@
+"""
+PENIN-Ω Memoization
+===================
+
+``@memoize`` for pure functions that are called repeatedly with identical
+inputs (equation entry points, scoring kernels, async probes).
+
+- O(1) eviction: LRU (``OrderedDict``) or LFU (frequency buckets).
+- Stable, typed keys: ``1``, ``1.0`` and ``True`` are different keys;
+  NumPy arrays are keyed by dtype, shape and a BLAKE2b digest of their
+  buffer; dataclasses, enums and Pydantic models are keyed by value.
+  Arguments without a stable encoding bypass the cache (counted as
+  ``uncacheable``) instead of being keyed by ``repr``/``id``.
+- Per-function namespace with its own ``MemoStats``; ``memo_stats()``
+  reports every namespace in the process.
+- Single-flight: concurrent misses on the same key run the function once,
+  the other callers wait for (and share) that result or exception.
+  The cache lock is never held while the function runs.
+- ``async def`` functions are supported with the same semantics.
+- Optional L2 spill: entries evicted from memory are written to a
+  ``SecureCache`` (``penin.cache``) and looked up there on a miss. Only
+  values that survive a JSON round trip unchanged are spilled.
+
+Results are returned by reference, so memoize only functions whose return
+values callers do not mutate.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import enum
+import functools
+import hashlib
+import inspect
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import asyncio
+
+logger = logging.getLogger("penin.memo")
+
+_MISSING = object()
+_KWARGS_MARK = object()
+_DICT_MARK = object()
+_PRIMITIVES = frozenset({int, float, str, bool, type(None), bytes})
+
+
+class Uncacheable(TypeError):
+    """Argument has no stable key encoding"""
+
+
+# -----------------------------------------------------------------------------
+# Stable key encoding
+# -----------------------------------------------------------------------------
+
+
+def _encode(obj: Any, out: bytearray) -> None:
+    t = type(obj)
+    if t is float:
+        out += b"f" + struct.pack("<d", obj)
+    elif t is int:
+        s = str(obj).encode()
+        out += b"i" + s + b";"
+    elif t is str:
+        s = obj.encode("utf-8", "surrogatepass")
+        out += b"s" + struct.pack("<Q", len(s)) + s
+    elif t is bool:
+        out += b"T" if obj else b"F"
+    elif obj is None:
+        out += b"N"
+    elif t is tuple or t is list:
+        out += (b"(" if t is tuple else b"[") + struct.pack("<Q", len(obj))
+        for item in obj:
+            _encode(item, out)
+    elif t is dict:
+        # Insertion order is part of the key: float reductions over
+        # dict.items() depend on it.
+        out += b"{" + struct.pack("<Q", len(obj))
+        for k, v in obj.items():
+            _encode(k, out)
+            _encode(v, out)
+    elif t is bytes or t is bytearray or t is memoryview:
+        b = bytes(obj)
+        out += b"b" + struct.pack("<Q", len(b)) + b
+    elif t is set or t is frozenset:
+        parts = []
+        for item in obj:
+            buf = bytearray()
+            _encode(item, buf)
+            parts.append(bytes(buf))
+        out += b"S" + struct.pack("<Q", len(parts)) + b"".join(sorted(parts))
+    elif t is type:
+        name = f"{obj.__module__}.{obj.__qualname__}".encode()
+        out += b"t" + struct.pack("<Q", len(name)) + name
+    elif isinstance(obj, enum.Enum):
+        out += b"e"
+        _encode(type(obj), out)
+        _encode(obj.value, out)
+    elif dataclasses.is_dataclass(obj):
+        out += b"d"
+        _encode(type(obj), out)
+        for f in dataclasses.fields(obj):
+            _encode(f.name, out)
+            _encode(getattr(obj, f.name), out)
+    elif _is_ndarray(obj):
+        if obj.dtype.hasobject:
+            raise Uncacheable("object arrays have no stable encoding")
+        digest = hashlib.blake2b(obj.tobytes(order="C"), digest_size=16).digest()
+        out += b"a"
+        _encode(obj.dtype.str, out)
+        _encode(tuple(obj.shape), out)
+        out += digest
+    elif _is_numpy_scalar(obj):
+        out += b"g"
+        _encode(obj.dtype.str, out)
+        out += obj.tobytes()
+    elif hasattr(obj, "model_dump") and hasattr(type(obj), "model_fields"):
+        out += b"m"
+        _encode(type(obj), out)
+        _encode(obj.model_dump(), out)
+    elif isinstance(obj, (int, float, str, tuple)):
+        # Subclasses (IntEnum handled above): key by the base value + type
+        out += b"x"
+        _encode(t, out)
+        base = next(b for b in (int, float, str, tuple) if isinstance(obj, b))
+        _encode(base(obj), out)
+    elif obj is _KWARGS_MARK or obj is _DICT_MARK:
+        out += b"K" if obj is _KWARGS_MARK else b"D"
+    else:
+        raise Uncacheable(f"cannot build a stable key for {t.__qualname__}")
+
+
+def _is_ndarray(obj: Any) -> bool:
+    return type(obj).__name__ == "ndarray" and type(obj).__module__ == "numpy"
+
+
+def _is_numpy_scalar(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy" and hasattr(obj, "dtype")
+
+
+def stable_key(*args: Any, **kwargs: Any) -> bytes:
+    """128-bit BLAKE2b digest of the typed encoding of ``args``/``kwargs``"""
+    out = bytearray()
+    _encode(args, out)
+    _encode(kwargs, out)
+    return hashlib.blake2b(bytes(out), digest_size=16).digest()
+
+
+def _signed_zero_or_nan(value: Any) -> bool:
+    # 0.0 == -0.0 share a hash and NaN never equals itself: as dict keys they
+    # would alias or never hit, so they go through the byte encoding instead
+    return type(value) is float and (value == 0.0 or value != value)
+
+
+def _flat(value: Any, t: type) -> Hashable:
+    """Hashable stand-in for a primitive or a flat dict of primitives"""
+    if t in _PRIMITIVES:
+        if _signed_zero_or_nan(value):
+            raise Uncacheable
+        return value
+    if t is dict and _PRIMITIVES.issuperset(map(type, value.values())):
+        if all(type(k) is str for k in value) and not any(
+            map(_signed_zero_or_nan, value.values())
+        ):
+            return (_DICT_MARK, *value.items(), *map(type, value.values()))
+    elif isinstance(value, (int, float, str)) and not isinstance(value, enum.Enum):
+        return value  # e.g. numpy.float64; its type is part of the key
+    raise Uncacheable
+
+
+def make_key(args: tuple, kwargs: dict) -> Hashable:
+    """
+    Cache key for a call: typed tuple for primitive/flat-dict arguments,
+    ``stable_key`` digest otherwise. Raises ``Uncacheable`` when an argument
+    has no stable encoding.
+    """
+    types = tuple(map(type, args))
+    if (
+        not kwargs
+        and _PRIMITIVES.issuperset(types)
+        and (float not in types or not any(map(_signed_zero_or_nan, args)))
+    ):
+        return args + types
+    try:
+        key = tuple(map(_flat, args, types))
+        if kwargs:
+            kw_types = tuple(map(type, kwargs.values()))
+            key += (_KWARGS_MARK, *kwargs, *map(_flat, kwargs.values(), kw_types))
+            return key + types + kw_types
+        return key + types
+    except Uncacheable:
+        return stable_key(*args, **kwargs)
+
+
+def _l2_name(namespace: str, key: Hashable) -> str:
+    if not isinstance(key, bytes):
+        out = bytearray()
+        _encode(key, out)
+        key = hashlib.blake2b(bytes(out), digest_size=16).digest()
+    return f"{namespace}:{key.hex()}"
+
+
+def _json_stable(value: Any) -> bool:
+    """True when ``value`` comes back identical from a JSON round trip"""
+    t = type(value)
+    if t in (int, float, str, bool):
+        return True
+    if t is list:
+        return all(_json_stable(v) for v in value)
+    if t is dict:
+        return all(type(k) is str and _json_stable(v) for k, v in value.items())
+    return False
+
+
+# -----------------------------------------------------------------------------
+# Eviction policies
+# -----------------------------------------------------------------------------
+
+
+class _LRUStore:
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable) -> tuple[Any, float | None] | None:
+        entry = self._data.get(key)
+        if entry is not None:
+            self._data.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, entry: tuple[Any, float | None]) -> list:
+        self._data[key] = entry
+        self._data.move_to_end(key)
+        evicted = []
+        while len(self._data) > self.maxsize:
+            evicted.append(self._data.popitem(last=False))
+        return evicted
+
+    def pop(self, key: Hashable) -> None:
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class _LFUStore:
+    """O(1) LFU: one insertion-ordered bucket per frequency, LRU within a bucket"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: dict[Hashable, list] = {}  # key -> [entry, freq]
+        self._buckets: dict[int, OrderedDict] = {}
+        self._min_freq = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _touch(self, key: Hashable, node: list) -> None:
+        freq = node[1]
+        bucket = self._buckets[freq]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[freq]
+            if self._min_freq == freq:
+                self._min_freq = freq + 1
+        node[1] = freq + 1
+        self._buckets.setdefault(freq + 1, OrderedDict())[key] = None
+
+    def get(self, key: Hashable) -> tuple[Any, float | None] | None:
+        node = self._data.get(key)
+        if node is None:
+            return None
+        self._touch(key, node)
+        return node[0]
+
+    def put(self, key: Hashable, entry: tuple[Any, float | None]) -> list:
+        node = self._data.get(key)
+        if node is not None:
+            node[0] = entry
+            self._touch(key, node)
+            return []
+        evicted = []
+        if len(self._data) >= self.maxsize:
+            bucket = self._buckets[self._min_freq]
+            old_key, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_freq]
+            evicted.append((old_key, self._data.pop(old_key)[0]))
+        self._data[key] = [entry, 1]
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_freq = 1
+        return evicted
+
+    def pop(self, key: Hashable) -> None:
+        node = self._data.pop(key, None)
+        if node is None:
+            return
+        bucket = self._buckets[node[1]]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[node[1]]
+            if self._min_freq == node[1]:
+                self._min_freq = min(self._buckets, default=0)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._buckets.clear()
+        self._min_freq = 0
+
+
+_POLICIES = {"lru": _LRUStore, "lfu": _LFUStore}
+
+
+# -----------------------------------------------------------------------------
+# Memo
+# -----------------------------------------------------------------------------
+
+
+@dataclass
+class MemoStats:
+    """Counters for one memoized namespace"""
+
+    hits: int = 0
+    misses: int = 0
+    l2_hits: int = 0
+    waits: int = 0
+    evictions: int = 0
+    spills: int = 0
+    expired: int = 0
+    uncacheable: int = 0
+    compute_s: float = 0.0
+    last_compute_at: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+_REGISTRY: dict[str, Memo] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+class Memo:
+    """Bounded result cache for one function namespace"""
+
+    def __init__(
+        self,
+        namespace: str,
+        maxsize: int = 1024,
+        policy: str = "lru",
+        ttl: float | None = None,
+        l2: Any | None = None,
+    ):
+        if policy not in _POLICIES:
+            raise ValueError(f"policy must be one of {sorted(_POLICIES)}, got {policy!r}")
+        if maxsize < 1:
+            raise ValueError("maxsize must be >= 1")
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.policy = policy
+        self.ttl = ttl
+        self.l2 = l2
+        self.stats = MemoStats()
+        self._store = _POLICIES[policy](maxsize)
+        self._lock = threading.Lock()
+        self._l2_lock = threading.Lock()
+        self._inflight: dict[Hashable, Future] = {}
+        self._ainflight: dict[Hashable, asyncio.Future] = {}
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    # ---------- lookup/store (call with self._lock held) ----------
+    def _lookup(self, key: Hashable) -> Any:
+        entry = self._store.get(key)
+        if entry is None:
+            return _MISSING
+        value, expires_at = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._store.pop(key)
+            self.stats.expired += 1
+            return _MISSING
+        self.stats.hits += 1
+        return value
+
+    def _store_value(self, key: Hashable, value: Any, ttl: Any = _MISSING) -> list:
+        if ttl is _MISSING:
+            ttl = self.ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        evicted = self._store.put(key, (value, expires_at))
+        self.stats.evictions += len(evicted)
+        return evicted
+
+    # ---------- L2 ----------
+    def _l2_get(self, key: Hashable) -> Any:
+        if self.l2 is None:
+            return _MISSING
+        try:
+            with self._l2_lock:
+                value = self.l2.get(_l2_name(self.namespace, key))
+        except ValueError as e:  # HMAC mismatch: recompute rather than trust it
+            logger.warning("memo %s: discarding L2 entry: %s", self.namespace, e)
+            return _MISSING
+        return _MISSING if value is None else value
+
+    def _spill(self, evicted: list) -> None:
+        if self.l2 is None:
+            return
+        for key, (value, expires_at) in evicted:
+            if value is None or not _json_stable(value):
+                continue
+            if expires_at is not None and time.monotonic() >= expires_at:
+                continue
+            with self._l2_lock:
+                self.l2.set(_l2_name(self.namespace, key), value)
+            self.stats.spills += 1
+
+    # ---------- compute paths ----------
+    def _finish(self, key: Hashable, value: Any, started: float, ttl: Any) -> None:
+        with self._lock:
+            self.stats.compute_s += time.perf_counter() - started
+            self.stats.last_compute_at = time.time()
+            evicted = self._store_value(key, value, ttl)
+        self._spill(evicted)
+
+    def call(
+        self, func: Callable, key: Hashable, args: tuple, kwargs: dict, ttl: Any = _MISSING
+    ) -> Any:
+        """Cached ``func(*args, **kwargs)`` under ``key`` (``ttl`` overrides ``self.ttl``)"""
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is not None and (
+                entry[1] is None or time.monotonic() < entry[1]
+            ):
+                self.stats.hits += 1
+                return entry[0]
+            value = self._lookup(key)  # expiry bookkeeping
+            if value is not _MISSING:
+                return value
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+                self.stats.misses += 1
+            else:
+                self.stats.waits += 1
+        if not leader:
+            return future.result()
+
+        try:
+            value = self._l2_get(key)
+            if value is not _MISSING:
+                with self._lock:
+                    self.stats.l2_hits += 1
+                    evicted = self._store_value(key, value, ttl)
+                self._spill(evicted)
+            else:
+                started = time.perf_counter()
+                value = func(*args, **kwargs)
+                self._finish(key, value, started, ttl)
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_result(value)
+        return value
+
+    async def acall(
+        self, func: Callable, key: Hashable, args: tuple, kwargs: dict, ttl: Any = _MISSING
+    ) -> Any:
+        """Async counterpart of :meth:`call`"""
+        import asyncio  # deferred: keeps `import penin.memo` cheap
+
+        loop = asyncio.get_running_loop()
+        while True:
+            with self._lock:
+                value = self._lookup(key)
+                if value is not _MISSING:
+                    return value
+                future = self._ainflight.get(key)
+                if future is not None and future.get_loop() is not loop:
+                    future = None  # in flight on another loop: compute here
+                leader = future is None
+                if leader:
+                    future = self._ainflight[key] = loop.create_future()
+                    self.stats.misses += 1
+                else:
+                    self.stats.waits += 1
+            if leader:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # Leader was cancelled: retry (the next caller becomes leader)
+
+        try:
+            value = self._l2_get(key)
+            if value is not _MISSING:
+                with self._lock:
+                    self.stats.l2_hits += 1
+                    evicted = self._store_value(key, value, ttl)
+                self._spill(evicted)
+            else:
+                started = time.perf_counter()
+                value = await func(*args, **kwargs)
+                self._finish(key, value, started, ttl)
+        except asyncio.CancelledError:
+            self._release_async(key, future)
+            future.cancel()
+            raise
+        except BaseException as e:
+            self._release_async(key, future)
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody is waiting
+            raise
+        self._release_async(key, future)
+        future.set_result(value)
+        return value
+
+    def _release_async(self, key: Hashable, future: asyncio.Future) -> None:
+        with self._lock:
+            if self._ainflight.get(key) is future:
+                del self._ainflight[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+    def info(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "namespace": self.namespace,
+                "policy": self.policy,
+                "maxsize": self.maxsize,
+                "currsize": len(self._store),
+                "ttl": self.ttl,
+                **self.stats.to_dict(),
+            }
+
+
+def memoize(
+    maxsize: int = 1024,
+    policy: str = "lru",
+    ttl: float | None = None,
+    namespace: str | None = None,
+    l2: Any | None = None,
+    key_func: Callable[..., Hashable] | None = None,
+) -> Callable[[Callable], Callable]:
+    """
+    Memoize a pure function (sync or ``async def``)
+
+    Args:
+        maxsize: Entries kept in memory
+        policy: "lru" or "lfu"
+        ttl: Seconds an entry stays valid (None = no expiry)
+        namespace: Stats/L2 namespace (default: module.qualname)
+        l2: Optional ``SecureCache`` receiving evicted entries
+        key_func: Custom key builder ``key_func(*args, **kwargs) -> hashable``
+
+    The wrapper exposes ``cache`` (the ``Memo``), ``cache_info()`` and
+    ``cache_clear()``.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        ns = namespace or f"{func.__module__}.{func.__qualname__}"
+        memo = Memo(ns, maxsize=maxsize, policy=policy, ttl=ttl, l2=l2)
+        with _REGISTRY_LOCK:
+            _REGISTRY[ns] = memo
+
+        def build_key(args: tuple, kwargs: dict) -> Hashable | None:
+            try:
+                if key_func is None:
+                    return make_key(args, kwargs)
+                return key_func(*args, **kwargs)
+            except Uncacheable:
+                memo.stats.uncacheable += 1
+                return None
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                key = build_key(args, kwargs)
+                if key is None:
+                    return await func(*args, **kwargs)
+                return await memo.acall(func, key, args, kwargs)
+
+            wrapper = async_wrapper
+        else:
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                key = build_key(args, kwargs)
+                if key is None:
+                    return func(*args, **kwargs)
+                return memo.call(func, key, args, kwargs)
+
+        wrapper.cache = memo
+        wrapper.cache_info = memo.info
+        wrapper.cache_clear = memo.clear
+        return wrapper
+
+    return decorator
+
+
+def memo_stats() -> dict[str, dict[str, Any]]:
+    """``Memo.info()`` for every memoized namespace in this process"""
+    with _REGISTRY_LOCK:
+        memos = list(_REGISTRY.values())
+    return {m.namespace: m.info() for m in memos}
+
+
+def clear_all_memos() -> None:
+    """Drop every in-memory memo entry (L2 tiers are left untouched)"""
+    with _REGISTRY_LOCK:
+        memos = list(_REGISTRY.values())
+    for m in memos:
+        m.clear()
+
+
+__all__ = [
+    "Memo",
+    "MemoStats",
+    "Uncacheable",
+    "clear_all_memos",
+    "make_key",
+    "memo_stats",
+    "memoize",
+    "stable_key",
+]
@@ -1,7 +1,44 @@
+"""
+Clients for the Σ-Guard and SR-Ω∞ microservices.
+
+- ``GuardClient``/``SRClient``: blocking, for scripts and sync callers.
+- ``AsyncGuardClient``/``AsyncSRClient``: for use inside ``async`` code
+  (e.g. FastAPI handlers). They share a keep-alive ``httpx.AsyncClient``
+  pool per event loop, with timeouts and retries on connection errors/5xx.
+- ``LocalGuardClient``/``LocalSRClient``: same async interface, evaluated
+  in-process without HTTP for co-located deployments.
+"""
+
+from __future__ import annotations
+
+import asyncio
 from typing import Any
 
+import httpx
 import requests
 
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_pools: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_async_pool() -> httpx.AsyncClient:
+    """Shared keep-alive ``httpx.AsyncClient`` for the running event loop"""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool.is_closed:
+        for stale in [lp for lp in _pools if lp.is_closed()]:
+            del _pools[stale]
+        pool = httpx.AsyncClient(limits=_POOL_LIMITS)
+        _pools[loop] = pool
+    return pool
+
+
+async def close_async_pool() -> None:
+    """Close the pool bound to the running event loop"""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
+
 
 class GuardClient:
     def __init__(self, base_url: str = "http://127.0.0.1:8011"):
@@ -41,3 +78,120 @@ class SRClient:
         )
         r.raise_for_status()
         return r.json()
+
+
+class _AsyncServiceClient:
+    """HTTP plumbing shared by the async clients"""
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float = 5.0,
+        retries: int = 2,
+        backoff_s: float = 0.05,
+        client: httpx.AsyncClient | None = None,
+    ):
+        self.base = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_s = backoff_s
+        self._client = client
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client if self._client is not None else get_async_pool()
+
+    async def _request(
+        self, method: str, path: str, json: Any = None, timeout: float | None = None
+    ) -> dict[str, Any]:
+        for attempt in range(self.retries + 1):
+            try:
+                r = await self.client.request(
+                    method,
+                    f"{self.base}{path}",
+                    json=json,
+                    timeout=timeout or self.timeout,
+                )
+                if r.status_code < 500 or attempt == self.retries:
+                    r.raise_for_status()
+                    return r.json()
+            except httpx.TransportError:
+                if attempt == self.retries:
+                    raise
+            await asyncio.sleep(self.backoff_s * 2**attempt)
+        raise AssertionError("unreachable")
+
+    async def health(self) -> bool:
+        try:
+            body = await self._request("GET", "/health", timeout=2.0)
+            return bool(body.get("ok", False))
+        except Exception:
+            return False
+
+
+class AsyncGuardClient(_AsyncServiceClient):
+    def __init__(self, base_url: str = "http://127.0.0.1:8011", **kwargs):
+        super().__init__(base_url, **kwargs)
+
+    async def eval(self, metrics: dict[str, Any]) -> dict[str, Any]:
+        return await self._request("POST", "/sigma_guard/eval", json=metrics)
+
+    async def eval_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        body = await self._request(
+            "POST", "/sigma_guard/eval_batch", json={"items": items}
+        )
+        return body["results"]
+
+
+class AsyncSRClient(_AsyncServiceClient):
+    def __init__(self, base_url: str = "http://127.0.0.1:8012", **kwargs):
+        super().__init__(base_url, **kwargs)
+
+    async def eval(
+        self, ece: float, rho: float, risk: float, dlinf_dc: float
+    ) -> dict[str, Any]:
+        return await self._request(
+            "POST",
+            "/sr/eval",
+            json={"ece": ece, "rho": rho, "risk": risk, "dlinf_dc": dlinf_dc},
+        )
+
+    async def eval_batch(self, probes: list[dict[str, float]]) -> list[dict[str, Any]]:
+        body = await self._request("POST", "/sr/eval_batch", json={"items": probes})
+        return body["results"]
+
+
+class LocalGuardClient:
+    """In-process Σ-Guard: same interface as AsyncGuardClient, no HTTP"""
+
+    async def health(self) -> bool:
+        return True
+
+    async def eval(self, metrics: dict[str, Any]) -> dict[str, Any]:
+        from penin.guard.sigma_guard_service import evaluate_guard
+
+        return evaluate_guard(metrics)
+
+    async def eval_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        from penin.guard.sigma_guard_service import evaluate_guard
+
+        return [evaluate_guard(m) for m in items]
+
+
+class LocalSRClient:
+    """In-process SR-Ω∞ probe: same interface as AsyncSRClient, no HTTP"""
+
+    async def health(self) -> bool:
+        return True
+
+    async def eval(
+        self, ece: float, rho: float, risk: float, dlinf_dc: float
+    ) -> dict[str, Any]:
+        from penin.sr.sr_service import evaluate_sr_probe
+
+        return evaluate_sr_probe(ece, rho, risk, dlinf_dc)
+
+    async def eval_batch(self, probes: list[dict[str, float]]) -> list[dict[str, Any]]:
+        from penin.sr.sr_service import evaluate_sr_probe
+
+        return [evaluate_sr_probe(**p) for p in probes]
@@ -38,6 +38,12 @@ from penin.ledger.worm_ledger_complete import (
     create_pcag,
     create_worm_ledger,
 )
+from penin.omega.racing import (
+    RaceResult,
+    RacingConfig,
+    SampleFn,
+    SuccessiveHalvingRacer,
+)
 
 # ============================================================================
 # Constants and Configuration
@@ -544,6 +550,43 @@ class ChampionChallengerFramework:
 
         return evaluation
 
+    async def race_challengers(
+        self,
+        mutations: list[Mutation],
+        evaluate_fn: SampleFn,
+        max_budget: int,
+        config: RacingConfig | None = None,
+    ) -> RaceResult:
+        """
+        Race proposed challengers with successive halving.
+
+        Eliminated challengers are rolled back (with a PCAg in the ledger);
+        survivors are left proposed for the full shadow/canary evaluation.
+
+        Args:
+            mutations: Proposed challenger mutations
+            evaluate_fn: ``evaluate_fn(mutation_id, start, stop)`` returning
+                L∞ samples ``[start, stop)`` for one challenger
+            max_budget: Samples per challenger at full budget
+            config: Racing configuration
+
+        Returns:
+            RaceResult
+        """
+        racer = SuccessiveHalvingRacer(config)
+        race = await racer.race(
+            [m.mutation_id for m in mutations], evaluate_fn, max_budget
+        )
+
+        for mutation in mutations:
+            rung = race.eliminated.get(mutation.mutation_id)
+            if rung is not None:
+                self.rollback_challenger(
+                    mutation, reason=f"Eliminated by racing at rung {rung}"
+                )
+
+        return race
+
     def decide_promotion(
         self,
         evaluation: ChallengerEvaluation,
@@ -755,6 +798,61 @@ class OmegaMeta:
         # Propose
         self.framework.propose_challenger(mutation)
 
+        return await self._evaluate_proposed(mutation, shadow_samples, run_canary)
+
+    async def race_and_evaluate(
+        self,
+        mutations: list[Mutation],
+        evaluate_fn: SampleFn,
+        max_budget: int,
+        racing_config: RacingConfig | None = None,
+        shadow_samples: int = 100,
+        run_canary: bool = True,
+    ) -> tuple[list[ChallengerEvaluation], RaceResult]:
+        """
+        Propose several challengers, race them, and fully evaluate survivors.
+
+        Survivors go through shadow/canary and the Σ-Guard decision in
+        ranking order; evaluation stops at the first one cleared for
+        promotion.
+
+        Args:
+            mutations: Mutations to evaluate
+            evaluate_fn: Cheap L∞ sampler used for racing
+            max_budget: Racing samples per challenger at full budget
+            racing_config: Racing configuration
+            shadow_samples: Shadow sample count
+            run_canary: Run canary evaluation
+
+        Returns:
+            Tuple of (survivor evaluations, race result)
+        """
+        for mutation in mutations:
+            self.framework.propose_challenger(mutation)
+
+        race = await self.framework.race_challengers(
+            mutations, evaluate_fn, max_budget, racing_config
+        )
+
+        by_id = {m.mutation_id: m for m in mutations}
+        evaluations: list[ChallengerEvaluation] = []
+        for mutation_id in race.ranking:
+            evaluation = await self._evaluate_proposed(
+                by_id[mutation_id], shadow_samples, run_canary
+            )
+            evaluations.append(evaluation)
+            if evaluation.promote:
+                break
+
+        return evaluations, race
+
+    async def _evaluate_proposed(
+        self,
+        mutation: Mutation,
+        shadow_samples: int,
+        run_canary: bool,
+    ) -> ChallengerEvaluation:
+        """Run shadow (and canary) evaluation for an already proposed mutation."""
         # Shadow evaluation
         shadow_eval = await self.framework.evaluate_shadow(
             mutation,
@@ -1,3 +1,6 @@
+import asyncio
+import os
+from contextlib import asynccontextmanager
 from pathlib import Path
 from random import random
 from typing import Any
@@ -5,7 +8,13 @@ from typing import Any
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
 
-from penin.meta.guard_client import GuardClient, SRClient
+from penin.meta.guard_client import (
+    AsyncGuardClient,
+    AsyncSRClient,
+    LocalGuardClient,
+    LocalSRClient,
+    close_async_pool,
+)
 from penin.omega import phi_caos
 from penin.omega.ledger import SQLiteWORMLedger, WORMEvent
 from penin.plugins.mammoth_adapter import continual_step_mammoth
@@ -13,10 +22,23 @@ from penin.plugins.naslib_adapter import propose_with_naslib
 from penin.plugins.nextpy_adapter import propose_with_nextpy
 from penin.plugins.symbolicai_adapter import verify_with_symbolicai
 
-app = FastAPI(title="Omega-META", version="0.1.0")
 
-GUARD = GuardClient("http://127.0.0.1:8011")
-SR = SRClient("http://127.0.0.1:8012")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    await close_async_pool()
+
+
+app = FastAPI(title="Omega-META", version="0.1.0", lifespan=lifespan)
+
+# PENIN_META_TRANSPORT=inprocess evaluates Σ-Guard/SR in this process (co-located
+# deployment); the default talks HTTP to the microservices over a keep-alive pool.
+if os.getenv("PENIN_META_TRANSPORT", "http") == "inprocess":
+    GUARD = LocalGuardClient()
+    SR = LocalSRClient()
+else:
+    GUARD = AsyncGuardClient(os.getenv("PENIN_GUARD_URL", "http://127.0.0.1:8011"))
+    SR = AsyncSRClient(os.getenv("PENIN_SR_URL", "http://127.0.0.1:8012"))
 _led = Path.home() / ".penin_omega" / "worm_ledger"
 _led.mkdir(parents=True, exist_ok=True)
 LEDGER = SQLiteWORMLedger(str(_led / "meta_events.db"))
@@ -24,7 +46,8 @@ LEDGER = SQLiteWORMLedger(str(_led / "meta_events.db"))
 
 @app.get("/health")
 async def health():
-    return {"ok": True, "guard": GUARD.health(), "sr": SR.health()}
+    guard_ok, sr_ok = await asyncio.gather(GUARD.health(), SR.health())
+    return {"ok": True, "guard": guard_ok, "sr": sr_ok}
 
 
 class NextPyInput(BaseModel):
@@ -123,7 +146,7 @@ async def promote(
     pid: str, dlinf: float, caos_plus: float, sr: float, guard: GuardMetrics
 ):
     gate_ok = (dlinf >= 0.01) and (caos_plus >= 1.0) and (sr >= 0.80)
-    g = GUARD.eval(guard.dict())
+    g = await GUARD.eval(guard.dict())
     allow = bool(g.get("allow", False))
     promoted = bool(gate_ok and allow)
     LEDGER.append(
@@ -189,9 +212,12 @@ async def propose_canary_promote(x: PipelineInput):
     can = await canary(x.id)
     dlinf = can["delta_linf"]
 
-    # 4) SR
-    sr_res = SR.eval(**x.sr_probe)
+    # 4) SR and Guard round trips, issued concurrently
+    sr_res, g = await asyncio.gather(
+        SR.eval(**x.sr_probe), GUARD.eval(x.guard_metrics.dict())
+    )
     R = float(sr_res.get("R", 0.0))
+    allow = bool(g.get("allow", False))
 
     # 5) CAOS+
     c, a, o, s = (
@@ -202,11 +228,7 @@ async def propose_canary_promote(x: PipelineInput):
     )
     caos_plus = 1.0 + phi_caos(c, a, o, s)  # ensure >=1.0 thresholding idea
 
-    # 6) Guard
-    g = GUARD.eval(x.guard_metrics.dict())
-    allow = bool(g.get("allow", False))
-
-    # 7) Promote
+    # 6) Promote
     promoted = bool((dlinf >= 0.01) and (caos_plus >= 1.0) and (R >= 0.80) and allow)
     LEDGER.append(
         WORMEvent(
@@ -0,0 +1,380 @@
+"""
+PENIN-Ω Tracing
+===============
+
+In-process structured tracing for router requests, guard validations and
+evolution cycles:
+
+- nested spans (context manager or decorator) whose parent is carried in a
+  ``contextvars.ContextVar``, so nesting follows asyncio tasks and threads
+- head sampling: the sampling decision is taken once per root span and
+  inherited by every descendant (a trace is kept or dropped whole)
+- finished spans go to a bounded ring buffer (``deque(maxlen=...)``, one
+  atomic append per span, no lock); the oldest spans are overwritten
+- export as JSON Lines or Chrome trace-event JSON (``chrome://tracing``,
+  Perfetto)
+
+Tracing is disabled by default; ``span()`` then returns a shared no-op object
+and costs one attribute check. Enable with ``PENIN_TRACE=1`` (and optionally
+``PENIN_TRACE_SAMPLE=0.01``) or :func:`configure`.
+
+Usage:
+------
+    from penin.observability.tracing import configure, span, traced
+
+    configure(enabled=True, sample_rate=0.1)
+
+    with span("guard.validate", candidate=cid) as s:
+        ...
+        s.set(passed=True)
+
+    @traced("evaluator.task")
+    async def run(task): ...
+
+    get_tracer().export_chrome_trace("trace.json")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import itertools
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+__all__ = [
+    "NOOP_SPAN",
+    "Span",
+    "SpanRecord",
+    "Tracer",
+    "configure",
+    "get_tracer",
+    "span",
+    "traced",
+]
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+DEFAULT_CAPACITY = 65536
+
+
+@dataclass(frozen=True)
+class SpanRecord:
+    """A finished span (times in nanoseconds since the Unix epoch)."""
+
+    name: str
+    trace_id: int
+    span_id: int
+    parent_id: int | None
+    start_ns: int
+    duration_ns: int
+    lane: int
+    attributes: dict[str, Any]
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration_ns / 1e6
+
+
+class _NoopSpan:
+    """Returned when tracing is off or the trace was not sampled."""
+
+    __slots__ = ()
+    recording = False
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+# Marks the context of a root span that lost the sampling draw, so its
+# descendants are dropped instead of starting traces of their own
+_UNSAMPLED = object()
+
+_current: ContextVar[Any] = ContextVar("penin_trace_span", default=None)
+
+
+def _lane() -> int:
+    """Current asyncio task (spans of one task nest properly) or thread."""
+    if asyncio._get_running_loop() is not None:
+        task = asyncio.current_task()
+        if task is not None:
+            return id(task)
+    return threading.get_ident()
+
+
+class _UnsampledRoot:
+    __slots__ = ("_token",)
+    recording = False
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+    def __enter__(self) -> _UnsampledRoot:
+        self._token = _current.set(_UNSAMPLED)
+        return self
+
+    def __exit__(self, *exc: Any) -> bool:
+        _current.reset(self._token)
+        return False
+
+
+class Span:
+    """A span being recorded; use as a context manager."""
+
+    __slots__ = (
+        "tracer",
+        "name",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "_start",
+        "_token",
+    )
+    recording = True
+
+    def __init__(
+        self,
+        tracer: Tracer,
+        name: str,
+        attributes: dict[str, Any],
+        parent: Span | None,
+    ) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.attributes = attributes
+        self.span_id = next(tracer._ids)
+        if parent is None:
+            self.trace_id = self.span_id
+            self.parent_id = None
+        else:
+            self.trace_id = parent.trace_id
+            self.parent_id = parent.span_id
+
+    def set(self, **attributes: Any) -> None:
+        """Add or overwrite attributes before the span ends."""
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> Span:
+        self._token = _current.set(self)
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> bool:
+        end = time.perf_counter_ns()
+        _current.reset(self._token)
+        self.tracer._buffer.append(
+            (
+                self.name,
+                self.trace_id,
+                self.span_id,
+                self.parent_id,
+                self._start,
+                end - self._start,
+                _lane(),
+                self.attributes,
+                None if exc_type is None else exc_type.__name__,
+            )
+        )
+        return False
+
+
+class Tracer:
+    """
+    Span factory plus ring buffer of finished spans.
+
+    Args:
+        capacity: Finished spans kept (oldest overwritten first)
+        sample_rate: Fraction of root spans recorded, with their descendants
+        enabled: When False every span is the shared no-op
+    """
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        sample_rate: float = 1.0,
+        enabled: bool = True,
+    ) -> None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in [0, 1]")
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self._buffer: deque[tuple[Any, ...]] = deque(maxlen=capacity)
+        self._ids = itertools.count(1)
+        self._random = random.random
+        # perf_counter_ns is monotonic but has an arbitrary origin
+        self._epoch_offset_ns = time.time_ns() - time.perf_counter_ns()
+
+    @property
+    def capacity(self) -> int:
+        return self._buffer.maxlen or 0
+
+    def span(self, name: str, **attributes: Any) -> Any:
+        """Child of the current span, or a new (possibly unsampled) root."""
+        if not self.enabled:
+            return NOOP_SPAN
+        parent = _current.get()
+        if parent is None:
+            if self.sample_rate < 1.0 and self._random() >= self.sample_rate:
+                return _UnsampledRoot()
+            return Span(self, name, attributes, None)
+        if parent is _UNSAMPLED:
+            return NOOP_SPAN
+        return Span(self, name, attributes, parent)
+
+    def spans(self) -> list[SpanRecord]:
+        """Finished spans in completion order."""
+        offset = self._epoch_offset_ns
+        return [
+            SpanRecord(
+                name=name,
+                trace_id=trace_id,
+                span_id=span_id,
+                parent_id=parent_id,
+                start_ns=start + offset,
+                duration_ns=duration,
+                lane=lane,
+                attributes=attributes,
+                error=error,
+            )
+            for name, trace_id, span_id, parent_id, start, duration, lane, attributes, error in list(
+                self._buffer
+            )
+        ]
+
+    def clear(self) -> None:
+        self._buffer.clear()
+
+    def export_jsonl(self, path: str | Path) -> int:
+        """Write one JSON object per span; returns the number written."""
+        records = self.spans()
+        with open(path, "w", encoding="utf-8") as f:
+            for record in records:
+                f.write(json.dumps(asdict(record), default=str) + "\n")
+        return len(records)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Trace-event JSON: one complete (``ph: "X"``) event per span."""
+        pid = os.getpid()
+        lanes: dict[int, int] = {}
+        events = []
+        for record in sorted(self.spans(), key=lambda r: r.start_ns):
+            tid = lanes.setdefault(record.lane, len(lanes) + 1)
+            args = {
+                "trace_id": record.trace_id,
+                "span_id": record.span_id,
+                "parent_id": record.parent_id,
+                **record.attributes,
+            }
+            if record.error is not None:
+                args["error"] = record.error
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.name.split(".", 1)[0],
+                    "ph": "X",
+                    "ts": record.start_ns / 1000.0,
+                    "dur": record.duration_ns / 1000.0,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": args,
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str | Path) -> int:
+        """Write :meth:`to_chrome_trace` to ``path``; returns the event count."""
+        trace = self.to_chrome_trace()
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, default=str)
+        return len(trace["traceEvents"])
+
+
+def _env_sample_rate() -> float:
+    try:
+        return min(1.0, max(0.0, float(os.environ.get("PENIN_TRACE_SAMPLE", "1.0"))))
+    except ValueError:
+        return 1.0
+
+
+_tracer = Tracer(
+    enabled=os.environ.get("PENIN_TRACE", "").lower() in ("1", "true", "yes", "on"),
+    sample_rate=_env_sample_rate(),
+)
+
+
+def get_tracer() -> Tracer:
+    """The process-wide tracer used by :func:`span` and :func:`traced`."""
+    return _tracer
+
+
+def configure(
+    enabled: bool | None = None,
+    sample_rate: float | None = None,
+    capacity: int | None = None,
+) -> Tracer:
+    """Reconfigure the global tracer in place (a new ``capacity`` clears it)."""
+    if sample_rate is not None:
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be in [0, 1]")
+        _tracer.sample_rate = sample_rate
+    if capacity is not None and capacity != _tracer.capacity:
+        _tracer._buffer = deque(maxlen=capacity)
+    if enabled is not None:
+        _tracer.enabled = enabled
+    return _tracer
+
+
+def span(name: str, **attributes: Any) -> Any:
+    """Open a span on the global tracer (no-op while tracing is disabled)."""
+    if not _tracer.enabled:
+        return NOOP_SPAN
+    return _tracer.span(name, **attributes)
+
+
+def traced(name: str | None = None) -> Callable[[F], F]:
+    """Decorator: run each call (sync or async) inside a span."""
+
+    def decorator(fn: F) -> F:
+        span_name = name or fn.__qualname__
+
+        if inspect.iscoroutinefunction(fn):
+
+            @functools.wraps(fn)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                if not _tracer.enabled:
+                    return await fn(*args, **kwargs)
+                with _tracer.span(span_name):
+                    return await fn(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            if not _tracer.enabled:
+                return fn(*args, **kwargs)
+            with _tracer.span(span_name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
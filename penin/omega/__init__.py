@@ -9,24 +9,52 @@ ethics metrics, and comprehensive evaluation modules.
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from penin._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from penin.core.caos import (
+        CAOSComponents,
+        CAOSConfig,
+        CAOSPlusEngine,
+        CAOSTracker,
+        caos_plus,
+        compute_caos_plus,
+        compute_caos_plus_exponential,
+        phi_caos,
+    )
+
+    from .ethics_metrics import EthicsCalculator, EthicsGate, EthicsMetrics
+    from .scoring import quick_harmonic, quick_score_gate
+
+# Loaded on first access (PEP 562); see penin._lazy.
 # CAOS+ metrics - Consolidated to penin.core.caos
-# Import from definitive implementation
-# Import new dataclasses and engine
-from penin.core.caos import (
-    CAOSComponents,
-    CAOSConfig,
-    CAOSPlusEngine,
-    CAOSTracker,
-    caos_plus,
-    compute_caos_plus,
-    compute_caos_plus_exponential,
-    phi_caos,
-)
+_EXPORTS = {
+    "CAOSComponents": "penin.core.caos",
+    "CAOSConfig": "penin.core.caos",
+    "CAOSPlusEngine": "penin.core.caos",
+    "CAOSTracker": "penin.core.caos",
+    "caos_plus": "penin.core.caos",
+    "compute_caos_plus": "penin.core.caos",
+    "compute_caos_plus_exponential": "penin.core.caos",
+    "phi_caos": "penin.core.caos",
+    # Ethics and safety
+    "EthicsCalculator": ".ethics_metrics",
+    "EthicsGate": ".ethics_metrics",
+    "EthicsMetrics": ".ethics_metrics",
+    # Scoring and evaluation
+    "quick_harmonic": ".scoring",
+    "quick_score_gate": ".scoring",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 
 # Create stub functions for missing quick_ variants
 def quick_caos_phi(*args, **kwargs):
     """Quick wrapper for phi_caos (compatibility)"""
+    from penin.core.caos import phi_caos
+
     return phi_caos(*args, **kwargs)
 
 
@@ -36,12 +64,6 @@ def validate_caos_stability(*args, **kwargs):
     return True
 
 
-# Ethics and safety
-from .ethics_metrics import EthicsCalculator, EthicsGate, EthicsMetrics
-
-# Scoring and evaluation
-from .scoring import quick_harmonic, quick_score_gate
-
 __all__ = [
     # CAOS
     "phi_caos",
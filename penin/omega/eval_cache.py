@@ -0,0 +1,234 @@
+"""
+PENIN-Ω Evaluation Cache
+========================
+
+Persistent cache of task-battery results keyed by
+``(config_hash, metric_type, task_id, evaluator_version)``.
+
+``ParameterMutator`` emits deterministic ``config_hash`` values, so cycles
+with stable seeds keep producing the same challengers. ``TaskBattery``
+consults this cache before invoking the model and only evaluates the
+(config, task) pairs it has not seen. Entries are invalidated when:
+
+- the task definition changes (a BLAKE2b fingerprint of the task is stored
+  with each entry and compared on lookup),
+- the evaluator's ``version`` is bumped,
+- they are older than ``ttl_s``.
+
+Failed evaluations are never cached. Results served from the cache carry
+``evidence["cached"] = True``. Hit/miss counters are kept per cycle
+(``begin_cycle``) and cumulatively.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+from penin.ledger.hash_utils import hash_json
+
+from .evaluators import EvaluationResult
+
+
+@dataclass
+class CacheStats:
+    """Hit/miss counters for the evaluation cache"""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    expired: int = 0
+    invalidated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {**asdict(self), "hit_rate": self.hit_rate}
+
+
+class EvaluationCache:
+    """SQLite-backed cache of ``EvaluationResult`` objects"""
+
+    def __init__(
+        self,
+        db_path: str | Path = "evaluation_cache.db",
+        ttl_s: float | None = 7 * 24 * 3600,
+    ):
+        self.db_path = str(db_path)
+        self.ttl_s = ttl_s
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._lock = threading.RLock()
+        self.stats = CacheStats()
+        self.cycle_stats = CacheStats()
+        self._init_db()
+
+    def _init_db(self):
+        c = self._conn.cursor()
+        c.execute("PRAGMA journal_mode=WAL")
+        c.execute("PRAGMA synchronous=NORMAL")
+        c.execute("PRAGMA busy_timeout=3000")
+        c.execute(
+            """
+            CREATE TABLE IF NOT EXISTS evaluations (
+                config_hash TEXT NOT NULL,
+                metric_type TEXT NOT NULL,
+                task_id TEXT NOT NULL,
+                evaluator_version TEXT NOT NULL,
+                task_fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                PRIMARY KEY (config_hash, metric_type, task_id, evaluator_version)
+            )
+            """
+        )
+        c.execute(
+            "CREATE INDEX IF NOT EXISTS idx_evaluations_created ON evaluations(created_at)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def task_fingerprint(task: dict[str, Any]) -> str:
+        """Deterministic hash of a task definition"""
+        return hash_json(task)
+
+    def begin_cycle(self) -> CacheStats:
+        """Reset the per-cycle counters and return those of the previous cycle"""
+        with self._lock:
+            previous, self.cycle_stats = self.cycle_stats, CacheStats()
+            return previous
+
+    def _count(self, field: str) -> None:
+        setattr(self.stats, field, getattr(self.stats, field) + 1)
+        setattr(self.cycle_stats, field, getattr(self.cycle_stats, field) + 1)
+
+    def get(
+        self,
+        config_hash: str,
+        metric_type: str,
+        evaluator_version: str,
+        task: dict[str, Any],
+    ) -> EvaluationResult | None:
+        """Return the cached result for a (config, task) pair, if still valid"""
+        key = (config_hash, metric_type, task["id"], evaluator_version)
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT task_fingerprint, result, created_at FROM evaluations
+                WHERE config_hash = ? AND metric_type = ? AND task_id = ?
+                  AND evaluator_version = ?
+                """,
+                key,
+            ).fetchone()
+
+            if row is None:
+                self._count("misses")
+                return None
+
+            fingerprint, payload, created_at = row
+            stale = None
+            if fingerprint != self.task_fingerprint(task):
+                stale = "invalidated"
+            elif self.ttl_s is not None and time.time() - created_at > self.ttl_s:
+                stale = "expired"
+
+            if stale:
+                self._conn.execute(
+                    """
+                    DELETE FROM evaluations WHERE config_hash = ? AND metric_type = ?
+                      AND task_id = ? AND evaluator_version = ?
+                    """,
+                    key,
+                )
+                self._conn.commit()
+                self._count(stale)
+                self._count("misses")
+                return None
+
+            self._count("hits")
+            result = EvaluationResult(**json.loads(payload))
+            result.evidence["cached"] = True
+            return result
+
+    def put(
+        self,
+        config_hash: str,
+        evaluator_version: str,
+        task: dict[str, Any],
+        result: EvaluationResult,
+    ) -> bool:
+        """Store a result; failed evaluations are not cached"""
+        if result.evidence.get("failed"):
+            return False
+
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO evaluations (
+                    config_hash, metric_type, task_id, evaluator_version,
+                    task_fingerprint, result, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    config_hash,
+                    result.metric_type,
+                    result.task_id,
+                    evaluator_version,
+                    self.task_fingerprint(task),
+                    json.dumps(asdict(result), ensure_ascii=False, default=str),
+                    time.time(),
+                ),
+            )
+            self._conn.commit()
+            self._count("stores")
+            return True
+
+    def invalidate(
+        self,
+        config_hash: str | None = None,
+        task_id: str | None = None,
+        metric_type: str | None = None,
+    ) -> int:
+        """Delete matching entries (all entries when no filter is given)"""
+        clauses, params = [], []
+        for column, value in (
+            ("config_hash", config_hash),
+            ("task_id", task_id),
+            ("metric_type", metric_type),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+
+        with self._lock:
+            cursor = self._conn.execute(f"DELETE FROM evaluations{where}", params)
+            self._conn.commit()
+            return cursor.rowcount
+
+    def purge_expired(self) -> int:
+        """Delete entries older than the TTL"""
+        if self.ttl_s is None:
+            return 0
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM evaluations WHERE created_at < ?",
+                (time.time() - self.ttl_s,),
+            )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM evaluations").fetchone()[0]
+
+    def close(self):
+        try:
+            self._conn.close()
+        except Exception:
+            pass
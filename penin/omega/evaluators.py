@@ -4,11 +4,33 @@ PENIN-Ω Evaluators Module
 
 Implements evaluation batteries for U/S/C/L metrics (Utility, Stability, Cost, Learning).
 Provides deterministic tasks and scoring for model assessment.
+
+Model functions may be plain callables or coroutine functions. The async
+entry points (``TaskBattery.aevaluate_all_metrics`` and
+``TaskBattery.aevaluate_population``) run (challenger × task) pairs
+concurrently under a shared concurrency limit and cost budget, both applied
+to each model call. Sync model functions run in worker threads
+(``asyncio.to_thread``) so they do not block the event loop.
+
+When a ``TaskBattery`` is given an ``EvaluationCache`` and the caller
+passes the challenger's ``config_hash``, results are looked up before the
+model is invoked and stored afterwards; cache hits cost nothing against
+the cycle budget.
 """
 
+import asyncio
+import inspect
 import time
+from collections.abc import Callable
 from dataclasses import dataclass
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+from penin.observability.tracing import span
+
+if TYPE_CHECKING:
+    from .eval_cache import EvaluationCache
+
+METRIC_TYPES = ("U", "S", "C", "L")
 
 
 @dataclass
@@ -34,61 +56,186 @@ class TaskBatteryConfig:
     include_synthetic: bool = True
     include_real_world: bool = True
 
+    # Concurrent evaluation settings (async paths only)
+    max_concurrency: int = 8
+    cost_budget_usd: float | None = None
+    early_stop_dominated: bool = True
+    dominance_margin: float = 0.0
 
-class UtilityEvaluator:
-    """Evaluates utility (U) - accuracy, correctness, helpfulness"""
+
+class _CallRefused(Exception):
+    """A model call was not admitted (challenger pruned or budget spent)"""
+
+
+def _is_async_model(model_fn: Callable) -> bool:
+    if inspect.iscoroutinefunction(model_fn):
+        return True
+    # Instances with an ``async def __call__``
+    return callable(model_fn) and inspect.iscoroutinefunction(model_fn.__call__)
+
+
+async def _call_model_async(model_fn: Callable, input_text: str) -> Any:
+    """Call a sync or async model function and return its response
+
+    Sync functions are offloaded to a worker thread so a blocking model
+    does not stall the other evaluations sharing the event loop.
+    """
+    if _is_async_model(model_fn):
+        response = model_fn(input_text)
+    else:
+        response = await asyncio.to_thread(model_fn, input_text)
+    if inspect.isawaitable(response):
+        response = await response
+    return response
+
+
+class MetricEvaluator:
+    """Base class for single-metric evaluators.
+
+    Subclasses provide the default tasks and the scoring of a task's
+    responses; running the model (sync or async) and failure handling are
+    shared so both paths produce identical ``EvaluationResult`` shapes.
+    """
+
+    metric_type = ""
+    runs_per_task = 1
+    failure_cost_usd = 0.001
+    version = "1"  # Bump when scoring changes to invalidate cached results
 
     def __init__(self, config: TaskBatteryConfig = None):
         self.config = config or TaskBatteryConfig()
 
+    def default_tasks(self) -> list[dict]:
+        raise NotImplementedError
+
+    def select_tasks(self, tasks: list[dict] = None) -> list[dict]:
+        """Tasks that will actually be run, honouring ``max_tasks_per_metric``"""
+        if tasks is None:
+            tasks = self.default_tasks()
+        return tasks[: self.config.max_tasks_per_metric]
+
+    def evaluate_task(self, model_fn, task: dict) -> EvaluationResult:
+        """Evaluate a single task with a synchronous model function"""
+        start_time = time.time()
+
+        try:
+            responses = [model_fn(task["input"]) for _ in range(self.runs_per_task)]
+            latency_ms = (time.time() - start_time) * 1000
+            return self._score_task(task, responses, latency_ms)
+        except Exception as e:
+            return self._failed_result(task, e, start_time)
+
+    async def aevaluate_task(
+        self,
+        model_fn,
+        task: dict,
+        semaphore: asyncio.Semaphore | None = None,
+        admit: Callable[[], bool] | None = None,
+    ) -> EvaluationResult:
+        """Evaluate a single task with a sync or async model function
+
+        Each model call holds ``semaphore`` (if given) and is only made when
+        ``admit()`` still returns True once the slot is acquired; a refused
+        call raises ``_CallRefused`` instead of producing a failed result.
+        The timeout applies to each call, not to the wait for a slot.
+        """
+        start_time = time.time()
+
+        try:
+            responses = await self._run_async(model_fn, task, semaphore, admit)
+            latency_ms = (time.time() - start_time) * 1000
+            return self._score_task(task, responses, latency_ms)
+        except _CallRefused:
+            raise
+        except Exception as e:
+            return self._failed_result(task, e, start_time)
+
+    @property
+    def timeout_s(self) -> float | None:
+        return self.config.timeout_seconds or None
+
+    async def _run_async(
+        self,
+        model_fn,
+        task: dict,
+        semaphore: asyncio.Semaphore | None = None,
+        admit: Callable[[], bool] | None = None,
+    ) -> list[Any]:
+        async def timed_call() -> Any:
+            if self.timeout_s:
+                return await asyncio.wait_for(
+                    _call_model_async(model_fn, task["input"]), timeout=self.timeout_s
+                )
+            return await _call_model_async(model_fn, task["input"])
+
+        async def call() -> Any:
+            if semaphore is None:
+                return await timed_call()
+            async with semaphore:
+                if admit is not None and not admit():
+                    raise _CallRefused(task["id"])
+                return await timed_call()
+
+        runs = await asyncio.gather(
+            *(call() for _ in range(self.runs_per_task)), return_exceptions=True
+        )
+        for run in runs:
+            if isinstance(run, BaseException):
+                raise run
+        return runs
+
+    def _score_task(
+        self, task: dict, responses: list[Any], latency_ms: float
+    ) -> EvaluationResult:
+        raise NotImplementedError
+
+    def _failed_result(
+        self, task: dict, error: BaseException, start_time: float
+    ) -> EvaluationResult:
+        # Failed task gets 0 score
+        return EvaluationResult(
+            task_id=task["id"],
+            metric_type=self.metric_type,
+            score=0.0,
+            raw_metrics={"error": str(error) or type(error).__name__},
+            evidence={"task_type": task["type"], "failed": True},
+            latency_ms=(time.time() - start_time) * 1000,
+            cost_usd=self.failure_cost_usd,
+        )
+
+
+class UtilityEvaluator(MetricEvaluator):
+    """Evaluates utility (U) - accuracy, correctness, helpfulness"""
+
+    metric_type = "U"
+
     def evaluate_utility(
         self, model_fn, tasks: list[dict] = None
     ) -> list[EvaluationResult]:
         """Evaluate model utility across tasks"""
-        if tasks is None:
-            tasks = self._get_default_utility_tasks()
-
-        results = []
-        for task in tasks[: self.config.max_tasks_per_metric]:
-            start_time = time.time()
-
-            try:
-                # Run model on task
-                response = model_fn(task["input"])
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Score response
-                score = self._score_utility_response(response, task)
-
-                # Create result
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="U",
-                    score=score,
-                    raw_metrics={
-                        "exact_match": score,
-                        "response_length": len(str(response)),
-                    },
-                    evidence={"task_type": task["type"], "expected": task["expected"]},
-                    latency_ms=latency_ms,
-                    cost_usd=0.001,  # Estimated
-                )
-                results.append(result)
-
-            except Exception as e:
-                # Failed task gets 0 score
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="U",
-                    score=0.0,
-                    raw_metrics={"error": str(e)},
-                    evidence={"task_type": task["type"], "failed": True},
-                    latency_ms=(time.time() - start_time) * 1000,
-                    cost_usd=0.001,
-                )
-                results.append(result)
-
-        return results
+        return [self.evaluate_task(model_fn, task) for task in self.select_tasks(tasks)]
+
+    def default_tasks(self) -> list[dict]:
+        return self._get_default_utility_tasks()
+
+    def _score_task(
+        self, task: dict, responses: list[Any], latency_ms: float
+    ) -> EvaluationResult:
+        response = responses[0]
+        score = self._score_utility_response(response, task)
+
+        return EvaluationResult(
+            task_id=task["id"],
+            metric_type="U",
+            score=score,
+            raw_metrics={
+                "exact_match": score,
+                "response_length": len(str(response)),
+            },
+            evidence={"task_type": task["type"], "expected": task["expected"]},
+            latency_ms=latency_ms,
+            cost_usd=0.001,  # Estimated
+        )
 
     def _get_default_utility_tasks(self) -> list[dict]:
         """Get default utility evaluation tasks"""
@@ -132,59 +279,39 @@ class UtilityEvaluator:
             return 1.0 if expected in response_str else 0.0
 
 
-class StabilityEvaluator:
+class StabilityEvaluator(MetricEvaluator):
     """Evaluates stability (S) - consistency, robustness, calibration"""
 
-    def __init__(self, config: TaskBatteryConfig = None):
-        self.config = config or TaskBatteryConfig()
+    metric_type = "S"
+    runs_per_task = 3  # 3 runs for consistency check
+    failure_cost_usd = 0.003
 
     def evaluate_stability(
         self, model_fn, tasks: list[dict] = None
     ) -> list[EvaluationResult]:
         """Evaluate model stability"""
-        if tasks is None:
-            tasks = self._get_default_stability_tasks()
-
-        results = []
-        for task in tasks[: self.config.max_tasks_per_metric]:
-            start_time = time.time()
-
-            try:
-                # Run same task multiple times
-                responses = []
-                for _ in range(3):  # 3 runs for consistency check
-                    response = model_fn(task["input"])
-                    responses.append(str(response))
-
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Score consistency
-                score = self._score_stability_responses(responses, task)
-
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="S",
-                    score=score,
-                    raw_metrics={"consistency": score, "num_runs": len(responses)},
-                    evidence={"task_type": task["type"], "responses": responses},
-                    latency_ms=latency_ms,
-                    cost_usd=0.003,  # 3 runs
-                )
-                results.append(result)
-
-            except Exception as e:
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="S",
-                    score=0.0,
-                    raw_metrics={"error": str(e)},
-                    evidence={"task_type": task["type"], "failed": True},
-                    latency_ms=(time.time() - start_time) * 1000,
-                    cost_usd=0.003,
-                )
-                results.append(result)
-
-        return results
+        return [self.evaluate_task(model_fn, task) for task in self.select_tasks(tasks)]
+
+    def default_tasks(self) -> list[dict]:
+        return self._get_default_stability_tasks()
+
+    def _score_task(
+        self, task: dict, responses: list[Any], latency_ms: float
+    ) -> EvaluationResult:
+        responses = [str(r) for r in responses]
+
+        # Score consistency
+        score = self._score_stability_responses(responses, task)
+
+        return EvaluationResult(
+            task_id=task["id"],
+            metric_type="S",
+            score=score,
+            raw_metrics={"consistency": score, "num_runs": len(responses)},
+            evidence={"task_type": task["type"], "responses": responses},
+            latency_ms=latency_ms,
+            cost_usd=0.003,  # 3 runs
+        )
 
     def _get_default_stability_tasks(self) -> list[dict]:
         """Get default stability tasks"""
@@ -217,57 +344,40 @@ class StabilityEvaluator:
         return consistent_count / len(responses)
 
 
-class CostEvaluator:
+class CostEvaluator(MetricEvaluator):
     """Evaluates cost (C) - efficiency, resource usage"""
 
-    def __init__(self, config: TaskBatteryConfig = None):
-        self.config = config or TaskBatteryConfig()
+    metric_type = "C"
 
     def evaluate_cost(
         self, model_fn, tasks: list[dict] = None
     ) -> list[EvaluationResult]:
         """Evaluate model cost efficiency"""
-        if tasks is None:
-            tasks = self._get_default_cost_tasks()
-
-        results = []
-        for task in tasks[: self.config.max_tasks_per_metric]:
-            start_time = time.time()
-
-            try:
-                response = model_fn(task["input"])
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Score based on efficiency (lower latency = higher score)
-                score = self._score_cost_efficiency(latency_ms, len(str(response)))
-
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="C",
-                    score=score,
-                    raw_metrics={
-                        "latency_ms": latency_ms,
-                        "response_length": len(str(response)),
-                    },
-                    evidence={"task_type": task["type"]},
-                    latency_ms=latency_ms,
-                    cost_usd=latency_ms * 0.00001,  # Rough estimate
-                )
-                results.append(result)
-
-            except Exception as e:
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="C",
-                    score=0.0,
-                    raw_metrics={"error": str(e)},
-                    evidence={"task_type": task["type"], "failed": True},
-                    latency_ms=(time.time() - start_time) * 1000,
-                    cost_usd=0.001,
-                )
-                results.append(result)
-
-        return results
+        return [self.evaluate_task(model_fn, task) for task in self.select_tasks(tasks)]
+
+    def default_tasks(self) -> list[dict]:
+        return self._get_default_cost_tasks()
+
+    def _score_task(
+        self, task: dict, responses: list[Any], latency_ms: float
+    ) -> EvaluationResult:
+        response = responses[0]
+
+        # Score based on efficiency (lower latency = higher score)
+        score = self._score_cost_efficiency(latency_ms, len(str(response)))
+
+        return EvaluationResult(
+            task_id=task["id"],
+            metric_type="C",
+            score=score,
+            raw_metrics={
+                "latency_ms": latency_ms,
+                "response_length": len(str(response)),
+            },
+            evidence={"task_type": task["type"]},
+            latency_ms=latency_ms,
+            cost_usd=latency_ms * 0.00001,  # Rough estimate
+        )
 
     def _get_default_cost_tasks(self) -> list[dict]:
         """Get default cost evaluation tasks"""
@@ -292,54 +402,35 @@ class CostEvaluator:
         return (latency_score + length_score) / 2.0
 
 
-class LearningEvaluator:
+class LearningEvaluator(MetricEvaluator):
     """Evaluates learning (L) - adaptation, improvement, tool use"""
 
-    def __init__(self, config: TaskBatteryConfig = None):
-        self.config = config or TaskBatteryConfig()
+    metric_type = "L"
 
     def evaluate_learning(
         self, model_fn, tasks: list[dict] = None
     ) -> list[EvaluationResult]:
         """Evaluate model learning capabilities"""
-        if tasks is None:
-            tasks = self._get_default_learning_tasks()
-
-        results = []
-        for task in tasks[: self.config.max_tasks_per_metric]:
-            start_time = time.time()
-
-            try:
-                response = model_fn(task["input"])
-                latency_ms = (time.time() - start_time) * 1000
-
-                # Score learning indicators
-                score = self._score_learning_response(str(response), task)
-
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="L",
-                    score=score,
-                    raw_metrics={"learning_score": score},
-                    evidence={"task_type": task["type"]},
-                    latency_ms=latency_ms,
-                    cost_usd=0.001,
-                )
-                results.append(result)
-
-            except Exception as e:
-                result = EvaluationResult(
-                    task_id=task["id"],
-                    metric_type="L",
-                    score=0.0,
-                    raw_metrics={"error": str(e)},
-                    evidence={"task_type": task["type"], "failed": True},
-                    latency_ms=(time.time() - start_time) * 1000,
-                    cost_usd=0.001,
-                )
-                results.append(result)
-
-        return results
+        return [self.evaluate_task(model_fn, task) for task in self.select_tasks(tasks)]
+
+    def default_tasks(self) -> list[dict]:
+        return self._get_default_learning_tasks()
+
+    def _score_task(
+        self, task: dict, responses: list[Any], latency_ms: float
+    ) -> EvaluationResult:
+        # Score learning indicators
+        score = self._score_learning_response(str(responses[0]), task)
+
+        return EvaluationResult(
+            task_id=task["id"],
+            metric_type="L",
+            score=score,
+            raw_metrics={"learning_score": score},
+            evidence={"task_type": task["type"]},
+            latency_ms=latency_ms,
+            cost_usd=0.001,
+        )
 
     def _get_default_learning_tasks(self) -> list[dict]:
         """Get default learning tasks"""
@@ -382,26 +473,292 @@ class LearningEvaluator:
         return min(1.0, found_reasoning / 3.0)  # Cap at 1.0
 
 
+class _RaceState:
+    """Running score bounds for one challenger during population evaluation.
+
+    Unfinished tasks are bounded by 0 (lower) and 1 (upper), so the final
+    ``overall_score`` is guaranteed to lie in ``[lower_bound, upper_bound]``.
+    """
+
+    def __init__(self, planned: dict[str, int]):
+        self.planned = planned
+        self.results: dict[str, list[EvaluationResult]] = {m: [] for m in METRIC_TYPES}
+        self.cost_usd = 0.0
+        self.skipped = 0
+        self.pruned = False
+        self.budget_exhausted = False
+
+    def record(self, result: EvaluationResult) -> None:
+        self.results[result.metric_type].append(result)
+        if not result.evidence.get("cached"):
+            self.cost_usd += result.cost_usd
+
+    def _bound(self, unknown_score: float) -> float:
+        total = 0.0
+        for metric_type in METRIC_TYPES:
+            planned = self.planned.get(metric_type, 0)
+            if planned == 0:
+                continue
+            done = self.results[metric_type]
+            known = sum(r.score for r in done)
+            total += (known + unknown_score * (planned - len(done))) / planned
+        return total / len(METRIC_TYPES)
+
+    @property
+    def lower_bound(self) -> float:
+        return self._bound(0.0)
+
+    @property
+    def upper_bound(self) -> float:
+        return self._bound(1.0)
+
+
 class TaskBattery:
     """Main evaluation orchestrator"""
 
-    def __init__(self, config: TaskBatteryConfig = None):
+    def __init__(
+        self,
+        config: TaskBatteryConfig = None,
+        cache: "EvaluationCache | None" = None,
+    ):
         self.config = config or TaskBatteryConfig()
         self.utility_evaluator = UtilityEvaluator(config)
         self.stability_evaluator = StabilityEvaluator(config)
         self.cost_evaluator = CostEvaluator(config)
         self.learning_evaluator = LearningEvaluator(config)
+        self.cache = cache
+
+    @property
+    def evaluators(self) -> dict[str, MetricEvaluator]:
+        return {
+            "U": self.utility_evaluator,
+            "S": self.stability_evaluator,
+            "C": self.cost_evaluator,
+            "L": self.learning_evaluator,
+        }
 
-    def evaluate_all_metrics(self, model_fn) -> dict[str, Any]:
+    def evaluate_all_metrics(self, model_fn, config_hash: str | None = None) -> dict[str, Any]:
         """Run complete evaluation battery"""
-        results = {
-            "U": self.utility_evaluator.evaluate_utility(model_fn),
-            "S": self.stability_evaluator.evaluate_stability(model_fn),
-            "C": self.cost_evaluator.evaluate_cost(model_fn),
-            "L": self.learning_evaluator.evaluate_learning(model_fn),
+        if self.cache is None or config_hash is None:
+            results = {
+                "U": self.utility_evaluator.evaluate_utility(model_fn),
+                "S": self.stability_evaluator.evaluate_stability(model_fn),
+                "C": self.cost_evaluator.evaluate_cost(model_fn),
+                "L": self.learning_evaluator.evaluate_learning(model_fn),
+            }
+            return self.aggregate_results(results)
+
+        results = {}
+        for metric_type, evaluator in self.evaluators.items():
+            results[metric_type] = []
+            for task in evaluator.select_tasks():
+                result = self._cache_lookup(evaluator, task, config_hash)
+                if result is None:
+                    result = evaluator.evaluate_task(model_fn, task)
+                    self.cache.put(config_hash, evaluator.version, task, result)
+                results[metric_type].append(result)
+        return self.aggregate_results(results)
+
+    async def aevaluate_all_metrics(
+        self, model_fn, config_hash: str | None = None
+    ) -> dict[str, Any]:
+        """Run complete evaluation battery with all tasks in flight concurrently"""
+        population = await self.aevaluate_population(
+            {"model": model_fn},
+            early_stop_dominated=False,
+            config_hashes={"model": config_hash} if config_hash else None,
+        )
+        return population["model"]
+
+    def _cache_lookup(
+        self, evaluator: MetricEvaluator, task: dict, config_hash: str | None
+    ) -> EvaluationResult | None:
+        if self.cache is None or config_hash is None:
+            return None
+        return self.cache.get(config_hash, evaluator.metric_type, evaluator.version, task)
+
+    async def _aevaluate_cached(
+        self,
+        evaluator: MetricEvaluator,
+        model_fn,
+        task: dict,
+        config_hash: str | None,
+        semaphore: asyncio.Semaphore | None = None,
+        admit: Callable[[], bool] | None = None,
+    ) -> EvaluationResult:
+        result = await evaluator.aevaluate_task(model_fn, task, semaphore, admit)
+        if self.cache is not None and config_hash is not None:
+            self.cache.put(config_hash, evaluator.version, task, result)
+        return result
+
+    async def aevaluate_population(
+        self,
+        model_fns: dict[str, Callable],
+        max_concurrency: int | None = None,
+        cost_budget_usd: float | None = None,
+        early_stop_dominated: bool | None = None,
+        config_hashes: dict[str, str] | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Evaluate several challengers concurrently
+
+        Every (challenger × task) pair becomes a job; at most
+        ``max_concurrency`` model calls are in flight at once (a stability
+        task's repeated runs count separately), so cycle wall time scales
+        with the concurrency limit rather than the number of challengers.
+        Jobs are interleaved task-major so all challengers advance together,
+        which lets clearly dominated challengers (whose best possible
+        ``overall_score`` is below another challenger's worst possible one)
+        skip their remaining calls. Once the cumulative cost of finished
+        tasks reaches ``cost_budget_usd`` no further calls are admitted;
+        calls already in flight still complete, so the spend can exceed the
+        budget by at most ``max_concurrency`` calls' worth of tasks.
+
+        A job that raises (e.g. a cache backend error) only affects its own
+        challenger, which is reported with an ``error`` and as incomplete.
+
+        Args:
+            model_fns: Mapping of challenger id to sync or async model function
+            max_concurrency: Overrides ``config.max_concurrency``
+            cost_budget_usd: Overrides ``config.cost_budget_usd``
+            early_stop_dominated: Overrides ``config.early_stop_dominated``
+            config_hashes: Challenger id -> config hash, enables the cache
+
+        Returns:
+            Mapping of challenger id to the ``evaluate_all_metrics`` result
+            shape, extended with ``cost_usd``, ``complete``, ``pruned``,
+            ``budget_exhausted`` and, for failed challengers, ``error``.
+        """
+        if max_concurrency is None:
+            max_concurrency = self.config.max_concurrency
+        if cost_budget_usd is None:
+            cost_budget_usd = self.config.cost_budget_usd
+        if early_stop_dominated is None:
+            early_stop_dominated = self.config.early_stop_dominated
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+
+        plan = [
+            (evaluator, task)
+            for evaluator in self.evaluators.values()
+            for task in evaluator.select_tasks()
+        ]
+        planned = {
+            metric_type: sum(1 for ev, _ in plan if ev.metric_type == metric_type)
+            for metric_type in METRIC_TYPES
         }
+        states = {cid: _RaceState(planned) for cid in model_fns}
+        config_hashes = config_hashes or {}
+        semaphore = asyncio.Semaphore(max_concurrency)
+        spent = 0.0
+
+        async def run_job(cid: str, evaluator: MetricEvaluator, task: dict) -> None:
+            nonlocal spent
+            state = states[cid]
+            config_hash = config_hashes.get(cid)
+
+            def admit() -> bool:
+                if state.pruned:
+                    return False
+                if cost_budget_usd is not None and spent >= cost_budget_usd:
+                    state.budget_exhausted = True
+                    return False
+                return True
+
+            cached = self._cache_lookup(evaluator, task, config_hash)
+            if cached is not None:
+                state.record(cached)
+            else:
+                try:
+                    result = await self._aevaluate_cached(
+                        evaluator, model_fns[cid], task, config_hash, semaphore, admit
+                    )
+                except _CallRefused:
+                    state.skipped += 1
+                    return
+
+                spent += result.cost_usd
+                state.record(result)
+            if early_stop_dominated and len(states) > 1:
+                self._prune_dominated(states)
+
+        jobs = [(cid, evaluator, task) for evaluator, task in plan for cid in model_fns]
+        outcomes = await asyncio.gather(
+            *(run_job(*job) for job in jobs), return_exceptions=True
+        )
+        errors: dict[str, str] = {}
+        for (cid, _, _), outcome in zip(jobs, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                errors.setdefault(cid, str(outcome) or type(outcome).__name__)
+                states[cid].skipped += 1
+            elif isinstance(outcome, BaseException):
+                raise outcome
+
+        population = {}
+        for cid, state in states.items():
+            result = self.aggregate_results(state.results)
+            result.update(
+                {
+                    "cost_usd": state.cost_usd,
+                    "complete": state.skipped == 0,
+                    "pruned": state.pruned,
+                    "budget_exhausted": state.budget_exhausted,
+                }
+            )
+            if cid in errors:
+                result["error"] = errors[cid]
+            population[cid] = result
+
+        return population
+
+    def task_rounds(self) -> list[list[tuple[MetricEvaluator, dict]]]:
+        """Split the battery into rounds holding at most one task per metric
+
+        Round ``i`` contains the ``i``-th selected task of every metric, so
+        each round yields one U/S/C/L sample. Used by the racing scheduler
+        to evaluate challengers incrementally.
+        """
+        per_metric = [
+            [(evaluator, task) for task in evaluator.select_tasks()]
+            for evaluator in self.evaluators.values()
+        ]
+        n_rounds = max((len(items) for items in per_metric), default=0)
+        return [
+            [items[i] for items in per_metric if i < len(items)] for i in range(n_rounds)
+        ]
+
+    async def aevaluate_tasks(
+        self,
+        model_fn,
+        items: list[tuple[MetricEvaluator, dict]],
+        semaphore: asyncio.Semaphore | None = None,
+        config_hash: str | None = None,
+    ) -> list[EvaluationResult]:
+        """Evaluate specific (evaluator, task) pairs concurrently"""
+        semaphore = semaphore or asyncio.Semaphore(self.config.max_concurrency)
+
+        async def run(evaluator: MetricEvaluator, task: dict) -> EvaluationResult:
+            with span("evaluator.task", metric=evaluator.metric_type, task=task.get("id")) as trace:
+                cached = self._cache_lookup(evaluator, task, config_hash)
+                trace.set(cached=cached is not None)
+                if cached is not None:
+                    return cached
+                return await self._aevaluate_cached(
+                    evaluator, model_fn, task, config_hash, semaphore
+                )
+
+        return list(await asyncio.gather(*(run(ev, task) for ev, task in items)))
+
+    def _prune_dominated(self, states: dict[str, _RaceState]) -> None:
+        """Mark challengers that can no longer reach the best guaranteed score"""
+        best_lower = max(s.lower_bound for s in states.values() if not s.pruned)
+        margin = self.config.dominance_margin
+        for state in states.values():
+            if not state.pruned and state.upper_bound + margin < best_lower:
+                state.pruned = True
 
-        # Calculate aggregate scores
+    @staticmethod
+    def aggregate_results(results: dict[str, list[EvaluationResult]]) -> dict[str, Any]:
+        """Calculate aggregate scores from per-metric evaluation results"""
         aggregates = {}
         for metric_type, evals in results.items():
             if evals:
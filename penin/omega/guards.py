@@ -6,12 +6,25 @@ Implementa:
 - Σ-Guard: Verificação ética/segurança (ECE, ρ_bias, consent, eco_ok)
 - IR→IC: Contratividade de risco (ρ < 1 para convergência)
 - Fail-closed: Qualquer falha bloqueia promoção com detalhes
+- GuardEngine: gates ordenados por custo/P(falha), curto-circuito,
+  execução concorrente e latência por gate
 - Integração com ethics_metrics para cálculo real das métricas
 """
 
 import time
+from collections.abc import Callable
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from dataclasses import dataclass
 from enum import Enum
+from functools import partial
 from typing import Any
 
 # Import do módulo de métricas éticas
@@ -491,7 +504,16 @@ class IRtoICGuard:
                     "min_required": self.min_history,
                 }
 
-                return GuardResult.FAIL, violations, analysis
+                return (
+                    GuardResult(
+                        passed=False,
+                        violations=violations,
+                        details={"error": "insufficient_data"},
+                        timestamp=str(time.time()),
+                    ),
+                    violations,
+                    analysis,
+                )
 
             # Calcular ratios consecutivos
             ratios = []
@@ -570,7 +592,7 @@ class IRtoICGuard:
 
             analysis = {
                 "guard": "IR_TO_IC",
-                "result": result.value,
+                "result": "PASS" if result.passed else "FAIL",
                 "max_ratio": max_ratio,
                 "mean_ratio": mean_ratio,
                 "is_contractive": is_contractive,
@@ -628,25 +650,373 @@ class IRtoICGuard:
         }
 
 
+GuardOutcome = tuple[GuardResult, list[GuardViolation], dict[str, Any]]
+
+
+class GuardMode(Enum):
+    """Modo de execução dos gates"""
+
+    FAIL_CLOSED = "fail_closed"  # encerra na primeira falha hard
+    AUDIT = "audit"  # executa todos os gates e coleta todas as violações
+
+
+@dataclass
+class GuardRequest:
+    """Entrada compartilhada pelos gates de uma avaliação"""
+
+    state_dict: dict[str, Any]
+    risk_series: list[float]
+    dataset_id: str | None = None
+    seed: int | None = None
+
+
+@dataclass
+class GuardGate:
+    """
+    Gate executado pelo GuardEngine
+
+    ``check`` recebe um GuardRequest e retorna (result, violations,
+    evidence). Para rodar num ProcessPoolExecutor ele precisa ser picklable
+    (função de módulo, functools.partial, método de instância picklable).
+    """
+
+    name: str
+    check: Callable[[GuardRequest], GuardOutcome]
+    hard: bool = True  # falha não-compensatória: bloqueia a promoção
+    concurrent: bool = False  # gate caro: roda no pool quando houver um
+    cost_hint: float = 0.0  # latência esperada (s) antes da primeira medição
+
+
+@dataclass
+class GateStats:
+    """Latência e taxa de falha observadas de um gate"""
+
+    calls: int = 0
+    failures: int = 0
+    mean_latency: float = 0.0  # EWMA (s)
+    total_latency: float = 0.0
+
+    def record(self, elapsed: float, failed: bool, alpha: float) -> None:
+        self.calls += 1
+        self.failures += failed
+        self.total_latency += elapsed
+        if self.calls == 1:
+            self.mean_latency = elapsed
+        else:
+            self.mean_latency += alpha * (elapsed - self.mean_latency)
+
+    @property
+    def failure_rate(self) -> float:
+        """P(falha) com suavização de Laplace"""
+        return (self.failures + 1) / (self.calls + 2)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "failures": self.failures,
+            "failure_rate": self.failure_rate,
+            "mean_latency_ms": self.mean_latency * 1e3,
+        }
+
+
+@dataclass
+class GuardReport:
+    """Resultado de uma avaliação do GuardEngine"""
+
+    passed: bool
+    violations: list[GuardViolation]
+    results: dict[str, GuardResult]
+    evidence: dict[str, dict[str, Any]]
+    latencies: dict[str, float]  # s por gate executado
+    order: list[str]  # ordem planejada
+    skipped: list[str]
+    total_latency: float
+
+
+def _error_outcome(name: str, e: BaseException) -> GuardOutcome:
+    """Fail-closed: erro do gate vira falha SYSTEM_ERROR"""
+    violation = GuardViolation(
+        guard_name=name,
+        metric="SYSTEM_ERROR",
+        value=str(e),
+        threshold="NO_ERROR",
+        message=f"{name} system error: {e}",
+        severity="high",
+    )
+    result = GuardResult(
+        passed=False,
+        violations=[violation],
+        details={"error": str(e)},
+        timestamp=str(time.time()),
+    )
+    return result, [violation], {"guard": name, "error": str(e), "result": "ERROR"}
+
+
+def _run_gate(name: str, check: Callable[[GuardRequest], GuardOutcome], request: GuardRequest):
+    """Executa um gate medindo sua latência (também dentro de workers)"""
+    start = time.perf_counter()
+    try:
+        result, violations, evidence = check(request)
+    except Exception as e:
+        result, violations, evidence = _error_outcome(name, e)
+    return result, violations, evidence, time.perf_counter() - start
+
+
+def _future_outcome(name: str, future: Future):
+    """Resultado de _run_gate no pool; falhas fora dele (ex.: pickle) também fecham"""
+    try:
+        return future.result()
+    except Exception as e:
+        return (*_error_outcome(name, e), 0.0)
+
+
+class GuardEngine:
+    """
+    Executa gates ordenados por custo e probabilidade de falha
+
+    Em FAIL_CLOSED os gates hard rodam em ordem crescente de
+    latência / P(falha) (ordem ótima para um AND com curto-circuito) e a
+    avaliação termina na primeira falha hard; gates soft vêm depois. Em
+    AUDIT todos os gates rodam. Gates ``concurrent`` consecutivos na ordem
+    rodam juntos no executor (ou num pool de ``n_workers``).
+    """
+
+    def __init__(
+        self,
+        gates: list[GuardGate] | None = None,
+        mode: GuardMode = GuardMode.FAIL_CLOSED,
+        adaptive: bool = True,
+        executor: Executor | None = None,
+        n_workers: int = 0,
+        use_processes: bool = False,
+        ewma_alpha: float = 0.1,
+    ):
+        """
+        Args:
+            gates: Gates na ordem de registro (ordem estática sem ``adaptive``)
+            mode: FAIL_CLOSED (curto-circuito) ou AUDIT (coleta tudo)
+            adaptive: Reordenar os gates pelas estatísticas medidas
+            executor: Pool externo para gates ``concurrent``
+            n_workers: Tamanho do pool próprio (> 1 habilita)
+            use_processes: Pool próprio de processos em vez de threads
+            ewma_alpha: Peso da última medição na latência média
+        """
+        self.gates: list[GuardGate] = []
+        self.stats: dict[str, GateStats] = {}
+        self.mode = GuardMode(mode)
+        self.adaptive = adaptive
+        self.ewma_alpha = ewma_alpha
+        self.n_workers = n_workers
+        self.use_processes = use_processes
+        self._executor = executor
+        self._pool: Executor | None = None
+        for gate in gates or []:
+            self.add_gate(gate)
+
+    def add_gate(self, gate: GuardGate) -> None:
+        if gate.name in self.stats:
+            raise ValueError(f"Gate '{gate.name}' already registered")
+        self.gates.append(gate)
+        self.stats[gate.name] = GateStats()
+
+    def plan(self) -> list[GuardGate]:
+        """Ordem de execução da próxima avaliação"""
+        if not self.adaptive or self.mode is GuardMode.AUDIT:
+            return sorted(self.gates, key=lambda g: not g.hard)
+
+        def rank(gate: GuardGate) -> tuple[bool, float]:
+            stats = self.stats[gate.name]
+            cost = stats.mean_latency if stats.calls else gate.cost_hint
+            return not gate.hard, cost / stats.failure_rate
+
+        return sorted(self.gates, key=rank)
+
+    def _pool_for(self) -> Executor | None:
+        if self._executor is not None:
+            return self._executor
+        if self.n_workers > 1:
+            if self._pool is None:
+                executor_cls = ProcessPoolExecutor if self.use_processes else ThreadPoolExecutor
+                self._pool = executor_cls(max_workers=self.n_workers)
+            return self._pool
+        return None
+
+    def run(self, request: GuardRequest) -> GuardReport:
+        """Avalia um candidato"""
+        start = time.perf_counter()
+        order = self.plan()
+        fail_closed = self.mode is GuardMode.FAIL_CLOSED
+        pool = self._pool_for()
+        outcomes: dict[str, GuardOutcome] = {}
+        latencies: dict[str, float] = {}
+        blocked = False
+
+        def record(gate: GuardGate, outcome) -> bool:
+            result, violations, evidence, elapsed = outcome
+            outcomes[gate.name] = (result, violations, evidence)
+            latencies[gate.name] = elapsed
+            self.stats[gate.name].record(elapsed, not result.passed, self.ewma_alpha)
+            return gate.hard and not result.passed
+
+        def run_wave(wave: list[GuardGate]) -> None:
+            nonlocal blocked
+            futures = {pool.submit(_run_gate, g.name, g.check, request): g for g in wave}
+            pending = set(futures)
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    gate = futures[future]
+                    blocked |= record(gate, _future_outcome(gate.name, future))
+                if fail_closed and blocked:
+                    for future in pending:
+                        future.cancel()
+                    return
+
+        if pool is not None and not fail_closed:
+            # AUDIT: gates caros rodam no pool enquanto os baratos rodam aqui
+            background = [g for g in order if g.concurrent]
+            futures = {pool.submit(_run_gate, g.name, g.check, request): g for g in background}
+            for gate in order:
+                if not gate.concurrent:
+                    blocked |= record(gate, _run_gate(gate.name, gate.check, request))
+            for future in as_completed(futures):
+                gate = futures[future]
+                blocked |= record(gate, _future_outcome(gate.name, future))
+        else:
+            i = 0
+            while i < len(order) and not (fail_closed and blocked):
+                if pool is None or not order[i].concurrent:
+                    gate = order[i]
+                    blocked |= record(gate, _run_gate(gate.name, gate.check, request))
+                    i += 1
+                    continue
+                # Gates concorrentes consecutivos rodam juntos no pool
+                j = i
+                while j < len(order) and order[j].concurrent:
+                    j += 1
+                run_wave(order[i:j])
+                i = j
+
+        return GuardReport(
+            passed=not blocked,
+            violations=[v for g in order if g.name in outcomes for v in outcomes[g.name][1]],
+            results={name: outcome[0] for name, outcome in outcomes.items()},
+            evidence={name: outcome[2] for name, outcome in outcomes.items()},
+            latencies=latencies,
+            order=[g.name for g in order],
+            skipped=[g.name for g in order if g.name not in outcomes],
+            total_latency=time.perf_counter() - start,
+        )
+
+    def run_batch(self, requests: list[GuardRequest]) -> list[GuardReport]:
+        """Avalia N candidatos; a ordem se adapta ao longo do lote"""
+        return [self.run(request) for request in requests]
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
+
+    def close(self) -> None:
+        """Encerra o pool próprio (o executor externo fica com o chamador)"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+
+def _sigma_gate(guard: SigmaGuard, request: GuardRequest) -> GuardOutcome:
+    return guard.check(request.state_dict, request.dataset_id, request.seed)
+
+
+def _iric_gate(guard: IRtoICGuard, request: GuardRequest) -> GuardOutcome:
+    return guard.check_contractive(request.risk_series)
+
+
 class GuardOrchestrator:
     """
     Orquestrador de todos os guards
 
-    Executa Σ-Guard e IR→IC em sequência, fail-closed
+    Executa Σ-Guard, IR→IC e gates extras pelo GuardEngine, fail-closed:
+    qualquer falha hard reprova. Em GuardMode.AUDIT (padrão) todos os
+    gates rodam; em GuardMode.FAIL_CLOSED a avaliação para na primeira
+    falha hard, com os gates ordenados por custo e taxa de falha medidos.
     """
 
     def __init__(
         self,
         sigma_guard: SigmaGuard | None = None,
         iric_guard: IRtoICGuard | None = None,
+        mode: GuardMode = GuardMode.AUDIT,
+        extra_gates: list[GuardGate] | None = None,
+        adaptive: bool = True,
+        executor: Executor | None = None,
+        n_workers: int = 0,
+        use_processes: bool = False,
     ):
         """
         Args:
             sigma_guard: Instância do Σ-Guard (default: padrão)
             iric_guard: Instância do IR→IC Guard (default: padrão)
+            mode: AUDIT (executa tudo) ou FAIL_CLOSED (curto-circuito)
+            extra_gates: Gates adicionais (ex.: avaliações caras)
+            adaptive: Ordenar gates por latência / P(falha) medidos
+            executor: Pool para gates ``concurrent``
+            n_workers: Tamanho do pool próprio (> 1 habilita)
+            use_processes: Pool próprio de processos em vez de threads
         """
         self.sigma_guard = sigma_guard or SigmaGuard()
         self.iric_guard = iric_guard or IRtoICGuard()
+        self.engine = GuardEngine(
+            [
+                GuardGate("SIGMA_GUARD", partial(_sigma_gate, self.sigma_guard)),
+                GuardGate("IR_TO_IC", partial(_iric_gate, self.iric_guard)),
+                *(extra_gates or []),
+            ],
+            mode=mode,
+            adaptive=adaptive,
+            executor=executor,
+            n_workers=n_workers,
+            use_processes=use_processes,
+        )
+
+    @staticmethod
+    def _request(
+        state_dict: dict[str, Any],
+        risk_series: list[float] | None,
+        dataset_id: str | None,
+        seed: int | None,
+    ) -> GuardRequest:
+        if risk_series is None:
+            # Usar histórico do state_dict ou valor atual
+            risk_series = state_dict.get("risk_history", [state_dict.get("rho", 0.5)])
+        return GuardRequest(state_dict, risk_series, dataset_id, seed)
+
+    @staticmethod
+    def _evidence(report: GuardReport) -> dict[str, Any]:
+        executed = [name for name in report.order if name in report.results]
+
+        def verdict(name: str) -> str:
+            if name not in report.results:
+                return "SKIPPED"
+            return "PASS" if report.results[name].passed else "FAIL"
+
+        evidence = {
+            "timestamp": time.time(),
+            "guards_executed": executed,
+            "guards_skipped": report.skipped,
+            "overall_result": "PASS" if report.passed else "FAIL",
+            "sigma_result": verdict("SIGMA_GUARD"),
+            "iric_result": verdict("IR_TO_IC"),
+            "total_violations": len(report.violations),
+            "gate_latency_ms": {name: t * 1e3 for name, t in report.latencies.items()},
+            "total_latency_ms": report.total_latency * 1e3,
+        }
+        if "SIGMA_GUARD" in report.evidence:
+            evidence["sigma_guard"] = report.evidence["SIGMA_GUARD"]
+        if "IR_TO_IC" in report.evidence:
+            evidence["iric_guard"] = report.evidence["IR_TO_IC"]
+        for name in executed:
+            if name not in ("SIGMA_GUARD", "IR_TO_IC"):
+                evidence[name] = report.evidence[name]
+        return evidence
 
     def check_all_guards(
         self,
@@ -667,53 +1037,51 @@ class GuardOrchestrator:
         Returns:
             (all_passed, all_violations, combined_evidence)
         """
-        all_violations = []
-        evidence = {
-            "timestamp": time.time(),
-            "guards_executed": [],
-            "overall_result": None,
-        }
-
-        # 1. Σ-Guard
-        sigma_result, sigma_violations, sigma_evidence = self.sigma_guard.check(
-            state_dict, dataset_id, seed
-        )
-
-        all_violations.extend(sigma_violations)
-        evidence["sigma_guard"] = sigma_evidence
-        evidence["guards_executed"].append("SIGMA_GUARD")
-
-        # 2. IR→IC Guard
-        if risk_series is None:
-            # Usar histórico do state_dict ou valor atual
-            risk_series = state_dict.get("risk_history", [state_dict.get("rho", 0.5)])
+        report = self.engine.run(self._request(state_dict, risk_series, dataset_id, seed))
+        return report.passed, report.violations, self._evidence(report)
 
-        iric_result, iric_violations, iric_evidence = self.iric_guard.check_contractive(
-            risk_series
-        )
-
-        all_violations.extend(iric_violations)
-        evidence["iric_guard"] = iric_evidence
-        evidence["guards_executed"].append("IR_TO_IC")
-
-        # Resultado combinado (fail-closed)
-        all_passed = sigma_result.passed and iric_result.passed
-
-        evidence["overall_result"] = "PASS" if all_passed else "FAIL"
-        evidence["sigma_result"] = "PASS" if sigma_result.passed else "FAIL"
-        evidence["iric_result"] = "PASS" if iric_result.passed else "FAIL"
-        evidence["total_violations"] = len(all_violations)
+    def check_batch(
+        self,
+        states: list[dict[str, Any]],
+        risk_series: list[list[float] | None] | None = None,
+        dataset_id: str | None = None,
+        seed: int | None = None,
+    ) -> list[tuple[bool, list[GuardViolation], dict[str, Any]]]:
+        """
+        Executa os guards para N candidatos
 
-        return all_passed, all_violations, evidence
+        Returns:
+            Lista de (all_passed, all_violations, combined_evidence)
+        """
+        series = risk_series if risk_series is not None else [None] * len(states)
+        if len(series) != len(states):
+            raise ValueError("risk_series must have one entry per state")
+        requests = [
+            self._request(state, risk, dataset_id, seed)
+            for state, risk in zip(states, series, strict=True)
+        ]
+        return [
+            (report.passed, report.violations, self._evidence(report))
+            for report in self.engine.run_batch(requests)
+        ]
 
     def get_guard_summary(self) -> dict[str, Any]:
         """Retorna resumo de configuração dos guards"""
         return {
             "sigma_guard": self.sigma_guard.get_config(),
             "iric_guard": self.iric_guard.get_config(),
-            "orchestrator": {"fail_closed": True, "guards_count": 2},
+            "orchestrator": {
+                "fail_closed": True,
+                "guards_count": len(self.engine.gates),
+                "mode": self.engine.mode.value,
+                "order": [g.name for g in self.engine.plan()],
+                "gate_stats": self.engine.get_stats(),
+            },
         }
 
+    def close(self) -> None:
+        self.engine.close()
+
 
 # Funções de conveniência
 def quick_sigma_guard_check(
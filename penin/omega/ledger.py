@@ -16,16 +16,22 @@ Hash Algorithm Evolution:
 """
 
 import json
+import os
 import sqlite3
 import threading
 import time
 import uuid
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import contextmanager
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from penin.ledger.hash_utils import hash_json
+from penin.observability.tracing import traced
 
 try:
     import portalocker
@@ -124,6 +130,228 @@ class RunRecord(BaseModel):
         json_encoders = {datetime: lambda v: v.isoformat()}
 
 
+# -----------------------------------------------------------------------------
+# Verificação da hash chain (streaming + paralela)
+# -----------------------------------------------------------------------------
+# O hash de cada linha depende só do seu conteúdo e do `prev` gravado, então o
+# recálculo pode ser distribuído em chunks; os links prev→hash são verificados
+# numa única passada sequencial barata enquanto as linhas são lidas.
+
+VERIFY_CHUNK_SIZE = 10_000
+# Marcador dos records da API simplificada append_record(event_type, data);
+# o payload (com o marcador) fica em metrics_json e entra no hash
+SIMPLE_RECORD_FORMAT = "simple-v1"
+
+
+def _is_legacy_simple_row(
+    cycle: int,
+    provider_id: str,
+    metrics_json: str,
+    gates_json: str,
+    decision_json: str,
+    artifacts_path: str | None,
+    parent_run_id: str | None,
+) -> bool:
+    """
+    Record simplificado gravado antes de SIMPLE_RECORD_FORMAT.
+
+    Esses records não persistiam etype/data/ts, então o hash original não pode
+    ser recalculado; como na verificação antiga, só o link prev→hash vale.
+    Só o formato exato da gravação antiga é aceito.
+    """
+    return (
+        cycle == 0
+        and provider_id == "unknown"
+        and metrics_json == gates_json == decision_json == "{}"
+        and artifacts_path is None
+        and parent_run_id is None
+    )
+
+
+def _simple_record_hash(
+    run_id: str, timestamp: float, payload: dict[str, Any], prev_hash: str
+) -> str:
+    """Hash de um record simplificado: marcador, identidade, payload e link"""
+    return hash_json(
+        {
+            "format": payload.get("format"),
+            "run_id": run_id,
+            "timestamp": timestamp,
+            "etype": payload.get("etype"),
+            "data": payload.get("data"),
+            "prev": prev_hash,
+        }
+    )
+
+
+@dataclass
+class ChainVerification:
+    """Resultado da verificação da chain (primeira falha + throughput)"""
+
+    ok: bool
+    error: str | None
+    rows: int
+    elapsed_s: float
+    failed_row: int | None = None
+
+    @property
+    def rows_per_s(self) -> float:
+        return self.rows / self.elapsed_s if self.elapsed_s > 0 else 0.0
+
+    def as_tuple(self) -> tuple[bool, str | None]:
+        return self.ok, self.error
+
+
+def _rehash_event_rows(rows: Sequence[tuple]) -> int | None:
+    """Offset da primeira linha de `events` cujo hash não confere"""
+    for k, (etype, data, ts, prev, stored_hash) in enumerate(rows):
+        payload = {"etype": etype, "data": json.loads(data), "ts": ts, "prev": prev}
+        if hash_json(payload) != stored_hash:
+            return k
+    return None
+
+
+def _rehash_run_rows(rows: Sequence[tuple]) -> int | None:
+    """Offset da primeira linha de `run_records` cujo hash não confere"""
+    for k, row in enumerate(rows):
+        (
+            run_id, timestamp, cycle, git_sha, seed, config_hash, provider_id,
+            model_name, candidate_cfg_hash, metrics_json, gates_json,
+            decision_json, artifacts_path, parent_run_id, prev_hash, record_hash,
+        ) = row
+        if config_hash == "simple" and candidate_cfg_hash == "simple":
+            # Record simplificado: payload marcado em metrics_json, sempre re-hasheado
+            if _is_legacy_simple_row(
+                cycle, provider_id, metrics_json, gates_json, decision_json,
+                artifacts_path, parent_run_id,
+            ):
+                continue
+            try:
+                payload = json.loads(metrics_json)
+            except (TypeError, ValueError):
+                return k
+            if not isinstance(payload, dict) or payload.get("format") != SIMPLE_RECORD_FORMAT:
+                return k
+            if _simple_record_hash(run_id, timestamp, payload, prev_hash) != record_hash:
+                return k
+            continue
+        try:
+            record = RunRecord(
+                run_id=run_id,
+                timestamp=timestamp,
+                cycle=cycle,
+                git_sha=git_sha,
+                seed=seed,
+                config_hash=config_hash,
+                provider_id=provider_id,
+                model_name=model_name,
+                candidate_cfg_hash=candidate_cfg_hash,
+                metrics=RunMetrics.model_validate_json(metrics_json),
+                gates=GuardResults.model_validate_json(gates_json),
+                decision=DecisionInfo.model_validate_json(decision_json),
+                artifacts_path=artifacts_path,
+                parent_run_id=parent_run_id,
+            )
+            record_dict = record.model_dump()
+        except Exception:
+            return k
+        record_dict["prev_hash"] = prev_hash
+        if hash_json(record_dict) != record_hash:
+            return k
+    return None
+
+
+def _verify_hash_chain(
+    cursor: sqlite3.Cursor,
+    rehash: Callable[[Sequence[tuple]], int | None],
+    prev_col: int,
+    hash_col: int,
+    describe: Callable[[str, int, tuple, str], str],
+    workers: int = 1,
+    chunk_size: int = VERIFY_CHUNK_SIZE,
+    use_processes: bool = True,
+) -> ChainVerification:
+    """
+    Verifica a chain lida de `cursor` em chunks de `chunk_size` linhas.
+
+    Links são checados em ordem na thread chamadora; o recálculo dos hashes vai
+    para um pool de `workers` (processos ou threads) com no máximo 2×workers
+    chunks em voo, o que limita a memória independentemente do tamanho do
+    ledger. Retorna a falha de menor índice (link antes de hash na mesma linha).
+
+    `describe(kind, row_number, row, expected_prev)` formata a mensagem de erro,
+    com `kind` em {"link", "hash"} e `row_number` começando em 1.
+    """
+    start = time.perf_counter()
+    prev = "genesis"
+    scanned = 0
+    link_fail: tuple[int, tuple, str] | None = None
+    hash_fail: tuple[int, tuple] | None = None
+    pending: deque = deque()
+    pool = None
+
+    def drain_one():
+        first, rows, future = pending.popleft()
+        offset = future.result()
+        return None if offset is None else (first + offset, rows[offset])
+
+    try:
+        while link_fail is None and hash_fail is None:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            first = scanned + 1
+            for k, row in enumerate(rows):
+                if row[prev_col] != prev:
+                    link_fail = (first + k, row, prev)
+                    rows = rows[:k]
+                    break
+                prev = row[hash_col]
+            scanned += len(rows) + (link_fail is not None)
+            if not rows:
+                break
+
+            if workers <= 1:
+                offset = rehash(rows)
+                if offset is not None:
+                    hash_fail = (first + offset, rows[offset])
+                continue
+
+            if pool is None:
+                executor_cls = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+                pool = executor_cls(max_workers=workers)
+            pending.append((first, rows, pool.submit(rehash, rows)))
+            while len(pending) >= 2 * workers and hash_fail is None:
+                hash_fail = drain_one()
+
+        # Chunks ainda em voo: drenar em ordem até a primeira falha de hash
+        while pending and hash_fail is None:
+            hash_fail = drain_one()
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    elapsed = time.perf_counter() - start
+    if link_fail is not None and (hash_fail is None or link_fail[0] <= hash_fail[0]):
+        row_number, row, expected = link_fail
+        return ChainVerification(
+            False, describe("link", row_number, row, expected), scanned, elapsed, row_number
+        )
+    if hash_fail is not None:
+        row_number, row = hash_fail
+        return ChainVerification(
+            False, describe("hash", row_number, row, ""), scanned, elapsed, row_number
+        )
+    return ChainVerification(True, None, scanned, elapsed)
+
+
+def _verify_workers(workers: int | None, max_rowid: int | None, chunk_size: int) -> int:
+    """Pool só compensa quando há mais de um chunk"""
+    if not max_rowid or max_rowid <= chunk_size:
+        return 1
+    return workers if workers is not None else (os.cpu_count() or 1)
+
+
 class WORMLedger:
     """
     Write-Once Read-Many Ledger com SQLite
@@ -293,6 +521,7 @@ class WORMLedger:
             # Lock é liberado automaticamente quando arquivo fecha
             pass
 
+    @traced("ledger.append")
     def append_record(
         self, record: RunRecord | str, artifacts: dict[str, Any] | None = None
     ) -> str:
@@ -310,25 +539,27 @@ class WORMLedger:
             with self._file_lock():
                 # If called with simplified API: append_record(event_type, data_dict)
                 if isinstance(record, str):
-                    simple_payload = {
-                        "etype": record,
-                        "data": artifacts or {},
-                        "ts": time.time(),
-                        "prev": self._tail_hash,
-                    }
-                    record_hash = hash_json(simple_payload)
+                    run_id = str(uuid.uuid4())
+                    timestamp = time.time()
+                    payload_json = json.dumps(
+                        {"format": SIMPLE_RECORD_FORMAT, "etype": record, "data": artifacts or {}}
+                    )
+                    # Hash sobre o payload como será relido do banco
+                    record_hash = _simple_record_hash(
+                        run_id, timestamp, json.loads(payload_json), self._tail_hash
+                    )
                     with sqlite3.connect(str(self.db_path)) as conn:
                         c = conn.cursor()
                         c.execute(
                             "INSERT INTO run_records (run_id, timestamp, cycle, config_hash, provider_id, candidate_cfg_hash, metrics_json, gates_json, decision_json, artifacts_path, parent_run_id, prev_hash, record_hash, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
                             (
-                                str(uuid.uuid4()),
-                                time.time(),
+                                run_id,
+                                timestamp,
                                 0,
                                 "simple",
                                 "unknown",
                                 "simple",
-                                json.dumps({}),
+                                payload_json,
                                 json.dumps({}),
                                 json.dumps({}),
                                 None,
@@ -545,39 +776,63 @@ class WORMLedger:
 
             return self.get_record(row[0])
 
-    def verify_chain_integrity(self) -> tuple[bool, str | None]:
-        """Verifica integridade da hash chain"""
+    def verify_chain_integrity(
+        self,
+        workers: int | None = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+        use_processes: bool = True,
+    ) -> tuple[bool, str | None]:
+        """Verifica integridade da hash chain (links e hash de cada record)"""
+        return self.verify_chain_report(workers, chunk_size, use_processes).as_tuple()
+
+    def verify_chain_report(
+        self,
+        workers: int | None = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+        use_processes: bool = True,
+    ) -> ChainVerification:
+        """
+        Verificação em streaming com recálculo paralelo dos hashes
+
+        Records simplificados no formato antigo (sem payload persistido) só
+        têm o link verificado, como antes de SIMPLE_RECORD_FORMAT.
+
+        Args:
+            workers: Tamanho do pool (default: os.cpu_count(); 1 = inline)
+            chunk_size: Linhas por chunk lido/enviado ao pool
+            use_processes: Processos (default) ou threads
+        """
+
+        def describe(kind: str, row_number: int, row: tuple, expected: str) -> str:
+            if kind == "link":
+                return (
+                    f"Chain break at {row[0]}: expected prev_hash {expected}, "
+                    f"got {row[14]}"
+                )
+            return f"Hash mismatch at {row[0]}"
+
         with sqlite3.connect(str(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
             cursor = conn.cursor()
-
+            max_rowid = cursor.execute("SELECT MAX(id) FROM run_records").fetchone()[0]
             cursor.execute(
                 """
-                SELECT run_id, prev_hash, record_hash,
-                       metrics_json, gates_json, decision_json
+                SELECT run_id, timestamp, cycle, git_sha, seed, config_hash,
+                       provider_id, model_name, candidate_cfg_hash,
+                       metrics_json, gates_json, decision_json,
+                       artifacts_path, parent_run_id, prev_hash, record_hash
                 FROM run_records ORDER BY id
             """
             )
-
-            prev_hash = "genesis"
-
-            for row in cursor.fetchall():
-                if row["prev_hash"] != prev_hash:
-                    return (
-                        False,
-                        f"Chain break at {row['run_id']}: expected prev_hash {prev_hash}, got {row['prev_hash']}",
-                    )
-
-                # Reconstruir record para verificar hash
-                try:
-                    # Simplificado - só verificar se hash bate
-                    expected_hash = row["record_hash"]
-                    # Em produção, recalcular hash completo
-                    prev_hash = expected_hash
-                except Exception as e:
-                    return False, f"Hash verification failed at {row['run_id']}: {e}"
-
-            return True, None
+            return _verify_hash_chain(
+                cursor,
+                _rehash_run_rows,
+                prev_col=14,
+                hash_col=15,
+                describe=describe,
+                workers=_verify_workers(workers, max_rowid, chunk_size),
+                chunk_size=chunk_size,
+                use_processes=use_processes,
+            )
 
     def get_stats(self) -> dict[str, Any]:
         """Estatísticas do ledger"""
@@ -716,26 +971,50 @@ class SQLiteWORMLedger:
             for r in rows
         ]
 
-    def verify_chain(self) -> tuple[bool, str | None]:
-        c = self._conn.cursor()
-        c.execute("SELECT etype, data, ts, prev, hash FROM events ORDER BY id")
-        prev = "genesis"
-        for i, (etype, data, ts, stored_prev, stored_hash) in enumerate(
-            c.fetchall(), 1
-        ):
-            if stored_prev != prev:
-                return False, f"Chain break at row {i}"
-            payload = {
-                "etype": etype,
-                "data": json.loads(data),
-                "ts": ts,
-                "prev": stored_prev,
-            }
-            calc = hash_json(payload)
-            if calc != stored_hash:
-                return False, f"Hash mismatch at row {i}"
-            prev = stored_hash
-        return True, None
+    def verify_chain(
+        self,
+        workers: int | None = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+        use_processes: bool = True,
+    ) -> tuple[bool, str | None]:
+        return self.verify_chain_report(workers, chunk_size, use_processes).as_tuple()
+
+    def verify_chain_report(
+        self,
+        workers: int | None = None,
+        chunk_size: int = VERIFY_CHUNK_SIZE,
+        use_processes: bool = True,
+    ) -> ChainVerification:
+        """Streams `events` in chunks and re-hashes them on a worker pool.
+
+        Reads go through a separate connection (a consistent WAL snapshot)
+        so appends are not blocked while a large ledger is being verified.
+        """
+
+        def describe(kind: str, row_number: int, row: tuple, expected: str) -> str:
+            if kind == "link":
+                return f"Chain break at row {row_number}"
+            return f"Hash mismatch at row {row_number}"
+
+        in_memory = self.db_path == ":memory:"
+        conn = self._conn if in_memory else sqlite3.connect(self.db_path)
+        try:
+            c = conn.cursor()
+            max_rowid = c.execute("SELECT MAX(id) FROM events").fetchone()[0]
+            c.execute("SELECT etype, data, ts, prev, hash FROM events ORDER BY id")
+            return _verify_hash_chain(
+                c,
+                _rehash_event_rows,
+                prev_col=3,
+                hash_col=4,
+                describe=describe,
+                workers=_verify_workers(workers, max_rowid, chunk_size),
+                chunk_size=chunk_size,
+                use_processes=use_processes,
+            )
+        finally:
+            if not in_memory:
+                conn.close()
 
     def close(self):
         try:
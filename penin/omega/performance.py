@@ -9,6 +9,7 @@ This module provides performance optimizations including:
 - Memory management
 """
 
+import inspect
 import threading
 import time
 import weakref
@@ -17,6 +18,8 @@ from dataclasses import dataclass
 from functools import lru_cache, wraps
 from typing import Any
 
+from penin.memo import Memo, Uncacheable, make_key
+
 
 @dataclass
 class PerformanceMetrics:
@@ -34,85 +37,92 @@ class PerformanceMetrics:
 
 
 class PerformanceOptimizer:
-    """Main performance optimizer class"""
+    """Main performance optimizer class
+
+    ``cached`` is backed by one ``penin.memo.Memo`` per optimizer: every
+    decorated function shares its LRU store, so ``max_cache_size`` caps the
+    total number of entries, while each entry expires after the ``ttl`` of
+    the function that stored it (``cache_ttl`` by default). Keys are typed
+    and misses single-flight.
+
+    ``metrics`` reads the shared counters; assigning a ``PerformanceMetrics``
+    to it resets them (e.g. ``optimizer.metrics = PerformanceMetrics()``).
+    """
 
     def __init__(self, cache_ttl: float = 60.0, max_cache_size: int = 128):
         self.cache_ttl = cache_ttl
         self.max_cache_size = max_cache_size
-        self.metrics = PerformanceMetrics()
-        self._cache: dict[str, tuple[Any, float]] = {}
-        self._lock = threading.RLock()
+        self._memo = Memo(f"performance.{id(self):x}", maxsize=max_cache_size)
 
     def cached(self, ttl: float | None = None, key_func: Callable | None = None):
         """Decorator for caching function results"""
 
         def decorator(func: Callable) -> Callable:
+            memo = self._memo
+            name = f"{func.__module__}.{func.__qualname__}"
+            entry_ttl = ttl or self.cache_ttl
+
+            def build_key(args: tuple, kwargs: dict) -> Any:
+                try:
+                    inner = key_func(*args, **kwargs) if key_func else make_key(args, kwargs)
+                except Uncacheable:
+                    memo.stats.uncacheable += 1
+                    return None
+                return (name, inner)
+
+            if inspect.iscoroutinefunction(func):
+
+                @wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    key = build_key(args, kwargs)
+                    if key is None:
+                        return await func(*args, **kwargs)
+                    return await memo.acall(func, key, args, kwargs, ttl=entry_ttl)
+
+                return async_wrapper
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                # Generate cache key
-                if key_func:
-                    cache_key = key_func(*args, **kwargs)
-                else:
-                    cache_key = f"{func.__name__}:{hash(str(args) + str(sorted(kwargs.items())))}"
-
-                with self._lock:
-                    current_time = time.time()
-
-                    # Check cache
-                    if cache_key in self._cache:
-                        result, timestamp = self._cache[cache_key]
-                        cache_ttl_actual = ttl or self.cache_ttl
-
-                        if current_time - timestamp < cache_ttl_actual:
-                            self.metrics.cache_hits += 1
-                            return result
-                        else:
-                            # Expired cache entry
-                            del self._cache[cache_key]
-
-                    self.metrics.cache_misses += 1
-
-                # Compute result
-                start_time = time.time()
-                result = func(*args, **kwargs)
-                computation_time = time.time() - start_time
-
-                # Cache result
-                with self._lock:
-                    self.metrics.total_computation_time += computation_time
-                    self.metrics.last_update = current_time
-
-                    # Clean up old entries if cache is full
-                    if len(self._cache) >= self.max_cache_size:
-                        # Remove oldest entries (simple FIFO)
-                        oldest_keys = sorted(
-                            self._cache.keys(), key=lambda k: self._cache[k][1]
-                        )[: len(self._cache) - self.max_cache_size + 1]
-                        for key in oldest_keys:
-                            del self._cache[key]
-
-                    self._cache[cache_key] = (result, current_time)
-
-                return result
+                key = build_key(args, kwargs)
+                if key is None:
+                    return func(*args, **kwargs)
+                return memo.call(func, key, args, kwargs, ttl=entry_ttl)
 
             return wrapper
 
         return decorator
 
+    @property
+    def metrics(self) -> PerformanceMetrics:
+        stats = self._memo.stats
+        return PerformanceMetrics(
+            cache_hits=stats.hits,
+            cache_misses=stats.misses,
+            total_computation_time=stats.compute_s,
+            last_update=stats.last_compute_at,
+        )
+
+    @metrics.setter
+    def metrics(self, value: PerformanceMetrics) -> None:
+        stats = self._memo.stats
+        stats.hits = value.cache_hits
+        stats.misses = value.cache_misses
+        stats.compute_s = value.total_computation_time
+        stats.last_compute_at = value.last_update
+
     def clear_cache(self):
         """Clear all cached results"""
-        with self._lock:
-            self._cache.clear()
+        self._memo.clear()
 
     def get_cache_stats(self) -> dict[str, Any]:
         """Get cache statistics"""
-        with self._lock:
-            return {
-                "cache_size": len(self._cache),
-                "cache_hit_rate": self.metrics.cache_hit_rate,
-                "total_computation_time": self.metrics.total_computation_time,
-                "last_update": self.metrics.last_update,
-            }
+        metrics = self.metrics
+        return {
+            "cache_size": len(self._memo),
+            "cache_hit_rate": metrics.cache_hit_rate,
+            "total_computation_time": metrics.total_computation_time,
+            "last_update": metrics.last_update,
+        }
 
 
 class ResourceMonitor:
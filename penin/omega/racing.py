@@ -0,0 +1,269 @@
+"""
+PENIN-Ω Racing Module
+=====================
+
+Successive-halving / racing scheduler for challenger selection.
+
+Instead of evaluating every challenger on the full task battery, all
+challengers are first evaluated on a small budget of samples (tasks,
+rounds or shadow requests). After each rung the bottom fraction, ranked by
+the upper confidence bound of their L∞ estimate, is dropped, as is any
+challenger whose upper bound falls below the best lower bound. The budget
+then grows by ``eta`` and is spent only on the survivors, which are always
+carried to the full budget so the final winner is judged on complete
+evidence (and still passes through the full Σ-Guard at the call site).
+
+With ``n`` challengers and ``eta = 2`` the number of samples consumed is
+roughly ``n · r0 · log2(R / r0) + R · min_survivors`` instead of ``n · R``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import math
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+# evaluate_fn(candidate_id, start, stop) -> samples for indices [start, stop)
+SampleFn = Callable[[str, int, int], "list[float] | Awaitable[list[float]]"]
+
+
+@dataclass
+class RacingConfig:
+    """Configuration for the successive-halving racer"""
+
+    eta: float = 2.0  # Keep 1/eta of survivors per rung, grow budget by eta
+    initial_budget: int = 1  # Samples per challenger at rung 0
+    min_survivors: int = 1  # Never eliminate below this many challengers
+    confidence_z: float = 1.96  # z-score of the confidence bounds
+    prior_std: float = 0.25  # Assumed std of L∞ samples before 2 are observed
+    min_std: float = 0.01  # Floor on the std used for the bounds
+    max_concurrency: int = 8  # Challengers sampled concurrently within a rung
+
+    def __post_init__(self):
+        if self.eta <= 1.0:
+            raise ValueError("eta must be > 1")
+        if self.initial_budget < 1:
+            raise ValueError("initial_budget must be >= 1")
+        if self.min_survivors < 1:
+            raise ValueError("min_survivors must be >= 1")
+
+
+@dataclass
+class CandidateBounds:
+    """Confidence interval of a challenger's mean L∞ estimate"""
+
+    mean: float
+    lower: float
+    upper: float
+    n: int
+
+
+@dataclass
+class RaceRung:
+    """Snapshot of one rung of the race"""
+
+    rung: int
+    budget: int
+    bounds: dict[str, CandidateBounds]
+    survivors: list[str]
+    eliminated: list[str]
+
+
+@dataclass
+class RaceResult:
+    """Outcome of a race"""
+
+    winner_id: str | None
+    ranking: list[str]  # Survivors, best mean first
+    eliminated: dict[str, int]  # Challenger id -> rung at which it was dropped
+    samples: dict[str, list[float]]
+    rungs: list[RaceRung] = field(default_factory=list)
+    max_budget: int = 0
+
+    @property
+    def evaluations(self) -> int:
+        """Samples actually consumed"""
+        return sum(len(s) for s in self.samples.values())
+
+    @property
+    def full_evaluations(self) -> int:
+        """Samples a full (non-racing) evaluation would have consumed"""
+        return len(self.samples) * self.max_budget
+
+    @property
+    def savings(self) -> float:
+        """Fraction of the full evaluation cost that was avoided"""
+        if self.full_evaluations == 0:
+            return 0.0
+        return 1.0 - self.evaluations / self.full_evaluations
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "winner_id": self.winner_id,
+            "ranking": self.ranking,
+            "eliminated": self.eliminated,
+            "evaluations": self.evaluations,
+            "full_evaluations": self.full_evaluations,
+            "savings": self.savings,
+            "rungs": [
+                {"rung": r.rung, "budget": r.budget, "survivors": r.survivors}
+                for r in self.rungs
+            ],
+        }
+
+
+class SuccessiveHalvingRacer:
+    """Successive-halving scheduler with confidence-bound elimination"""
+
+    def __init__(self, config: RacingConfig = None):
+        self.config = config or RacingConfig()
+
+    def compute_bounds(self, samples: list[float]) -> CandidateBounds:
+        """Mean and z-confidence interval of a list of L∞ samples"""
+        n = len(samples)
+        if n == 0:
+            return CandidateBounds(mean=0.0, lower=-math.inf, upper=math.inf, n=0)
+
+        mean = sum(samples) / n
+        if n >= 2:
+            var = sum((s - mean) ** 2 for s in samples) / (n - 1)
+            std = math.sqrt(var)
+        else:
+            std = self.config.prior_std
+        radius = self.config.confidence_z * max(std, self.config.min_std) / math.sqrt(n)
+
+        return CandidateBounds(mean=mean, lower=mean - radius, upper=mean + radius, n=n)
+
+    def budget_schedule(self, max_budget: int) -> list[int]:
+        """Cumulative per-challenger budgets for each rung, ending at max_budget"""
+        budgets = []
+        budget = float(min(self.config.initial_budget, max_budget))
+        while int(budget) < max_budget:
+            budgets.append(int(budget))
+            budget = max(budget + 1, budget * self.config.eta)
+        budgets.append(max_budget)
+        return budgets
+
+    async def race(
+        self,
+        candidate_ids: list[str],
+        evaluate_fn: SampleFn,
+        max_budget: int,
+    ) -> RaceResult:
+        """
+        Race challengers and return the survivors ranked by mean L∞
+
+        Args:
+            candidate_ids: Challenger identifiers
+            evaluate_fn: ``evaluate_fn(candidate_id, start, stop)`` returns the
+                L∞ samples with indices ``[start, stop)`` for one challenger;
+                may be sync or async. Samples already collected are never
+                requested twice.
+            max_budget: Samples per challenger in a full evaluation
+
+        Returns:
+            RaceResult with the winner, ranking and per-rung bounds
+        """
+        if max_budget < 1:
+            raise ValueError("max_budget must be >= 1")
+
+        samples: dict[str, list[float]] = {cid: [] for cid in candidate_ids}
+        survivors = list(candidate_ids)
+        eliminated: dict[str, int] = {}
+        rungs: list[RaceRung] = []
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+
+        async def extend(cid: str, budget: int) -> None:
+            start = len(samples[cid])
+            if start >= budget:
+                return
+            async with semaphore:
+                new = evaluate_fn(cid, start, budget)
+                if inspect.isawaitable(new):
+                    new = await new
+            samples[cid].extend(float(s) for s in list(new)[: budget - start])
+
+        schedule = self.budget_schedule(max_budget)
+        for rung, budget in enumerate(schedule):
+            # Once the field is down to min_survivors, finish them outright
+            if len(survivors) <= self.config.min_survivors:
+                budget = max_budget
+
+            await asyncio.gather(*(extend(cid, budget) for cid in survivors))
+            bounds = {cid: self.compute_bounds(samples[cid]) for cid in survivors}
+
+            dropped: list[str] = []
+            if budget < max_budget:
+                dropped = self._select_eliminated(survivors, bounds)
+                for cid in dropped:
+                    eliminated[cid] = rung
+                survivors = [cid for cid in survivors if cid not in dropped]
+
+            rungs.append(
+                RaceRung(
+                    rung=rung,
+                    budget=budget,
+                    bounds=bounds,
+                    survivors=list(survivors),
+                    eliminated=dropped,
+                )
+            )
+            if budget >= max_budget:
+                break
+
+        ranking = sorted(
+            survivors, key=lambda cid: self.compute_bounds(samples[cid]).mean, reverse=True
+        )
+
+        return RaceResult(
+            winner_id=ranking[0] if ranking else None,
+            ranking=ranking,
+            eliminated=eliminated,
+            samples=samples,
+            rungs=rungs,
+            max_budget=max_budget,
+        )
+
+    def _select_eliminated(
+        self, survivors: list[str], bounds: dict[str, CandidateBounds]
+    ) -> list[str]:
+        """Challengers to drop after a rung"""
+        keep = max(
+            self.config.min_survivors, math.ceil(len(survivors) / self.config.eta)
+        )
+
+        # Optimistic ranking: a challenger that could still be best is kept
+        ranked = sorted(
+            survivors, key=lambda cid: (bounds[cid].upper, bounds[cid].mean), reverse=True
+        )
+        dropped = set(ranked[keep:])
+
+        # Racing: drop anything statistically dominated by the leader
+        best_lower = max(b.lower for b in bounds.values())
+        for cid in ranked[: keep]:
+            if bounds[cid].upper < best_lower:
+                dropped.add(cid)
+
+        # Never drop below min_survivors
+        remaining = [cid for cid in ranked if cid not in dropped]
+        for cid in ranked:
+            if len(remaining) >= self.config.min_survivors:
+                break
+            if cid in dropped:
+                dropped.discard(cid)
+                remaining.append(cid)
+
+        return [cid for cid in survivors if cid in dropped]
+
+
+async def race_challengers(
+    candidate_ids: list[str],
+    evaluate_fn: SampleFn,
+    max_budget: int,
+    config: RacingConfig = None,
+) -> RaceResult:
+    """Quick successive-halving race"""
+    return await SuccessiveHalvingRacer(config).race(candidate_ids, evaluate_fn, max_budget)
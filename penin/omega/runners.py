@@ -12,15 +12,19 @@ import time
 from dataclasses import dataclass
 from typing import Any
 
+from penin.observability.tracing import traced
+
 from .acfa import LeagueConfig, LeagueOrchestrator, run_full_deployment_cycle
 from .caos import quick_caos_phi
 from .ethics_metrics import EthicsCalculator, EthicsGate
-from .evaluators import TaskBattery, TaskBatteryConfig
+from .eval_cache import EvaluationCache
+from .evaluators import METRIC_TYPES, TaskBattery, TaskBatteryConfig
 from .guards import quick_sigma_guard_check_simple
 from .ledger import WORMLedger
 
 # Import other omega modules
 from .mutators import MutationConfig, ParameterMutator
+from .racing import RaceResult, RacingConfig, SuccessiveHalvingRacer
 from .scoring import quick_harmonic, quick_score_gate
 from .sr import quick_sr_harmonic
 from .tuner import create_penin_tuner
@@ -39,6 +43,19 @@ class EvolutionConfig:
     # Evaluation settings
     max_tasks_per_metric: int = 3
     evaluation_timeout_s: int = 60
+    max_concurrency: int = 8
+    cycle_cost_budget_usd: float | None = None
+    early_stop_dominated: bool = True
+
+    # Persistent (config_hash, task) result cache; None disables it
+    evaluation_cache_path: str | None = "evaluation_cache.db"
+    evaluation_cache_ttl_s: float | None = 7 * 24 * 3600
+
+    # Challenger selection: "full" evaluates every challenger on the whole
+    # battery, "racing" uses successive halving over task rounds
+    selection_strategy: str = "full"
+    racing_eta: float = 2.0
+    racing_min_survivors: int = 1
 
     # Deployment settings
     auto_deploy: bool = True
@@ -84,6 +101,9 @@ class CycleResult:
     # Evidence
     evidence_hash: str
 
+    # Evaluation cache hit/miss counters for this cycle
+    cache_stats: dict[str, Any] | None = None
+
 
 class EvolutionRunner:
     """Main evolution cycle orchestrator"""
@@ -93,11 +113,24 @@ class EvolutionRunner:
 
         # Initialize components
         self.mutator = ParameterMutator(MutationConfig(seed=self.config.seed))
+        self.evaluation_cache = (
+            EvaluationCache(
+                self.config.evaluation_cache_path,
+                ttl_s=self.config.evaluation_cache_ttl_s,
+            )
+            if self.config.evaluation_cache_path
+            else None
+        )
         self.evaluator = TaskBattery(
             TaskBatteryConfig(
                 seed=self.config.seed,
                 max_tasks_per_metric=self.config.max_tasks_per_metric,
-            )
+                timeout_seconds=self.config.evaluation_timeout_s,
+                max_concurrency=self.config.max_concurrency,
+                cost_budget_usd=self.config.cycle_cost_budget_usd,
+                early_stop_dominated=self.config.early_stop_dominated,
+            ),
+            cache=self.evaluation_cache,
         )
         self.ethics_calculator = EthicsCalculator()
         self.ethics_gate = EthicsGate()
@@ -108,6 +141,15 @@ class EvolutionRunner:
             )
         )
 
+        self.racer = SuccessiveHalvingRacer(
+            RacingConfig(
+                eta=self.config.racing_eta,
+                min_survivors=self.config.racing_min_survivors,
+                max_concurrency=self.config.max_concurrency,
+            )
+        )
+        self.last_race: RaceResult | None = None
+
         # Initialize tuner if enabled
         self.tuner = create_penin_tuner() if self.config.enable_auto_tuning else None
 
@@ -116,6 +158,7 @@ class EvolutionRunner:
 
         print(f"🚀 Evolution runner initialized (seed={self.config.seed})")
 
+    @traced("evolution.cycle")
     async def evolve_one_cycle(self, base_config: dict[str, Any] = None) -> CycleResult:
         """
         Execute one complete evolution cycle
@@ -149,8 +192,17 @@ class EvolutionRunner:
 
             # Step 2: Evaluate challengers
             print("📊 Step 2: Evaluating challengers...")
+            if self.evaluation_cache:
+                self.evaluation_cache.begin_cycle()
             evaluation_results = await self._evaluate_challengers(challengers)
             print(f"   Evaluated {len(evaluation_results)} challengers")
+            cache_stats = (
+                self.evaluation_cache.cycle_stats.to_dict()
+                if self.evaluation_cache
+                else None
+            )
+            if cache_stats:
+                print(f"   Evaluation cache hit rate: {cache_stats['hit_rate']:.0%}")
 
             # Step 3: Apply gates and scoring
             print("🛡️  Step 3: Applying gates and scoring...")
@@ -202,6 +254,7 @@ class EvolutionRunner:
                 evidence_hash=self._compute_evidence_hash(
                     cycle_id, challengers, evaluation_results
                 ),
+                cache_stats=cache_stats,
             )
 
             # Record in WORM ledger
@@ -235,6 +288,7 @@ class EvolutionRunner:
             self._record_cycle_result(result)
             raise
 
+    @traced("evolution.generate")
     async def _generate_challengers(
         self, base_config: dict[str, Any]
     ) -> list[dict[str, Any]]:
@@ -256,37 +310,62 @@ class EvolutionRunner:
 
         return challengers
 
+    def _make_model_fn(self, challenger: dict[str, Any]):
+        """Create the model function used to evaluate one challenger"""
+        config = challenger["config"]
+
+        async def mock_model_fn(input_text: str) -> str:
+            # In a real implementation, this would call the actual model
+            # For now, return a simple response based on config
+            temp = config.get("temperature", 0.7)
+
+            # Simulate different responses based on temperature
+            if temp < 0.3:
+                return "42"  # Deterministic
+            elif temp > 1.0:
+                return "The answer varies depending on context and interpretation"  # Creative
+            else:
+                return "42 is the answer"  # Balanced
+
+        return mock_model_fn
+
+    @traced("evolution.evaluate")
     async def _evaluate_challengers(
         self, challengers: list[dict[str, Any]]
     ) -> dict[str, Any]:
-        """Evaluate all challengers using the task battery"""
-        evaluation_results = {}
+        """Evaluate all challengers concurrently using the task battery
 
-        for challenger in challengers:
-            challenger_id = challenger["challenger_id"]
+        A failure while evaluating one challenger is reported on that
+        challenger only (``error``, incomplete); the others keep their
+        results.
+        """
+        model_fns = {
+            challenger["challenger_id"]: self._make_model_fn(challenger)
+            for challenger in challengers
+        }
+        config_hashes = {
+            challenger["challenger_id"]: challenger["config_hash"]
+            for challenger in challengers
+        }
 
-            # Create mock model function for evaluation
-            def mock_model_fn(input_text: str) -> str:
-                # In a real implementation, this would call the actual model
-                # For now, return a simple response based on config
-                config = challenger["config"]
-                temp = config.get("temperature", 0.7)
-
-                # Simulate different responses based on temperature
-                if temp < 0.3:
-                    return "42"  # Deterministic
-                elif temp > 1.0:
-                    return "The answer varies depending on context and interpretation"  # Creative
-                else:
-                    return "42 is the answer"  # Balanced
-
-            # Evaluate using task battery
-            try:
-                eval_result = self.evaluator.evaluate_all_metrics(mock_model_fn)
-                evaluation_results[challenger_id] = eval_result
-            except Exception as e:
-                print(f"   ⚠️  Evaluation failed for {challenger_id}: {e}")
-                evaluation_results[challenger_id] = {
+        try:
+            if self.config.selection_strategy == "racing":
+                population = await self._race_challengers(model_fns, config_hashes)
+            else:
+                population = await self.evaluator.aevaluate_population(
+                    model_fns, config_hashes=config_hashes
+                )
+        except Exception as e:
+            print(f"   ⚠️  Evaluation failed: {e}")
+            population = {challenger_id: {"error": str(e)} for challenger_id in model_fns}
+
+        evaluation_results = {}
+        for challenger_id in model_fns:
+            result = population.get(challenger_id) or {"error": "not evaluated"}
+            if "error" in result:
+                print(f"   ⚠️  Evaluation failed for {challenger_id}: {result['error']}")
+            if "aggregate_scores" not in result:
+                result = {
                     "aggregate_scores": {
                         "U": {"mean": 0},
                         "S": {"mean": 0},
@@ -294,11 +373,75 @@ class EvolutionRunner:
                         "L": {"mean": 0},
                     },
                     "overall_score": 0.0,
-                    "error": str(e),
+                    "error": result["error"],
+                }
+            evaluation_results[challenger_id] = result
+        return evaluation_results
+
+    async def _race_challengers(
+        self, model_fns: dict[str, Any], config_hashes: dict[str, str]
+    ) -> dict[str, Any]:
+        """Evaluate challengers round by round, dropping the weakest early
+
+        Each round of the battery (one task per metric) yields one L∞
+        sample per challenger. Survivors are carried through every round,
+        so their results are complete and go through the usual gates;
+        eliminated challengers are reported as incomplete.
+        """
+        rounds = self.evaluator.task_rounds()
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
+        results = {cid: {m: [] for m in METRIC_TYPES} for cid in model_fns}
+        costs = dict.fromkeys(model_fns, 0.0)
+        errors: dict[str, str] = {}
+
+        async def evaluate_rounds(cid: str, start: int, stop: int) -> list[float]:
+            samples = []
+            for items in rounds[start:stop]:
+                if cid in errors:
+                    samples.append(0.0)
+                    continue
+                try:
+                    round_results = await self.evaluator.aevaluate_tasks(
+                        model_fns[cid], items, semaphore, config_hashes[cid]
+                    )
+                except Exception as e:
+                    # Scored 0 from here on so the race drops it; others go on
+                    errors[cid] = str(e) or type(e).__name__
+                    samples.append(0.0)
+                    continue
+                for r in round_results:
+                    results[cid][r.metric_type].append(r)
+                    if not r.evidence.get("cached"):
+                        costs[cid] += r.cost_usd
+                samples.append(quick_harmonic([r.score for r in round_results]))
+            return samples
+
+        race = await self.racer.race(list(model_fns), evaluate_rounds, len(rounds))
+        self.last_race = race
+        print(
+            f"   Racing: {race.evaluations}/{race.full_evaluations} rounds "
+            f"({race.savings:.0%} saved), {len(race.eliminated)} eliminated"
+        )
+
+        evaluation_results = {}
+        for cid, per_metric in results.items():
+            result = TaskBattery.aggregate_results(per_metric)
+            eliminated = cid in race.eliminated
+            result.update(
+                {
+                    "cost_usd": costs[cid],
+                    "complete": not eliminated and cid not in errors,
+                    "pruned": eliminated,
+                    "budget_exhausted": False,
                 }
+            )
+            if cid in errors:
+                result["error"] = errors[cid]
+            evaluation_results[cid] = result
 
         return evaluation_results
 
+    @traced("evolution.gate")
     async def _score_and_gate_challengers(
         self, challengers: list[dict[str, Any]], evaluation_results: dict[str, Any]
     ) -> tuple[dict[str, Any], dict[str, Any]]:
@@ -336,6 +479,10 @@ class EvolutionRunner:
                 # Ethics check (simplified)
                 ethics_passed = True  # Would do real ethics check here
 
+                # Challengers pruned as dominated or cut by the cost budget
+                # were not evaluated on the full battery (fail-closed)
+                evaluation_complete = eval_result.get("complete", True)
+
                 # Sigma guard check
                 sigma_guard_passed = quick_sigma_guard_check_simple(
                     ece=0.05, rho_bias=1.02, fairness=0.9, consent=True, eco_ok=True
@@ -356,9 +503,11 @@ class EvolutionRunner:
                     "score_gate_details": gate_details,
                     "ethics_passed": ethics_passed,
                     "sigma_guard_passed": sigma_guard_passed,
+                    "evaluation_complete": evaluation_complete,
                     "all_gates_passed": gate_passed
                     and ethics_passed
-                    and sigma_guard_passed,
+                    and sigma_guard_passed
+                    and evaluation_complete,
                 }
             else:
                 # Failed evaluation
@@ -380,6 +529,7 @@ class EvolutionRunner:
 
         return scoring_results, gate_results
 
+    @traced("evolution.select")
     def _select_best_challenger(
         self,
         challengers: list[dict[str, Any]],
@@ -416,6 +566,7 @@ class EvolutionRunner:
 
         return best_challenger, decision, reason
 
+    @traced("evolution.deploy")
     async def _deploy_challenger(self, challenger: dict[str, Any]) -> bool:
         """Deploy challenger using league orchestrator"""
         try:
@@ -453,6 +604,11 @@ class EvolutionRunner:
         self, challengers: list[dict[str, Any]], evaluation_results: dict[str, Any]
     ) -> float:
         """Estimate total cost of the cycle"""
+        # Prefer the cost measured by the task battery when available
+        measured = [r["cost_usd"] for r in evaluation_results.values() if "cost_usd" in r]
+        if measured:
+            return sum(measured)
+
         # Simple estimation based on number of challengers and evaluations
         base_cost_per_challenger = 0.01  # $0.01 per challenger
         evaluation_cost = len(challengers) * self.config.max_tasks_per_metric * 0.001
@@ -460,6 +460,40 @@ class SROmegaEngine:
 
         return sr_score, details
 
+    def compute_sr_batch(self, components: Any) -> Any:
+        """
+        Versão vetorizada (NumPy) de compute_sr, sem dicionário de detalhes
+
+        Args:
+            components: Array (N, 4) nas colunas de SRComponents.to_list()
+                (awareness, ethics, autocorrection, metacognition)
+
+        Returns:
+            Array (N,) de SR-Ω∞ em [0, 1], idêntico a compute_sr por linha
+        """
+        import numpy as np
+
+        keys = ("awareness", "ethics", "autocorrection", "metacognition")
+        w = np.array([self.weights[k] for k in keys])
+
+        # Clamp componentes (mesma semântica de SRComponents.clamp, inclusive NaN)
+        x = np.fmax(0.0, np.fmin(1.0, np.asarray(components, dtype=np.float64)))
+        safe = np.fmax(self.epsilon, x)
+
+        if self.method == SRAggregationMethod.HARMONIC:
+            sr = 1.0 / np.fmax(self.epsilon, (w / safe).sum(axis=-1))
+        elif self.method == SRAggregationMethod.MIN_SOFT:
+            if self.p_norm == 0:
+                sr = np.exp((w * np.log(safe)).sum(axis=-1))
+            else:
+                sr = (w * safe**self.p_norm).sum(axis=-1) ** (1.0 / self.p_norm)
+        elif self.method == SRAggregationMethod.GEOMETRIC:
+            sr = np.exp((w * np.log(safe)).sum(axis=-1))
+        else:
+            raise ValueError(f"Unknown SR method: {self.method}")
+
+        return np.fmax(0.0, np.fmin(1.0, sr))
+
     def gate_check(
         self, components: SRComponents, tau: float = 0.8
     ) -> tuple[bool, dict[str, Any]]:
@@ -674,6 +708,26 @@ def sr_omega(
     return score
 
 
+def sr_omega_batch(
+    awareness: Any, ethics_ok: Any, autocorr: Any, metacognition: Any
+) -> Any:
+    """Versão vetorizada de sr_omega: arrays (N,) ou escalares → array (N,)"""
+    import numpy as np
+
+    ethics = np.where(np.asarray(ethics_ok, dtype=bool), 1.0, 0.001)
+    components = np.stack(
+        np.broadcast_arrays(
+            np.asarray(awareness, dtype=np.float64),
+            ethics,
+            np.asarray(autocorr, dtype=np.float64),
+            np.asarray(metacognition, dtype=np.float64),
+        ),
+        axis=-1,
+    )
+    engine = SROmegaEngine(method=SRAggregationMethod.HARMONIC)
+    return engine.compute_sr_batch(components)
+
+
 def compute_sr_omega(
     awareness: float,
     ethics: float,
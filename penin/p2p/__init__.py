@@ -9,9 +9,13 @@ Baseado em libp2p para máxima flexibilidade e descentralização.
 
 from penin.p2p.node import PeninNode
 from penin.p2p.protocol import MessageType, PeninProtocol
+from penin.p2p.transport import MemoryNetwork, MemoryTransport, StreamTransport
 
 __all__ = [
     "PeninNode",
     "PeninProtocol",
     "MessageType",
+    "StreamTransport",
+    "MemoryTransport",
+    "MemoryNetwork",
 ]
@@ -3,14 +3,18 @@ PENIN Node - P2P Node Implementation
 
 Implements a PENIN-Ω node that can communicate via the PENIN protocol,
 handle status queries, and exchange knowledge with other nodes.
+Network I/O goes through an attached transport (``penin.p2p.transport``).
 """
 
 import asyncio
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from penin.omega.sr import SROmegaService
 from penin.p2p.protocol import MessageType, PeninMessage, PeninProtocol
 
+if TYPE_CHECKING:
+    from penin.p2p.transport import Transport
+
 
 class PeninNode:
     """
@@ -35,6 +39,9 @@ class PeninNode:
         self.status_responses: dict[str, dict[str, Any]] = (
             {}
         )  # Store responses by peer_id
+        # query_peer_status calls waiting for a STATUS_RESPONSE without a transport
+        self._status_waiters: dict[str, list[asyncio.Future]] = {}
+        self.transport: Transport | None = None  # Set by the transport on attach
 
         # Register message handlers
         self._register_handlers()
@@ -51,6 +58,9 @@ class PeninNode:
             MessageType.STATUS_RESPONSE, self._handle_status_response
         )
         self.protocol.register_handler(MessageType.HEARTBEAT, self._handle_heartbeat)
+        self.protocol.register_handler(
+            MessageType.PEER_ANNOUNCE, self._handle_peer_announce
+        )
 
     async def _handle_status_query(self, message: PeninMessage) -> PeninMessage:
         """
@@ -78,7 +88,12 @@ class PeninNode:
         sender_id = message.sender_id
         mental_state = message.payload.get("mental_state", {})
 
-        # Store response
+        # Hand to the oldest waiting query, else store for a later one
+        for waiter in self._status_waiters.pop(sender_id, []):
+            if not waiter.done():
+                waiter.set_result(mental_state)
+                return
+
         self.status_responses[sender_id] = {
             "mental_state": mental_state,
             "timestamp": message.timestamp,
@@ -96,6 +111,26 @@ class PeninNode:
         """
         return self.protocol.create_heartbeat(status="healthy")
 
+    async def _handle_peer_announce(self, message: PeninMessage) -> PeninMessage:
+        """
+        Record an announcing peer and announce ourselves back
+
+        Args:
+            message: Peer announce message
+
+        Returns:
+            This node's peer announcement
+        """
+        self.peers[message.sender_id] = message.payload
+        return self.announcement()
+
+    def announcement(self) -> PeninMessage:
+        """Peer announce message for this node"""
+        multiaddrs = [self.transport.address] if self.transport is not None else []
+        return self.protocol.create_peer_announce(
+            multiaddrs=multiaddrs, specializations=[], metrics={}
+        )
+
     async def query_peer_status(
         self, peer_id: str, timeout: float = 5.0
     ) -> dict[str, Any] | None:
@@ -108,23 +143,38 @@ class PeninNode:
 
         Returns:
             Mental state dictionary or None if query failed
-        """
-        # Create status query
-        self.protocol.create_status_query(peer_id)
-
-        # In a real implementation, this would send via network
-        # For now, we simulate the response handling
-        # This is a placeholder that would be replaced with actual network code
 
-        # Wait for response (in real implementation, this would wait for network response)
-        start_time = asyncio.get_event_loop().time()
-        while asyncio.get_event_loop().time() - start_time < timeout:
-            if peer_id in self.status_responses:
-                response = self.status_responses.pop(peer_id)
-                return response["mental_state"]
-            await asyncio.sleep(0.1)
-
-        return None
+        With a transport connected to ``peer_id`` the query goes over the
+        network and the reply is matched by message ID. Otherwise the call
+        waits for a status response delivered through ``handle_message``.
+        """
+        query = self.protocol.create_status_query(peer_id)
+
+        conn = self.transport.connection(peer_id) if self.transport else None
+        if conn is not None:
+            try:
+                reply = await conn.request(query, timeout)
+            except (TimeoutError, ConnectionError):
+                return None
+            if reply.msg_type != MessageType.STATUS_RESPONSE:
+                return None
+            return reply.payload.get("mental_state", {})
+
+        if peer_id in self.status_responses:
+            return self.status_responses.pop(peer_id)["mental_state"]
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._status_waiters.setdefault(peer_id, []).append(waiter)
+        try:
+            return await asyncio.wait_for(waiter, timeout)
+        except TimeoutError:
+            return None
+        finally:
+            waiters = self._status_waiters.get(peer_id)
+            if waiters and waiter in waiters:
+                waiters.remove(waiter)
+                if not waiters:
+                    del self._status_waiters[peer_id]
 
     async def handle_message(self, message: PeninMessage) -> PeninMessage | None:
         """
@@ -145,4 +195,7 @@ class PeninNode:
             "protocol_version": self.protocol.VERSION,
             "peers_count": len(self.peers),
             "sr_service_active": self.sr_service is not None,
+            "connected_peers": (
+                sorted(self.transport.connections) if self.transport else []
+            ),
         }
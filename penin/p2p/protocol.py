@@ -5,12 +5,16 @@ Defines message types, serialization, and protocol handlers for PENIN-Ω P2P com
 """
 
 import hashlib
+import itertools
 import json
+import struct
 import time
 from dataclasses import asdict, dataclass
 from enum import Enum
 from typing import Any
 
+import orjson
+
 
 class MessageType(str, Enum):
     """Protocol message types"""
@@ -42,6 +46,22 @@ class MessageType(str, Enum):
     ERROR = "error"
 
 
+# Binary wire format (see PeninMessage.to_bytes). Type codes follow the
+# declaration order of MessageType (aliases excluded): append new types only.
+WIRE_VERSION = 1
+_WIRE_TYPES: tuple[MessageType, ...] = tuple(MessageType)
+_WIRE_CODES: dict[MessageType, int] = {t: i for i, t in enumerate(_WIRE_TYPES)}
+# version, type code, flags, timestamp, len(msg_id), len(reply_to),
+# len(sender_id), len(signature), len(payload)
+_WIRE_HEADER = struct.Struct("!BBBdBBHHI")
+_FLAG_SIGNATURE = 0x01
+_FLAG_REPLY = 0x02
+
+# Makes IDs of otherwise identical messages (same type, sender, payload and
+# clock tick) distinct, so replies can be matched to requests by ID
+_MSG_SEQ = itertools.count()
+
+
 @dataclass
 class PeninMessage:
     """Base PENIN Protocol message"""
@@ -52,6 +72,7 @@ class PeninMessage:
     payload: dict[str, Any]
     signature: str | None = None
     msg_id: str | None = None
+    reply_to: str | None = None  # msg_id of the request this message answers
 
     def __post_init__(self):
         if self.msg_id is None:
@@ -59,8 +80,9 @@ class PeninMessage:
 
     def _generate_msg_id(self) -> str:
         """Generate unique message ID"""
-        content = f"{self.msg_type}:{self.sender_id}:{self.timestamp}:{json.dumps(self.payload, sort_keys=True)}"
-        return hashlib.sha256(content.encode()).hexdigest()[:16]
+        content = f"{self.msg_type}:{self.sender_id}:{self.timestamp}:{next(_MSG_SEQ)}:".encode()
+        payload = orjson.dumps(self.payload, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(content + payload).hexdigest()[:16]
 
     def to_dict(self) -> dict[str, Any]:
         """Serialize to dictionary"""
@@ -71,6 +93,7 @@ class PeninMessage:
             "payload": self.payload,
             "signature": self.signature,
             "msg_id": self.msg_id,
+            "reply_to": self.reply_to,
         }
 
     @classmethod
@@ -83,6 +106,7 @@ class PeninMessage:
             payload=data["payload"],
             signature=data.get("signature"),
             msg_id=data.get("msg_id"),
+            reply_to=data.get("reply_to"),
         )
 
     def to_json(self) -> str:
@@ -94,6 +118,69 @@ class PeninMessage:
         """Deserialize from JSON"""
         return cls.from_dict(json.loads(json_str))
 
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to the compact binary wire format
+
+        A fixed ``_WIRE_HEADER`` (version, one-byte type code, flags,
+        timestamp and field lengths) followed by the UTF-8 ``msg_id``,
+        ``reply_to``, ``sender_id`` and ``signature`` and the payload as
+        compact JSON. Framing (length prefix) is left to the transport.
+        """
+        msg_id = (self.msg_id or "").encode()
+        reply_to = (self.reply_to or "").encode()
+        sender = self.sender_id.encode()
+        signature = (self.signature or "").encode()
+        payload = orjson.dumps(self.payload)
+        flags = (_FLAG_SIGNATURE if self.signature is not None else 0) | (
+            _FLAG_REPLY if self.reply_to is not None else 0
+        )
+        header = _WIRE_HEADER.pack(
+            WIRE_VERSION,
+            _WIRE_CODES[self.msg_type],
+            flags,
+            self.timestamp,
+            len(msg_id),
+            len(reply_to),
+            len(sender),
+            len(signature),
+            len(payload),
+        )
+        return b"".join((header, msg_id, reply_to, sender, signature, payload))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "PeninMessage":
+        """Deserialize from the binary wire format (raises ValueError if malformed)"""
+        try:
+            (version, code, flags, timestamp, n_id, n_reply, n_sender, n_sig, n_payload) = (
+                _WIRE_HEADER.unpack_from(data)
+            )
+        except struct.error as exc:
+            raise ValueError(f"Truncated PENIN message header: {exc}") from None
+        if version != WIRE_VERSION:
+            raise ValueError(f"Unsupported PENIN wire version {version}")
+        if code >= len(_WIRE_TYPES):
+            raise ValueError(f"Unknown PENIN message type code {code}")
+        offset = _WIRE_HEADER.size
+        end = offset + n_id + n_reply + n_sender + n_sig + n_payload
+        if end != len(data):
+            raise ValueError(f"PENIN message length mismatch: expected {end} bytes, got {len(data)}")
+        view = memoryview(data)
+        fields = []
+        for n in (n_id, n_reply, n_sender, n_sig):
+            fields.append(str(view[offset : offset + n], "utf-8"))
+            offset += n
+        msg_id, reply_to, sender_id, signature = fields
+        return cls(
+            msg_type=_WIRE_TYPES[code],
+            sender_id=sender_id,
+            timestamp=timestamp,
+            payload=orjson.loads(view[offset:end]),
+            signature=signature if flags & _FLAG_SIGNATURE else None,
+            msg_id=msg_id or None,
+            reply_to=reply_to if flags & _FLAG_REPLY else None,
+        )
+
 
 @dataclass
 class PeerInfo:
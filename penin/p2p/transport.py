@@ -0,0 +1,363 @@
+"""
+PENIN Transport - Framed message transports for PENIN nodes
+
+Messages travel as length-prefixed frames (4-byte big-endian length, then
+``PeninMessage.to_bytes()``) over one persistent connection per peer.
+Requests and replies are matched by ``msg_id``/``reply_to``: ``request()``
+parks a future keyed by the request ID and the connection's reader task
+resolves it when the reply arrives, so there is no polling.
+
+Transports:
+
+- ``StreamTransport``: asyncio TCP streams (``start()`` to listen,
+  ``connect(host, port)`` to dial)
+- ``MemoryTransport``: in-process loopback over a shared ``MemoryNetwork``,
+  same framing and codec, no sockets (tests, simulations)
+
+Connecting sends a ``PEER_ANNOUNCE`` request; each side registers the
+connection under the other's ``sender_id``.
+"""
+
+import asyncio
+import struct
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from penin.p2p.protocol import PeninMessage
+
+if TYPE_CHECKING:
+    from penin.p2p.node import PeninNode
+
+_LENGTH = struct.Struct("!I")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+# Pause a sender once this much is queued in the socket's write buffer
+WRITE_HIGH_WATER = 256 * 1024
+
+
+class FrameError(ValueError):
+    """Malformed or oversized frame"""
+
+
+def encode_frame(message: PeninMessage) -> bytes:
+    """Length-prefixed wire frame for ``message``"""
+    body = message.to_bytes()
+    if len(body) > MAX_FRAME_BYTES:
+        raise FrameError(f"Frame of {len(body)} bytes exceeds {MAX_FRAME_BYTES}")
+    return _LENGTH.pack(len(body)) + body
+
+
+async def read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    """Read one frame body (``None`` on clean EOF)"""
+    try:
+        header = await reader.readexactly(_LENGTH.size)
+    except asyncio.IncompleteReadError as exc:
+        if exc.partial:
+            raise FrameError("Connection closed inside a frame header") from None
+        return None
+    (size,) = _LENGTH.unpack(header)
+    if size > MAX_FRAME_BYTES:
+        raise FrameError(f"Frame of {size} bytes exceeds {MAX_FRAME_BYTES}")
+    try:
+        return await reader.readexactly(size)
+    except asyncio.IncompleteReadError:
+        raise FrameError("Connection closed inside a frame") from None
+
+
+class StreamChannel:
+    """Frames over an asyncio stream pair"""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def send(self, frame: bytes) -> None:
+        self.writer.write(frame)
+        if self.writer.transport.get_write_buffer_size() > WRITE_HIGH_WATER:
+            await self.writer.drain()
+
+    async def recv(self) -> bytes | None:
+        return await read_frame(self.reader)
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except (ConnectionError, OSError):
+            pass
+
+
+class MemoryChannel:
+    """One end of an in-process duplex frame pipe"""
+
+    def __init__(self, inbox: asyncio.Queue, outbox: asyncio.Queue):
+        self._inbox = inbox
+        self._outbox = outbox
+
+    @classmethod
+    def pair(cls) -> tuple["MemoryChannel", "MemoryChannel"]:
+        a_to_b: asyncio.Queue = asyncio.Queue()
+        b_to_a: asyncio.Queue = asyncio.Queue()
+        return cls(b_to_a, a_to_b), cls(a_to_b, b_to_a)
+
+    async def send(self, frame: bytes) -> None:
+        # Frames carry their length prefix for parity with the stream path
+        self._outbox.put_nowait(frame)
+
+    async def recv(self) -> bytes | None:
+        frame = await self._inbox.get()
+        if frame is None:
+            return None
+        (size,) = _LENGTH.unpack_from(frame)
+        if size != len(frame) - _LENGTH.size:
+            raise FrameError("Frame length prefix does not match its body")
+        return frame[_LENGTH.size :]
+
+    async def close(self) -> None:
+        self._outbox.put_nowait(None)
+        self._inbox.put_nowait(None)
+
+
+class PeerConnection:
+    """
+    Persistent connection to one peer
+
+    A reader task decodes incoming frames: replies resolve the matching
+    ``request()`` future, anything else is handed to the node (in its own
+    task, so a slow handler does not stall replies) and a returned message
+    is sent back with ``reply_to`` set. Handler exceptions are answered
+    with an ``ERROR`` message.
+    """
+
+    def __init__(
+        self,
+        node: "PeninNode",
+        channel: Any,
+        on_close: Callable[["PeerConnection"], None] | None = None,
+    ):
+        self.node = node
+        self.channel = channel
+        self.peer_id: str | None = None
+        self.on_peer: Callable[["PeerConnection"], None] | None = None
+        self._on_close = on_close
+        self._pending: dict[str, asyncio.Future] = {}
+        self._handlers: set[asyncio.Task] = set()
+        self.closed = False
+        self._reader = asyncio.get_running_loop().create_task(self._read_loop())
+
+    async def send(self, message: PeninMessage) -> None:
+        """Send without waiting for a reply"""
+        if self.closed:
+            raise ConnectionError(f"Connection to {self.peer_id or 'peer'} is closed")
+        await self.channel.send(encode_frame(message))
+
+    async def request(self, message: PeninMessage, timeout: float = 5.0) -> PeninMessage:
+        """Send ``message`` and wait for the reply carrying its ``msg_id``"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message.msg_id] = future
+        try:
+            await self.send(message)
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message.msg_id, None)
+
+    async def _read_loop(self) -> None:
+        error: BaseException | None = None
+        try:
+            while True:
+                body = await self.channel.recv()
+                if body is None:
+                    break
+                message = PeninMessage.from_bytes(body)
+                if self.peer_id is None:
+                    self.peer_id = message.sender_id
+                    if self.on_peer is not None:
+                        self.on_peer(self)
+                if message.reply_to is not None:
+                    future = self._pending.get(message.reply_to)
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                    continue
+                task = asyncio.get_running_loop().create_task(self._dispatch(message))
+                self._handlers.add(task)
+                task.add_done_callback(self._handlers.discard)
+        except (ConnectionError, OSError, ValueError) as exc:
+            error = exc
+        finally:
+            self.closed = True
+            self._fail_pending(error)
+            if self._on_close is not None:
+                self._on_close(self)
+        # Peer hung up or sent garbage (cancellation skips this; see close())
+        await self.channel.close()
+
+    async def _dispatch(self, message: PeninMessage) -> None:
+        try:
+            reply = await self.node.handle_message(message)
+        except Exception as exc:
+            reply = self.node.protocol.create_error(
+                str(exc), {"msg_type": message.msg_type.value, "msg_id": message.msg_id}
+            )
+        if reply is None or self.closed:
+            return
+        reply.reply_to = message.msg_id
+        try:
+            await self.send(reply)
+        except (ConnectionError, OSError):
+            pass
+
+    def _fail_pending(self, error: BaseException | None) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionError(f"Connection to {self.peer_id or 'peer'} lost: {error or 'closed'}")
+                )
+
+    async def close(self) -> None:
+        self.closed = True
+        self._reader.cancel()
+        for task in list(self._handlers):
+            task.cancel()
+        await asyncio.gather(self._reader, *self._handlers, return_exceptions=True)
+        await self.channel.close()
+
+
+class Transport:
+    """
+    Per-peer connection registry shared by the concrete transports
+
+    Attaches itself to ``node`` (``node.transport``), which then routes
+    requests to connected peers through it.
+    """
+
+    def __init__(self, node: "PeninNode"):
+        self.node = node
+        self.connections: dict[str, PeerConnection] = {}
+        node.transport = self
+
+    def connection(self, peer_id: str) -> PeerConnection | None:
+        conn = self.connections.get(peer_id)
+        return conn if conn is not None and not conn.closed else None
+
+    async def request(
+        self, peer_id: str, message: PeninMessage, timeout: float = 5.0
+    ) -> PeninMessage:
+        conn = self.connection(peer_id)
+        if conn is None:
+            raise ConnectionError(f"Not connected to peer '{peer_id}'")
+        return await conn.request(message, timeout)
+
+    async def send(self, peer_id: str, message: PeninMessage) -> None:
+        conn = self.connection(peer_id)
+        if conn is None:
+            raise ConnectionError(f"Not connected to peer '{peer_id}'")
+        await conn.send(message)
+
+    async def broadcast(self, message: PeninMessage) -> None:
+        """Send ``message`` to every connected peer"""
+        for conn in list(self.connections.values()):
+            if not conn.closed:
+                await conn.send(message)
+
+    def _open(self, channel: Any) -> PeerConnection:
+        conn = PeerConnection(self.node, channel, on_close=self._forget)
+        conn.on_peer = self._register
+        return conn
+
+    def _register(self, conn: PeerConnection) -> None:
+        if conn.peer_id is not None:
+            self.connections[conn.peer_id] = conn
+
+    def _forget(self, conn: PeerConnection) -> None:
+        if conn.peer_id is not None and self.connections.get(conn.peer_id) is conn:
+            del self.connections[conn.peer_id]
+
+    async def _handshake(self, conn: PeerConnection, timeout: float) -> str:
+        """Announce ourselves; the reply names the peer"""
+        announce = self.node.announcement()
+        try:
+            reply = await conn.request(announce, timeout)
+        except BaseException:
+            await conn.close()
+            raise
+        conn.peer_id = reply.sender_id
+        self.node.peers[reply.sender_id] = reply.payload
+        self._register(conn)
+        return reply.sender_id
+
+    async def close(self) -> None:
+        conns = list(self.connections.values())
+        self.connections.clear()
+        await asyncio.gather(*(c.close() for c in conns), return_exceptions=True)
+
+
+class StreamTransport(Transport):
+    """TCP transport: one persistent, framed connection per peer"""
+
+    def __init__(self, node: "PeninNode", host: str = "127.0.0.1", port: int = 0):
+        super().__init__(node)
+        self.host = host
+        self.port = port
+        self._server: asyncio.AbstractServer | None = None
+        self._accepted: set[PeerConnection] = set()
+
+    @property
+    def address(self) -> str:
+        return f"/ip4/{self.host}/tcp/{self.port}"
+
+    async def start(self) -> "StreamTransport":
+        """Listen for peers (``port=0`` picks a free port)"""
+        self._server = await asyncio.start_server(self._accept, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        conn = self._open(StreamChannel(reader, writer))
+        self._accepted.add(conn)
+        conn._reader.add_done_callback(lambda _: self._accepted.discard(conn))
+
+    async def connect(self, host: str, port: int, timeout: float = 5.0) -> str:
+        """Dial a peer, exchange announcements and return its node ID"""
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+        return await self._handshake(self._open(StreamChannel(reader, writer)), timeout)
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+        await asyncio.gather(*(c.close() for c in list(self._accepted)), return_exceptions=True)
+        await super().close()
+        if self._server is not None:
+            await self._server.wait_closed()
+            self._server = None
+
+
+class MemoryNetwork:
+    """Registry of in-process nodes reachable by ``MemoryTransport``"""
+
+    def __init__(self) -> None:
+        self.transports: dict[str, "MemoryTransport"] = {}
+
+
+class MemoryTransport(Transport):
+    """Loopback transport: framed messages over in-process queues"""
+
+    def __init__(self, node: "PeninNode", network: MemoryNetwork):
+        super().__init__(node)
+        self.network = network
+        network.transports[node.node_id] = self
+
+    @property
+    def address(self) -> str:
+        return f"/memory/{self.node.node_id}"
+
+    async def connect(self, peer_id: str, timeout: float = 5.0) -> str:
+        remote = self.network.transports.get(peer_id)
+        if remote is None:
+            raise ConnectionError(f"No node '{peer_id}' on this memory network")
+        local_end, remote_end = MemoryChannel.pair()
+        remote._open(remote_end)
+        return await self._handshake(self._open(local_end), timeout)
+
+    async def close(self) -> None:
+        await super().close()
+        if self.network.transports.get(self.node.node_id) is self:
+            del self.network.transports[self.node.node_id]
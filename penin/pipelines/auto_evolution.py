@@ -26,6 +26,7 @@ References:
 
 from __future__ import annotations
 
+import random
 import time
 import uuid
 from collections import deque
@@ -52,6 +53,7 @@ from penin.meta.omega_meta_complete import (
     Mutation,
     OmegaMeta,
 )
+from penin.omega.racing import RaceResult, RacingConfig, SuccessiveHalvingRacer
 
 # ============================================================================
 # Pipeline Configuration
@@ -89,6 +91,13 @@ class PipelineConfig:
     auto_tune_enabled: bool = True
     auto_tune_lr: float = 0.01
 
+    # Racing (successive halving) challenger selection
+    racing_enabled: bool = False
+    racing_eta: float = 2.0
+    racing_samples: int = 8  # Shadow L∞ samples per challenger at full budget
+    racing_min_survivors: int = 2
+    racing_noise_std: float = 0.03  # Simulated per-sample L∞ noise
+
 
 # ============================================================================
 # Pipeline Results
@@ -161,6 +170,10 @@ class PipelineResult:
     # Audit trail
     pcags: list[ProofCarryingArtifact] = field(default_factory=list)
 
+    # Racing summary (when racing is enabled)
+    race: RaceResult | None = None
+    eliminated: int = 0
+
 
 # ============================================================================
 # Auto-Evolution Pipeline
@@ -235,18 +248,26 @@ class AutoEvolutionPipeline:
         # Step 1: Generate Challengers (Ω-META)
         challengers = await self._generate_challengers(champion_state, num_challengers)
 
-        # Step 2: Evaluate each challenger
-        evaluations: list[ChallengerEvaluation] = []
-        for mutation in challengers:
-            eval_result = await self._evaluate_challenger(
+        # Step 2: Evaluate challengers (all of them, or only race survivors)
+        race: RaceResult | None = None
+        if self.config.racing_enabled:
+            evaluations, race = await self._race_challengers(
                 champion_state=champion_state,
-                mutation=mutation,
+                challengers=challengers,
                 environment=environment,
             )
-            evaluations.append(eval_result)
-
-            # Record in ledger
-            await self._record_evaluation(eval_result)
+        else:
+            evaluations = []
+            for mutation in challengers:
+                eval_result = await self._evaluate_challenger(
+                    champion_state=champion_state,
+                    mutation=mutation,
+                    environment=environment,
+                )
+                evaluations.append(eval_result)
+
+                # Record in ledger
+                await self._record_evaluation(eval_result)
 
         # Step 3: Select winner (if any)
         promoted_challenger = self._select_winner(evaluations)
@@ -262,7 +283,7 @@ class AutoEvolutionPipeline:
             challengers=evaluations,
             promoted_challenger=promoted_challenger,
             total_duration_sec=time.time() - start_time,
-            total_challengers=len(evaluations),
+            total_challengers=len(challengers),
             promoted=sum(
                 1 for e in evaluations if e.decision == PipelineDecision.PROMOTED
             ),
@@ -272,6 +293,8 @@ class AutoEvolutionPipeline:
             rolled_back=sum(
                 1 for e in evaluations if e.decision == PipelineDecision.ROLLED_BACK
             ),
+            race=race,
+            eliminated=len(race.eliminated) if race else 0,
         )
 
         self.pipeline_history.append(result)
@@ -296,6 +319,81 @@ class AutoEvolutionPipeline:
 
         return challengers
 
+    async def _race_challengers(
+        self,
+        champion_state: MasterState,
+        challengers: list[Mutation],
+        environment: Any | None,
+    ) -> tuple[list[ChallengerEvaluation], RaceResult]:
+        """
+        Race challengers on cheap shadow L∞ samples, then run the full
+        shadow → canary → Σ-Guard evaluation only on the survivors.
+
+        Survivors are evaluated best-first and evaluation stops at the first
+        one that is promoted; eliminated challengers are recorded in the
+        ledger but never reach the gates.
+        """
+        racer = SuccessiveHalvingRacer(
+            RacingConfig(
+                eta=self.config.racing_eta,
+                min_survivors=self.config.racing_min_survivors,
+            )
+        )
+        race = await racer.race(
+            [m.mutation_id for m in challengers],
+            self._sample_challenger_linf,
+            max_budget=self.config.racing_samples,
+        )
+
+        by_id = {m.mutation_id: m for m in challengers}
+        for challenger_id, rung in race.eliminated.items():
+            self.ledger.append(
+                event_type="challenger_eliminated",
+                event_id=challenger_id,
+                payload={
+                    "rung": rung,
+                    "samples": len(race.samples[challenger_id]),
+                    "mean_linf": sum(race.samples[challenger_id])
+                    / max(1, len(race.samples[challenger_id])),
+                },
+            )
+
+        evaluations: list[ChallengerEvaluation] = []
+        for challenger_id in race.ranking:
+            eval_result = await self._evaluate_challenger(
+                champion_state=champion_state,
+                mutation=by_id[challenger_id],
+                environment=environment,
+            )
+            evaluations.append(eval_result)
+            await self._record_evaluation(eval_result)
+
+            if eval_result.decision == PipelineDecision.PROMOTED:
+                break
+
+        return evaluations, race
+
+    def _sample_challenger_linf(
+        self, challenger_id: str, start: int, stop: int
+    ) -> list[float]:
+        """
+        Shadow L∞ samples ``[start, stop)`` for a challenger.
+
+        Simulated as noisy observations of the same L∞ that the full
+        evaluation reports (in production, one sample per shadow request).
+        """
+        seed = self._challenger_seed(challenger_id)
+        true_linf = 0.75 + random.Random(seed).uniform(-0.05, 0.15)
+        return [
+            true_linf
+            + random.Random(f"{seed}:{i}").gauss(0.0, self.config.racing_noise_std)
+            for i in range(start, stop)
+        ]
+
+    @staticmethod
+    def _challenger_seed(challenger_id: str) -> int:
+        return hash(challenger_id) % (2**32)
+
     async def _evaluate_challenger(
         self,
         champion_state: MasterState,
@@ -315,9 +413,7 @@ class AutoEvolutionPipeline:
         champion_linf = 0.75
 
         # Challenger metrics (slightly better)
-        import random
-
-        random.seed(hash(challenger_id) % (2**32))
+        random.seed(self._challenger_seed(challenger_id))
 
         challenger_linf = champion_linf + random.uniform(-0.05, 0.15)
         delta_linf = challenger_linf - champion_linf
@@ -7,24 +7,49 @@ Unified interface for multiple LLM providers with cost tracking.
 
 from __future__ import annotations
 
-from .anthropic_provider import AnthropicProvider
-from .base import BaseProvider, LLMResponse
-from .deepseek_provider import DeepSeekProvider
-from .gemini_provider import GeminiProvider
-from .grok_provider import GrokProvider
-from .mistral_provider import MistralProvider
-from .openai_provider import OpenAIProvider
-from .pricing import PROVIDER_PRICING, calculate_cost
+from typing import TYPE_CHECKING
+
+from penin._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .anthropic_provider import AnthropicProvider
+    from .base import BaseProvider, LLMResponse, StreamDelta
+    from .deepseek_provider import DeepSeekProvider
+    from .gemini_provider import GeminiProvider
+    from .grok_provider import GrokProvider
+    from .http_transport import HTTPTransportConfig
+    from .mistral_provider import MistralProvider
+    from .openai_provider import OpenAIProvider
+    from .pricing import PROVIDER_PRICING, calculate_cost
+
+# Each adapter imports its vendor SDK; load them on first use only.
+_EXPORTS = {
+    "AnthropicProvider": ".anthropic_provider",
+    "BaseProvider": ".base",
+    "LLMResponse": ".base",
+    "StreamDelta": ".base",
+    "DeepSeekProvider": ".deepseek_provider",
+    "GeminiProvider": ".gemini_provider",
+    "GrokProvider": ".grok_provider",
+    "HTTPTransportConfig": ".http_transport",
+    "MistralProvider": ".mistral_provider",
+    "OpenAIProvider": ".openai_provider",
+    "PROVIDER_PRICING": ".pricing",
+    "calculate_cost": ".pricing",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "BaseProvider",
     "LLMResponse",
+    "StreamDelta",
     "OpenAIProvider",
     "AnthropicProvider",
     "GeminiProvider",
     "GrokProvider",
     "MistralProvider",
     "DeepSeekProvider",
+    "HTTPTransportConfig",
     "PROVIDER_PRICING",
     "calculate_cost",
 ]
@@ -12,12 +12,37 @@ from penin.config import settings
 from penin.providers.pricing import estimate_cost, usage_value
 
 from .base import BaseProvider, LLMResponse, Message, Tool
+from .http_transport import HTTPTransportConfig, ProviderHTTPClient
+
+BASE_URL = "https://api.anthropic.com/v1"
+API_VERSION = "2023-06-01"
+MAX_TOKENS = 2048
 
 
 class AnthropicProvider(BaseProvider):
-    def __init__(self, model: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        *,
+        native_http: bool | None = None,
+        base_url: str | None = None,
+        http_config: HTTPTransportConfig | None = None,
+    ):
         self.name = "anthropic"
         self.model = model or settings.ANTHROPIC_MODEL
+        native = settings.PENIN_NATIVE_HTTP if native_http is None else native_http
+        self.http: ProviderHTTPClient | None = None
+        self.client = None
+        if native:
+            self.http = ProviderHTTPClient(
+                base_url or BASE_URL,
+                headers={
+                    "anthropic-version": API_VERSION,
+                    **({"x-api-key": settings.ANTHROPIC_API_KEY} if settings.ANTHROPIC_API_KEY else {}),
+                },
+                config=http_config,
+            )
+            return
         # In tests, anthropic module is monkeypatched; if it's None, create a shim module
         if anthropic is None:  # pragma: no cover
             import types
@@ -33,6 +58,8 @@ class AnthropicProvider(BaseProvider):
         temperature: float = 0.7,
     ) -> LLMResponse:
         start = time.time()
+        if self.http is not None:
+            return await self._chat_http(messages, system, start)
         msgs = []
         if system:
             msgs.append({"role": "system", "content": system})
@@ -40,7 +67,7 @@ class AnthropicProvider(BaseProvider):
         resp = await asyncio.to_thread(
             self.client.messages.create,
             model=self.model,
-            max_tokens=2048,
+            max_tokens=MAX_TOKENS,
             messages=msgs,
         )
         content = resp.content[0].text if getattr(resp, "content", None) else ""
@@ -58,3 +85,26 @@ class AnthropicProvider(BaseProvider):
             provider=self.name,
             latency_s=end - start,
         )
+
+    async def _chat_http(
+        self, messages: list[Message], system: str | None, start: float
+    ) -> LLMResponse:
+        payload = {"model": self.model, "max_tokens": MAX_TOKENS, "messages": messages}
+        if system:
+            payload["system"] = system
+        data = await self.http.post_json("/messages", payload)
+        content = "".join(
+            block.get("text", "") for block in data.get("content") or [] if block.get("type") == "text"
+        )
+        usage = data.get("usage")
+        tokens_in = usage_value(usage, "input_tokens")
+        tokens_out = usage_value(usage, "output_tokens")
+        return LLMResponse(
+            content=content,
+            model=self.model,
+            tokens_in=tokens_in,
+            tokens_out=tokens_out,
+            cost_usd=estimate_cost(self.name, self.model, tokens_in, tokens_out),
+            provider=self.name,
+            latency_s=time.time() - start,
+        )
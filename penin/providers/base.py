@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from typing import Any
 
 Message = dict[str, Any]
@@ -31,6 +32,32 @@ class LLMResponse:
         self.provider = provider
 
 
+class StreamDelta:
+    """
+    Incremental piece of a streamed completion.
+
+    ``tokens_out``/``cost_usd`` are the provider's running estimate for this
+    piece. The last delta carries the assembled ``response`` with the
+    authoritative usage; its ``content`` is the final (possibly empty) piece.
+    """
+
+    def __init__(
+        self,
+        content: str = "",
+        tokens_out: int = 0,
+        cost_usd: float = 0.0,
+        response: LLMResponse | None = None,
+    ):
+        self.content = content
+        self.tokens_out = tokens_out
+        self.cost_usd = cost_usd
+        self.response = response
+
+    @property
+    def done(self) -> bool:
+        return self.response is not None
+
+
 class BaseProvider(ABC):
     name: str
     model: str
@@ -43,3 +70,22 @@ class BaseProvider(ABC):
         system: str | None = None,
         temperature: float = 0.7,
     ) -> LLMResponse: ...
+
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        system: str | None = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamDelta]:
+        """Stream the completion; providers without native streaming yield it whole."""
+        response = await self.chat(
+            messages, tools=tools, system=system, temperature=temperature
+        )
+        yield StreamDelta(content=response.content or "", response=response)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections this provider opened on the running loop."""
+        http = getattr(self, "http", None)
+        if http is not None:
+            await http.aclose()
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from collections.abc import AsyncIterator
 
 try:
     from openai import OpenAI  # type: ignore
@@ -9,17 +10,52 @@ except Exception:  # pragma: no cover
 from penin.config import settings
 from penin.providers.pricing import estimate_cost, usage_value
 
-from .base import BaseProvider, LLMResponse, Message, Tool
+from .base import BaseProvider, LLMResponse, Message, StreamDelta, Tool
+from .http_transport import (
+    HTTPTransportConfig,
+    ProviderHTTPClient,
+    bearer,
+    chat_completion,
+    chat_completion_stream,
+)
+from .streaming import openai_compatible_stream
 
 BETA = False
 BASE_URL = "https://api.deepseek.com/beta" if BETA else "https://api.deepseek.com"
 
 
 class DeepSeekProvider(BaseProvider):
-    def __init__(self, model: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        *,
+        native_http: bool | None = None,
+        base_url: str | None = None,
+        http_config: HTTPTransportConfig | None = None,
+    ):
         self.name = "deepseek"
         self.model = model or settings.DEEPSEEK_MODEL
-        self.client = OpenAI(api_key=settings.DEEPSEEK_API_KEY, base_url=BASE_URL)
+        native = settings.PENIN_NATIVE_HTTP if native_http is None else native_http
+        self.http: ProviderHTTPClient | None = None
+        self.client = None
+        if native:
+            self.http = ProviderHTTPClient(
+                base_url or BASE_URL,
+                headers=bearer(settings.DEEPSEEK_API_KEY),
+                config=http_config,
+            )
+        else:
+            self.client = OpenAI(api_key=settings.DEEPSEEK_API_KEY, base_url=base_url or BASE_URL)
+
+    def _request_kwargs(self, messages: list[Message], tools: list[Tool] | None, system: str | None):
+        msgs = []
+        if system:
+            msgs.append({"role": "system", "content": system})
+        msgs += messages
+        kwargs = {"model": self.model, "messages": msgs}
+        if tools:
+            kwargs["tools"] = tools
+        return kwargs
 
     async def chat(
         self,
@@ -28,20 +64,11 @@ class DeepSeekProvider(BaseProvider):
         system: str | None = None,
         temperature: float = 0.7,
     ) -> LLMResponse:
+        kwargs = self._request_kwargs(messages, tools, system)
+        if self.http is not None:
+            return await chat_completion(self, self.http, kwargs)
         start = time.time()
-        msgs = []
-        if system:
-            msgs.append({"role": "system", "content": system})
-        msgs += messages
-        kwargs = {}
-        if tools:
-            kwargs["tools"] = tools
-        resp = await asyncio.to_thread(
-            self.client.chat.completions.create,
-            model=self.model,
-            messages=msgs,
-            **kwargs,
-        )
+        resp = await asyncio.to_thread(self.client.chat.completions.create, **kwargs)
         choice = resp.choices[0]
         content = (
             getattr(choice.message, "content", "") if hasattr(choice, "message") else ""
@@ -66,3 +93,20 @@ class DeepSeekProvider(BaseProvider):
             provider=self.name,
             latency_s=end - start,
         )
+
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        system: str | None = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamDelta]:
+        kwargs = self._request_kwargs(messages, tools, system)
+        if self.http is not None:
+            async for delta in chat_completion_stream(self, self.http, kwargs):
+                yield delta
+            return
+        async for delta in openai_compatible_stream(
+            self, self.client.chat.completions.create, kwargs
+        ):
+            yield delta
@@ -0,0 +1,228 @@
+"""Pooled async HTTP transport for provider adapters.
+
+Vendor SDKs are synchronous, so calling them from the event loop costs one
+executor thread per in-flight request; a wide fan-out queues behind the
+default pool (``min(32, cpu + 4)`` threads). :class:`ProviderHTTPClient`
+talks to the provider's REST API directly with one pooled
+``httpx.AsyncClient`` per provider and event loop:
+
+- keep-alive connection reuse, bounded by ``max_connections`` and
+  ``max_keepalive_connections`` (each client targets a single host, so the
+  limits are per host)
+- requests beyond ``max_connections`` wait on a FIFO semaphore instead of
+  httpcore's pool queue, whose bookkeeping is O(connections x queued) per
+  state change and dominates CPU at high fan-out
+- HTTP/2 when the optional ``h2`` package is installed
+- separate connect/read/write/pool timeouts
+
+:func:`chat_completion` and :func:`chat_completion_stream` implement the
+OpenAI-compatible ``/chat/completions`` call on top of it.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+import orjson
+
+from penin.config import settings
+from penin.providers.pricing import estimate_cost, usage_value
+
+from .base import LLMResponse, StreamDelta
+from .streaming import openai_stream_deltas
+
+H2_AVAILABLE: bool
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+__all__ = [
+    "HTTPTransportConfig",
+    "ProviderHTTPClient",
+    "bearer",
+    "chat_completion",
+    "chat_completion_stream",
+]
+
+
+@dataclass
+class HTTPTransportConfig:
+    """Connection pool and timeout settings for one provider client."""
+
+    max_connections: int = 32
+    max_keepalive_connections: int = 32
+    keepalive_expiry_s: float = 30.0
+    connect_timeout_s: float = 5.0
+    read_timeout_s: float = 60.0
+    write_timeout_s: float = 10.0
+    pool_timeout_s: float = 30.0
+    http2: bool | None = None  # None: use HTTP/2 when h2 is installed
+
+    @classmethod
+    def from_settings(cls) -> HTTPTransportConfig:
+        return cls(
+            max_connections=settings.PENIN_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.PENIN_HTTP_MAX_KEEPALIVE,
+            connect_timeout_s=settings.PENIN_HTTP_CONNECT_TIMEOUT_S,
+            read_timeout_s=settings.PENIN_HTTP_READ_TIMEOUT_S,
+        )
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry_s,
+        )
+
+    def timeout(self) -> httpx.Timeout:
+        return httpx.Timeout(
+            connect=self.connect_timeout_s,
+            read=self.read_timeout_s,
+            write=self.write_timeout_s,
+            pool=self.pool_timeout_s,
+        )
+
+
+class ProviderHTTPClient:
+    """
+    Pooled JSON/SSE client for one provider endpoint.
+
+    ``httpx.AsyncClient`` connections belong to the event loop that opened
+    them, so one client is kept per running loop (dropped with the loop).
+    Call :meth:`aclose` from a loop to close that loop's pool.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict[str, str] | None = None,
+        config: HTTPTransportConfig | None = None,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self.base_url = base_url.rstrip("/")
+        self.headers = dict(headers or {})
+        self.config = config or HTTPTransportConfig.from_settings()
+        self._transport = transport
+        self._pools: weakref.WeakKeyDictionary[Any, tuple[httpx.AsyncClient, Any]] = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _pool(self) -> tuple[httpx.AsyncClient, Any]:
+        loop = asyncio.get_running_loop()
+        pool = self._pools.get(loop)
+        if pool is None or pool[0].is_closed:
+            http2 = H2_AVAILABLE if self.config.http2 is None else self.config.http2
+            client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=self.headers,
+                limits=self.config.limits(),
+                timeout=self.config.timeout(),
+                http2=http2 and H2_AVAILABLE,
+                transport=self._transport,
+            )
+            pool = (client, asyncio.Semaphore(self.config.max_connections))
+            self._pools[loop] = pool
+        return pool
+
+    def client(self) -> httpx.AsyncClient:
+        """The pooled client for the running event loop."""
+        return self._pool()[0]
+
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one of ``max_connections`` request slots (``pool_timeout_s`` to get one)."""
+        client, slots = self._pool()
+        try:
+            await asyncio.wait_for(slots.acquire(), self.config.pool_timeout_s)
+        except TimeoutError:
+            raise httpx.PoolTimeout(
+                f"No connection slot to {self.base_url} within {self.config.pool_timeout_s}s"
+            ) from None
+        try:
+            yield client
+        finally:
+            slots.release()
+
+    async def post_json(self, path: str, payload: dict[str, Any]) -> Any:
+        """POST ``payload`` and return the decoded JSON body (raises on HTTP errors)."""
+        async with self._slot() as client:
+            response = await client.post(
+                path, content=orjson.dumps(payload), headers={"content-type": "application/json"}
+            )
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def stream_sse(self, path: str, payload: dict[str, Any]) -> AsyncIterator[Any]:
+        """POST ``payload`` and yield each server-sent ``data:`` event as JSON."""
+        async with self._slot() as client, client.stream(
+            "POST",
+            path,
+            content=orjson.dumps(payload),
+            headers={"content-type": "application/json", "accept": "text/event-stream"},
+        ) as response:
+            if response.is_error:
+                await response.aread()
+                response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[5:].strip()
+                if data == "[DONE]":
+                    return
+                if data:
+                    yield orjson.loads(data)
+
+    async def aclose(self) -> None:
+        """Close the pool owned by the running event loop."""
+        pool = self._pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            await pool[0].aclose()
+
+
+def bearer(token: str | None) -> dict[str, str]:
+    """``Authorization`` header for ``token`` (none when unset)."""
+    return {"authorization": f"Bearer {token}"} if token else {}
+
+
+async def chat_completion(
+    provider: Any, http: ProviderHTTPClient, payload: dict[str, Any]
+) -> LLMResponse:
+    """Call an OpenAI-compatible ``/chat/completions`` endpoint."""
+    start = time.time()
+    data = await http.post_json("/chat/completions", payload)
+    choices = data.get("choices") or [{}]
+    message = choices[0].get("message") or {}
+    usage = data.get("usage")
+    tokens_in = usage_value(usage, "prompt_tokens")
+    tokens_out = usage_value(usage, "completion_tokens")
+    return LLMResponse(
+        content=message.get("content") or "",
+        model=provider.model,
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        tool_calls=message.get("tool_calls") or [],
+        cost_usd=estimate_cost(provider.name, provider.model, tokens_in, tokens_out),
+        provider=provider.name,
+        latency_s=time.time() - start,
+    )
+
+
+async def chat_completion_stream(
+    provider: Any, http: ProviderHTTPClient, payload: dict[str, Any]
+) -> AsyncIterator[StreamDelta]:
+    """Stream an OpenAI-compatible ``/chat/completions`` call (SSE)."""
+    stream_payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+    async for delta in openai_stream_deltas(
+        provider, http.stream_sse("/chat/completions", stream_payload)
+    ):
+        yield delta
@@ -10,13 +10,34 @@ from penin.config import settings
 from penin.providers.pricing import estimate_cost, usage_value
 
 from .base import BaseProvider, LLMResponse, Message, Tool
+from .http_transport import HTTPTransportConfig, ProviderHTTPClient, bearer, chat_completion
+
+BASE_URL = "https://api.mistral.ai/v1"
 
 
 class MistralProvider(BaseProvider):
-    def __init__(self, model: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        *,
+        native_http: bool | None = None,
+        base_url: str | None = None,
+        http_config: HTTPTransportConfig | None = None,
+    ):
         self.name = "mistral"
         self.model = model or settings.MISTRAL_MODEL
-        self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
+        native = settings.PENIN_NATIVE_HTTP if native_http is None else native_http
+        self.http: ProviderHTTPClient | None = None
+        self.client = None
+        if native:
+            # Mistral's chat API is OpenAI-compatible
+            self.http = ProviderHTTPClient(
+                base_url or BASE_URL,
+                headers=bearer(settings.MISTRAL_API_KEY),
+                config=http_config,
+            )
+        else:
+            self.client = Mistral(api_key=settings.MISTRAL_API_KEY)
 
     async def chat(
         self,
@@ -30,6 +51,8 @@ class MistralProvider(BaseProvider):
         if system:
             msgs.append({"role": "system", "content": system})
         msgs += messages
+        if self.http is not None:
+            return await chat_completion(self, self.http, {"model": self.model, "messages": msgs})
         resp = await asyncio.to_thread(
             self.client.chat.complete, model=self.model, messages=msgs
         )
@@ -1,5 +1,6 @@
 import asyncio
 import time
+from collections.abc import AsyncIterator
 from typing import Any
 
 try:
@@ -10,23 +11,56 @@ except Exception:  # pragma: no cover - allow import without dependency
 from penin.config import settings
 from penin.providers.pricing import estimate_cost, usage_value
 
-from .base import BaseProvider, LLMResponse, Message, Tool
+from .base import BaseProvider, LLMResponse, Message, StreamDelta, Tool
+from .http_transport import (
+    HTTPTransportConfig,
+    ProviderHTTPClient,
+    bearer,
+    chat_completion,
+    chat_completion_stream,
+)
+from .streaming import openai_compatible_stream
 
 
 class OpenAIProvider(BaseProvider):
-    def __init__(self, model: str | None = None):
+    def __init__(
+        self,
+        model: str | None = None,
+        *,
+        native_http: bool | None = None,
+        base_url: str | None = None,
+        http_config: HTTPTransportConfig | None = None,
+    ):
+        """
+        Args:
+            model: Model name (default: ``settings.OPENAI_MODEL``)
+            native_http: Call the REST API through the pooled async client
+                (default: ``settings.PENIN_NATIVE_HTTP``); False uses the
+                blocking SDK in a worker thread
+            base_url: API root (default: ``settings.OPENAI_BASE_URL``)
+            http_config: Connection pool and timeout settings
+        """
         self.name = "openai"
         self.model = model or settings.OPENAI_MODEL
-        self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        native = settings.PENIN_NATIVE_HTTP if native_http is None else native_http
+        self.http: ProviderHTTPClient | None = None
+        self.client = None
+        if native:
+            self.http = ProviderHTTPClient(
+                base_url or settings.OPENAI_BASE_URL,
+                headers=bearer(settings.OPENAI_API_KEY),
+                config=http_config,
+            )
+        else:
+            self.client = OpenAI(api_key=settings.OPENAI_API_KEY, base_url=base_url)
 
-    async def chat(
+    def _request_kwargs(
         self,
         messages: list[Message],
-        tools: list[Tool] | None = None,
-        system: str | None = None,
-        temperature: float = 0.7,
-    ) -> LLMResponse:
-        start = time.time()
+        tools: list[Tool] | None,
+        system: str | None,
+        temperature: float,
+    ) -> dict[str, Any]:
         msgs: list[Message] = []
         if system:
             msgs.append({"role": "system", "content": system})
@@ -39,7 +73,19 @@ class OpenAIProvider(BaseProvider):
         }
         if tools:
             kwargs["tools"] = tools
+        return kwargs
 
+    async def chat(
+        self,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        system: str | None = None,
+        temperature: float = 0.7,
+    ) -> LLMResponse:
+        kwargs = self._request_kwargs(messages, tools, system, temperature)
+        if self.http is not None:
+            return await chat_completion(self, self.http, kwargs)
+        start = time.time()
         resp = await asyncio.to_thread(self.client.chat.completions.create, **kwargs)
         choice = resp.choices[0]
         message = getattr(choice, "message", None)
@@ -71,3 +117,20 @@ class OpenAIProvider(BaseProvider):
             provider=self.name,
             latency_s=end - start,
         )
+
+    async def chat_stream(
+        self,
+        messages: list[Message],
+        tools: list[Tool] | None = None,
+        system: str | None = None,
+        temperature: float = 0.7,
+    ) -> AsyncIterator[StreamDelta]:
+        kwargs = self._request_kwargs(messages, tools, system, temperature)
+        if self.http is not None:
+            async for delta in chat_completion_stream(self, self.http, kwargs):
+                yield delta
+            return
+        async for delta in openai_compatible_stream(
+            self, self.client.chat.completions.create, kwargs
+        ):
+            yield delta
@@ -0,0 +1,152 @@
+"""Streaming helpers shared by provider adapters.
+
+Vendor SDKs used here are synchronous, so a streamed response is iterated
+in a worker thread and handed to the event loop chunk by chunk. The
+OpenAI-compatible helpers turn ``chat.completions`` chunks (SDK objects,
+or decoded SSE events from :mod:`penin.providers.http_transport`) into
+:class:`StreamDelta` objects with incremental cost estimates and a final
+delta carrying the assembled :class:`LLMResponse`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Callable, Iterable
+from typing import Any, TypeVar
+
+from penin.providers.pricing import estimate_cost, usage_value
+
+from .base import LLMResponse, StreamDelta
+
+__all__ = ["iterate_in_thread", "openai_compatible_stream", "openai_stream_deltas"]
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _Failure:
+    def __init__(self, exc: BaseException) -> None:
+        self.exc = exc
+
+
+async def iterate_in_thread(make_iter: Callable[[], Iterable[T]]) -> AsyncIterator[T]:
+    """Consume a blocking iterable in a worker thread, yielding items as they arrive."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue[Any] = asyncio.Queue()
+    stop = threading.Event()
+
+    def put(item: Any) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            # Event loop already closed: the consumer is gone
+            stop.set()
+
+    def pump() -> None:
+        try:
+            for item in make_iter():
+                if stop.is_set():
+                    return
+                put(item)
+            put(_DONE)
+        except BaseException as exc:  # re-raised in the consumer
+            put(_Failure(exc))
+
+    loop.run_in_executor(None, pump)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.exc
+            yield item
+    finally:
+        # Abandoned early (client disconnect, budget cutoff): stop pulling chunks
+        stop.set()
+
+
+def _merge_tool_call(calls: dict[int, dict[str, Any]], fragment: Any) -> None:
+    """Accumulate a streamed tool-call fragment (arguments arrive in pieces)."""
+    if hasattr(fragment, "model_dump"):
+        fragment = fragment.model_dump()
+    elif not isinstance(fragment, dict):
+        fragment = dict(vars(fragment))
+    call = calls.setdefault(
+        int(fragment.get("index") or 0),
+        {"id": None, "type": "function", "function": {"name": "", "arguments": ""}},
+    )
+    if fragment.get("id"):
+        call["id"] = fragment["id"]
+    function = fragment.get("function") or {}
+    if not isinstance(function, dict):
+        function = dict(vars(function))
+    call["function"]["name"] += function.get("name") or ""
+    call["function"]["arguments"] += function.get("arguments") or ""
+
+
+def _field(obj: Any, name: str) -> Any:
+    """Read ``name`` from an SDK object or a decoded JSON dict."""
+    if isinstance(obj, dict):
+        return obj.get(name)
+    return getattr(obj, name, None)
+
+
+async def openai_stream_deltas(
+    provider: Any, chunks: AsyncIterator[Any]
+) -> AsyncIterator[StreamDelta]:
+    """
+    Turn OpenAI-style completion chunks (SDK objects or JSON dicts) into deltas.
+
+    Each content chunk is counted as one completion token for the running
+    cost estimate; the final delta uses the usage block the API sends when
+    ``stream_options.include_usage`` is set (falling back to the chunk count).
+    """
+    start = time.time()
+    per_token = estimate_cost(provider.name, provider.model, 0, 1)
+    parts: list[str] = []
+    tool_calls: dict[int, dict[str, Any]] = {}
+    usage = None
+    streamed_tokens = 0
+
+    async for chunk in chunks:
+        usage = _field(chunk, "usage") or usage
+        for choice in _field(chunk, "choices") or []:
+            delta = _field(choice, "delta")
+            if delta is None:
+                continue
+            for fragment in _field(delta, "tool_calls") or []:
+                _merge_tool_call(tool_calls, fragment)
+            text = _field(delta, "content")
+            if text:
+                parts.append(text)
+                streamed_tokens += 1
+                yield StreamDelta(content=text, tokens_out=1, cost_usd=per_token)
+
+    tokens_in = usage_value(usage, "prompt_tokens")
+    tokens_out = usage_value(usage, "completion_tokens") or streamed_tokens
+    response = LLMResponse(
+        content="".join(parts),
+        model=provider.model,
+        tokens_in=tokens_in,
+        tokens_out=tokens_out,
+        tool_calls=[tool_calls[i] for i in sorted(tool_calls)],
+        cost_usd=estimate_cost(provider.name, provider.model, tokens_in, tokens_out),
+        provider=provider.name,
+        latency_s=time.time() - start,
+    )
+    yield StreamDelta(response=response)
+
+
+async def openai_compatible_stream(
+    provider: Any, create: Callable[..., Iterable[Any]], kwargs: dict[str, Any]
+) -> AsyncIterator[StreamDelta]:
+    """Stream an OpenAI-style chat completion through a synchronous SDK ``create``."""
+    stream_kwargs = {**kwargs, "stream": True, "stream_options": {"include_usage": True}}
+    async for delta in openai_stream_deltas(
+        provider, iterate_in_thread(lambda: create(**stream_kwargs))
+    ):
+        yield delta
@@ -19,6 +19,7 @@ Complies with:
 from __future__ import annotations
 
 import hashlib
+import importlib.util
 import math
 import re
 from collections import Counter, defaultdict
@@ -33,12 +34,17 @@ try:
 except ImportError:
     NUMPY_AVAILABLE = False
 
-try:
+# Probed without importing: sentence-transformers pulls in torch, which is
+# only paid for when an embedding model is actually built.
+SENTENCE_TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec("sentence_transformers") is not None
+)
+
+
+def _load_sentence_transformer(model_name: str):
     from sentence_transformers import SentenceTransformer
 
-    SENTENCE_TRANSFORMERS_AVAILABLE = True
-except ImportError:
-    SENTENCE_TRANSFORMERS_AVAILABLE = False
+    return SentenceTransformer(model_name)
 
 
 # ============================================================================
@@ -329,7 +335,7 @@ class EmbeddingRetriever:
         if not NUMPY_AVAILABLE:
             raise ImportError("numpy not available. " "Install with: pip install numpy")
 
-        self.model = SentenceTransformer(model_name)
+        self.model = _load_sentence_transformer(model_name)
         self.embeddings: np.ndarray | None = None
         self.doc_ids: list[str] = []
 
@@ -575,7 +581,7 @@ class Deduplicator:
         if not SENTENCE_TRANSFORMERS_AVAILABLE or not NUMPY_AVAILABLE:
             return self._deduplicate_hashes(chunks)
 
-        model = SentenceTransformer(DEFAULT_EMBEDDING_MODEL)
+        model = _load_sentence_transformer(DEFAULT_EMBEDDING_MODEL)
 
         # Encode all chunks
         contents = [chunk.content for chunk in chunks]
@@ -25,12 +25,13 @@ import hmac
 import json
 import time
 from collections import deque
-from collections.abc import Iterable
+from collections.abc import AsyncIterator, Iterable
+from contextlib import aclosing
 from dataclasses import dataclass, field
 from datetime import date, datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 ORJSON_AVAILABLE: bool
 try:
@@ -43,7 +44,12 @@ except ImportError:
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 from penin.config import settings
-from penin.providers.base import BaseProvider, LLMResponse
+from penin.observability.tracing import span, traced
+from penin.providers.base import BaseProvider, LLMResponse, StreamDelta
+
+if TYPE_CHECKING:
+    from penin.router_pkg.bandit import AdaptiveProviderSelector
+    from penin.router_pkg.shared_state import SharedRouterState
 
 # ============================================================================
 # Constants and Configuration
@@ -127,12 +133,22 @@ class BudgetTracker:
             self.request_count = 0
             self.last_reset = today
 
-    def add_usage(self, cost_usd: float, tokens: int) -> None:
-        """Record usage."""
+    def add_usage(self, cost_usd: float, tokens: int, requests: int = 1) -> None:
+        """Record usage (``requests=0`` for incremental charges of a streamed call)."""
         self._reset_if_needed()
         self.current_spend_usd += float(cost_usd)
         self.total_tokens += int(tokens)
-        self.request_count += 1
+        self.request_count += requests
+
+    def try_add_usage(self, cost_usd: float, tokens: int) -> bool:
+        """Record usage only if it keeps the spend within the hard cutoff."""
+        self._reset_if_needed()
+        limit = self.daily_budget_usd * BUDGET_HARD_CUTOFF
+        spend = self.current_spend_usd
+        if spend >= limit or spend + float(cost_usd) > limit:
+            return False
+        self.add_usage(cost_usd, tokens)
+        return True
 
     def remaining_budget(self) -> float:
         """Get remaining budget."""
@@ -151,8 +167,9 @@ class BudgetTracker:
         return self.usage_percent() >= BUDGET_SOFT_CUTOFF * 100.0
 
     def is_hard_cutoff(self) -> bool:
-        """Check if hard cutoff reached (100%)."""
-        return self.usage_percent() >= BUDGET_HARD_CUTOFF * 100.0
+        """Check if hard cutoff reached (100%); a zero budget is always cut off."""
+        self._reset_if_needed()
+        return self.current_spend_usd >= self.daily_budget_usd * BUDGET_HARD_CUTOFF
 
     def snapshot(self) -> dict[str, Any]:
         """Get current budget snapshot."""
@@ -552,8 +569,18 @@ class MultiLLMRouterComplete:
         enable_cache: bool = True,
         mode: RouterMode = RouterMode.PRODUCTION,
         state_path: Path | None = None,
+        shared_state: SharedRouterState | None = None,
+        selector: AdaptiveProviderSelector | None = None,
     ) -> None:
-        """Initialize router."""
+        """
+        Initialize router.
+
+        ``shared_state`` moves budget, provider stats and circuit breakers into
+        a region shared by every worker process opening the same state file.
+        ``selector`` switches ``ask`` from fan-out to routing each request to
+        one provider chosen by an online bandit (``penin.router_pkg.bandit``);
+        its posterior is persisted with the router state.
+        """
         # Providers
         provider_list = list(providers)
         max_parallel = max(
@@ -575,6 +602,8 @@ class MultiLLMRouterComplete:
         self.enable_circuit_breaker: bool = enable_circuit_breaker
         self.enable_cache: bool = enable_cache
         self.mode: RouterMode = mode
+        self._shared_state: SharedRouterState | None = shared_state
+        self.selector: AdaptiveProviderSelector | None = selector
 
         # State persistence
         self._state_path: Path = (
@@ -587,8 +616,10 @@ class MultiLLMRouterComplete:
             if daily_budget_usd is not None
             else settings.PENIN_BUDGET_DAILY_USD
         )
-        self._budget: BudgetTracker = BudgetTracker(
-            daily_budget_usd=float(daily_budget)
+        self._budget: BudgetTracker = (
+            shared_state.budget_tracker(float(daily_budget))  # type: ignore[assignment]
+            if shared_state is not None
+            else BudgetTracker(daily_budget_usd=float(daily_budget))
         )
         self._budget_lock: asyncio.Lock = asyncio.Lock()
 
@@ -604,6 +635,12 @@ class MultiLLMRouterComplete:
         # Cache
         self._cache: HMACCache | None = HMACCache() if enable_cache else None
 
+        # Analytics: per-provider latency/cost/token quantile sketches.
+        # Imported here: penin.router_pkg imports this module on package init.
+        from penin.router_pkg.analytics import AnalyticsTracker
+
+        self.analytics: AnalyticsTracker = AnalyticsTracker()
+
         # Persistence
         self._persistence_lock: asyncio.Lock = asyncio.Lock()
         self._load_state()
@@ -625,13 +662,21 @@ class MultiLLMRouterComplete:
             if not getattr(provider, "provider_id", None):
                 provider.provider_id = provider_id  # type: ignore[attr-defined]
 
-            # Initialize stats
-            self.provider_stats[provider_id] = ProviderStats(provider_id=provider_id)
+            # Initialize stats and circuit breaker (process-local or shared)
+            shared = self._shared_state
+            self.provider_stats[provider_id] = (
+                shared.provider_stats(provider_id)
+                if shared is not None
+                else ProviderStats(provider_id=provider_id)
+            )
             self._provider_locks[provider_id] = asyncio.Lock()
 
-            # Initialize circuit breaker
             if self.enable_circuit_breaker:
-                self.circuit_breakers[provider_id] = CircuitBreaker()
+                self.circuit_breakers[provider_id] = (
+                    shared.circuit_breaker(provider_id)  # type: ignore[assignment]
+                    if shared is not None
+                    else CircuitBreaker()
+                )
 
     def _load_state(self) -> None:
         """Load persisted state."""
@@ -646,9 +691,13 @@ class MultiLLMRouterComplete:
         except Exception:
             return
 
+        # Budget and provider stats: the shared region, when configured, is
+        # itself the persistent, authoritative copy
+        shared = self._shared_state is not None
+
         # Load budget
         budget = data.get("budget", {})
-        if budget:
+        if budget and not shared:
             self._budget.current_spend_usd = float(budget.get("daily_spend_usd", 0.0))
             self._budget.total_tokens = int(budget.get("total_tokens", 0))
             self._budget.request_count = int(budget.get("request_count", 0))
@@ -663,8 +712,22 @@ class MultiLLMRouterComplete:
             history = budget.get("history", [])
             self._budget.spend_history.extend(history)
 
+        # Load bandit posterior
+        if self.selector is not None and "bandit" in data:
+            try:
+                self.selector.load_dict(data["bandit"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
+        # Load analytics sketches
+        if "analytics" in data:
+            try:
+                self.analytics = type(self.analytics).from_dict(data["analytics"])
+            except (KeyError, TypeError, ValueError):
+                pass
+
         # Load provider stats
-        for pid, stats_data in data.get("providers", {}).items():
+        for pid, stats_data in ({} if shared else data.get("providers", {})).items():
             if pid in self.provider_stats:
                 stats = self.provider_stats[pid]
                 stats.total_requests = int(stats_data.get("total_requests", 0))
@@ -691,8 +754,12 @@ class MultiLLMRouterComplete:
             "providers": {
                 pid: stats.to_dict() for pid, stats in self.provider_stats.items()
             },
+            "analytics": self.analytics.to_dict(),
         }
 
+        if self.selector is not None:
+            payload["bandit"] = self.selector.to_dict()
+
         if self._cache:
             payload["cache"] = self._cache.stats()
 
@@ -766,15 +833,19 @@ class MultiLLMRouterComplete:
         # Call provider
         start = time.monotonic()
         try:
-            response = await provider.chat(
-                messages, tools=tools, system=system, temperature=temperature
-            )
+            with span("router.provider_call", provider=provider_id):
+                response = await provider.chat(
+                    messages, tools=tools, system=system, temperature=temperature
+                )
         except Exception as exc:
             # Record failure
             async with self._provider_locks[provider_id]:
                 self.provider_stats[provider_id].record_failure(exc)
                 if breaker:
                     breaker.record_failure()
+            self.analytics.record_request(
+                provider_id, (time.monotonic() - start) * 1000.0, success=False
+            )
             raise
 
         # Record success
@@ -789,9 +860,152 @@ class MultiLLMRouterComplete:
             stats.record_success(response, latency)
             if breaker:
                 breaker.record_success()
+        self._record_analytics(provider_id, response, latency)
 
         return response, provider_id
 
+    def _score_provider(self, stats: ProviderStats) -> float:
+        """
+        Score a provider before calling it (streaming picks one provider).
+
+        Same weights as ``_score_response``, using the provider's historical
+        averages in place of a response.
+        """
+        latency_score = 1.0 / (1.0 + (stats.avg_latency() or 1.0))
+        cost_score = 1.0 / (1.0 + stats.avg_cost_per_request() * 100)
+        return (
+            latency_score * self.latency_weight
+            + cost_score * self.cost_weight
+            + stats.success_rate() * self.quality_weight
+        )
+
+    def _check_budget(self, force_budget_override: bool) -> None:
+        """Raise if the hard cutoff is reached (fail-closed)."""
+        if not force_budget_override and self._budget.is_hard_cutoff():
+            raise RuntimeError(
+                f"Daily budget exceeded (hard cutoff): "
+                f"${self._budget.current_spend_usd:.2f} >= "
+                f"${self._budget.daily_budget_usd:.2f}"
+            )
+
+        # Warn on soft cutoff
+        if self._budget.is_soft_cutoff():
+            # Log warning (structured logging integration point)
+            pass
+
+    def _estimate_cost(self, providers: Iterable[BaseProvider], fan_out: bool) -> float:
+        """Expected cost of a call from the providers' average cost so far."""
+        costs = [
+            self.provider_stats[self._provider_id(p)].avg_cost_per_request() for p in providers
+        ]
+        if not costs:
+            return 0.0
+        return sum(costs) if fan_out else max(costs)
+
+    async def _reserve_budget(self, estimate: float, force_budget_override: bool) -> float:
+        """
+        Reserve ``estimate`` USD and count the request before dispatch.
+
+        The check-and-add is a single atomic step on the tracker, so
+        concurrent calls (tasks of this router or, with ``shared_state``,
+        other processes) cannot all pass the hard cutoff and overshoot it
+        together. Returns the reserved amount for :meth:`_settle_budget`.
+        """
+        async with self._budget_lock:
+            if force_budget_override:
+                self._budget.add_usage(estimate, 0)
+            elif not self._budget.try_add_usage(estimate, 0):
+                raise RuntimeError(
+                    f"Daily budget exceeded (hard cutoff): "
+                    f"${self._budget.current_spend_usd:.2f} + "
+                    f"${estimate:.2f} estimated > "
+                    f"${self._budget.daily_budget_usd:.2f}"
+                )
+            if self._budget.is_soft_cutoff():
+                # Log warning (structured logging integration point)
+                pass
+        return estimate
+
+    async def _settle_budget(
+        self, reserved: float, cost_usd: float, tokens: int, requests: int = 0
+    ) -> None:
+        """Replace a reservation with the actual usage (``requests=-1`` releases it)."""
+        async with self._budget_lock:
+            self._budget.add_usage(cost_usd - reserved, tokens, requests=requests)
+
+    async def _ask_selected(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        tools: list[dict[str, Any]] | None,
+        system: str | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> tuple[LLMResponse, str]:
+        """
+        Route to the provider picked by the selector.
+
+        Providers with an open circuit are not offered. A failed call is fed
+        back as reward 0 and the selector picks again among the rest.
+        """
+        from penin.router_pkg.bandit import BanditContext
+
+        selector = self.selector
+        if selector is None:
+            raise RuntimeError("Router configured without a provider selector")
+        by_id = {self._provider_id(p): p for p in self.providers}
+        if not by_id:
+            raise RuntimeError("Router configured without providers")
+        candidates = [
+            pid
+            for pid in by_id
+            if pid not in self.circuit_breakers
+            or self.circuit_breakers[pid].state != ProviderHealth.CIRCUIT_OPEN
+        ] or list(by_id)
+        budget = self._budget.snapshot()
+        context = BanditContext.from_messages(
+            messages,
+            max_tokens=max_tokens,
+            budget_remaining_usd=budget["budget_remaining_usd"],
+            daily_budget_usd=budget["daily_budget_usd"],
+        )
+
+        errors: list[str] = []
+        while candidates:
+            decision = selector.select(
+                candidates, context, daily_budget_usd=budget["daily_budget_usd"]
+            )
+            try:
+                response, provider_id = await self._invoke_provider(
+                    by_id[decision.provider],
+                    messages,
+                    tools=tools,
+                    system=system,
+                    temperature=temperature,
+                )
+            except Exception as exc:
+                selector.update(decision, quality=0.0, success=False)
+                errors.append(str(exc))
+                candidates.remove(decision.provider)
+                continue
+            selector.update_from_response(decision, response)
+            return response, provider_id
+
+        raise RuntimeError(f"All providers failed. Errors: {errors}")
+
+    def _record_analytics(
+        self, provider_id: str, response: LLMResponse, latency_s: float
+    ) -> None:
+        """Feed a successful call into the analytics sketches."""
+        _, tokens = self._aggregate_usage([response])
+        self.analytics.record_request(
+            provider_id,
+            latency_s * 1000.0,
+            success=True,
+            cost_usd=float(getattr(response, "cost_usd", 0.0) or 0.0),
+            tokens=tokens,
+        )
+
     def _aggregate_usage(self, responses: Iterable[LLMResponse]) -> tuple[float, int]:
         """Aggregate cost and tokens from responses."""
         total_cost = 0.0
@@ -805,7 +1019,8 @@ class MultiLLMRouterComplete:
 
         return total_cost, total_tokens
 
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=0.5))
+    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=0.5), reraise=True)
+    @traced("router.ask")
     async def ask(
         self,
         messages: list[dict[str, Any]],
@@ -814,10 +1029,14 @@ class MultiLLMRouterComplete:
         temperature: float = 0.7,
         force_budget_override: bool = False,
         use_cache: bool = True,
+        max_tokens: int | None = None,
     ) -> LLMResponse:
         """
         Main routing method.
 
+        Fans out to every provider and keeps the best-scoring response, or,
+        with a ``selector`` configured, routes to the single provider it picks.
+
         Args:
             messages: Chat messages
             system: System prompt
@@ -825,6 +1044,7 @@ class MultiLLMRouterComplete:
             temperature: Sampling temperature
             force_budget_override: Skip budget check
             use_cache: Use cache if enabled
+            max_tokens: Requested completion size (selector context feature)
 
         Returns:
             Best LLMResponse based on scoring
@@ -837,26 +1057,15 @@ class MultiLLMRouterComplete:
             cache_key = self._cache._make_key(
                 messages, system=system, tools=tools, temperature=temperature
             )
-            cached = self._cache.get(cache_key)
+            with span("router.cache_lookup") as trace:
+                cached = self._cache.get(cache_key)
+                trace.set(hit=cached is not None)
             if cached is not None:
                 return cached  # type: ignore[no-any-return]
 
-        # Check budget (hard cutoff)
-        async with self._budget_lock:
-            if not force_budget_override and self._budget.is_hard_cutoff():
-                raise RuntimeError(
-                    f"Daily budget exceeded (hard cutoff): "
-                    f"${self._budget.current_spend_usd:.2f} >= "
-                    f"${self._budget.daily_budget_usd:.2f}"
-                )
-
-            # Warn on soft cutoff
-            if self._budget.is_soft_cutoff():
-                # Log warning (structured logging integration point)
-                pass
-
         # Dry-run mode: return mock response
         if self.mode == RouterMode.DRY_RUN:
+            self._check_budget(force_budget_override)
             return LLMResponse(
                 content="[DRY RUN] Mock response",
                 provider="dry-run",
@@ -866,52 +1075,26 @@ class MultiLLMRouterComplete:
                 latency_s=0.0,
             )
 
-        # Invoke providers in parallel
-        tasks = [
-            self._invoke_provider(
-                provider, messages, tools=tools, system=system, temperature=temperature
-            )
-            for provider in self.providers
-        ]
-
-        if not tasks:
-            raise RuntimeError("Router configured without providers")
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Separate successes and failures
-        successful: list[tuple[LLMResponse, str]] = []
-        errors: list[str] = []
-
-        for result in results:
-            if isinstance(result, Exception):
-                errors.append(str(result))
-                continue
-            successful.append(result)  # type: ignore[arg-type]
-
-        if not successful:
-            raise RuntimeError(f"All providers failed. Errors: {errors}")
-
-        # Score and select best response
-        scored = [
-            (
-                response,
-                provider_id,
-                self._score_response(response, self.provider_stats[provider_id]),
-            )
-            for response, provider_id in successful
-        ]
-        best_response, best_provider_id, best_score = max(
-            scored, key=lambda item: item[2]
+        # Reserve the expected cost (hard cutoff) before dispatch
+        reserved = await self._reserve_budget(
+            self._estimate_cost(self.providers, fan_out=self.selector is None),
+            force_budget_override,
         )
-
-        # Update budget
-        async with self._budget_lock:
-            total_cost, total_tokens = self._aggregate_usage(
-                [resp for resp, _ in successful]
+        try:
+            best_response, best_provider_id, successful = await self._dispatch(
+                messages,
+                tools=tools,
+                system=system,
+                temperature=temperature,
+                max_tokens=max_tokens,
             )
-            if total_cost or total_tokens:
-                self._budget.add_usage(total_cost, total_tokens)
+        except BaseException:
+            await self._settle_budget(reserved, 0.0, 0, requests=-1)
+            raise
+
+        # Reconcile the reservation with the reported usage
+        total_cost, total_tokens = self._aggregate_usage([resp for resp, _ in successful])
+        await self._settle_budget(reserved, total_cost, total_tokens)
 
         # Cache result
         if use_cache and self._cache:
@@ -931,6 +1114,214 @@ class MultiLLMRouterComplete:
 
         return best_response
 
+    async def _dispatch(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        tools: list[dict[str, Any]] | None,
+        system: str | None,
+        temperature: float,
+        max_tokens: int | None,
+    ) -> tuple[LLMResponse, str, list[tuple[LLMResponse, str]]]:
+        """Run the providers for :meth:`ask`: best response, its provider, all successes."""
+        if self.selector is not None:
+            # Adaptive routing: one provider per request
+            best_response, best_provider_id = await self._ask_selected(
+                messages,
+                tools=tools,
+                system=system,
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            successful = [(best_response, best_provider_id)]
+        else:
+            # Invoke providers in parallel
+            tasks = [
+                self._invoke_provider(
+                    provider, messages, tools=tools, system=system, temperature=temperature
+                )
+                for provider in self.providers
+            ]
+
+            if not tasks:
+                raise RuntimeError("Router configured without providers")
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Separate successes and failures
+            successful: list[tuple[LLMResponse, str]] = []
+            errors: list[str] = []
+
+            for result in results:
+                if isinstance(result, Exception):
+                    errors.append(str(result))
+                    continue
+                successful.append(result)  # type: ignore[arg-type]
+
+            if not successful:
+                raise RuntimeError(f"All providers failed. Errors: {errors}")
+
+            # Score and select best response
+            scored = [
+                (
+                    response,
+                    provider_id,
+                    self._score_response(response, self.provider_stats[provider_id]),
+                )
+                for response, provider_id in successful
+            ]
+            best_response, best_provider_id, best_score = max(
+                scored, key=lambda item: item[2]
+            )
+
+        return best_response, best_provider_id, successful
+
+    async def ask_stream(
+        self,
+        messages: list[dict[str, Any]],
+        system: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        temperature: float = 0.7,
+        force_budget_override: bool = False,
+        use_cache: bool = True,
+    ) -> AsyncIterator[StreamDelta]:
+        """
+        Streaming variant of :meth:`ask`.
+
+        Streams from the single best-scoring provider whose circuit breaker
+        allows a call, falling back to the next one if a provider fails
+        before producing output. Each delta's estimated cost is charged to
+        the budget as it arrives, drawing down a reservation of the expected
+        cost taken up front (the stream is cut when the hard cutoff is hit),
+        and reconciled with the provider's reported usage at the end.
+        The last delta carries the assembled ``LLMResponse``, which is cached.
+
+        Raises:
+            RuntimeError: If budget exceeded or all providers fail
+        """
+        cache_key = ""
+        if use_cache and self._cache:
+            cache_key = self._cache._make_key(
+                messages, system=system, tools=tools, temperature=temperature
+            )
+            with span("router.cache_lookup") as trace:
+                cached = self._cache.get(cache_key)
+                trace.set(hit=cached is not None)
+            if cached is not None:
+                yield StreamDelta(content=cached.content or "", response=cached)
+                return
+
+        if self.mode == RouterMode.DRY_RUN:
+            self._check_budget(force_budget_override)
+            content = "[DRY RUN] Mock response"
+            yield StreamDelta(
+                content=content,
+                response=LLMResponse(content=content, provider="dry-run"),
+            )
+            return
+
+        if not self.providers:
+            raise RuntimeError("Router configured without providers")
+
+        candidates = sorted(
+            self.providers,
+            key=lambda p: -self._score_provider(self.provider_stats[self._provider_id(p)]),
+        )
+        errors: list[str] = []
+        reserved = await self._reserve_budget(
+            self._estimate_cost(self.providers, fan_out=False), force_budget_override
+        )
+
+        for provider in candidates:
+            provider_id = self._provider_id(provider)
+            breaker = self.circuit_breakers.get(provider_id)
+            if breaker and not breaker.can_call():
+                errors.append(f"Circuit breaker open for provider '{provider_id}'")
+                continue
+
+            start = time.monotonic()
+            charged_cost, charged_tokens, started = 0.0, 0, False
+            final: LLMResponse | None = None
+            try:
+                stream = provider.chat_stream(
+                    messages, tools=tools, system=system, temperature=temperature
+                )
+                async with aclosing(stream):  # type: ignore[type-var]
+                    async for delta in stream:
+                        if delta.response is not None:
+                            final = delta.response
+                            final_content = delta.content
+                            break
+                        async with self._budget_lock:
+                            # Deltas draw down the reservation, then the budget
+                            excess = max(0.0, charged_cost - reserved)
+                            charged_cost += delta.cost_usd
+                            charged_tokens += delta.tokens_out
+                            self._budget.add_usage(
+                                max(0.0, charged_cost - reserved) - excess,
+                                delta.tokens_out,
+                                requests=0,
+                            )
+                            over_budget = (
+                                not force_budget_override and self._budget.is_hard_cutoff()
+                            )
+                        started = True
+                        yield delta
+                        if over_budget:
+                            break
+            except Exception as exc:
+                async with self._provider_locks[provider_id]:
+                    self.provider_stats[provider_id].record_failure(exc)
+                    if breaker:
+                        breaker.record_failure()
+                self.analytics.record_request(
+                    provider_id, (time.monotonic() - start) * 1000.0, success=False
+                )
+                if started:
+                    # Partial output stays charged; the unused reservation is returned
+                    await self._settle_budget(max(charged_cost, reserved), charged_cost, 0)
+                    raise
+                errors.append(str(exc))
+                continue
+
+            if final is None:
+                # Cut by the hard cutoff; partial output stays charged
+                await self._settle_budget(max(charged_cost, reserved), charged_cost, 0)
+                raise RuntimeError(
+                    f"Daily budget exceeded mid-stream (hard cutoff): "
+                    f"${self._budget.current_spend_usd:.2f} >= "
+                    f"${self._budget.daily_budget_usd:.2f}"
+                )
+
+            latency = time.monotonic() - start
+            if getattr(final, "latency_s", 0) in (0, None):
+                final.latency_s = latency
+            final.provider = final.provider or provider_id
+
+            async with self._provider_locks[provider_id]:
+                self.provider_stats[provider_id].record_success(final, latency)
+                if breaker:
+                    breaker.record_success()
+            self._record_analytics(provider_id, final, latency)
+
+            # Reconcile the reservation and running charges with the reported usage
+            total_cost, total_tokens = self._aggregate_usage([final])
+            await self._settle_budget(
+                max(charged_cost, reserved), total_cost, total_tokens - charged_tokens
+            )
+
+            if cache_key and self._cache:
+                self._cache.put(cache_key, final)
+
+            if self._budget.request_count % 10 == 0:
+                await self._persist_state()
+
+            yield StreamDelta(content=final_content, response=final)
+            return
+
+        await self._settle_budget(reserved, 0.0, 0, requests=-1)
+        raise RuntimeError(f"All providers failed. Errors: {errors}")
+
     # ========================================================================
     # Public API
     # ========================================================================
@@ -964,6 +1355,14 @@ class MultiLLMRouterComplete:
     def get_analytics(self) -> dict[str, Any]:
         """Get full analytics."""
         stats = self.get_usage_stats()
+        stats["percentiles"] = {
+            pid: {
+                "latency_ms": self.analytics.get_percentiles(pid, "latency"),
+                "cost_usd": self.analytics.get_percentiles(pid, "cost"),
+                "tokens": self.analytics.get_percentiles(pid, "tokens"),
+            }
+            for pid in self.provider_stats
+        }
         stats["config"] = {
             "mode": self.mode.value,
             "cost_weight": self.cost_weight,
@@ -10,6 +10,7 @@ Components:
 - CircuitBreaker: Provider-level failure detection and isolation
 - MultiLLMRouter: Cost-optimized routing across providers
 - Analytics: Performance metrics and cost tracking
+- SharedRouterState: Budget/breaker state shared across worker processes
 """
 
 from __future__ import annotations
@@ -19,10 +20,12 @@ from penin.router import MultiLLMRouterComplete
 
 # Import new components
 from .budget_tracker import BudgetTracker, ProviderStats, RequestRecord
+from .shared_state import SharedRouterState
 
 __all__ = [
     "MultiLLMRouterComplete",
     "BudgetTracker",
     "ProviderStats",
     "RequestRecord",
+    "SharedRouterState",
 ]
@@ -6,19 +6,30 @@ Tracks performance metrics, success rates, and latency percentiles.
 
 Features:
 - Per-provider success rate tracking
-- Latency percentiles (p50, p90, p95, p99)
+- Latency, cost and token percentiles (p50, p90, p95, p99, p999) from
+  mergeable streaming sketches (see ``quantile_sketch``)
 - Request/error counters
 - Time-windowed statistics
+- Snapshot/merge across worker processes (``to_dict``/``from_dict``/``merge``)
 """
 
 from __future__ import annotations
 
-import statistics
 import time
 from collections import deque
 from dataclasses import dataclass, field
 from typing import Any
 
+from .quantile_sketch import RollingQuantileSketch
+
+PERCENTILES: dict[str, float] = {
+    "p50": 0.50,
+    "p90": 0.90,
+    "p95": 0.95,
+    "p99": 0.99,
+    "p999": 0.999,
+}
+
 
 @dataclass
 class RequestMetrics:
@@ -44,6 +55,9 @@ class ProviderAnalytics:
     total_cost_usd: float = 0.0
     total_tokens: int = 0
     latencies: deque[float] = field(default_factory=lambda: deque(maxlen=1000))
+    latency_sketch: RollingQuantileSketch = field(default_factory=RollingQuantileSketch)
+    cost_sketch: RollingQuantileSketch = field(default_factory=RollingQuantileSketch)
+    tokens_sketch: RollingQuantileSketch = field(default_factory=RollingQuantileSketch)
 
     @property
     def success_rate(self) -> float:
@@ -66,26 +80,77 @@ class ProviderAnalytics:
             return 0.0
         return self.total_cost_usd / self.requests_total
 
-    def get_latency_percentiles(self) -> dict[str, float]:
+    def get_percentiles(
+        self, metric: str = "latency", window_s: float | None = None
+    ) -> dict[str, float]:
         """
-        Calculate latency percentiles.
+        Percentiles of ``metric`` ("latency", "cost" or "tokens").
+
+        Args:
+            metric: Which distribution to query
+            window_s: Look-back in seconds (None = since start/last reset)
 
         Returns:
-            Dict of percentile_name -> latency_ms
+            Dict of percentile_name -> value
         """
-        if not self.latencies:
-            return {"p50": 0.0, "p90": 0.0, "p95": 0.0, "p99": 0.0}
+        sketch = getattr(self, f"{metric}_sketch")
+        values = sketch.quantiles(list(PERCENTILES.values()), window_s=window_s)
+        return dict(zip(PERCENTILES, values, strict=True))
 
-        sorted_latencies = sorted(self.latencies)
-        n = len(sorted_latencies)
+    def get_latency_percentiles(self, window_s: float | None = None) -> dict[str, float]:
+        """
+        Calculate latency percentiles (sketch-based, O(buckets) per call).
 
+        Returns:
+            Dict of percentile_name -> latency_ms
+        """
+        return self.get_percentiles("latency", window_s)
+
+    def merge(self, other: ProviderAnalytics) -> ProviderAnalytics:
+        """Merge counters and sketches of another worker/window; returns ``self``."""
+        self.requests_total += other.requests_total
+        self.successes += other.successes
+        self.failures += other.failures
+        self.total_latency_ms += other.total_latency_ms
+        self.total_cost_usd += other.total_cost_usd
+        self.total_tokens += other.total_tokens
+        self.latency_sketch.merge(other.latency_sketch)
+        self.cost_sketch.merge(other.cost_sketch)
+        self.tokens_sketch.merge(other.tokens_sketch)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable snapshot (counters and sketches, not raw latencies)."""
         return {
-            "p50": sorted_latencies[int(n * 0.50)] if n > 0 else 0.0,
-            "p90": sorted_latencies[int(n * 0.90)] if n > 1 else 0.0,
-            "p95": sorted_latencies[int(n * 0.95)] if n > 1 else 0.0,
-            "p99": sorted_latencies[int(n * 0.99)] if n > 1 else 0.0,
+            "provider": self.provider,
+            "requests_total": self.requests_total,
+            "successes": self.successes,
+            "failures": self.failures,
+            "total_latency_ms": self.total_latency_ms,
+            "total_cost_usd": self.total_cost_usd,
+            "total_tokens": self.total_tokens,
+            "latency_sketch": self.latency_sketch.to_dict(),
+            "cost_sketch": self.cost_sketch.to_dict(),
+            "tokens_sketch": self.tokens_sketch.to_dict(),
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], history_window: int = 1000) -> ProviderAnalytics:
+        """Rebuild from :meth:`to_dict` output."""
+        return cls(
+            provider=data["provider"],
+            requests_total=int(data.get("requests_total", 0)),
+            successes=int(data.get("successes", 0)),
+            failures=int(data.get("failures", 0)),
+            total_latency_ms=float(data.get("total_latency_ms", 0.0)),
+            total_cost_usd=float(data.get("total_cost_usd", 0.0)),
+            total_tokens=int(data.get("total_tokens", 0)),
+            latencies=deque(maxlen=history_window),
+            latency_sketch=RollingQuantileSketch.from_dict(data["latency_sketch"]),
+            cost_sketch=RollingQuantileSketch.from_dict(data["cost_sketch"]),
+            tokens_sketch=RollingQuantileSketch.from_dict(data["tokens_sketch"]),
+        )
+
 
 class AnalyticsTracker:
     """
@@ -94,14 +159,20 @@ class AnalyticsTracker:
     Collects performance metrics, success rates, and latency distributions.
     """
 
-    def __init__(self, history_window: int = 1000):
+    def __init__(
+        self, history_window: int = 1000, window_s: float = 60.0, max_windows: int = 60
+    ):
         """
         Initialize analytics tracker.
 
         Args:
-            history_window: Number of recent requests to track per provider
+            history_window: Number of recent raw latencies to keep per provider
+            window_s: Sketch interval length in seconds
+            max_windows: Sketch intervals kept for windowed percentiles
         """
         self.history_window = history_window
+        self.window_s = window_s
+        self.max_windows = max_windows
         self._providers: dict[str, ProviderAnalytics] = {}
         self._recent_requests: deque[RequestMetrics] = deque(maxlen=10000)
 
@@ -123,14 +194,8 @@ class AnalyticsTracker:
             cost_usd: Cost of request (USD)
             tokens: Tokens used
         """
-        # Get or create provider analytics
-        if provider not in self._providers:
-            self._providers[provider] = ProviderAnalytics(
-                provider=provider,
-                latencies=deque(maxlen=self.history_window),
-            )
-
-        analytics = self._providers[provider]
+        analytics = self._get_or_create(provider)
+        now = time.time()
 
         # Update counters
         analytics.requests_total += 1
@@ -144,8 +209,12 @@ class AnalyticsTracker:
         analytics.total_cost_usd += cost_usd
         analytics.total_tokens += tokens
 
-        # Add to latency history
+        # Add to latency history and sketches (cost/tokens per successful request)
         analytics.latencies.append(latency_ms)
+        analytics.latency_sketch.add(latency_ms, now)
+        if success:
+            analytics.cost_sketch.add(cost_usd, now)
+            analytics.tokens_sketch.add(tokens, now)
 
         # Store request
         self._recent_requests.append(
@@ -153,12 +222,24 @@ class AnalyticsTracker:
                 provider=provider,
                 latency_ms=latency_ms,
                 success=success,
-                timestamp=time.time(),
+                timestamp=now,
                 cost_usd=cost_usd,
                 tokens=tokens,
             )
         )
 
+    def _get_or_create(self, provider: str) -> ProviderAnalytics:
+        analytics = self._providers.get(provider)
+        if analytics is None:
+            analytics = self._providers[provider] = ProviderAnalytics(
+                provider=provider,
+                latencies=deque(maxlen=self.history_window),
+                latency_sketch=RollingQuantileSketch(self.window_s, self.max_windows),
+                cost_sketch=RollingQuantileSketch(self.window_s, self.max_windows),
+                tokens_sketch=RollingQuantileSketch(self.window_s, self.max_windows),
+            )
+        return analytics
+
     def get_provider_analytics(self, provider: str) -> ProviderAnalytics | None:
         """
         Get analytics for a specific provider.
@@ -193,18 +274,66 @@ class AnalyticsTracker:
         analytics = self._providers.get(provider)
         return analytics.success_rate if analytics else 0.0
 
-    def get_latency_percentiles(self, provider: str) -> dict[str, float]:
+    def get_latency_percentiles(
+        self, provider: str, window_s: float | None = None
+    ) -> dict[str, float]:
         """
         Get latency percentiles for provider.
 
         Args:
             provider: Provider name
+            window_s: Look-back in seconds (None = all time)
 
         Returns:
             Dict of percentile -> latency_ms
         """
         analytics = self._providers.get(provider)
-        return analytics.get_latency_percentiles() if analytics else {}
+        return analytics.get_latency_percentiles(window_s) if analytics else {}
+
+    def get_percentiles(
+        self, provider: str, metric: str = "latency", window_s: float | None = None
+    ) -> dict[str, float]:
+        """
+        Get percentiles of "latency", "cost" or "tokens" for provider.
+
+        Args:
+            provider: Provider name
+            metric: Distribution to query
+            window_s: Look-back in seconds (None = all time)
+
+        Returns:
+            Dict of percentile -> value
+        """
+        analytics = self._providers.get(provider)
+        return analytics.get_percentiles(metric, window_s) if analytics else {}
+
+    def merge(self, other: AnalyticsTracker) -> AnalyticsTracker:
+        """Merge another tracker (e.g. another worker's snapshot); returns ``self``."""
+        for provider, analytics in other._providers.items():
+            self._get_or_create(provider).merge(analytics)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serializable snapshot of all providers."""
+        return {
+            "window_s": self.window_s,
+            "max_windows": self.max_windows,
+            "providers": {p: a.to_dict() for p, a in self._providers.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], history_window: int = 1000) -> AnalyticsTracker:
+        """Rebuild a tracker from :meth:`to_dict` output."""
+        tracker = cls(
+            history_window=history_window,
+            window_s=data.get("window_s", 60.0),
+            max_windows=data.get("max_windows", 60),
+        )
+        for provider, analytics in data.get("providers", {}).items():
+            tracker._providers[provider] = ProviderAnalytics.from_dict(
+                analytics, history_window
+            )
+        return tracker
 
     def export_metrics(self) -> dict[str, Any]:
         """
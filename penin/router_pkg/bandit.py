@@ -0,0 +1,411 @@
+"""
+Adaptive (Bandit) Provider Selection
+====================================
+
+Learns which provider to route a single request to from observed outcomes,
+instead of fanning out to every provider or using a fixed
+``CostOptimizer`` strategy.
+
+Policies:
+- ThompsonSamplingPolicy: Beta posterior per provider over a [0, 1] reward
+  (context-free; fast to adapt when one provider is simply better)
+- LinUCBPolicy: disjoint linear UCB over request context (prompt length,
+  requested max_tokens, time of day, budget remaining), for when the best
+  provider depends on the request
+
+Reward is a configurable blend of quality, cost and latency in [0, 1]
+(failures score 0). Exploration is capped by budget: below a remaining
+budget floor, or once exploratory picks have spent a fraction of the daily
+budget, the selector only exploits.
+
+Usage:
+    selector = AdaptiveProviderSelector(LinUCBPolicy(alpha=0.5))
+    router = MultiLLMRouterComplete(providers, selector=selector)
+
+    # or directly
+    ctx = BanditContext.from_messages(messages, max_tokens=512,
+                                      budget_remaining_usd=4.2, daily_budget_usd=5.0)
+    decision = selector.select(["openai", "deepseek"], ctx)
+    ...
+    selector.update(decision, quality=1.0, cost_usd=0.002, latency_s=0.8)
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+# ============================================================================
+# Context and Reward
+# ============================================================================
+
+
+@dataclass
+class BanditContext:
+    """Request features used by contextual policies."""
+
+    prompt_tokens: int = 0
+    max_tokens: int = 0
+    hour_of_day: float = 0.0
+    budget_remaining_frac: float = 1.0
+
+    N_FEATURES = 6
+
+    @classmethod
+    def from_messages(
+        cls,
+        messages: Sequence[dict[str, Any]],
+        max_tokens: int | None = None,
+        budget_remaining_usd: float | None = None,
+        daily_budget_usd: float | None = None,
+        now: datetime | None = None,
+    ) -> BanditContext:
+        """Build context from chat messages (~4 characters per token)."""
+        chars = sum(len(str(m.get("content", ""))) for m in messages)
+        now = now or datetime.now()
+        frac = 1.0
+        if budget_remaining_usd is not None and daily_budget_usd:
+            frac = max(0.0, min(1.0, budget_remaining_usd / daily_budget_usd))
+        return cls(
+            prompt_tokens=chars // 4,
+            max_tokens=int(max_tokens or 0),
+            hour_of_day=now.hour + now.minute / 60.0,
+            budget_remaining_frac=frac,
+        )
+
+    def features(self) -> np.ndarray:
+        """Bias, log sizes (scaled to ~[0, 1]), cyclic hour and budget fraction."""
+        angle = 2.0 * math.pi * self.hour_of_day / 24.0
+        return np.array(
+            [
+                1.0,
+                math.log1p(self.prompt_tokens) / 10.0,
+                math.log1p(self.max_tokens) / 10.0,
+                math.sin(angle),
+                math.cos(angle),
+                self.budget_remaining_frac,
+            ]
+        )
+
+
+@dataclass
+class RewardWeights:
+    """
+    Blend of quality, cost and latency into a reward in [0, 1].
+
+    Cost and latency map to ``1 / (1 + x / scale)``: a call costing
+    ``cost_scale_usd`` (or taking ``latency_scale_s``) scores 0.5 on that axis.
+    """
+
+    quality: float = 0.6
+    cost: float = 0.25
+    latency: float = 0.15
+    cost_scale_usd: float = 0.01
+    latency_scale_s: float = 2.0
+
+    def reward(self, quality: float, cost_usd: float, latency_s: float) -> float:
+        total = self.quality + self.cost + self.latency
+        if total <= 0:
+            return 0.0
+        value = (
+            self.quality * max(0.0, min(1.0, quality))
+            + self.cost / (1.0 + max(0.0, cost_usd) / self.cost_scale_usd)
+            + self.latency / (1.0 + max(0.0, latency_s) / self.latency_scale_s)
+        )
+        return value / total
+
+
+# ============================================================================
+# Policies
+# ============================================================================
+
+
+class ThompsonSamplingPolicy:
+    """
+    Beta-Bernoulli Thompson sampling with fractional rewards.
+
+    Each provider keeps ``Beta(alpha, beta)``; a reward ``r`` adds ``r`` to
+    alpha and ``1 - r`` to beta. Context is ignored.
+    """
+
+    name = "thompson"
+
+    def __init__(self, prior_alpha: float = 1.0, prior_beta: float = 1.0) -> None:
+        self.prior_alpha = prior_alpha
+        self.prior_beta = prior_beta
+        self.arms: dict[str, list[float]] = {}
+
+    def _arm(self, arm: str) -> list[float]:
+        if arm not in self.arms:
+            self.arms[arm] = [self.prior_alpha, self.prior_beta]
+        return self.arms[arm]
+
+    def scores(
+        self, arms: Sequence[str], x: np.ndarray, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(exploration scores, greedy scores) for ``arms``."""
+        params = np.array([self._arm(a) for a in arms])
+        sampled = rng.beta(params[:, 0], params[:, 1])
+        return sampled, params[:, 0] / params.sum(axis=1)
+
+    def update(self, arm: str, x: np.ndarray, reward: float) -> None:
+        params = self._arm(arm)
+        params[0] += reward
+        params[1] += 1.0 - reward
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "policy": self.name,
+            "prior_alpha": self.prior_alpha,
+            "prior_beta": self.prior_beta,
+            "arms": self.arms,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ThompsonSamplingPolicy:
+        policy = cls(data["prior_alpha"], data["prior_beta"])
+        policy.arms = {a: [float(v) for v in p] for a, p in data["arms"].items()}
+        return policy
+
+
+class LinUCBPolicy:
+    """
+    Disjoint LinUCB (Li et al., 2010).
+
+    Per provider: ``A = ridge * I + sum x x^T``, ``b = sum r x``; the score is
+    ``theta . x + alpha * sqrt(x^T A^-1 x)`` with ``theta = A^-1 b``.
+    ``A^-1`` is kept up to date with Sherman-Morrison (O(d^2) per update).
+    """
+
+    name = "linucb"
+
+    def __init__(
+        self, alpha: float = 1.0, ridge: float = 1.0, n_features: int = BanditContext.N_FEATURES
+    ) -> None:
+        self.alpha = alpha
+        self.ridge = ridge
+        self.n_features = n_features
+        self.arms: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+    def _arm(self, arm: str) -> tuple[np.ndarray, np.ndarray]:
+        if arm not in self.arms:
+            self.arms[arm] = (np.eye(self.n_features) / self.ridge, np.zeros(self.n_features))
+        return self.arms[arm]
+
+    def scores(
+        self, arms: Sequence[str], x: np.ndarray, rng: np.random.Generator
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """(UCB scores, greedy scores) for ``arms``."""
+        ucb = np.empty(len(arms))
+        greedy = np.empty(len(arms))
+        for i, arm in enumerate(arms):
+            A_inv, b = self._arm(arm)
+            A_inv_x = A_inv @ x
+            greedy[i] = (A_inv @ b) @ x
+            ucb[i] = greedy[i] + self.alpha * math.sqrt(max(0.0, x @ A_inv_x))
+        # Random tie-break among never-updated arms
+        return ucb + rng.uniform(0.0, 1e-9, len(arms)), greedy
+
+    def update(self, arm: str, x: np.ndarray, reward: float) -> None:
+        A_inv, b = self._arm(arm)
+        A_inv_x = A_inv @ x
+        A_inv -= np.outer(A_inv_x, A_inv_x) / (1.0 + x @ A_inv_x)
+        b += reward * x
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "policy": self.name,
+            "alpha": self.alpha,
+            "ridge": self.ridge,
+            "n_features": self.n_features,
+            "arms": {a: [A_inv.tolist(), b.tolist()] for a, (A_inv, b) in self.arms.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> LinUCBPolicy:
+        policy = cls(data["alpha"], data["ridge"], data["n_features"])
+        policy.arms = {
+            a: (np.array(A_inv, dtype=float), np.array(b, dtype=float))
+            for a, (A_inv, b) in data["arms"].items()
+        }
+        return policy
+
+
+POLICIES: dict[str, type[ThompsonSamplingPolicy] | type[LinUCBPolicy]] = {
+    ThompsonSamplingPolicy.name: ThompsonSamplingPolicy,
+    LinUCBPolicy.name: LinUCBPolicy,
+}
+
+
+# ============================================================================
+# Selector
+# ============================================================================
+
+
+@dataclass
+class BanditDecision:
+    """A routing choice, handed back to :meth:`AdaptiveProviderSelector.update`."""
+
+    provider: str
+    context: BanditContext
+    exploratory: bool
+    features: np.ndarray = field(repr=False, default_factory=lambda: np.zeros(0))
+
+
+def default_quality(response: Any) -> float:
+    """1.0 for a non-empty answer (or tool calls), else 0.0."""
+    if getattr(response, "content", None) or getattr(response, "tool_calls", None):
+        return 1.0
+    return 0.0
+
+
+class AdaptiveProviderSelector:
+    """
+    Online provider selection with budget-tied exploration caps.
+
+    Args:
+        policy: ThompsonSamplingPolicy or LinUCBPolicy
+        reward_weights: Quality/cost/latency blend
+        quality_fn: Maps an ``LLMResponse`` to quality in [0, 1]
+        explore_budget_floor: Below this remaining-budget fraction, only exploit
+        max_explore_fraction: Exploratory picks may spend at most this
+            fraction of the daily budget (per day of selector use)
+        seed: RNG seed (sampling and tie-breaks)
+    """
+
+    def __init__(
+        self,
+        policy: ThompsonSamplingPolicy | LinUCBPolicy | None = None,
+        reward_weights: RewardWeights | None = None,
+        quality_fn: Callable[[Any], float] = default_quality,
+        explore_budget_floor: float = 0.2,
+        max_explore_fraction: float = 0.1,
+        seed: int | None = None,
+    ) -> None:
+        self.policy = policy or LinUCBPolicy()
+        self.reward_weights = reward_weights or RewardWeights()
+        self.quality_fn = quality_fn
+        self.explore_budget_floor = explore_budget_floor
+        self.max_explore_fraction = max_explore_fraction
+        self.rng = np.random.default_rng(seed)
+        self.explore_spend_usd = 0.0
+        self.explore_day = datetime.now().date().toordinal()
+        self.n_updates = 0
+        self.n_exploratory = 0
+
+    def _may_explore(self, context: BanditContext, daily_budget_usd: float | None) -> bool:
+        today = datetime.now().date().toordinal()
+        if today != self.explore_day:
+            self.explore_day = today
+            self.explore_spend_usd = 0.0
+        if context.budget_remaining_frac < self.explore_budget_floor:
+            return False
+        if daily_budget_usd:
+            return self.explore_spend_usd < self.max_explore_fraction * daily_budget_usd
+        return True
+
+    def select(
+        self,
+        providers: Sequence[str],
+        context: BanditContext,
+        daily_budget_usd: float | None = None,
+    ) -> BanditDecision:
+        """Pick one provider for this request."""
+        if not providers:
+            raise ValueError("No providers to select from")
+        x = context.features()
+        explore_scores, greedy_scores = self.policy.scores(providers, x, self.rng)
+        greedy = int(np.argmax(greedy_scores))
+        chosen = int(np.argmax(explore_scores)) if self._may_explore(context, daily_budget_usd) else greedy
+        return BanditDecision(
+            provider=providers[chosen],
+            context=context,
+            exploratory=chosen != greedy,
+            features=x,
+        )
+
+    def update(
+        self,
+        decision: BanditDecision,
+        quality: float,
+        cost_usd: float = 0.0,
+        latency_s: float = 0.0,
+        success: bool = True,
+    ) -> float:
+        """Feed back the outcome of ``decision``; returns the reward used."""
+        reward = (
+            self.reward_weights.reward(quality, cost_usd, latency_s) if success else 0.0
+        )
+        self.policy.update(decision.provider, decision.features, reward)
+        self.n_updates += 1
+        if decision.exploratory:
+            self.n_exploratory += 1
+            self.explore_spend_usd += max(0.0, cost_usd)
+        return reward
+
+    def update_from_response(
+        self, decision: BanditDecision, response: Any, latency_s: float | None = None
+    ) -> float:
+        """Update using an ``LLMResponse`` (quality via ``quality_fn``)."""
+        latency = latency_s if latency_s is not None else getattr(response, "latency_s", 0.0)
+        return self.update(
+            decision,
+            quality=self.quality_fn(response),
+            cost_usd=float(getattr(response, "cost_usd", 0.0) or 0.0),
+            latency_s=float(latency or 0.0),
+        )
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "policy": self.policy.to_dict(),
+            "reward_weights": asdict(self.reward_weights),
+            "explore_budget_floor": self.explore_budget_floor,
+            "max_explore_fraction": self.max_explore_fraction,
+            "explore_spend_usd": self.explore_spend_usd,
+            "explore_day": self.explore_day,
+            "n_updates": self.n_updates,
+            "n_exploratory": self.n_exploratory,
+        }
+
+    def load_dict(self, data: dict[str, Any]) -> None:
+        """Restore posterior state and counters (``quality_fn`` is kept)."""
+        policy = data["policy"]
+        self.policy = POLICIES[policy["policy"]].from_dict(policy)
+        self.reward_weights = RewardWeights(**data.get("reward_weights", {}))
+        self.explore_budget_floor = data.get("explore_budget_floor", self.explore_budget_floor)
+        self.max_explore_fraction = data.get("max_explore_fraction", self.max_explore_fraction)
+        self.explore_spend_usd = float(data.get("explore_spend_usd", 0.0))
+        self.explore_day = int(data.get("explore_day", self.explore_day))
+        self.n_updates = int(data.get("n_updates", 0))
+        self.n_exploratory = int(data.get("n_exploratory", 0))
+
+    def save(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict()))
+
+    @classmethod
+    def load(cls, path: str | Path, **kwargs: Any) -> AdaptiveProviderSelector:
+        selector = cls(**kwargs)
+        selector.load_dict(json.loads(Path(path).read_text()))
+        return selector
+
+
+__all__ = [
+    "AdaptiveProviderSelector",
+    "BanditContext",
+    "BanditDecision",
+    "LinUCBPolicy",
+    "RewardWeights",
+    "ThompsonSamplingPolicy",
+    "default_quality",
+]
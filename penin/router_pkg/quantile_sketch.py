@@ -0,0 +1,311 @@
+"""
+Streaming Quantile Sketches
+===========================
+
+Log-bucketed histogram (DDSketch-style) for router latency, cost and token
+distributions.
+
+- O(1) inserts: one ``log`` and one dict increment
+- Relative-error guarantee: every quantile is within ``relative_accuracy``
+  of a true sample value (1% by default), at any scale
+- Exact merges: bucket counts add, so sketches from different time windows
+  or worker processes combine without loss
+- Compact JSON form (``to_dict``/``from_dict``) for state snapshots
+
+Values ``<= min_value`` (including 0 and negatives) share one zero bucket.
+
+Usage:
+    sketch = QuantileSketch()
+    for latency_ms in samples:
+        sketch.add(latency_ms)
+    sketch.quantiles([0.5, 0.99])
+
+    rolling = RollingQuantileSketch(window_s=60, max_windows=60)
+    rolling.add(latency_ms)
+    rolling.quantiles([0.99], window_s=300)  # last 5 minutes
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections import deque
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+DEFAULT_RELATIVE_ACCURACY = 0.01
+DEFAULT_MAX_BINS = 2048
+DEFAULT_MIN_VALUE = 1e-9
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch with bounded relative error.
+
+    Bucket ``k`` covers ``(gamma^(k-1), gamma^k]`` with
+    ``gamma = (1 + a) / (1 - a)``; its representative value
+    ``2 gamma^k / (gamma + 1)`` is within ``a`` of anything in the bucket.
+    When more than ``max_bins`` buckets are in use the lowest ones are
+    collapsed, trading accuracy in the far low tail (rarely of interest for
+    latency/cost) for bounded memory.
+    """
+
+    __slots__ = (
+        "relative_accuracy",
+        "max_bins",
+        "min_value",
+        "_gamma",
+        "_inv_log_gamma",
+        "_bins",
+        "_zero",
+        "_sorted_keys",
+        "count",
+        "sum",
+        "min",
+        "max",
+    )
+
+    def __init__(
+        self,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+        max_bins: int = DEFAULT_MAX_BINS,
+        min_value: float = DEFAULT_MIN_VALUE,
+    ) -> None:
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError("relative_accuracy must be in (0, 1)")
+        if max_bins < 1:
+            raise ValueError("max_bins must be positive")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self.min_value = min_value
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._inv_log_gamma = 1.0 / math.log(self._gamma)
+        self._bins: dict[int, int] = {}
+        self._zero = 0
+        self._sorted_keys: list[int] | None = []
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Insert ``value`` (``count`` times)."""
+        if value > self.min_value:
+            key = math.ceil(math.log(value) * self._inv_log_gamma)
+            bins = self._bins
+            if key in bins:
+                bins[key] += count
+            else:
+                bins[key] = count
+                self._sorted_keys = None
+                if len(bins) > self.max_bins:
+                    self._collapse()
+        else:
+            self._zero += count
+        self.count += count
+        self.sum += value * count
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def extend(self, values: Iterable[float]) -> None:
+        """Insert many values."""
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: QuantileSketch) -> QuantileSketch:
+        """Add ``other``'s counts into this sketch (in place); returns ``self``."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative_accuracy")
+        bins = self._bins
+        for key, n in other._bins.items():
+            bins[key] = bins.get(key, 0) + n
+        self._sorted_keys = None
+        if len(bins) > self.max_bins:
+            self._collapse()
+        self._zero += other._zero
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        return self
+
+    def _collapse(self) -> None:
+        """Fold the lowest buckets into one so at most ``max_bins`` remain."""
+        keys = sorted(self._bins)
+        excess = len(keys) - self.max_bins
+        target = keys[excess]
+        folded = sum(self._bins.pop(k) for k in keys[:excess])
+        self._bins[target] += folded
+        self._sorted_keys = None
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def quantiles(self, qs: Sequence[float]) -> list[float]:
+        """Estimate several quantiles (``0 <= q <= 1``) in one pass."""
+        if self.count == 0:
+            return [0.0] * len(qs)
+        if self._sorted_keys is None:
+            self._sorted_keys = sorted(self._bins)
+        keys = self._sorted_keys
+        bins = self._bins
+
+        order = sorted(range(len(qs)), key=qs.__getitem__)
+        results = [0.0] * len(qs)
+        cumulative = self._zero
+        i = 0
+        for j in order:
+            q = qs[j]
+            if not 0.0 <= q <= 1.0:
+                raise ValueError(f"Quantile must be in [0, 1], got {q}")
+            rank = q * (self.count - 1)
+            if rank < cumulative:
+                # Zero bucket
+                results[j] = max(self.min, min(self.max, 0.0))
+                continue
+            while i < len(keys) and cumulative + bins[keys[i]] <= rank:
+                cumulative += bins[keys[i]]
+                i += 1
+            key = keys[min(i, len(keys) - 1)]
+            value = 2.0 * self._gamma**key / (self._gamma + 1.0)
+            results[j] = max(self.min, min(self.max, value))
+        return results
+
+    def quantile(self, q: float) -> float:
+        """Estimate a single quantile."""
+        return self.quantiles([q])[0]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def __len__(self) -> int:
+        return self.count
+
+    # ------------------------------------------------------------------
+    # Serialization
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-friendly snapshot."""
+        keys = sorted(self._bins)
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "max_bins": self.max_bins,
+            "min_value": self.min_value,
+            "keys": keys,
+            "counts": [self._bins[k] for k in keys],
+            "zero": self._zero,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> QuantileSketch:
+        """Rebuild a sketch from :meth:`to_dict` output."""
+        sketch = cls(
+            relative_accuracy=data.get("relative_accuracy", DEFAULT_RELATIVE_ACCURACY),
+            max_bins=data.get("max_bins", DEFAULT_MAX_BINS),
+            min_value=data.get("min_value", DEFAULT_MIN_VALUE),
+        )
+        sketch._bins = {int(k): int(n) for k, n in zip(data["keys"], data["counts"], strict=True)}
+        sketch._sorted_keys = None
+        sketch._zero = int(data.get("zero", 0))
+        sketch.count = int(data.get("count", 0))
+        sketch.sum = float(data.get("sum", 0.0))
+        if sketch.count:
+            sketch.min = float(data["min"])
+            sketch.max = float(data["max"])
+        return sketch
+
+    def copy(self) -> QuantileSketch:
+        return QuantileSketch.from_dict(self.to_dict())
+
+
+class RollingQuantileSketch:
+    """
+    All-time sketch plus one sketch per ``window_s`` interval.
+
+    Inserts update the total and the current interval; queries either use the
+    total or merge the intervals overlapping the requested look-back. Only
+    the newest ``max_windows`` intervals are kept.
+    """
+
+    def __init__(
+        self,
+        window_s: float = 60.0,
+        max_windows: int = 60,
+        relative_accuracy: float = DEFAULT_RELATIVE_ACCURACY,
+    ) -> None:
+        self.window_s = window_s
+        self.max_windows = max_windows
+        self.relative_accuracy = relative_accuracy
+        self.total = QuantileSketch(relative_accuracy)
+        self._windows: deque[tuple[float, QuantileSketch]] = deque(maxlen=max_windows)
+
+    def add(self, value: float, now: float | None = None) -> None:
+        """Insert ``value`` at time ``now`` (default: wall clock)."""
+        now = time.time() if now is None else now
+        start = now - (now % self.window_s)
+        if not self._windows or self._windows[-1][0] != start:
+            self._windows.append((start, QuantileSketch(self.relative_accuracy)))
+        self._windows[-1][1].add(value)
+        self.total.add(value)
+
+    def sketch(self, window_s: float | None = None, now: float | None = None) -> QuantileSketch:
+        """Sketch over the last ``window_s`` seconds (None: all time)."""
+        if window_s is None:
+            return self.total
+        now = time.time() if now is None else now
+        merged = QuantileSketch(self.relative_accuracy)
+        for start, window in self._windows:
+            if start + self.window_s > now - window_s:
+                merged.merge(window)
+        return merged
+
+    def quantiles(
+        self, qs: Sequence[float], window_s: float | None = None, now: float | None = None
+    ) -> list[float]:
+        return self.sketch(window_s, now).quantiles(qs)
+
+    def merge(self, other: RollingQuantileSketch) -> RollingQuantileSketch:
+        """Merge another rolling sketch (e.g. from another worker); returns ``self``."""
+        self.total.merge(other.total)
+        windows = {start: sketch for start, sketch in self._windows}
+        for start, sketch in other._windows:
+            if start in windows:
+                windows[start].merge(sketch)
+            else:
+                windows[start] = sketch.copy()
+        self._windows = deque(sorted(windows.items()), maxlen=self.max_windows)
+        return self
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "window_s": self.window_s,
+            "max_windows": self.max_windows,
+            "total": self.total.to_dict(),
+            "windows": [[start, sketch.to_dict()] for start, sketch in self._windows],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RollingQuantileSketch:
+        total = QuantileSketch.from_dict(data["total"])
+        rolling = cls(data["window_s"], data["max_windows"], total.relative_accuracy)
+        rolling.total = total
+        rolling._windows.extend(
+            (float(start), QuantileSketch.from_dict(sketch)) for start, sketch in data["windows"]
+        )
+        return rolling
+
+
+__all__ = ["QuantileSketch", "RollingQuantileSketch"]
@@ -0,0 +1,567 @@
+"""
+Cross-Process Router State
+==========================
+
+Shares budget spend, token counts, provider statistics and circuit-breaker
+state between router worker processes (e.g. several uvicorn workers), so the
+daily budget and breaker trips are global instead of per process.
+
+State lives in a small fixed-layout binary region:
+
+- ``mmap`` backend (default on POSIX): a memory-mapped file guarded by an
+  ``fcntl`` record lock plus a thread lock. Every operation is a single
+  lock/unpack/pack/unlock round trip, a few microseconds.
+- ``sqlite`` backend (fallback where ``fcntl`` is unavailable): the same
+  region stored as one BLOB in a WAL-mode SQLite database, updated inside a
+  ``BEGIN IMMEDIATE`` transaction.
+
+Both backends expose the region as a writable buffer for the duration of a
+critical section, so the budget/breaker/stats logic is written once.
+
+Usage:
+    state = SharedRouterState("/run/penin/router.state")
+    router = MultiLLMRouterComplete(providers, shared_state=state)
+
+    # or directly
+    budget = state.budget_tracker(daily_budget_usd=5.0)
+    if budget.try_add_usage(0.02, 1500):
+        ...
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from penin.router import (
+    BUDGET_HARD_CUTOFF,
+    BUDGET_SOFT_CUTOFF,
+    CB_FAILURE_THRESHOLD,
+    CB_HALF_OPEN_MAX_CALLS,
+    CB_RECOVERY_TIMEOUT,
+    ProviderHealth,
+    ProviderStats,
+)
+
+try:
+    import fcntl
+    import mmap
+
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+STATE_MAGIC = b"PENINST1"
+DEFAULT_MAX_PROVIDERS = 64
+
+# magic, max_providers, day, daily_budget, spend, tokens, requests,
+# prev_day, prev_spend, prev_tokens, prev_requests
+_HEADER = struct.Struct("<8sIiddqqidqq")
+# name, breaker health, breaker failures, half-open calls, last failure (epoch),
+# total, successful, failed, cost, latency, tokens_in, tokens_out, consecutive
+_SLOT = struct.Struct("<32sBIIdqqqddqqq")
+
+_HEALTH = tuple(ProviderHealth)
+_HEALTH_CODE = {health: code for code, health in enumerate(_HEALTH)}
+
+
+# ============================================================================
+# Backends
+# ============================================================================
+
+
+class _MmapRegion:
+    """Memory-mapped file guarded by an fcntl record lock."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+        self._open()
+
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        self._thread_lock = threading.Lock()
+        self._fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.lockf(self._fd, fcntl.LOCK_EX)
+        try:
+            if os.fstat(self._fd).st_size < self.size:
+                os.ftruncate(self._fd, self.size)
+        finally:
+            fcntl.lockf(self._fd, fcntl.LOCK_UN)
+        self._mm = mmap.mmap(self._fd, self.size)
+
+    @contextmanager
+    def locked(self) -> Iterator[Any]:
+        # POSIX record locks belong to the process, so a forked child must not
+        # reuse the parent's thread lock (it may have been held at fork time).
+        # The inherited map and fd are dropped first (the child holds no lock
+        # on them, so closing cannot release the parent's).
+        if os.getpid() != self._pid:
+            self.close()
+            self._open()
+        with self._thread_lock:
+            fcntl.lockf(self._fd, fcntl.LOCK_EX)
+            try:
+                yield self._mm
+            finally:
+                fcntl.lockf(self._fd, fcntl.LOCK_UN)
+
+    def close(self) -> None:
+        self._mm.close()
+        os.close(self._fd)
+
+
+class _SQLiteRegion:
+    """Region stored as a single BLOB in a WAL-mode SQLite database."""
+
+    def __init__(self, path: Path, size: int) -> None:
+        self.path = path
+        self.size = size
+        self._open()
+
+    def _open(self) -> None:
+        self._pid = os.getpid()
+        self._thread_lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.path, timeout=30.0, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS region (id INTEGER PRIMARY KEY, data BLOB NOT NULL)"
+        )
+        self._conn.execute(
+            "INSERT OR IGNORE INTO region (id, data) VALUES (0, zeroblob(?))", (self.size,)
+        )
+
+    @contextmanager
+    def locked(self) -> Iterator[Any]:
+        if os.getpid() != self._pid:
+            self._open()
+        with self._thread_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self._conn.execute("SELECT data FROM region WHERE id = 0").fetchone()
+                buf = bytearray(row[0])
+                before = bytes(buf)
+                yield buf
+                if buf != before:
+                    self._conn.execute("UPDATE region SET data = ? WHERE id = 0", (bytes(buf),))
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+# ============================================================================
+# Shared State
+# ============================================================================
+
+
+class SharedRouterState:
+    """
+    Budget, provider statistics and circuit breakers shared across processes.
+
+    Every process opens the same ``path``; the region is created on first use.
+    The returned adapters (:meth:`budget_tracker`, :meth:`circuit_breaker`,
+    :meth:`provider_stats`) are drop-in replacements for the per-process
+    classes in ``penin.router``.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        backend: str = "auto",
+        max_providers: int = DEFAULT_MAX_PROVIDERS,
+    ) -> None:
+        if backend == "auto":
+            backend = "mmap" if FCNTL_AVAILABLE else "sqlite"
+        if backend == "mmap" and not FCNTL_AVAILABLE:
+            raise RuntimeError("mmap backend requires fcntl (POSIX)")
+        if backend not in ("mmap", "sqlite"):
+            raise ValueError(f"Unknown shared state backend: {backend}")
+
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.backend = backend
+        self.max_providers = max_providers
+        size = _HEADER.size + max_providers * _SLOT.size
+        region = _MmapRegion if backend == "mmap" else _SQLiteRegion
+        self._region: _MmapRegion | _SQLiteRegion = region(self.path, size)
+        self._slots: dict[str, int] = {}
+
+        with self._region.locked() as buf:
+            header = _HEADER.unpack_from(buf, 0)
+            if header[0] == STATE_MAGIC:
+                if header[1] != max_providers:
+                    raise ValueError(
+                        f"State file has {header[1]} provider slots, expected {max_providers}"
+                    )
+            elif header[0] == b"\x00" * 8:
+                _HEADER.pack_into(
+                    buf, 0, STATE_MAGIC, max_providers, date.today().toordinal(),
+                    0.0, 0.0, 0, 0, 0, 0.0, 0, 0,
+                )
+            else:
+                raise ValueError(f"Not a router state file: {self.path}")
+
+    def close(self) -> None:
+        """Release the mapping/connection."""
+        self._region.close()
+
+    # ------------------------------------------------------------------
+    # Adapters
+    # ------------------------------------------------------------------
+
+    def budget_tracker(self, daily_budget_usd: float | None = None) -> SharedBudgetTracker:
+        """Budget tracker view; ``daily_budget_usd`` (if given) is stored globally."""
+        return SharedBudgetTracker(self, daily_budget_usd)
+
+    def circuit_breaker(
+        self,
+        provider_id: str,
+        failure_threshold: int = CB_FAILURE_THRESHOLD,
+        recovery_timeout_s: float = CB_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = CB_HALF_OPEN_MAX_CALLS,
+    ) -> SharedCircuitBreaker:
+        """Circuit breaker whose state is shared by every process using ``provider_id``."""
+        return SharedCircuitBreaker(
+            self, provider_id, failure_threshold, recovery_timeout_s, half_open_max_calls
+        )
+
+    def provider_stats(self, provider_id: str) -> SharedProviderStats:
+        """Provider statistics aggregated across processes."""
+        return SharedProviderStats(provider_id=provider_id, shared=self)
+
+    # ------------------------------------------------------------------
+    # Budget primitives (all run under the region lock)
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _rollover(buf: Any) -> list[Any]:
+        """Unpack header, starting a new day if the date changed."""
+        header = list(_HEADER.unpack_from(buf, 0))
+        today = date.today().toordinal()
+        if today > header[2]:
+            header[7:11] = header[2], header[4], header[5], header[6]
+            header[2], header[4], header[5], header[6] = today, 0.0, 0, 0
+            _HEADER.pack_into(buf, 0, *header)
+        return header
+
+    def _budget_read(self) -> list[Any]:
+        with self._region.locked() as buf:
+            return self._rollover(buf)
+
+    def _budget_update(
+        self,
+        cost_usd: float = 0.0,
+        tokens: int = 0,
+        requests: int = 0,
+        within_budget: bool = False,
+        daily_budget_usd: float | None = None,
+        reset: bool = False,
+    ) -> tuple[bool, list[Any]]:
+        with self._region.locked() as buf:
+            header = self._rollover(buf)
+            if daily_budget_usd is not None:
+                header[3] = float(daily_budget_usd)
+            if reset:
+                header[2] = date.today().toordinal()
+                header[4:7] = 0.0, 0, 0
+                header[7:11] = 0, 0.0, 0, 0
+            limit = header[3] * BUDGET_HARD_CUTOFF
+            accepted = not within_budget or header[4] < limit and header[4] + cost_usd <= limit
+            if accepted:
+                header[4] += cost_usd
+                header[5] += tokens
+                header[6] += requests
+            _HEADER.pack_into(buf, 0, *header)
+            return accepted, header
+
+    # ------------------------------------------------------------------
+    # Provider slots
+    # ------------------------------------------------------------------
+
+    def _slot_offset(self, provider_id: str) -> int:
+        """Byte offset of the slot for ``provider_id``, claiming one if new."""
+        index = self._slots.get(provider_id)
+        if index is None:
+            name = provider_id.encode()[:32].ljust(32, b"\x00")
+            with self._region.locked() as buf:
+                for i in range(self.max_providers):
+                    stored = _SLOT.unpack_from(buf, _HEADER.size + i * _SLOT.size)[0]
+                    if stored == name:
+                        index = i
+                        break
+                    if stored == b"\x00" * 32:
+                        _SLOT.pack_into(
+                            buf, _HEADER.size + i * _SLOT.size,
+                            name, 0, 0, 0, 0.0, 0, 0, 0, 0.0, 0.0, 0, 0, 0,
+                        )
+                        index = i
+                        break
+                else:
+                    raise RuntimeError(
+                        f"No free provider slot ({self.max_providers} in use) in {self.path}"
+                    )
+            self._slots[provider_id] = index
+        return _HEADER.size + index * _SLOT.size
+
+    @contextmanager
+    def _slot(self, provider_id: str) -> Iterator[tuple[list[Any], Any, int]]:
+        """Locked read-modify-write of one provider slot."""
+        offset = self._slot_offset(provider_id)
+        with self._region.locked() as buf:
+            slot = list(_SLOT.unpack_from(buf, offset))
+            yield slot, buf, offset
+            _SLOT.pack_into(buf, offset, *slot)
+
+
+# ============================================================================
+# Adapters
+# ============================================================================
+
+
+class SharedBudgetTracker:
+    """
+    Cross-process counterpart of ``penin.router.BudgetTracker``.
+
+    Reads go to the shared region, so ``is_hard_cutoff`` reflects the spend of
+    every worker. :meth:`try_add_usage` is an atomic check-and-add: concurrent
+    callers can never push the global spend past the daily budget.
+    """
+
+    def __init__(self, shared: SharedRouterState, daily_budget_usd: float | None = None) -> None:
+        self._shared = shared
+        if daily_budget_usd is not None:
+            shared._budget_update(daily_budget_usd=daily_budget_usd)
+
+    @property
+    def daily_budget_usd(self) -> float:
+        return float(self._shared._budget_read()[3])
+
+    @property
+    def current_spend_usd(self) -> float:
+        return float(self._shared._budget_read()[4])
+
+    @property
+    def total_tokens(self) -> int:
+        return int(self._shared._budget_read()[5])
+
+    @property
+    def request_count(self) -> int:
+        return int(self._shared._budget_read()[6])
+
+    def add_usage(self, cost_usd: float, tokens: int, requests: int = 1) -> None:
+        """Record usage (``requests=0`` for incremental charges of a streamed call)."""
+        self._shared._budget_update(float(cost_usd), int(tokens), requests)
+
+    def try_add_usage(self, cost_usd: float, tokens: int) -> bool:
+        """Record usage only if it keeps the global spend within the hard cutoff."""
+        accepted, _ = self._shared._budget_update(
+            float(cost_usd), int(tokens), 1, within_budget=True
+        )
+        return accepted
+
+    def remaining_budget(self) -> float:
+        """Get remaining budget."""
+        header = self._shared._budget_read()
+        return max(0.0, header[3] - header[4])
+
+    def usage_percent(self) -> float:
+        """Get usage percentage."""
+        header = self._shared._budget_read()
+        if header[3] == 0:
+            return 0.0
+        return (header[4] / header[3]) * 100.0
+
+    def is_soft_cutoff(self) -> bool:
+        """Check if soft cutoff reached (95%)."""
+        return self.usage_percent() >= BUDGET_SOFT_CUTOFF * 100.0
+
+    def is_hard_cutoff(self) -> bool:
+        """Check if hard cutoff reached (100%); a zero budget is always cut off."""
+        header = self._shared._budget_read()
+        return header[4] >= header[3] * BUDGET_HARD_CUTOFF
+
+    def snapshot(self) -> dict[str, Any]:
+        """Get current budget snapshot."""
+        day, budget, spend, tokens, requests, prev_day, prev_spend, prev_tokens, prev_requests = (
+            self._shared._budget_read()[2:]
+        )
+        used_pct = (spend / budget) * 100.0 if budget else 0.0
+        history = []
+        if prev_day:
+            history.append(
+                {
+                    "date": date.fromordinal(prev_day).isoformat(),
+                    "spend_usd": round(prev_spend, 6),
+                    "tokens": prev_tokens,
+                    "requests": prev_requests,
+                }
+            )
+        return {
+            "daily_budget_usd": budget,
+            "daily_spend_usd": round(spend, 6),
+            "budget_remaining_usd": round(max(0.0, budget - spend), 6),
+            "budget_used_pct": round(used_pct, 2),
+            "soft_cutoff_reached": used_pct >= BUDGET_SOFT_CUTOFF * 100.0,
+            "hard_cutoff_reached": used_pct >= BUDGET_HARD_CUTOFF * 100.0,
+            "total_tokens": tokens,
+            "request_count": requests,
+            "last_reset": date.fromordinal(day).isoformat(),
+            "history": history,
+            "shared_backend": self._shared.backend,
+        }
+
+    def reset(self, new_budget_usd: float | None = None) -> None:
+        """Manually reset budget (for every process)."""
+        self._shared._budget_update(daily_budget_usd=new_budget_usd, reset=True)
+
+
+class SharedCircuitBreaker:
+    """
+    Cross-process counterpart of ``penin.router.CircuitBreaker``.
+
+    Same state machine; the state, failure count and half-open call budget
+    live in the provider's shared slot, so a breaker tripped by one worker is
+    open for all of them. Timestamps are wall-clock (``time.time``) because
+    they are compared across processes.
+    """
+
+    def __init__(
+        self,
+        shared: SharedRouterState,
+        provider_id: str,
+        failure_threshold: int = CB_FAILURE_THRESHOLD,
+        recovery_timeout_s: float = CB_RECOVERY_TIMEOUT,
+        half_open_max_calls: int = CB_HALF_OPEN_MAX_CALLS,
+    ) -> None:
+        self._shared = shared
+        self.provider_id = provider_id
+        self.failure_threshold: int = failure_threshold
+        self.recovery_timeout_s: float = recovery_timeout_s
+        self.half_open_max_calls: int = half_open_max_calls
+        shared._slot_offset(provider_id)
+
+    def can_call(self) -> bool:
+        """Check if provider can be called."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            state = _HEALTH[slot[1]]
+            if state in (ProviderHealth.HEALTHY, ProviderHealth.UNHEALTHY):
+                return True
+
+            if state == ProviderHealth.CIRCUIT_OPEN:
+                if time.time() - slot[4] >= self.recovery_timeout_s:
+                    slot[1] = _HEALTH_CODE[ProviderHealth.DEGRADED]
+                    slot[3] = 0
+                    return True
+                return False
+
+            if slot[3] < self.half_open_max_calls:
+                slot[3] += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record successful call."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            slot[1] = _HEALTH_CODE[ProviderHealth.HEALTHY]
+            slot[2] = 0
+            slot[3] = 0
+
+    def record_failure(self) -> None:
+        """Record failed call."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            slot[2] += 1
+            slot[4] = time.time()
+            if slot[2] >= self.failure_threshold:
+                slot[1] = _HEALTH_CODE[ProviderHealth.CIRCUIT_OPEN]
+            else:
+                slot[1] = _HEALTH_CODE[ProviderHealth.DEGRADED]
+
+    @property
+    def state(self) -> ProviderHealth:
+        """Get current state."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            return _HEALTH[slot[1]]
+
+
+class SharedProviderStats(ProviderStats):
+    """
+    ``ProviderStats`` whose counters are aggregated across processes.
+
+    Each record call atomically adds its delta to the shared slot and pulls
+    the global totals back into the dataclass fields, so ``success_rate`` and
+    ``to_dict`` report fleet-wide numbers. ``last_error`` and timestamps stay
+    local to the process.
+    """
+
+    def __init__(self, provider_id: str, shared: SharedRouterState) -> None:
+        super().__init__(provider_id=provider_id)
+        self._shared = shared
+        self.refresh()
+
+    def _pull(self, slot: list[Any]) -> None:
+        (
+            self.total_requests,
+            self.successful_requests,
+            self.failed_requests,
+            self.total_cost_usd,
+            self.total_latency_s,
+            self.total_tokens_in,
+            self.total_tokens_out,
+            self.consecutive_failures,
+        ) = slot[5:13]
+
+    def refresh(self) -> None:
+        """Load the current global counters."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            self._pull(slot)
+
+    def record_success(self, response: Any, latency_s: float) -> None:
+        """Record successful call."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            self._pull(slot)
+            slot[5] += 1
+            slot[6] += 1
+            slot[8] += float(getattr(response, "cost_usd", 0.0) or 0.0)
+            slot[9] += latency_s
+            slot[10] += int(getattr(response, "tokens_in", 0) or 0)
+            slot[11] += int(getattr(response, "tokens_out", 0) or 0)
+            slot[12] = 0
+        super().record_success(response, latency_s)
+
+    def record_failure(self, error: Exception) -> None:
+        """Record failed call."""
+        with self._shared._slot(self.provider_id) as (slot, _, _):
+            self._pull(slot)
+            slot[5] += 1
+            slot[7] += 1
+            slot[12] += 1
+        super().record_failure(error)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary (global counters)."""
+        self.refresh()
+        return super().to_dict()
+
+
+__all__ = [
+    "FCNTL_AVAILABLE",
+    "SharedBudgetTracker",
+    "SharedCircuitBreaker",
+    "SharedProviderStats",
+    "SharedRouterState",
+]
@@ -11,6 +11,7 @@ from penin.sr.sr_service import (
     SRScore,
     SRService,
     compute_sr_score,
+    evaluate_sr_probe,
     quick_sr_score,
 )
 
@@ -18,5 +19,6 @@ __all__ = [
     "SRScore",
     "SRService",
     "compute_sr_score",
+    "evaluate_sr_probe",
     "quick_sr_score",
 ]
@@ -411,6 +411,35 @@ def quick_sr_score(
     return compute_sr_score(awareness, ethics_ok, autocorrection, metacognition)
 
 
+def evaluate_sr_probe(
+    ece: float, rho: float, risk: float, dlinf_dc: float
+) -> dict[str, Any]:
+    """
+    SR-Ω∞ probe used by Ω-META (the ``/sr/eval`` contract).
+
+    Args:
+        ece: Expected Calibration Error
+        rho: Contractivity factor (ρ ≥ 1 fails the ethics/IR→IC gate)
+        risk: Residual risk ∈ [0, 1]
+        dlinf_dc: Efficiency ΔL∞/ΔCost
+
+    Returns:
+        Dict with the score ``R`` and its four components
+    """
+    awareness = max(0.0, 1.0 - ece)
+    ethics_ok = rho < 1.0
+    autocorrection = max(0.0, 1.0 - risk)
+    metacognition = min(1.0, max(0.0, dlinf_dc))
+
+    return {
+        "R": compute_sr_score(awareness, ethics_ok, autocorrection, metacognition),
+        "awareness": awareness,
+        "ethics_ok": ethics_ok,
+        "autocorrection": autocorrection,
+        "metacognition": metacognition,
+    }
+
+
 # ============================================================================
 # FastAPI Application
 # ============================================================================
@@ -478,6 +507,19 @@ try:
         )
         delta_cost: float = Field(default=0.10, ge=0.0, description="Change in cost")
 
+    class ProbeRequest(BaseModel):
+        """Request model for the SR-Ω∞ probe."""
+
+        ece: float = Field(ge=0.0, le=1.0, description="Expected Calibration Error")
+        rho: float = Field(ge=0.0, description="Contractivity ratio")
+        risk: float = Field(ge=0.0, le=1.0, description="Residual risk")
+        dlinf_dc: float = Field(description="Efficiency ΔL∞/ΔCost")
+
+    class ProbeBatchRequest(BaseModel):
+        """Batch of SR-Ω∞ probes."""
+
+        items: list[ProbeRequest]
+
     @app.get("/health")
     async def health():
         """Health check endpoint."""
@@ -501,7 +543,7 @@ try:
     @app.post("/sr/compute")
     async def compute_score(request: ScoreRequest):
         """Compute new SR-Ω∞ score."""
-        score = _global_sr_service.compute_score(
+        score = await _global_sr_service.compute_score(
             ece=request.ece,
             rho=request.rho,
             delta_linf=request.delta_linf,
@@ -516,6 +558,18 @@ try:
             "timestamp": score.timestamp,
         }
 
+    @app.post("/sr/eval")
+    async def eval_probe(request: ProbeRequest):
+        """Evaluate one SR-Ω∞ probe."""
+        return evaluate_sr_probe(**request.model_dump())
+
+    @app.post("/sr/eval_batch")
+    async def eval_probe_batch(request: ProbeBatchRequest):
+        """Evaluate a batch of SR-Ω∞ probes."""
+        return {
+            "results": [evaluate_sr_probe(**p.model_dump()) for p in request.items]
+        }
+
     @app.get("/sr/health_report")
     async def get_health_report():
         """Get detailed health report."""
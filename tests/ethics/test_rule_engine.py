@@ -0,0 +1,140 @@
+"""
+Tests for the compiled ΣEA/LO-14 rule engine
+"""
+
+import numpy as np
+import pytest
+
+from penin.ethics.laws import (
+    LO14_RULES,
+    CompiledEthicsRules,
+    DecisionContext,
+    EthicsRule,
+    EthicsValidator,
+    OriginLaw,
+    ViolationSeverity,
+)
+
+
+def _columns(n: int = 200, seed: int = 0) -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(seed)
+    return {
+        "privacy_score": rng.uniform(0.9, 1.0, n),
+        "fairness_score": rng.uniform(0.9, 1.0, n),
+        "transparency_score": rng.uniform(0.8, 1.0, n),
+        "physical_risk": rng.uniform(0.0, 0.02, n),
+        "emotional_risk": rng.uniform(0.0, 0.1, n),
+        "consent_obtained": rng.random(n) > 0.1,
+        "claims_consciousness": rng.random(n) > 0.95,
+    }
+
+
+def _summary(result):
+    return (
+        result.passed,
+        result.score,
+        result.recommendation,
+        [(v.law, v.severity, v.description, v.evidence) for v in result.violations],
+    )
+
+
+class TestCompiledRules:
+    def test_fail_fast_stops_at_first_critical(self):
+        context = DecisionContext(
+            decision_id="d",
+            decision_type="t",
+            claims_consciousness=True,
+            physical_risk=0.5,
+            fairness_score=0.5,
+        )
+
+        full = EthicsValidator.validate_all(context)
+        fast = EthicsValidator.validate_all(context, fail_fast=True)
+
+        assert [v.law for v in full.violations] == [
+            OriginLaw.LO_01,
+            OriginLaw.LO_03,
+            OriginLaw.LO_09,
+        ]
+        assert [v.law for v in fast.violations] == [OriginLaw.LO_01]
+        assert fast.recommendation == full.recommendation == "ROLLBACK"
+        assert fast.score == full.score
+
+    def test_trusted_matches_validated(self):
+        fields = {"privacy_score": 0.9, "consent_obtained": False}
+
+        trusted = EthicsValidator.validate_trusted(fields)
+        validated = EthicsValidator.validate_all(
+            DecisionContext(decision_id="d", decision_type="t", **fields)
+        )
+
+        assert _summary(trusted) == _summary(validated)
+        assert trusted.violations[0].description == "Privacidade insuficiente: 0.900"
+
+    def test_subclass_thresholds_recompile(self):
+        class Lenient(EthicsValidator):
+            PRIVACY_MIN = 0.5
+
+        context = DecisionContext(decision_id="d", decision_type="t", privacy_score=0.9)
+
+        assert not EthicsValidator.validate_all(context).passed
+        assert Lenient.validate_all(context).passed
+        Lenient.PRIVACY_MIN = 0.95
+        assert not Lenient.validate_all(context).passed
+
+    def test_engine_built_once_without_class_state(self):
+        class Strict(EthicsValidator):
+            FAIRNESS_MIN = 0.99
+
+        engine = Strict.compiled_rules()
+
+        assert Strict.compiled_rules() is engine
+        assert EthicsValidator.compiled_rules() is not engine
+        assert "_compiled" not in vars(Strict) and "_compiled" not in vars(EthicsValidator)
+        assert engine.thresholds["FAIRNESS_MIN"] == 0.99
+
+    def test_invalid_rules(self):
+        with pytest.raises(ValueError, match="Missing rule thresholds"):
+            CompiledEthicsRules(LO14_RULES, {})
+
+        bad = EthicsRule(
+            law=OriginLaw.LO_14,
+            severity=ViolationSeverity.LOW,
+            fields=("hubris",),
+            op="any",
+            description="",
+            evidence=(),
+            suggested_fix="",
+        )
+        with pytest.raises(ValueError, match="Unknown context fields"):
+            CompiledEthicsRules((bad,))
+
+
+class TestBatchValidation:
+    @pytest.mark.parametrize("fail_fast", [False, True])
+    def test_batch_matches_single(self, fail_fast):
+        columns = _columns()
+
+        batch = EthicsValidator.validate_batch(columns, fail_fast=fail_fast)
+
+        assert len(batch) == 200
+        assert batch.passed.any() and not batch.passed.all()
+        for i in range(len(batch)):
+            row = {name: column[i].item() for name, column in columns.items()}
+            single = EthicsValidator.validate_trusted(row, fail_fast=fail_fast)
+            assert bool(batch.passed[i]) == single.passed
+            assert _summary(batch.result(i)) == _summary(single)
+
+    def test_batch_validates_ranges(self):
+        columns = _columns(10)
+        columns["privacy_score"][3] = 1.5
+
+        with pytest.raises(ValueError, match="privacy_score"):
+            EthicsValidator.validate_batch(columns)
+        assert len(EthicsValidator.validate_batch(columns, validate=False)) == 10
+
+    def test_batch_rejects_ragged_columns(self):
+        with pytest.raises(ValueError, match="equal length"):
+            EthicsValidator.validate_batch(
+                {"privacy_score": [1.0, 1.0], "fairness_score": [1.0]}
+            )
@@ -0,0 +1,173 @@
+"""
+Batch hyperparameter tuning (SPSA / central / forward differences)
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from penin.equations.auto_tuning import (
+    AutoTuner,
+    AutoTuningConfig,
+    BatchAutoTuner,
+    BatchTuningConfig,
+)
+
+NAMES = [f"h{i}" for i in range(6)]
+TARGET = np.linspace(0.2, 0.8, len(NAMES))
+WEIGHTS = np.linspace(0.5, 2.0, len(NAMES))
+
+
+def quadratic(values):
+    theta = np.array([values[n] for n in NAMES])
+    return float(np.sum(WEIGHTS * (theta - TARGET) ** 2))
+
+
+def make_tuner(method="spsa", warmup_steps=0, **batch):
+    config = AutoTuningConfig(
+        eta_base=1.0, warmup_steps=warmup_steps, bounds={n: (0.0, 1.0) for n in NAMES}
+    )
+    tuner = BatchAutoTuner(config, BatchTuningConfig(method=method, seed=0, **batch))
+    for name in NAMES:
+        tuner.register_hyperparam(name, 0.05)
+    return tuner
+
+
+class TestBaselineReuse:
+    def test_estimate_gradient_reuses_baseline(self):
+        tuner = AutoTuner()
+        tuner.register_hyperparam("kappa", 20.0)
+        calls = []
+
+        def loss(value):
+            calls.append(value)
+            return (value - 30.0) ** 2
+
+        tuner.estimate_gradient("kappa", loss, delta=1e-3)
+        tuner.estimate_gradient("kappa", loss, delta=1e-3)
+        tuner.estimate_gradient("kappa", loss, delta=1e-3, baseline=loss(20.0))
+
+        assert calls.count(20.0) == 2 and len(calls) == 5
+
+    def test_forward_method_uses_k_plus_one_evaluations(self):
+        tuner = make_tuner("forward")
+
+        tuner.estimate_gradients(quadratic)
+        tuner.baseline_loss(quadratic)
+
+        assert tuner.evaluations == len(NAMES) + 1
+
+
+class TestGradients:
+    @pytest.mark.parametrize("k", [2, 6, 40])
+    def test_spsa_costs_two_evaluations_per_step(self, k):
+        tuner = BatchAutoTuner(AutoTuningConfig(warmup_steps=0), BatchTuningConfig(seed=1))
+        for i in range(k):
+            tuner.register_hyperparam(f"x{i}", 1.0)
+
+        for _ in range(3):
+            tuner.step(lambda values: sum(v * v for v in values.values()))
+
+        assert tuner.evaluations == 6
+
+    def test_central_matches_analytic_gradient(self):
+        tuner = make_tuner("central", perturbation=1e-4)
+        theta = np.full(len(NAMES), 0.05)
+
+        grad = tuner.estimate_gradients(quadratic)
+
+        expected = np.clip(2 * WEIGHTS * (theta - TARGET), -1.0, 1.0)
+        np.testing.assert_allclose([grad[n] for n in NAMES], expected, atol=1e-6)
+        assert tuner.evaluations == 2 * len(NAMES)
+
+    def test_spsa_is_unbiased_on_average(self):
+        tuner = make_tuner("spsa", perturbation=1e-3, spsa_samples=400)
+        tuner.config.grad_clip = 10.0
+
+        grad = tuner.estimate_gradients(quadratic)
+
+        expected = 2 * WEIGHTS * (0.05 - TARGET)
+        np.testing.assert_allclose([grad[n] for n in NAMES], expected, atol=0.35)
+
+    def test_boundary_uses_realized_step(self):
+        tuner = make_tuner("central", perturbation=0.05)
+        for name in NAMES:
+            tuner.hyperparams[name].current_value = 0.0
+
+        grad = tuner.estimate_gradients(quadratic)
+
+        assert all(grad[n] < 0 for n in NAMES)
+
+    def test_pool_matches_serial(self):
+        serial = make_tuner("central").estimate_gradients(quadratic)
+        with make_tuner("central", n_workers=2) as pooled:
+            parallel = pooled.estimate_gradients(quadratic)
+        with ThreadPoolExecutor(2) as executor:
+            tuner = make_tuner("central")
+            tuner._executor = executor
+            threaded = tuner.estimate_gradients(quadratic)
+
+        assert parallel == serial == threaded
+
+    def test_unknown_method_rejected(self):
+        with pytest.raises(ValueError, match="Unknown gradient method"):
+            BatchAutoTuner(batch_config=BatchTuningConfig(method="newton"))
+
+
+class TestUpdates:
+    def test_update_rule_unchanged(self):
+        batch = make_tuner("central")
+        reference = AutoTuner(batch.config)
+        for name in NAMES:
+            reference.register_hyperparam(name, 0.05)
+
+        for _ in range(5):
+            grad = batch.estimate_gradients(quadratic)
+            batch.iteration -= 1  # keep c_t for the step below
+            values = batch.step(quadratic)
+            for name in NAMES:
+                reference.update_hyperparam(name, grad[name])
+
+        assert values == reference.get_current_values()
+
+    @pytest.mark.parametrize("method", ["spsa", "central", "forward"])
+    def test_converges_within_bounds(self, method):
+        tuner = make_tuner(method)
+        initial = quadratic(tuner.get_current_values())
+
+        for _ in range(200):
+            values = tuner.step(quadratic)
+
+        assert quadratic(values) < 0.02 * initial
+        assert all(0.0 <= v <= 1.0 for v in values.values())
+
+    def test_warmup_skips_evaluations(self):
+        tuner = make_tuner("spsa", warmup_steps=3)
+
+        for _ in range(3):
+            tuner.step(quadratic)
+
+        assert tuner.evaluations == 0
+        assert all(s.step_count == 3 for s in tuner.hyperparams.values())
+        tuner.step(quadratic)
+        assert tuner.evaluations == 2
+
+
+class TestCheckpoint:
+    def test_resume_reproduces_trajectory(self, tmp_path):
+        straight = make_tuner("spsa")
+        for _ in range(20):
+            straight.step(quadratic)
+
+        first = make_tuner("spsa")
+        for _ in range(10):
+            first.step(quadratic)
+        first.save_checkpoint(tmp_path / "tuner.json")
+        resumed = BatchAutoTuner(first.config, first.batch_config)
+        resumed.load_checkpoint(tmp_path / "tuner.json")
+        for _ in range(10):
+            resumed.step(quadratic)
+
+        assert resumed.state_dict() == straight.state_dict()
+        assert not (tmp_path / "tuner.json.tmp").exists()
@@ -0,0 +1,171 @@
+"""
+Tests for adaptive (bandit) provider selection
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from penin.providers.base import LLMResponse
+from penin.router import MultiLLMRouterComplete
+from penin.router_pkg.bandit import (
+    AdaptiveProviderSelector,
+    BanditContext,
+    LinUCBPolicy,
+    RewardWeights,
+    ThompsonSamplingPolicy,
+)
+
+SHORT = BanditContext(prompt_tokens=50, max_tokens=128, hour_of_day=10.0)
+LONG = BanditContext(prompt_tokens=8000, max_tokens=128, hour_of_day=10.0)
+
+
+def greedy_pick(selector, arms, ctx):
+    _, greedy = selector.policy.scores(arms, ctx.features(), np.random.default_rng(0))
+    return arms[int(np.argmax(greedy))]
+
+
+class TestReward:
+    def test_blend_bounds_and_monotonicity(self):
+        w = RewardWeights()
+
+        assert w.reward(1.0, 0.0, 0.0) == pytest.approx(1.0)
+        assert w.reward(0.0, 1e9, 1e9) == pytest.approx(0.0, abs=1e-6)
+        assert w.reward(1.0, 0.001, 1.0) > w.reward(1.0, 0.1, 1.0)
+        assert w.reward(1.0, 0.001, 0.5) > w.reward(1.0, 0.001, 5.0)
+
+    def test_context_from_messages(self):
+        ctx = BanditContext.from_messages(
+            [{"role": "user", "content": "x" * 400}], max_tokens=256,
+            budget_remaining_usd=1.0, daily_budget_usd=4.0,
+        )
+
+        assert (ctx.prompt_tokens, ctx.max_tokens, ctx.budget_remaining_frac) == (100, 256, 0.25)
+        assert ctx.features().shape == (BanditContext.N_FEATURES,)
+
+
+class TestPolicies:
+    def test_thompson_finds_best_arm(self):
+        rng = np.random.default_rng(0)
+        means = {"a": 0.3, "b": 0.8, "c": 0.5}
+        selector = AdaptiveProviderSelector(
+            ThompsonSamplingPolicy(), RewardWeights(1.0, 0.0, 0.0), seed=1
+        )
+        picks = []
+        for _ in range(1500):
+            decision = selector.select(list(means), SHORT)
+            selector.update(decision, quality=float(rng.random() < means[decision.provider]))
+            picks.append(decision.provider)
+
+        assert picks[-300:].count("b") > 250
+
+    def test_linucb_learns_context_dependent_best(self):
+        rng = np.random.default_rng(0)
+        quality = {("cheap", "short"): 0.9, ("cheap", "long"): 0.2,
+                   ("premium", "short"): 0.6, ("premium", "long"): 0.9}
+        selector = AdaptiveProviderSelector(
+            LinUCBPolicy(), RewardWeights(1.0, 0.0, 0.0), seed=2
+        )
+        for i in range(1500):
+            kind, ctx = ("short", SHORT) if i % 2 else ("long", LONG)
+            decision = selector.select(["cheap", "premium"], ctx)
+            selector.update(decision, quality=float(rng.random() < quality[decision.provider, kind]))
+
+        assert greedy_pick(selector, ["cheap", "premium"], SHORT) == "cheap"
+        assert greedy_pick(selector, ["cheap", "premium"], LONG) == "premium"
+
+    @pytest.mark.parametrize("policy", [ThompsonSamplingPolicy, LinUCBPolicy])
+    def test_posterior_round_trip(self, policy, tmp_path):
+        selector = AdaptiveProviderSelector(policy(), seed=0)
+        for i in range(50):
+            decision = selector.select(["a", "b"], SHORT if i % 2 else LONG)
+            selector.update(decision, quality=float(decision.provider == "a"), cost_usd=0.001)
+        selector.save(tmp_path / "bandit.json")
+
+        restored = AdaptiveProviderSelector.load(tmp_path / "bandit.json")
+
+        assert type(restored.policy) is policy
+        assert restored.n_updates == 50
+        for ctx in (SHORT, LONG):
+            np.testing.assert_allclose(
+                restored.policy.scores(["a", "b"], ctx.features(), np.random.default_rng(0))[1],
+                selector.policy.scores(["a", "b"], ctx.features(), np.random.default_rng(0))[1],
+            )
+
+
+class TestExplorationCaps:
+    def _trained(self):
+        selector = AdaptiveProviderSelector(LinUCBPolicy(alpha=50.0), seed=0)
+        for _ in range(20):
+            selector.policy.update("good", SHORT.features(), 0.9)
+        return selector
+
+    def test_no_exploration_below_budget_floor(self):
+        selector = self._trained()
+        low_budget = BanditContext(50, 128, 10.0, budget_remaining_frac=0.1)
+
+        decisions = [selector.select(["good", "new"], low_budget) for _ in range(20)]
+
+        assert all(d.provider == "good" and not d.exploratory for d in decisions)
+        # With budget to spare the huge alpha explores the untried provider
+        assert selector.select(["good", "new"], SHORT).exploratory
+
+    def test_exploration_spend_cap(self):
+        selector = self._trained()
+        decision = selector.select(["good", "new"], SHORT, daily_budget_usd=1.0)
+        assert decision.exploratory
+        selector.update(decision, quality=0.0, cost_usd=0.2)
+
+        # 0.2 >= 10% of the 1.0 daily budget: exploit only from now on
+        assert selector.explore_spend_usd == pytest.approx(0.2)
+        assert not selector.select(["good", "new"], SHORT, daily_budget_usd=1.0).exploratory
+
+
+class FakeProvider:
+    def __init__(self, name, fail=False, cost=0.001):
+        self.name = name
+        self.fail = fail
+        self.cost = cost
+        self.calls = 0
+
+    async def chat(self, *args, **kwargs):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError(f"{self.name} down")
+        return LLMResponse("answer", "m", tokens_in=10, tokens_out=20, cost_usd=self.cost, latency_s=0.2)
+
+
+class TestRouterIntegration:
+    def test_routes_single_provider_and_learns(self, tmp_path):
+        broken, good = FakeProvider("broken", fail=True), FakeProvider("good")
+        selector = AdaptiveProviderSelector(ThompsonSamplingPolicy(), seed=0)
+        router = MultiLLMRouterComplete(
+            [broken, good], daily_budget_usd=10.0, enable_cache=False,
+            enable_circuit_breaker=False, state_path=tmp_path / "state.json", selector=selector,
+        )
+
+        for i in range(40):
+            response = asyncio.run(router.ask([{"role": "user", "content": f"q{i}"}], max_tokens=64))
+            assert response.content == "answer"
+
+        assert good.calls == 40
+        assert broken.calls < 10
+        assert router.get_budget_status()["request_count"] == 40
+
+    def test_posterior_persisted_with_router_state(self, tmp_path):
+        state = tmp_path / "state.json"
+        kwargs = dict(daily_budget_usd=10.0, enable_cache=False, state_path=state)
+        router = MultiLLMRouterComplete(
+            [FakeProvider("a"), FakeProvider("b")], selector=AdaptiveProviderSelector(seed=0), **kwargs
+        )
+        for i in range(10):
+            asyncio.run(router.ask([{"role": "user", "content": f"q{i}"}]))
+
+        assert json.loads(state.read_text())["bandit"]["n_updates"] == 10
+        reloaded = MultiLLMRouterComplete(
+            [FakeProvider("a"), FakeProvider("b")], selector=AdaptiveProviderSelector(), **kwargs
+        )
+        assert reloaded.selector.n_updates == 10
+        assert set(reloaded.selector.policy.arms) <= {"a", "b"}
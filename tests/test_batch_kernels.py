@@ -0,0 +1,157 @@
+"""
+Batch (NumPy) kernels must match the scalar CAOS⁺, L∞ and SR-Ω∞ equations
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from penin.core.caos import (
+    compute_caos_plus_exponential,
+    compute_caos_plus_exponential_batch,
+    phi_caos,
+    phi_caos_batch,
+)
+from penin.math.linf import (
+    LInfConfig,
+    compute_linf_meta,
+    compute_linf_meta_batch,
+    harmonic_noncomp,
+    harmonic_noncomp_batch,
+    linf_score,
+    linf_score_batch,
+)
+from penin.omega.sr import (
+    SRAggregationMethod,
+    SRComponents,
+    SROmegaEngine,
+    sr_omega,
+    sr_omega_batch,
+)
+
+# Includes out-of-range and non-finite values to pin the clamp semantics
+EDGE = [0.0, 1.0, -0.5, 1.5, math.nan, math.inf, -math.inf, 1e-12]
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(7)
+
+
+def population(rng, n, k):
+    x = rng.uniform(-0.1, 1.1, size=(n, k))
+    x[: len(EDGE), 0] = EDGE
+    return x
+
+
+class TestCAOSBatch:
+    @pytest.mark.parametrize("kappa", [0.5, 2.0, 20.0, 250.0])
+    def test_exponential_matches_scalar(self, rng, kappa):
+        x = population(rng, 200, 4)
+
+        batch = compute_caos_plus_exponential_batch(*x.T, kappa=kappa)
+        scalar = [compute_caos_plus_exponential(*row, kappa=kappa) for row in x]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+
+    def test_phi_matches_scalar_with_array_params(self, rng):
+        x = population(rng, 200, 4)
+        kappa = rng.uniform(0.0, 12.0, 200)
+        gamma = rng.uniform(0.0, 3.0, 200)
+
+        batch = phi_caos_batch(*x.T, kappa=kappa, gamma=gamma)
+        scalar = [
+            phi_caos(*row, kappa=k, gamma=g)
+            for row, k, g in zip(x, kappa, gamma, strict=True)
+        ]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+        assert batch.shape == (200,)
+
+
+class TestLInfBatch:
+    def test_harmonic_and_score_match_scalar(self, rng):
+        x = population(rng, 100, 3)
+        weights = np.array([0.5, 0.3, 0.2])
+        cost = rng.uniform(-1.0, 3.0, 100)
+        keys = ["a", "b", "c"]
+
+        def as_dicts(row):
+            return dict(zip(keys, row, strict=True)), dict(zip(keys, weights, strict=True))
+
+        np.testing.assert_allclose(
+            harmonic_noncomp_batch(x, weights),
+            [harmonic_noncomp(*as_dicts(row)) for row in x],
+            rtol=1e-12,
+        )
+        np.testing.assert_allclose(
+            linf_score_batch(x, weights, cost),
+            [linf_score(*as_dicts(row), c) for row, c in zip(x, cost, strict=True)],
+            rtol=1e-12,
+        )
+
+    def test_default_weights_and_single_row(self):
+        row = [0.9, 0.8, 0.7]
+        expected = harmonic_noncomp(dict(enumerate(row)), {})
+
+        assert harmonic_noncomp_batch(row) == pytest.approx(expected)
+        assert harmonic_noncomp_batch(row).shape == ()
+
+    def test_meta_gates_fail_closed_per_candidate(self, rng):
+        x = population(rng, 50, 2)
+        weights = np.array([0.6, 0.4])
+        ethics = rng.random(50) > 0.3
+        rho_ok = rng.random(50) > 0.3
+        config = LInfConfig(lambda_c=0.2)
+
+        batch = compute_linf_meta_batch(x, weights, 0.5, config, ethics, rho_ok)
+        scalar = [
+            compute_linf_meta(
+                {"u": r[0], "v": r[1]}, {"u": 0.6, "v": 0.4}, 0.5, config, e, ok
+            )
+            for r, e, ok in zip(x, ethics, rho_ok, strict=True)
+        ]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+        assert np.all(batch[~(ethics & rho_ok)] == 0.0)
+
+    def test_meta_scalar_gate_blocks_everything(self, rng):
+        x = population(rng, 10, 2)
+
+        assert np.all(compute_linf_meta_batch(x, None, 0.0, ethics_ok=False) == 0.0)
+
+
+class TestSRBatch:
+    @pytest.mark.parametrize(
+        "method,p_norm",
+        [
+            (SRAggregationMethod.HARMONIC, -10.0),
+            (SRAggregationMethod.MIN_SOFT, -10.0),
+            (SRAggregationMethod.MIN_SOFT, 0.0),
+            (SRAggregationMethod.GEOMETRIC, -10.0),
+        ],
+    )
+    def test_engine_matches_scalar(self, rng, method, p_norm):
+        engine = SROmegaEngine(
+            weights={"awareness": 2, "ethics": 1, "autocorrection": 1, "metacognition": 1},
+            method=method,
+            p_norm=p_norm,
+        )
+        x = population(rng, 100, 4)
+
+        batch = engine.compute_sr_batch(x)
+        scalar = [engine.compute_sr(SRComponents(*row))[0] for row in x]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12)
+
+    def test_sr_omega_batch_matches_helper(self, rng):
+        x = rng.random((40, 3))
+        ethics = rng.random(40) > 0.5
+
+        batch = sr_omega_batch(x[:, 0], ethics, x[:, 1], x[:, 2])
+        scalar = [
+            sr_omega(a, e, c, m) for (a, c, m), e in zip(x, ethics, strict=True)
+        ]
+
+        np.testing.assert_allclose(batch, scalar, rtol=1e-12)
@@ -0,0 +1,234 @@
+"""Testes do L2 em SQLite do SecureCache (lotes, despejo, TTL, migração)"""
+
+import asyncio
+import hashlib
+import hmac
+import sqlite3
+import types
+
+import pytest
+
+import penin.cache as cache_mod
+from penin.cache import L2_FILENAME, SecureCache, main, migrate_file_cache, orjson
+
+
+@pytest.fixture(autouse=True)
+def hmac_key(monkeypatch):
+    monkeypatch.setenv("PENIN_CACHE_HMAC_KEY", "dev")
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(cache_mod, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+
+def write_legacy(cache_dir, key, value, ts, hmac_key=b"dev"):
+    data = {"value": value, "timestamp": ts}
+    tag = hmac.new(hmac_key, orjson.dumps(data), hashlib.sha256).hexdigest()
+    path = cache_dir / f"{hashlib.sha256(key.encode()).hexdigest()}.json"
+    path.write_bytes(orjson.dumps({"hmac": tag, "data": data}))
+    return path
+
+
+class TestWriteBehind:
+    def test_default_writes_are_visible_to_other_instances(self, tmp_path):
+        cache = SecureCache(tmp_path)
+
+        cache.set("a", 1)
+
+        assert SecureCache(tmp_path).get("a") == 1
+
+    def test_pending_batch_flushed_at_exit(self, tmp_path):
+        cache = SecureCache(tmp_path, flush_batch=64)
+        cache.set("a", 1)
+        assert SecureCache(tmp_path).get("a") is None
+
+        cache_mod._flush_at_exit()
+
+        assert SecureCache(tmp_path).get("a") == 1
+        cache.close()
+        assert cache not in cache_mod._BATCHED
+
+    def test_batched_flush_and_pending_reads(self, tmp_path):
+        cache = SecureCache(tmp_path, l1_size=1, flush_batch=10)
+        for i in range(5):
+            cache.set(f"k{i}", i)
+
+        stats = cache.get_stats()
+        assert (stats["l2_size"], stats["l2_pending"]) == (0, 5)
+        # k0 saiu do L1 mas ainda não foi gravado: servido pela fila
+        assert cache.get("k0") == 0
+
+        for i in range(5, 10):
+            cache.set(f"k{i}", i)
+        assert cache.get_stats()["l2_size"] == 10
+        assert cache.get_stats()["l2_pending"] == 0
+        cache.close()
+
+        reopened = SecureCache(tmp_path)
+        assert [reopened.get(f"k{i}") for i in range(10)] == list(range(10))
+        assert reopened.get_stats()["l2_hits"] == 10
+
+    def test_async_flush(self, tmp_path):
+        cache = SecureCache(tmp_path, flush_batch=4)
+
+        async def run():
+            for i in range(4):
+                cache.set(f"k{i}", i)  # 4ª escrita agenda o flush no executor
+            await asyncio.sleep(0.05)
+            cache.set("tail", "x")
+            return await cache.aflush()
+
+        assert asyncio.run(run()) == 1
+        assert cache.get_stats()["l2_size"] == 5
+        cache.close()
+
+    def test_failed_flush_requeues_batch(self, tmp_path, monkeypatch):
+        cache = SecureCache(tmp_path, l1_size=1, flush_batch=100)
+        for i in range(3):
+            cache.set(f"k{i}", i)
+        cache.get("k0")
+        write_batch = cache._write_batch
+
+        def failing(batch, touches):
+            touches.clear()
+            raise sqlite3.OperationalError("disk I/O error")
+
+        monkeypatch.setattr(cache, "_write_batch", failing)
+        with pytest.raises(sqlite3.OperationalError):
+            cache.flush()
+
+        # nada se perde: o lote e os acessos voltam à fila
+        assert cache.get_stats()["l2_pending"] == 3
+        assert cache.get("k1") == 1
+        monkeypatch.setattr(cache, "_write_batch", write_batch)
+        assert cache.flush() == 3
+        assert cache.get_stats()["l2_size"] == 3
+
+        cache.set("k9", 9)
+        cache.clear()
+        assert cache.get("k9") is None and cache.get_stats()["l2_pending"] == 0
+        cache.close()
+
+    def test_background_flush_failure_logged(self, tmp_path, caplog):
+        cache = SecureCache(tmp_path, flush_batch=2)
+
+        def failing(batch, touches):
+            raise sqlite3.OperationalError("database is locked")
+
+        cache._write_batch = failing
+
+        async def run():
+            cache.set("a", 1)
+            cache.set("b", 2)  # agenda o flush no executor
+            await asyncio.sleep(0.05)
+
+        with caplog.at_level("ERROR", logger="penin.cache"):
+            asyncio.run(run())
+
+        assert "Background cache flush failed" in caplog.text
+        assert cache.get_stats()["l2_pending"] == 2
+        del cache._write_batch
+        cache.close()
+
+
+class TestBoundsAndExpiry:
+    def test_lru_eviction_bounds_l2(self, tmp_path, clock):
+        cache = SecureCache(tmp_path, l1_size=1, l2_size=3, flush_batch=1)
+        for i in range(3):
+            cache.set(f"k{i}", i)
+            clock[0] += 1
+        cache.get("k0")  # k0 recente: k1 é o menos usado
+        cache.flush()
+        clock[0] += 1
+        cache.set("k3", 3)
+
+        stats = cache.get_stats()
+        assert stats["l2_size"] == 3 and stats["l2_evictions"] == 1
+        assert cache.get("k1") is None
+        assert cache.get("k0") == 0
+
+    def test_lfu_eviction(self, tmp_path, clock):
+        cache = SecureCache(tmp_path, l1_size=1, l2_size=2, eviction="lfu", flush_batch=1)
+        cache.set("hot", 1)
+        cache.set("cold", 2)
+        for _ in range(3):
+            cache.get("hot")
+        cache.flush()
+        clock[0] += 1
+        cache.set("new", 3)
+
+        assert cache.get("cold") is None
+        assert cache.get("hot") == 1
+
+    def test_expired_entries_purged_on_flush(self, tmp_path, clock):
+        cache = SecureCache(tmp_path, l1_ttl=10, l2_ttl=100, flush_batch=1)
+        cache.set("old", 1)
+        clock[0] += 50
+        cache.set("young", 2)
+        clock[0] += 60
+
+        assert cache.get("old") is None
+        cache.set("trigger", 3)
+        stats = cache.get_stats()
+        assert stats["l2_expired"] == 1 and stats["l2_size"] == 2
+        assert cache.purge_expired() == 0
+
+    def test_stats_counters_track_bytes(self, tmp_path, clock):
+        cache = SecureCache(tmp_path, flush_batch=1)
+        cache.set("a", "x" * 100)
+        size = cache.get_stats()["l2_bytes"]
+        cache.set("a", "x" * 10)  # sobrescrita não conta nova entrada
+
+        stats = cache.get_stats()
+        assert stats["l2_size"] == 1 and stats["l2_bytes"] == size - 90
+        cache.clear()
+        assert cache.get_stats()["l2_size"] == cache.get_stats()["l2_bytes"] == 0
+
+    def test_invalid_eviction_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            SecureCache(tmp_path, eviction="fifo")
+
+
+class TestIntegrity:
+    def test_tampered_row_raises(self, tmp_path):
+        with SecureCache(tmp_path) as cache:
+            cache.set("k", {"amount": 1})
+
+        with sqlite3.connect(tmp_path / L2_FILENAME) as conn:
+            conn.execute("UPDATE entries SET data = CAST(replace(CAST(data AS TEXT), '1', '9') AS BLOB)")
+
+        with pytest.raises(ValueError, match="L2 cache HMAC mismatch"):
+            SecureCache(tmp_path).get("k")
+
+
+class TestMigration:
+    def test_migrates_legacy_files(self, tmp_path, clock):
+        write_legacy(tmp_path, "fresh", {"a": [1, 2]}, clock[0] - 10)
+        write_legacy(tmp_path, "stale", 1, clock[0] - 10 * 86400)
+        (tmp_path / "broken.json").write_text("{not json")
+        forged = write_legacy(tmp_path, "forged", "x", clock[0], hmac_key=b"other")
+
+        counts = migrate_file_cache(tmp_path, remove=True)
+
+        assert counts == {"imported": 2, "expired": 1, "invalid": 1}
+        assert list(tmp_path.glob("*.json")) == []
+        cache = SecureCache(tmp_path)
+        assert cache.get("fresh") == {"a": [1, 2]}
+        assert cache.get("stale") is None
+        with pytest.raises(ValueError, match="HMAC mismatch"):
+            cache.get("forged")
+        assert not forged.exists()
+
+    def test_cli_keep(self, tmp_path, capsys):
+        import time
+
+        path = write_legacy(tmp_path, "k", "v", time.time())
+
+        assert main(["migrate", str(tmp_path), "--keep"]) == 0
+
+        assert "imported=1" in capsys.readouterr().out
+        assert path.exists()
+        assert SecureCache(tmp_path).get("k") == "v"
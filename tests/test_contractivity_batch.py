@@ -0,0 +1,175 @@
+"""
+Batched IR→IC refinement and life/death gates match the scalar equations
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from penin.math.ir_ic_contractivity import (
+    RISK_DIMS,
+    RiskProfile,
+    apply_Lpsi_operator,
+    apply_Lpsi_operator_batch,
+    check_contractivity,
+    compute_risk_entropy,
+    compute_risk_entropy_batch,
+    contractivity_batch,
+    iterative_refinement,
+    iterative_refinement_batch,
+    risk_matrix,
+)
+from penin.math.vida_morte_gates import (
+    GateDecision,
+    death_gate,
+    death_gate_batch,
+    life_gate_lyapunov,
+    life_gate_lyapunov_batch,
+    life_gate_trajectory,
+)
+
+TOL = 1e-12
+
+
+def reference_entropy(rp: RiskProfile, epsilon: float = 1e-9) -> float:
+    """Loop implementation the batch kernel replaced"""
+    risks = [getattr(rp, name) for name in RISK_DIMS[:-1]] + [1.0 - rp.transparency]
+    total = sum(risks) + epsilon
+    probs = [r / total for r in risks]
+    return -sum(p * math.log2(max(epsilon, p)) for p in probs if p > epsilon)
+
+
+def reference_refinement(rp: RiskProfile, rho: float, max_iterations: int, threshold: float):
+    current, H_prev = rp, reference_entropy(rp)
+    for iteration in range(max_iterations):
+        values = {name: getattr(current, name) * rho for name in RISK_DIMS[:-1]}
+        transparency = min(1.0, current.transparency / rho)
+        aggregate = (sum(values.values()) + (1.0 - transparency)) / 9.0
+        current = RiskProfile(**values, transparency=transparency, aggregate=aggregate)
+        H = reference_entropy(current)
+        if abs(H - H_prev) < threshold:
+            return current, iteration + 1, True
+        H_prev = H
+    return current, max_iterations, False
+
+
+def random_profiles(n: int, seed: int = 0) -> list[RiskProfile]:
+    rng = np.random.default_rng(seed)
+    rows = rng.uniform(0.0, 0.6, size=(n, len(RISK_DIMS)))
+    rows[:, -1] = rng.uniform(0.3, 1.0, n)
+    rows[: n // 10, 4] = 0.0  # zero categories hit the p > ε filter
+    return [RiskProfile(*row, aggregate=0.0) for row in rows.tolist()]
+
+
+class TestRiskKernels:
+    def setup_method(self):
+        self.profiles = random_profiles(300)
+        self.risks = risk_matrix(self.profiles)
+
+    def test_entropy_matches_reference(self):
+        batch = compute_risk_entropy_batch(self.risks)
+
+        expected = [reference_entropy(p) for p in self.profiles]
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=TOL)
+        assert compute_risk_entropy(self.profiles[0]) == pytest.approx(expected[0], abs=TOL)
+
+    def test_lpsi_matches_scalar_with_policies(self):
+        policies = {"privacy": 0.5, "bias": 0.7}
+        refined, aggregate = apply_Lpsi_operator_batch(self.risks, 0.85, policies)
+
+        for row, agg, profile in zip(refined, aggregate, self.profiles, strict=True):
+            scalar = apply_Lpsi_operator(profile, 0.85, policies)
+            np.testing.assert_allclose(row, risk_matrix([scalar])[0], rtol=0, atol=TOL)
+            assert agg == pytest.approx(scalar.aggregate, abs=TOL)
+        assert refined[0, RISK_DIMS.index("privacy_violation")] == pytest.approx(
+            0.5 * self.risks[0, RISK_DIMS.index("privacy_violation")]
+        )
+
+    def test_refinement_matches_reference_per_candidate(self):
+        rho = np.where(np.arange(len(self.risks)) % 2, 0.9, 0.6)
+
+        result = iterative_refinement_batch(self.risks, rho, max_iterations=12, convergence_threshold=1e-3)
+
+        for i, profile in enumerate(self.profiles):
+            ref, iters, ok = reference_refinement(profile, rho[i], 12, 1e-3)
+            assert (result.iterations[i], result.converged[i]) == (iters, ok)
+            np.testing.assert_allclose(result.risks[i], risk_matrix([ref])[0], rtol=0, atol=TOL)
+            assert result.aggregate[i] == pytest.approx(ref.aggregate, abs=TOL)
+            assert result.entropy[i] == pytest.approx(reference_entropy(ref), abs=1e-9)
+        assert len(set(result.iterations.tolist())) > 1  # candidates exit at different steps
+
+    def test_scalar_wrapper_and_zero_iterations(self):
+        profile = self.profiles[3]
+
+        refined, iters, ok = iterative_refinement(profile, rho=0.9, max_iterations=5)
+        ref, ref_iters, ref_ok = reference_refinement(profile, 0.9, 5, 1e-3)
+
+        assert (iters, ok) == (ref_iters, ref_ok) and isinstance(ok, bool)
+        assert refined.aggregate == pytest.approx(ref.aggregate, abs=TOL)
+        assert iterative_refinement(profile, rho=0.9, max_iterations=0) == (profile, 0, False)
+
+    def test_contractivity_batch(self):
+        contractive, H0, H1 = contractivity_batch(self.risks, 0.85)
+
+        for i, profile in enumerate(self.profiles[:50]):
+            H_refined = compute_risk_entropy(apply_Lpsi_operator(profile, 0.85))
+            assert contractive[i] == check_contractivity(H_refined, H0[i], 0.85)
+            assert H1[i] == pytest.approx(H_refined, abs=TOL)
+
+    @pytest.mark.parametrize("rho", [1.0, np.array([0.5, 1.2])])
+    def test_non_contractive_rho_rejected(self, rho):
+        with pytest.raises(ValueError, match=r"must be < 1\.0"):
+            apply_Lpsi_operator_batch(self.risks[:2], rho)
+
+    def test_shape_checked(self):
+        with pytest.raises(ValueError, match="shape"):
+            compute_risk_entropy_batch(np.ones((3, 4)))
+
+
+class TestGateBatches:
+    def test_death_gate_population(self):
+        rng = np.random.default_rng(1)
+        delta = np.concatenate([rng.normal(0.01, 0.01, 500), [0.01, 0.01 - 1e-13]])
+
+        for strict in (True, False):
+            mask = death_gate_batch(delta, 0.01, strict)
+            expected = [death_gate(float(d), 0.01, strict).passed for d in delta]
+            assert mask.tolist() == expected
+
+        result = death_gate(0.008, 0.01)
+        assert result.passed is False and result.decision == GateDecision.ROLLBACK
+
+    def test_life_gate_population(self):
+        rng = np.random.default_rng(2)
+        V_prev, V_cur = rng.random(500), rng.random(500)
+        V_cur[:5] = V_prev[:5] + 5e-7  # inside tolerance
+
+        passed, dV_dt = life_gate_lyapunov_batch(V_cur, V_prev, dt=0.5)
+
+        for i in range(500):
+            scalar = life_gate_lyapunov(float(V_cur[i]), float(V_prev[i]), dt=0.5)
+            assert passed[i] == scalar.passed and dV_dt[i] == scalar.dV_dt
+        assert life_gate_lyapunov(0.85, 0.92).passed is True
+
+    def test_trajectories_by_differencing(self):
+        rng = np.random.default_rng(3)
+        V = np.cumsum(-rng.random((200, 30)) * 0.01, axis=1) + 1.0
+        V[::7, 20] += 0.05  # one uphill step on some trajectories
+        t = np.cumsum(rng.uniform(0.5, 2.0, 30))
+
+        ok, steps, dV_dt = life_gate_trajectory(V, t=t)
+
+        assert steps.shape == dV_dt.shape == (200, 29)
+        for i in (0, 1, 7):
+            scalar = [
+                life_gate_lyapunov(V[i, k + 1], V[i, k], dt=t[k + 1] - t[k]) for k in range(29)
+            ]
+            assert steps[i].tolist() == [r.passed for r in scalar]
+            np.testing.assert_allclose(dV_dt[i], [r.dV_dt for r in scalar], rtol=0, atol=TOL)
+            assert ok[i] == all(r.passed for r in scalar)
+        assert not ok[::7].any() and ok[1:7].all()
+
+    def test_trajectory_needs_two_points(self):
+        with pytest.raises(ValueError):
+            life_gate_trajectory(np.ones((3, 1)))
@@ -0,0 +1,197 @@
+"""
+Batched kernels of the equations package match their scalar counterparts
+"""
+
+import numpy as np
+import pytest
+
+from penin.equations.acfa_epv import (
+    Action,
+    EPVConfig,
+    State,
+    compute_q_values,
+    compute_q_values_batch,
+    expected_possession_value,
+    expected_possession_value_batch,
+    state_values,
+)
+from penin.equations.omega_sea_total import (
+    OmegaSEAConfig,
+    diagnose_bottleneck,
+    diagnose_bottleneck_batch,
+    omega_sea_coherence,
+    omega_sea_coherence_batch,
+)
+from penin.equations.penin_equation import (
+    ControlPolicy,
+    Evidence,
+    GradientMethod,
+    PeninState,
+    estimate_gradient,
+    estimate_gradient_batch,
+    rowwise_objective,
+)
+
+TOL = 1e-9
+
+
+class TestEPVBatch:
+    def setup_method(self):
+        rng = np.random.default_rng(0)
+        self.n_states, self.n_actions = 6, 4
+        self.states = [
+            State(config={"i": i}, metrics={"linf": float(v)}, timestamp=0.0)
+            for i, v in enumerate(rng.random(self.n_states))
+        ]
+        self.actions = [Action("param_update", {"k": a}, 0.1) for a in range(self.n_actions)]
+        self.rewards = rng.normal(size=(self.n_states, self.n_actions))
+        probs = rng.random((self.n_states, self.n_actions, self.n_states))
+        self.transitions = probs / probs.sum(axis=2, keepdims=True)
+        self.config = EPVConfig(gamma=0.9)
+
+    def reward_fn(self, state, action):
+        return self.rewards[state.config["i"], action.delta["k"]]
+
+    def transition_fn(self, state, action):
+        row = self.transitions[state.config["i"], action.delta["k"]]
+        return list(zip(self.states, row, strict=True))
+
+    def test_dense_tensor_matches_scalar(self):
+        batch = expected_possession_value_batch(
+            self.rewards, self.transitions, state_values(self.states), self.config
+        )
+
+        for s, state in enumerate(self.states):
+            scalar = expected_possession_value(
+                state, self.actions, self.reward_fn, self.transition_fn, self.config
+            )
+            np.testing.assert_allclose(
+                batch[s], [scalar[a] for a in self.actions], rtol=0, atol=TOL
+            )
+
+    def test_q_table_and_greedy_backup(self):
+        q, v, greedy = compute_q_values_batch(
+            self.rewards, self.transitions, state_values(self.states), self.config
+        )
+
+        state = self.states[2]
+        scalar = compute_q_values(
+            state, self.actions, self.reward_fn, self.transition_fn, self.config
+        )
+        np.testing.assert_allclose(
+            q[2], [scalar[(state, a)] for a in self.actions], rtol=0, atol=TOL
+        )
+        np.testing.assert_array_equal(v, q.max(axis=1))
+        np.testing.assert_array_equal(greedy, q.argmax(axis=1))
+
+    def test_gathered_successors(self):
+        rng = np.random.default_rng(1)
+        probs = rng.dirichlet(np.ones(3), size=(100,))
+        values = rng.random((100, 3))
+        rewards = rng.random(100)
+
+        batch = expected_possession_value_batch(rewards, probs, values)
+
+        expected = [
+            r + 0.95 * sum(p * v for p, v in zip(pr, vr, strict=True))
+            for r, pr, vr in zip(rewards, probs, values, strict=True)
+        ]
+        np.testing.assert_allclose(batch, expected, rtol=0, atol=TOL)
+
+    def test_shape_mismatch_rejected(self):
+        with pytest.raises(ValueError):
+            expected_possession_value_batch(self.rewards, self.transitions, np.ones(3))
+
+
+class TestCoherenceBatch:
+    def test_matches_scalar(self):
+        config = OmegaSEAConfig()
+        modules = list(config.module_weights)
+        rng = np.random.default_rng(2)
+        scores = rng.uniform(0.6, 1.0, size=(200, len(modules)))
+        scores[:5, 3] = 0.0  # epsilon floor
+
+        G, passed = omega_sea_coherence_batch(scores)
+        names, worst = diagnose_bottleneck_batch(scores)
+
+        for row, G_row, pass_row, name, low in zip(scores, G, passed, names, worst, strict=True):
+            G_ref, pass_ref = omega_sea_coherence(dict(zip(modules, row, strict=True)))
+            name_ref, low_ref = diagnose_bottleneck(dict(zip(modules, row, strict=True)))
+            assert abs(G_row - G_ref) <= TOL and pass_row == pass_ref
+            assert name == name_ref and low == low_ref
+        assert passed.any() and not passed.all()
+
+    def test_column_order_and_extra_modules(self):
+        config = OmegaSEAConfig()
+        modules = ["extra", *reversed(list(config.module_weights))]
+        scores = np.linspace(0.5, 1.0, 2 * len(modules)).reshape(2, -1)
+
+        G, _ = omega_sea_coherence_batch(scores, modules)
+
+        for row, G_row in zip(scores, G, strict=True):
+            G_ref, _ = omega_sea_coherence(dict(zip(modules, row, strict=True)))
+            assert abs(G_row - G_ref) <= TOL
+
+    @pytest.mark.parametrize("bad", [1.2, -0.1, np.nan])
+    def test_invalid_scores_rejected(self, bad):
+        scores = np.full((3, 8), 0.9)
+        scores[1, 4] = bad
+
+        with pytest.raises(ValueError, match="must be in"):
+            omega_sea_coherence_batch(scores)
+
+    def test_missing_module_rejected(self):
+        modules = list(OmegaSEAConfig().module_weights)[:-1]
+
+        with pytest.raises(ValueError, match="Missing required modules"):
+            omega_sea_coherence_batch(np.full((2, len(modules)), 0.9), modules)
+
+
+TARGET = np.linspace(-1.0, 1.0, 24)
+
+
+def objective(state, evidence):
+    return -float(np.sum((state.parameters - TARGET) ** 2)) + 0.1 * float(np.sum(np.sin(state.parameters)))
+
+
+def objective_batch(rows, evidence):
+    return -np.sum((rows - TARGET) ** 2, axis=1) + 0.1 * np.sum(np.sin(rows), axis=1)
+
+
+class TestGradientBatch:
+    def setup_method(self):
+        self.state = PeninState(parameters=np.random.default_rng(3).random(24))
+        self.evidence = Evidence()
+        self.policy = ControlPolicy()
+
+    @pytest.mark.parametrize(
+        "method",
+        [GradientMethod.FINITE_DIFFERENCE, GradientMethod.EVOLUTION_STRATEGY, GradientMethod.ANALYTICAL],
+    )
+    @pytest.mark.parametrize("batch_size", [0, 5])
+    def test_matches_scalar_with_same_seed(self, method, batch_size):
+        np.random.seed(7)
+        scalar = estimate_gradient(self.state, self.evidence, self.policy, objective, method)
+        np.random.seed(7)
+        batch = estimate_gradient_batch(
+            self.state, self.evidence, self.policy, objective_batch, method, batch_size=batch_size
+        )
+
+        np.testing.assert_allclose(batch, scalar, rtol=0, atol=TOL)
+
+    def test_rowwise_adapter_and_no_state_clones(self, monkeypatch):
+        clones = []
+        original = PeninState.clone
+        monkeypatch.setattr(PeninState, "clone", lambda self: clones.append(1) or original(self))
+        adapter = rowwise_objective(objective, self.state)
+        clones.clear()
+
+        grad = estimate_gradient_batch(
+            self.state, self.evidence, self.policy, adapter, GradientMethod.EVOLUTION_STRATEGY,
+            rng=np.random.default_rng(0),
+        )
+
+        assert clones == [] and grad.shape == self.state.parameters.shape
+        # Ascent direction for the concave objective
+        step = self.state.parameters + 0.05 * grad
+        assert objective_batch(step[None], None)[0] > objective_batch(self.state.parameters[None], None)[0]
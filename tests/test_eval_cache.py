@@ -0,0 +1,135 @@
+"""
+Tests for the persistent evaluation cache
+"""
+
+import asyncio
+
+from penin.omega.eval_cache import EvaluationCache
+from penin.omega.evaluators import EvaluationResult, TaskBattery, TaskBatteryConfig
+
+
+def _counting_model():
+    calls = []
+
+    def model_fn(input_text: str) -> str:
+        calls.append(input_text)
+        return "42 is the answer, alice, pangram pattern"
+
+    return model_fn, calls
+
+
+def _result(task_id: str = "t1", failed: bool = False) -> EvaluationResult:
+    evidence = {"task_type": "x"}
+    if failed:
+        evidence["failed"] = True
+    return EvaluationResult(
+        task_id=task_id,
+        metric_type="U",
+        score=0.0 if failed else 1.0,
+        raw_metrics={},
+        evidence=evidence,
+        latency_ms=1.0,
+        cost_usd=0.001,
+    )
+
+
+class TestEvaluationCache:
+    def test_put_get_roundtrip(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        task = {"id": "t1", "type": "x", "input": "q"}
+
+        assert cache.get("cfg", "U", "1", task) is None
+        cache.put("cfg", "1", task, _result())
+        hit = cache.get("cfg", "U", "1", task)
+
+        assert hit.score == 1.0
+        assert hit.evidence["cached"] is True
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+
+    def test_task_change_invalidates(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        task = {"id": "t1", "type": "x", "input": "q"}
+        cache.put("cfg", "1", task, _result())
+
+        changed = {**task, "input": "a different question"}
+        assert cache.get("cfg", "U", "1", changed) is None
+        assert cache.stats.invalidated == 1
+        assert len(cache) == 0
+
+    def test_version_and_ttl(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db", ttl_s=0.0)
+        task = {"id": "t1", "type": "x", "input": "q"}
+        cache.put("cfg", "1", task, _result())
+
+        assert cache.get("cfg", "U", "2", task) is None
+        assert cache.get("cfg", "U", "1", task) is None
+        assert cache.stats.expired == 1
+
+    def test_failed_results_not_cached(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        task = {"id": "t1", "type": "x", "input": "q"}
+
+        assert cache.put("cfg", "1", task, _result(failed=True)) is False
+        assert len(cache) == 0
+
+    def test_invalidate_filters(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        for cfg in ("a", "b"):
+            for tid in ("t1", "t2"):
+                cache.put(cfg, "1", {"id": tid}, _result(tid))
+
+        assert cache.invalidate(config_hash="a") == 2
+        assert cache.invalidate(task_id="t1") == 1
+        assert len(cache) == 1
+
+    def test_persists_across_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        task = {"id": "t1", "type": "x", "input": "q"}
+        EvaluationCache(path).put("cfg", "1", task, _result())
+
+        assert EvaluationCache(path).get("cfg", "U", "1", task) is not None
+
+
+class TestTaskBatteryWithCache:
+    def test_second_cycle_is_free(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        battery = TaskBattery(TaskBatteryConfig(max_tasks_per_metric=2), cache=cache)
+        model_fn, calls = _counting_model()
+
+        first = battery.evaluate_all_metrics(model_fn, config_hash="cfg")
+        n_calls = len(calls)
+        cache.begin_cycle()
+        second = battery.evaluate_all_metrics(model_fn, config_hash="cfg")
+
+        assert n_calls > 0
+        assert len(calls) == n_calls
+        assert cache.cycle_stats.hit_rate == 1.0
+        assert second["aggregate_scores"] == first["aggregate_scores"]
+
+    def test_population_hits_cost_nothing(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        battery = TaskBattery(TaskBatteryConfig(max_tasks_per_metric=2), cache=cache)
+        model_fn, calls = _counting_model()
+        model_fns = {"a": model_fn, "b": model_fn}
+        hashes = {"a": "cfg-a", "b": "cfg-b"}
+
+        first = asyncio.run(battery.aevaluate_population(model_fns, config_hashes=hashes))
+        n_calls = len(calls)
+        second = asyncio.run(battery.aevaluate_population(model_fns, config_hashes=hashes))
+
+        assert len(calls) == n_calls
+        assert first["a"]["cost_usd"] > 0
+        assert second["a"]["cost_usd"] == 0.0
+        assert second["a"]["complete"] is True
+
+    def test_no_config_hash_bypasses_cache(self, tmp_path):
+        cache = EvaluationCache(tmp_path / "cache.db")
+        battery = TaskBattery(cache=cache)
+        model_fn, _ = _counting_model()
+
+        battery.evaluate_all_metrics(model_fn)
+
+        assert len(cache) == 0
+        assert cache.stats.misses == 0
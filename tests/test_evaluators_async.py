@@ -0,0 +1,201 @@
+"""
+Tests for concurrent TaskBattery evaluation
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from penin.omega.evaluators import TaskBattery, TaskBatteryConfig
+
+
+def _make_model(answer: str, delay_s: float = 0.0):
+    async def model_fn(input_text: str) -> str:
+        if delay_s:
+            await asyncio.sleep(delay_s)
+        return answer
+
+    return model_fn
+
+
+def _sync_model(input_text: str) -> str:
+    return "42 is the answer because of the pattern"
+
+
+class FlakyCache:
+    """Evaluation cache whose writes fail for the ``bad`` config hash"""
+
+    def get(self, config_hash, *args):
+        return None
+
+    def put(self, config_hash, *args):
+        if config_hash == "bad":
+            raise OSError("cache disk full")
+
+
+class TestAsyncTaskBattery:
+    def test_async_matches_sync_scores(self):
+        battery = TaskBattery(TaskBatteryConfig(max_tasks_per_metric=3))
+
+        sync_result = battery.evaluate_all_metrics(_sync_model)
+        async_result = asyncio.run(battery.aevaluate_all_metrics(_sync_model))
+
+        for metric in ("U", "S", "L"):
+            assert (
+                async_result["aggregate_scores"][metric]
+                == sync_result["aggregate_scores"][metric]
+            )
+        assert async_result["complete"] is True
+        assert async_result["pruned"] is False
+
+    def test_wall_time_scales_with_concurrency(self):
+        config = TaskBatteryConfig(
+            max_tasks_per_metric=2, max_concurrency=64, early_stop_dominated=False
+        )
+        battery = TaskBattery(config)
+        model_fns = {f"c{i}": _make_model("42", delay_s=0.05) for i in range(8)}
+
+        start = time.perf_counter()
+        results = asyncio.run(battery.aevaluate_population(model_fns))
+        elapsed = time.perf_counter() - start
+
+        # 8 challengers x 8 tasks at 50ms each would take >3s serially
+        assert elapsed < 1.0
+        assert set(results) == set(model_fns)
+        assert all(r["complete"] for r in results.values())
+
+    def test_concurrency_limit_respected(self):
+        in_flight = 0
+        peak = 0
+
+        async def model_fn(input_text: str) -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return "42"
+
+        battery = TaskBattery(
+            TaskBatteryConfig(max_concurrency=3, early_stop_dominated=False)
+        )
+        asyncio.run(battery.aevaluate_population({"a": model_fn, "b": model_fn}))
+
+        # The limit holds per model call, including a stability task's runs
+        assert peak == 3
+
+    def test_sync_model_runs_in_worker_threads(self):
+        threads = set()
+
+        def blocking_model(input_text: str) -> str:
+            threads.add(threading.get_ident())
+            time.sleep(0.05)
+            return "42"
+
+        battery = TaskBattery(
+            TaskBatteryConfig(max_tasks_per_metric=1, max_concurrency=4, early_stop_dominated=False)
+        )
+        start = time.perf_counter()
+        results = asyncio.run(battery.aevaluate_population({"a": blocking_model, "b": blocking_model}))
+        elapsed = time.perf_counter() - start
+
+        # 12 calls at 50ms would take 0.6s on the event loop thread
+        assert elapsed < 0.4
+        assert threading.get_ident() not in threads
+        assert all(r["complete"] for r in results.values())
+
+    def test_cost_budget_stops_new_jobs(self):
+        battery = TaskBattery(
+            TaskBatteryConfig(max_concurrency=1, cost_budget_usd=0.002)
+        )
+        results = asyncio.run(
+            battery.aevaluate_population(
+                {"a": _make_model("42"), "b": _make_model("42")},
+                early_stop_dominated=False,
+            )
+        )
+
+        assert any(r["budget_exhausted"] for r in results.values())
+        assert not all(r["complete"] for r in results.values())
+        assert sum(r["cost_usd"] for r in results.values()) < 0.01
+
+    def test_cost_budget_checked_per_call(self):
+        battery = TaskBattery(TaskBatteryConfig(max_concurrency=2, cost_budget_usd=0.002))
+        results = asyncio.run(
+            battery.aevaluate_population(
+                {"a": _make_model("42", 0.01), "b": _make_model("42", 0.01)},
+                early_stop_dominated=False,
+            )
+        )
+
+        # Queued calls are refused once the budget is spent; only calls
+        # already in flight (at most max_concurrency tasks) overshoot it
+        spent = sum(r["cost_usd"] for r in results.values())
+        assert 0.002 <= spent <= 0.002 + 2 * 0.001 + 1e-12
+        assert all(r["budget_exhausted"] for r in results.values())
+
+    def test_job_error_isolated_to_its_challenger(self):
+        battery = TaskBattery(TaskBatteryConfig(max_tasks_per_metric=1), cache=FlakyCache())
+        results = asyncio.run(
+            battery.aevaluate_population(
+                {"good": _make_model("42"), "bad": _make_model("42")},
+                early_stop_dominated=False,
+                config_hashes={"good": "good", "bad": "bad"},
+            )
+        )
+
+        assert results["bad"]["error"] == "cache disk full"
+        assert results["bad"]["complete"] is False
+        assert "error" not in results["good"] and results["good"]["complete"] is True
+
+    def test_dominated_challenger_is_pruned(self):
+        async def failing_model(input_text: str) -> str:
+            raise RuntimeError("model down")
+
+        battery = TaskBattery(TaskBatteryConfig(max_concurrency=1))
+        results = asyncio.run(
+            battery.aevaluate_population(
+                {
+                    "good": _make_model("42 is the pattern answer: alice, pangram"),
+                    "bad": failing_model,
+                }
+            )
+        )
+
+        assert results["bad"]["pruned"] is True
+        assert results["bad"]["complete"] is False
+        assert results["good"]["pruned"] is False
+        assert results["good"]["complete"] is True
+
+    def test_timeout_scores_zero(self):
+        battery = TaskBattery(
+            TaskBatteryConfig(max_tasks_per_metric=1, timeout_seconds=0.01)
+        )
+        result = asyncio.run(
+            battery.aevaluate_all_metrics(_make_model("42", delay_s=0.2))
+        )
+
+        assert result["overall_score"] == 0.0
+        assert result["detailed_results"]["U"][0].raw_metrics["error"]
+
+    def test_invalid_concurrency(self):
+        battery = TaskBattery()
+        with pytest.raises(ValueError, match="max_concurrency"):
+            asyncio.run(
+                battery.aevaluate_population({"a": _sync_model}, max_concurrency=0)
+            )
+
+    def test_task_rounds_cover_battery(self):
+        battery = TaskBattery(TaskBatteryConfig(max_tasks_per_metric=3))
+        rounds = battery.task_rounds()
+
+        # Utility has 3 default tasks, the other metrics 2
+        assert len(rounds) == 3
+        assert [ev.metric_type for ev, _ in rounds[0]] == ["U", "S", "C", "L"]
+        assert [ev.metric_type for ev, _ in rounds[2]] == ["U"]
+
+        results = asyncio.run(battery.aevaluate_tasks(_sync_model, rounds[0]))
+        assert [r.metric_type for r in results] == ["U", "S", "C", "L"]
+
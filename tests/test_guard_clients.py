@@ -0,0 +1,150 @@
+"""
+Tests for the async/in-process Σ-Guard and SR-Ω∞ clients
+"""
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from penin.guard.sigma_guard_service import app as guard_app
+from penin.meta import omega_meta_service
+from penin.meta.guard_client import (
+    AsyncGuardClient,
+    AsyncSRClient,
+    LocalGuardClient,
+    LocalSRClient,
+    get_async_pool,
+)
+
+try:
+    from penin.sr.sr_service import app as sr_app
+except ImportError:
+    sr_app = None
+
+GOOD = {"rho": 0.9, "ece": 0.005, "rho_bias": 1.0, "consent": True, "eco_ok": True}
+BAD = {**GOOD, "rho": 1.2}
+PROBE = {"ece": 0.006, "rho": 0.95, "risk": 0.2, "dlinf_dc": 1.0}
+
+
+def _asgi_client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app))
+
+
+class TestGuardService:
+    def test_batch_matches_single(self):
+        c = TestClient(guard_app)
+        batch = c.post("/sigma_guard/eval_batch", json={"items": [GOOD, BAD]}).json()
+
+        assert batch["results"] == [
+            c.post("/sigma_guard/eval", json=GOOD).json(),
+            c.post("/sigma_guard/eval", json=BAD).json(),
+        ]
+        assert [r["allow"] for r in batch["results"]] == [True, False]
+
+
+class TestAsyncClients:
+    def test_guard_client_over_http(self):
+        async def run():
+            async with _asgi_client(guard_app) as http:
+                client = AsyncGuardClient("http://guard", client=http)
+                return (
+                    await client.health(),
+                    await client.eval(GOOD),
+                    await client.eval_batch([GOOD, BAD]),
+                )
+
+        healthy, single, batch = asyncio.run(run())
+
+        assert healthy is True
+        assert single["allow"] is True
+        assert [r["allow"] for r in batch] == [True, False]
+
+    @pytest.mark.skipif(sr_app is None, reason="SR service app unavailable")
+    def test_sr_client_matches_local(self):
+        async def run():
+            async with _asgi_client(sr_app) as http:
+                client = AsyncSRClient("http://sr", client=http)
+                remote = await client.eval(**PROBE)
+                batch = await client.eval_batch([PROBE, {**PROBE, "rho": 1.1}])
+            local = await LocalSRClient().eval(**PROBE)
+            return remote, batch, local
+
+        remote, batch, local = asyncio.run(run())
+
+        assert remote == local
+        assert remote["R"] >= 0.80
+        assert batch[1]["ethics_ok"] is False
+
+    def test_retries_then_succeeds(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            if len(attempts) < 3:
+                return httpx.Response(503)
+            return httpx.Response(200, json={"allow": True, "reasons": {}})
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                client = AsyncGuardClient("http://guard", client=http, backoff_s=0.0)
+                return await client.eval(GOOD)
+
+        assert asyncio.run(run())["allow"] is True
+        assert len(attempts) == 3
+
+    def test_client_errors_not_retried(self):
+        attempts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            return httpx.Response(422)
+
+        async def run():
+            async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+                await AsyncGuardClient("http://guard", client=http).eval({})
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(run())
+        assert len(attempts) == 1
+
+    def test_health_false_when_unreachable(self):
+        client = AsyncGuardClient("http://127.0.0.1:9", retries=0, timeout=0.5)
+        assert asyncio.run(client.health()) is False
+
+    def test_pool_shared_per_loop(self):
+        async def pools():
+            return get_async_pool(), get_async_pool()
+
+        a, b = asyncio.run(pools())
+        c, _ = asyncio.run(pools())
+
+        assert a is b
+        assert a is not c
+
+
+class TestInProcessTransport:
+    def test_local_guard_matches_service(self):
+        c = TestClient(guard_app)
+        local = asyncio.run(LocalGuardClient().eval_batch([GOOD, BAD]))
+
+        assert local == [
+            c.post("/sigma_guard/eval", json=m).json() for m in (GOOD, BAD)
+        ]
+
+    def test_meta_promote_in_process(self, monkeypatch):
+        monkeypatch.setattr(omega_meta_service, "GUARD", LocalGuardClient())
+        monkeypatch.setattr(omega_meta_service, "SR", LocalSRClient())
+        c = TestClient(omega_meta_service.app)
+
+        health = c.get("/health").json()
+        promoted = c.post(
+            "/meta/promote/p1",
+            params={"dlinf": 0.02, "caos_plus": 1.2, "sr": 0.9},
+            json=GOOD,
+        ).json()
+
+        assert health == {"ok": True, "guard": True, "sr": True}
+        assert promoted["promoted"] is True
+        assert promoted["guard_allow"] is True
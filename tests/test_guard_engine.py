@@ -0,0 +1,222 @@
+"""
+GuardEngine: adaptive gate ordering, short-circuit, concurrency, batches
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from penin.omega.guards import (
+    GuardEngine,
+    GuardGate,
+    GuardMode,
+    GuardOrchestrator,
+    GuardRequest,
+    GuardResult,
+    GuardViolation,
+    IRtoICGuard,
+)
+
+GOOD_STATE = {
+    "ece": 0.005,
+    "rho_bias": 1.01,
+    "consent_valid": True,
+    "eco_impact": 0.2,
+    "risk_history": [1.0, 0.9, 0.8],
+}
+
+
+def outcome(name: str, passed: bool):
+    violations = [] if passed else [GuardViolation(name, "m", 1, 0, f"{name} failed")]
+    return GuardResult(passed, violations, {}, str(time.time())), violations, {"guard": name}
+
+
+class FakeGate:
+    """Gate with a fixed cost that fails when the request names it"""
+
+    def __init__(self, name: str, delay: float = 0.0):
+        self.name = name
+        self.delay = delay
+        self.calls = 0
+
+    def __call__(self, request: GuardRequest):
+        self.calls += 1
+        if self.delay:
+            time.sleep(self.delay)
+        return outcome(self.name, self.name not in request.state_dict.get("fail", ()))
+
+
+def request(*failing: str) -> GuardRequest:
+    return GuardRequest({"fail": failing}, [1.0, 0.5])
+
+
+class TestOrdering:
+    def test_short_circuit_on_first_hard_failure(self):
+        gates = {n: FakeGate(n) for n in ("a", "b", "c")}
+        engine = GuardEngine([GuardGate(n, g) for n, g in gates.items()], adaptive=False)
+
+        report = engine.run(request("a", "c"))
+
+        assert not report.passed
+        assert report.skipped == ["b", "c"] and gates["b"].calls == 0
+        assert [v.guard_name for v in report.violations] == ["a"]
+
+    def test_audit_collects_every_gate(self):
+        gates = [GuardGate(n, FakeGate(n)) for n in ("a", "b", "c")]
+        engine = GuardEngine(gates, mode=GuardMode.AUDIT)
+
+        report = engine.run(request("a", "c"))
+
+        assert report.skipped == [] and set(report.latencies) == {"a", "b", "c"}
+        assert [v.guard_name for v in report.violations] == ["a", "c"]
+
+    def test_adaptive_order_prefers_cheap_likely_failures(self):
+        slow, cheap = FakeGate("slow", 0.002), FakeGate("cheap")
+        engine = GuardEngine([GuardGate("slow", slow), GuardGate("cheap", cheap)])
+
+        for _ in range(20):
+            engine.run(request("cheap"))
+
+        assert [g.name for g in engine.plan()] == ["cheap", "slow"]
+        assert slow.calls <= 2
+        assert engine.stats["cheap"].failure_rate > 0.9
+
+    def test_static_order_and_cost_hints(self):
+        gates = [GuardGate("x", FakeGate("x"), cost_hint=1.0), GuardGate("y", FakeGate("y"))]
+
+        assert [g.name for g in GuardEngine(gates, adaptive=False).plan()] == ["x", "y"]
+        assert [g.name for g in GuardEngine(gates).plan()] == ["y", "x"]
+
+    def test_soft_gates_run_last_and_do_not_block(self):
+        engine = GuardEngine(
+            [GuardGate("soft", FakeGate("soft"), hard=False), GuardGate("hard", FakeGate("hard"))]
+        )
+
+        report = engine.run(request("soft"))
+
+        assert report.order == ["hard", "soft"]
+        assert report.passed and len(report.violations) == 1
+
+    def test_gate_exception_fails_closed(self):
+        def broken(req):
+            raise RuntimeError("metric backend down")
+
+        report = GuardEngine([GuardGate("broken", broken)]).run(request())
+
+        assert not report.passed
+        assert report.violations[0].metric == "SYSTEM_ERROR"
+        assert report.evidence["broken"]["result"] == "ERROR"
+
+    def test_duplicate_gate_rejected(self):
+        engine = GuardEngine([GuardGate("a", FakeGate("a"))])
+
+        with pytest.raises(ValueError, match="already registered"):
+            engine.add_gate(GuardGate("a", FakeGate("a")))
+
+
+class TestConcurrency:
+    def test_concurrent_gates_overlap(self):
+        gates = [GuardGate(f"g{i}", FakeGate(f"g{i}", 0.05), concurrent=True) for i in range(4)]
+
+        with ThreadPoolExecutor(4) as pool:
+            for mode in GuardMode:
+                report = GuardEngine(gates, mode=mode, executor=pool).run(request())
+                assert report.passed and len(report.latencies) == 4
+                assert report.total_latency < 0.15
+                assert all(t >= 0.05 for t in report.latencies.values())
+
+    def test_fail_closed_cancels_queued_gates(self):
+        started = []
+        lock = threading.Lock()
+
+        def gate(name, fails):
+            def check(req):
+                with lock:
+                    started.append(name)
+                time.sleep(0.02)
+                return outcome(name, not fails)
+
+            return GuardGate(name, check, concurrent=True)
+
+        gates = [gate("bad", True), *(gate(f"ok{i}", False) for i in range(6))]
+        engine = GuardEngine(gates, adaptive=False, n_workers=2)
+        try:
+            report = engine.run(request())
+        finally:
+            engine.close()
+
+        assert not report.passed and "bad" in report.results
+        assert len(started) < len(gates) and report.skipped
+
+    def test_process_pool(self):
+        engine = GuardOrchestrator(mode=GuardMode.FAIL_CLOSED).engine
+        for gate in engine.gates:
+            gate.concurrent = True
+        engine.n_workers, engine.use_processes = 2, True
+        try:
+            report = engine.run(GuardRequest(GOOD_STATE, GOOD_STATE["risk_history"]))
+        finally:
+            engine.close()
+
+        assert report.passed and set(report.results) == {"SIGMA_GUARD", "IR_TO_IC"}
+
+    @pytest.mark.parametrize("mode", list(GuardMode))
+    def test_unpicklable_gate_fails_closed(self, mode):
+        # Lambdas cannot be sent to a process pool: the future itself raises
+        gates = [
+            GuardGate("local", lambda req: outcome("local", True), concurrent=True),
+            GuardGate("ok", FakeGate("ok"), concurrent=True),
+        ]
+        engine = GuardEngine(gates, mode=mode, adaptive=False, n_workers=2, use_processes=True)
+        try:
+            report = engine.run(request())
+        finally:
+            engine.close()
+
+        assert not report.passed
+        assert report.violations[0].metric == "SYSTEM_ERROR"
+        assert report.evidence["local"]["result"] == "ERROR"
+
+
+class TestOrchestrator:
+    def test_audit_default_keeps_evidence_layout(self):
+        passed, violations, evidence = GuardOrchestrator().check_all_guards(GOOD_STATE)
+
+        assert passed and violations == []
+        assert evidence["guards_executed"] == ["SIGMA_GUARD", "IR_TO_IC"]
+        assert evidence["iric_guard"]["result"] == "PASS"
+        assert set(evidence["gate_latency_ms"]) == {"SIGMA_GUARD", "IR_TO_IC"}
+
+    def test_fail_closed_reports_skipped_guard(self):
+        orchestrator = GuardOrchestrator(mode=GuardMode.FAIL_CLOSED)
+
+        passed, _, evidence = orchestrator.check_all_guards({**GOOD_STATE, "ece": 0.5})
+
+        assert not passed
+        assert evidence["sigma_result"] == "FAIL" and evidence["iric_result"] == "SKIPPED"
+        assert "iric_guard" not in evidence
+
+    def test_batch_matches_single_checks(self):
+        states = [
+            GOOD_STATE,
+            {**GOOD_STATE, "consent_valid": False},
+            {**GOOD_STATE, "risk_history": [1.0, 1.2]},
+        ]
+        orchestrator = GuardOrchestrator(mode=GuardMode.FAIL_CLOSED)
+
+        batch = orchestrator.check_batch(states)
+
+        assert [passed for passed, _, _ in batch] == [True, False, False]
+        for state, (passed, violations, _) in zip(states, batch, strict=True):
+            single = GuardOrchestrator(mode=GuardMode.FAIL_CLOSED).check_all_guards(state)
+            assert (passed, [v.metric for v in violations]) == (single[0], [v.metric for v in single[1]])
+        summary = orchestrator.get_guard_summary()["orchestrator"]
+        assert summary["gate_stats"]["SIGMA_GUARD"]["calls"] == 3
+
+    def test_iric_short_history_is_a_failed_result(self):
+        result, violations, analysis = IRtoICGuard().check_contractive([0.5])
+
+        assert not result.passed and violations[0].metric == "HISTORY_LENGTH"
+        assert analysis["result"] == "INSUFFICIENT_DATA"
@@ -0,0 +1,80 @@
+"""
+Cold start: lazy package exports and import-time budgets
+"""
+
+import subprocess
+import sys
+
+import pytest
+
+import penin.core
+import penin.equations
+import penin.omega
+
+# Modules that must not be loaded just by importing the package facades
+HEAVY = ("numpy", "fastapi", "anthropic", "openai", "pydantic_settings", "torch")
+
+# Facades whose import must stay free of HEAVY
+FACADES = ("penin", "penin.omega", "penin.core", "penin.equations", "penin.cli")
+
+# Wall-clock import budget (seconds, best of BUDGET_RUNS fresh interpreters).
+# Generous on purpose: lazy imports take a few ms (typer ~30 ms for the CLI),
+# eager ones took seconds, so only real regressions trip it. Precise numbers
+# come from benchmarks/benchmark_import_time.py.
+IMPORT_BUDGET_S = {
+    "penin": 0.25,
+    "penin.omega": 0.25,
+    "penin.core": 0.25,
+    "penin.equations": 0.25,
+    "penin.cli": 0.5,
+}
+BUDGET_RUNS = 3
+
+
+def _loaded_heavy(module: str) -> list[str]:
+    code = f"import sys, {module}; print(' '.join(m for m in {HEAVY!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return result.stdout.split()
+
+
+def _import_seconds(module: str) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; print(time.perf_counter() - t)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return float(result.stdout)
+
+
+class TestLazyExports:
+    @pytest.mark.parametrize("module", FACADES)
+    def test_facade_does_not_load_heavy_dependencies(self, module):
+        assert _loaded_heavy(module) == []
+
+    def test_exports_resolve_on_access(self):
+        from penin.core.caos import phi_caos
+        from penin.math.sr_omega_infinity import SRComponents
+
+        assert penin.omega.phi_caos is phi_caos
+        assert penin.core.phi_caos is phi_caos
+        assert penin.equations.SRScore is SRComponents
+        assert "compute_linf_meta" in dir(penin.equations)
+
+    def test_submodules_still_reachable_as_attributes(self):
+        assert penin.omega.ledger.__name__ == "penin.omega.ledger"
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            penin.omega.does_not_exist  # noqa: B018
+
+    def test_version_is_lazy_but_available(self):
+        assert isinstance(penin.__version__, str)
+
+
+class TestImportBudget:
+    @pytest.mark.parametrize("module", sorted(IMPORT_BUDGET_S))
+    def test_import_within_budget(self, module):
+        best = min(_import_seconds(module) for _ in range(BUDGET_RUNS))
+
+        assert best < IMPORT_BUDGET_S[module], f"import {module} took {best * 1e3:.0f} ms"
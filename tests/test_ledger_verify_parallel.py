@@ -0,0 +1,187 @@
+"""
+Tests for streaming/parallel hash-chain verification of the omega ledgers
+"""
+
+import json
+import sqlite3
+import time
+import uuid
+
+import pytest
+
+from penin.omega.ledger import (
+    SQLiteWORMLedger,
+    WORMEvent,
+    WORMLedger,
+    create_run_record,
+    hash_json,
+)
+
+
+@pytest.fixture
+def events_ledger(tmp_path):
+    ledger = SQLiteWORMLedger(str(tmp_path / "events.db"))
+    for i in range(50):
+        ledger.append(WORMEvent("tick", f"c{i}", {"i": i, "label": "ç"}))
+    yield ledger
+    ledger.close()
+
+
+@pytest.fixture
+def run_ledger(tmp_path):
+    ledger = WORMLedger(tmp_path / "runs.db", tmp_path / "runs")
+    for i in range(12):
+        ledger.append_record(
+            create_run_record(provider_id=f"p{i}", metrics={"U": 0.5, "linf": i / 20}),
+            {"note": {"i": i}},
+        )
+    return ledger
+
+
+def _tamper(db_path, sql, *params):
+    with sqlite3.connect(str(db_path)) as conn:
+        conn.execute(sql, params)
+
+
+def _append_legacy_simple(db_path, etype, data):
+    """Simple-format row as written before payloads were persisted"""
+    with sqlite3.connect(str(db_path)) as conn:
+        row = conn.execute("SELECT record_hash FROM run_records ORDER BY id DESC LIMIT 1").fetchone()
+        prev = row[0] if row else "genesis"
+        record_hash = hash_json({"etype": etype, "data": data, "ts": time.time(), "prev": prev})
+        conn.execute(
+            "INSERT INTO run_records (run_id, timestamp, cycle, config_hash, provider_id, "
+            "candidate_cfg_hash, metrics_json, gates_json, decision_json, artifacts_path, "
+            "parent_run_id, prev_hash, record_hash, created_at) "
+            "VALUES (?, ?, 0, 'simple', 'unknown', 'simple', '{}', '{}', '{}', NULL, NULL, ?, ?, ?)",
+            (str(uuid.uuid4()), time.time(), prev, record_hash, time.time()),
+        )
+
+
+MODES = [
+    {"workers": 1},
+    {"workers": 2, "chunk_size": 4, "use_processes": False},
+    {"workers": 2, "chunk_size": 4, "use_processes": True},
+]
+
+
+class TestSQLiteWORMLedgerVerify:
+    @pytest.mark.parametrize("mode", MODES)
+    def test_valid_chain(self, events_ledger, mode):
+        report = events_ledger.verify_chain_report(**mode)
+
+        assert report.ok and report.error is None
+        assert report.rows == 50
+        assert report.rows_per_s > 0
+        assert events_ledger.verify_chain(**mode) == (True, None)
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_tampered_data_reported(self, events_ledger, mode):
+        _tamper(events_ledger.db_path, "UPDATE events SET data=? WHERE id=37", json.dumps({"i": -1}))
+
+        report = events_ledger.verify_chain_report(**mode)
+
+        assert report.as_tuple() == (False, "Hash mismatch at row 37")
+        assert report.failed_row == 37
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_earliest_failure_wins(self, events_ledger, mode):
+        _tamper(events_ledger.db_path, "UPDATE events SET prev='x' WHERE id=30")
+        _tamper(events_ledger.db_path, "UPDATE events SET ts=0 WHERE id=9")
+
+        assert events_ledger.verify_chain(**mode) == (False, "Hash mismatch at row 9")
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_broken_link_reported(self, events_ledger, mode):
+        _tamper(events_ledger.db_path, "UPDATE events SET prev='x' WHERE id=13")
+
+        assert events_ledger.verify_chain(**mode) == (False, "Chain break at row 13")
+
+    def test_empty_ledger(self, tmp_path):
+        ledger = SQLiteWORMLedger(str(tmp_path / "empty.db"))
+        report = ledger.verify_chain_report()
+
+        assert report.ok and report.rows == 0
+
+    def test_in_memory_ledger(self):
+        ledger = SQLiteWORMLedger(":memory:")
+        ledger.append(WORMEvent("a", "c", {"x": 1}))
+
+        assert ledger.verify_chain() == (True, None)
+
+
+class TestWORMLedgerVerify:
+    @pytest.mark.parametrize("mode", MODES)
+    def test_valid_chain_rehashes_records(self, run_ledger, mode):
+        run_ledger.append_record("simple_event", {"k": 1})
+
+        report = run_ledger.verify_chain_report(**mode)
+
+        assert report.ok, report.error
+        assert report.rows == 13
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_tampered_metrics_detected(self, run_ledger, mode):
+        row = sqlite3.connect(str(run_ledger.db_path)).execute(
+            "SELECT run_id, metrics_json FROM run_records WHERE id=6"
+        ).fetchone()
+        metrics = {**json.loads(row[1]), "linf": 0.99}
+        _tamper(run_ledger.db_path, "UPDATE run_records SET metrics_json=? WHERE id=6", json.dumps(metrics))
+
+        assert run_ledger.verify_chain_integrity(**mode) == (False, f"Hash mismatch at {row[0]}")
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_simple_marker_does_not_bypass_rehash(self, run_ledger, mode):
+        run_id = sqlite3.connect(str(run_ledger.db_path)).execute(
+            "SELECT run_id FROM run_records WHERE id=6"
+        ).fetchone()[0]
+        _tamper(
+            run_ledger.db_path,
+            "UPDATE run_records SET config_hash='simple', candidate_cfg_hash='simple' WHERE id=6",
+        )
+
+        assert run_ledger.verify_chain_integrity(**mode) == (False, f"Hash mismatch at {run_id}")
+
+    def test_tampered_simple_payload_detected(self, run_ledger):
+        run_ledger.append_record("simple_event", {"k": 1})
+        row = sqlite3.connect(str(run_ledger.db_path)).execute(
+            "SELECT run_id, metrics_json FROM run_records WHERE id=13"
+        ).fetchone()
+        payload = {**json.loads(row[1]), "data": {"k": 2}}
+        _tamper(run_ledger.db_path, "UPDATE run_records SET metrics_json=? WHERE id=13", json.dumps(payload))
+
+        assert run_ledger.verify_chain_integrity() == (False, f"Hash mismatch at {row[0]}")
+
+    @pytest.mark.parametrize("mode", MODES)
+    def test_legacy_simple_rows_still_verify(self, tmp_path, mode):
+        db_path = tmp_path / "legacy.db"
+        WORMLedger(db_path, tmp_path / "runs")  # creates the schema
+        for i in range(3):
+            _append_legacy_simple(db_path, "legacy_event", {"i": i})
+
+        ledger = WORMLedger(db_path, tmp_path / "runs")
+        ledger.append_record(create_run_record(provider_id="p", metrics={"U": 0.5}))
+        ledger.append_record("simple_event", {"k": 1})
+
+        assert ledger.verify_chain_integrity(**mode) == (True, None)
+
+    def test_legacy_shape_is_exact(self, tmp_path):
+        db_path = tmp_path / "legacy.db"
+        ledger = WORMLedger(db_path, tmp_path / "runs")
+        _append_legacy_simple(db_path, "legacy_event", {})
+        run_id = sqlite3.connect(str(db_path)).execute("SELECT run_id FROM run_records").fetchone()[0]
+        _tamper(db_path, "UPDATE run_records SET decision_json=? WHERE id=1", json.dumps({"verdict": "promote"}))
+
+        assert ledger.verify_chain_integrity() == (False, f"Hash mismatch at {run_id}")
+
+    def test_broken_link_message(self, run_ledger):
+        run_id = sqlite3.connect(str(run_ledger.db_path)).execute(
+            "SELECT run_id FROM run_records WHERE id=3"
+        ).fetchone()[0]
+        _tamper(run_ledger.db_path, "UPDATE run_records SET prev_hash='x' WHERE id=3")
+
+        ok, error = run_ledger.verify_chain_integrity(workers=2, chunk_size=2)
+
+        assert not ok
+        assert error.startswith(f"Chain break at {run_id}: expected prev_hash ")
+        assert error.endswith("got x")
@@ -0,0 +1,254 @@
+"""
+Batched, parallel and SPSA gradient estimators and the multi-trajectory
+ensemble runner of the Master Equation
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+import numpy as np
+import pytest
+
+from penin.math.penin_master_equation import (
+    MasterEquationEnsemble,
+    MasterEquationState,
+    compute_phi_saturation,
+    compute_phi_saturation_batch,
+    estimate_gradient,
+    estimate_gradient_ensemble,
+    estimate_gradient_fast,
+    estimate_gradient_spsa,
+    master_equation_cycle,
+    project_to_safe_set,
+    project_to_safe_set_batch,
+)
+
+TARGET = np.linspace(-1.0, 1.0, 37)
+
+
+def loss(I, E, P):
+    return float(np.sum((I - TARGET) ** 2) + 0.1 * np.sum(I**4))
+
+
+def loss_vectorized(rows, E, P):
+    rows = np.atleast_2d(rows)
+    return np.sum((rows - TARGET) ** 2, axis=1) + 0.1 * np.sum(rows**4, axis=1)
+
+
+class CountingLoss:
+    def __init__(self, fn):
+        self.fn = fn
+        self.calls = 0
+        self.rows = 0
+
+    def __call__(self, I, E, P):
+        self.calls += 1
+        self.rows += len(np.atleast_2d(I))
+        return self.fn(I, E, P)
+
+
+@pytest.fixture
+def state():
+    return np.random.default_rng(3).normal(size=37)
+
+
+class TestBatchedFiniteDifferences:
+    @pytest.mark.parametrize("method", ["forward", "central"])
+    @pytest.mark.parametrize("batch_size", [1, 8, 1000])
+    def test_matches_loop(self, state, method, batch_size):
+        expected = estimate_gradient(state, None, {}, loss, method=method)
+        counted = CountingLoss(loss_vectorized)
+
+        batched = estimate_gradient(
+            state, None, {}, counted, method=method, batch_size=batch_size
+        )
+
+        np.testing.assert_allclose(batched, expected, rtol=1e-6, atol=1e-8)
+        rows = 38 if method == "forward" else 74
+        assert counted.rows == rows
+        assert counted.calls == -(-rows // batch_size)
+
+    def test_fast_batched_matches_fast(self, state):
+        expected = estimate_gradient_fast(state, None, {}, loss)
+        counted = CountingLoss(loss_vectorized)
+
+        batched = estimate_gradient_fast(state, None, {}, counted, batch_size=64)
+
+        np.testing.assert_allclose(batched, expected, rtol=1e-6, atol=1e-8)
+        assert counted.calls == 1
+
+    def test_parallel_non_vectorized(self, state):
+        expected = estimate_gradient(state, None, {}, loss, method="central")
+
+        threaded = estimate_gradient(state, None, {}, loss, method="central", n_workers=4)
+        with ThreadPoolExecutor(2) as pool:
+            pooled = estimate_gradient(state, None, {}, loss, executor=pool)
+
+        np.testing.assert_allclose(threaded, expected, rtol=1e-12)
+        np.testing.assert_allclose(
+            pooled, estimate_gradient(state, None, {}, loss), rtol=1e-12
+        )
+
+    def test_unknown_method(self, state):
+        with pytest.raises(ValueError):
+            estimate_gradient(state, None, {}, loss_vectorized, method="sideways", batch_size=4)
+
+
+class TestSPSA:
+    @pytest.mark.parametrize("distribution", ["rademacher", "gaussian"])
+    def test_converges_to_true_gradient(self, state, distribution):
+        exact = estimate_gradient(state, None, {}, loss, method="central")
+
+        estimate = estimate_gradient_spsa(
+            state,
+            None,
+            {},
+            loss_vectorized,
+            n_samples=4000,
+            distribution=distribution,
+            rng=0,
+            batch_size=1024,
+        )
+
+        cosine = estimate @ exact / (np.linalg.norm(estimate) * np.linalg.norm(exact))
+        assert cosine > 0.9
+
+    def test_loss_calls_independent_of_dimension(self):
+        big = np.zeros(10_000)
+        counted = CountingLoss(lambda I, E, P: float(np.sum((I - 1.0) ** 2)))
+
+        g = estimate_gradient_spsa(big, None, {}, counted, n_samples=3, rng=1)
+
+        assert counted.calls == 6
+        assert g.shape == big.shape
+        # Descent direction points toward the minimum at 1.0
+        assert g @ np.ones_like(big) > 0
+
+    def test_seeded_and_backend_independent(self, state):
+        run = partial(estimate_gradient_spsa, state, None, {}, n_samples=5, rng=42)
+
+        np.testing.assert_allclose(run(loss), run(loss_vectorized, batch_size=3), rtol=1e-9)
+        np.testing.assert_allclose(run(loss), run(loss, n_workers=3), rtol=1e-12)
+
+    def test_master_equation_cycle_accepts_estimator(self, state):
+        current = MasterEquationState(
+            I=state, n=0, alpha_n=0.0, caos_plus=0.0, sr_score=0.0, Linf=0.0
+        )
+        losses = [loss(state, None, {})]
+        rng = np.random.default_rng(0)
+        for _ in range(30):
+            current = master_equation_cycle(
+                current,
+                None,
+                {},
+                loss_vectorized,
+                alpha_0=0.1,
+                caos_plus=1.5,
+                sr_score=0.9,
+                gradient_fn=partial(estimate_gradient_spsa, n_samples=8, batch_size=16, rng=rng),
+            )
+            losses.append(loss(current.I, None, {}))
+
+        assert losses[-1] < losses[0]
+        assert current.n == 30
+
+
+class TestEnsemble:
+    def test_matches_independent_cycles(self):
+        rng = np.random.default_rng(5)
+        I0 = rng.normal(size=(6, 37))
+        alpha_0 = np.linspace(0.05, 0.3, 6)
+        bounds = {"bounds": (-0.8, 0.8), "max_norm": 3.0}
+
+        ensemble = MasterEquationEnsemble(
+            I0, None, {}, loss_vectorized, alpha_0=alpha_0, caos_plus=1.5,
+            sr_score=0.85, H_constraints=bounds,
+        )
+        summaries = list(ensemble.run(max_steps=5))
+
+        for k in range(6):
+            single = MasterEquationState(
+                I=I0[k].copy(), n=0, alpha_n=0.0, caos_plus=0.0, sr_score=0.0, Linf=0.0
+            )
+            for _ in range(5):
+                single = master_equation_cycle(
+                    single, None, {}, loss, alpha_0=alpha_0[k], caos_plus=1.5,
+                    sr_score=0.85, H_constraints=bounds,
+                )
+            np.testing.assert_allclose(ensemble.I[k], single.I, rtol=1e-6, atol=1e-9)
+
+        assert [s.n for s in summaries] == [1, 2, 3, 4, 5]
+        assert summaries[-1].loss_min == pytest.approx(ensemble.loss.min())
+        assert summaries[-1].loss_mean < summaries[0].loss_mean
+
+    def test_converged_trajectories_are_frozen(self):
+        I0 = np.stack([TARGET * 0, TARGET * 0 + 5.0])
+        calls = CountingLoss(loss_vectorized)
+
+        # alpha 0 for the first trajectory: it converges on the first step
+        ensemble = MasterEquationEnsemble(
+            I0, None, {}, calls, alpha_0=np.array([0.0, 0.05]), caos_plus=1.5,
+            sr_score=1.0, tol=1e-9,
+        )
+        first = ensemble.step()
+        rows_after_first = calls.rows
+        frozen = ensemble.I[0].copy()
+        ensemble.step()
+
+        assert first.active == 1 and first.converged == 1
+        assert ensemble.converged_at.tolist() == [1, -1]
+        np.testing.assert_array_equal(ensemble.I[0], frozen)
+        # Second step only evaluates the remaining trajectory: d FD rows + 1 loss row
+        # (the base loss of the forward differences is the previous step's loss)
+        assert calls.rows - rows_after_first == 37 + 1
+
+    def test_forward_reuses_base_losses(self):
+        I0 = np.random.default_rng(4).normal(size=(3, 37))
+
+        base = loss_vectorized(I0, None, {})
+        calls = CountingLoss(loss_vectorized)
+        known = estimate_gradient_ensemble(I0, None, {}, calls, base_losses=base)
+        full = estimate_gradient_ensemble(I0, None, {}, loss_vectorized)
+
+        assert calls.rows == 3 * 37
+        np.testing.assert_allclose(known, full, rtol=1e-12, atol=1e-9)
+
+    def test_run_stops_when_all_converged(self):
+        ensemble = MasterEquationEnsemble(
+            np.zeros((3, 4)), None, {}, lambda X, E, P: np.zeros(len(X)),
+            alpha_0=0.1, caos_plus=1.5, sr_score=1.0, tol=1e-12,
+        )
+
+        assert len(list(ensemble.run(max_steps=50))) == 1
+
+    @pytest.mark.parametrize("method", ["central", "spsa"])
+    def test_estimators_descend(self, method):
+        I0 = np.random.default_rng(9).normal(size=(20, 37))
+        ensemble = MasterEquationEnsemble(
+            I0, None, {}, loss_vectorized, alpha_0=0.02, caos_plus=1.5,
+            sr_score=0.9, gradient=method, n_samples=4, rng=0, batch_size=64,
+        )
+        start = ensemble.loss.copy()
+
+        for _ in ensemble.run(max_steps=20):
+            pass
+
+        assert np.all(ensemble.loss < start)
+
+    def test_batch_helpers_match_scalar(self):
+        rng = np.random.default_rng(2)
+        X = rng.normal(size=(8, 5)) * 3
+        H = {"bounds": (-2.0, 2.0), "max_norm": 2.5}
+
+        np.testing.assert_allclose(
+            project_to_safe_set_batch(X, H), [project_to_safe_set(x, H) for x in X]
+        )
+        clipped = project_to_safe_set_batch(X, clip_norm=1.5)
+        np.testing.assert_allclose(clipped, [project_to_safe_set(x, clip_norm=1.5) for x in X])
+        assert np.linalg.norm(clipped, axis=1).max() == pytest.approx(1.5)
+        caos = rng.uniform(1.0, 3.0, 8)
+        for mode in ("tanh", "sigmoid"):
+            np.testing.assert_allclose(
+                compute_phi_saturation_batch(caos, 0.7, mode),
+                [compute_phi_saturation(c, 0.7, mode) for c in caos],
+            )
@@ -0,0 +1,256 @@
+"""
+Tests for penin.memo (memoization with typed keys, single-flight and L2 spill)
+"""
+
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+import numpy as np
+import pytest
+
+from penin import memo as memo_mod
+from penin.cache import SecureCache
+from penin.memo import make_key, memoize, stable_key
+from penin.omega.performance import PerformanceMetrics, PerformanceOptimizer
+
+
+def counting(**memo_kwargs):
+    calls = []
+
+    @memoize(namespace=f"test.counting.{id(calls)}", **memo_kwargs)
+    def f(*args, **kwargs):
+        calls.append((args, kwargs))
+        return len(calls)
+
+    return f, calls
+
+
+class TestKeys:
+    def test_keys_are_typed(self):
+        f, calls = counting()
+
+        f(1), f(1.0), f(True), f(1)
+
+        assert len(calls) == 3
+
+    def test_arrays_keyed_by_content(self):
+        f, calls = counting()
+        a = np.arange(6, dtype=np.float64)
+
+        f(a), f(a.copy()), f(a.reshape(2, 3)), f(a.astype(np.float32))
+        a[0] = 99.0
+        f(a)
+
+        assert len(calls) == 4
+
+    def test_flat_dicts_and_kwargs(self):
+        f, calls = counting()
+
+        f({"a": 0.5, "b": 1.0}, cost=0.1)
+        f({"a": 0.5, "b": 1.0}, cost=0.1)
+        f({"a": 0.5, "b": 1.0}, cost=0.2)
+
+        assert len(calls) == 2
+
+    def test_signed_zero_and_nan_keys(self):
+        f, calls = counting()
+        nan = float("nan")
+
+        f(0.0), f(-0.0), f(nan), f(nan), f({"x": 0.0}), f({"x": -0.0}), f(-0.0)
+
+        assert len(calls) == 5
+        assert make_key((0.0,), {}) != make_key((-0.0,), {})
+        assert make_key((nan,), {}) == make_key((float("nan"),), {})
+
+    def test_stable_key_is_deterministic(self):
+        @dataclass
+        class Cfg:
+            kappa: float = 20.0
+
+        assert stable_key(Cfg(), [1, 2], x=np.ones(3)) == stable_key(
+            Cfg(), [1, 2], x=np.ones(3)
+        )
+        assert stable_key(Cfg(kappa=2.0)) != stable_key(Cfg())
+
+    def test_unencodable_arguments_bypass_cache(self):
+        f, calls = counting()
+        obj = object()
+
+        f(obj), f(obj)
+
+        assert len(calls) == 2
+        assert f.cache_info()["uncacheable"] == 2
+
+
+class TestEviction:
+    def test_lru_evicts_least_recent(self):
+        f, calls = counting(maxsize=2)
+
+        f(1), f(2), f(1), f(3)  # evicts 2
+        f(1), f(2)
+
+        assert [c[0][0] for c in calls] == [1, 2, 3, 2]
+
+    def test_lfu_keeps_frequent(self):
+        f, calls = counting(maxsize=2, policy="lfu")
+
+        f(1), f(1), f(1), f(2), f(3)  # evicts 2 (freq 1, oldest)
+        f(1), f(3), f(2)
+
+        assert [c[0][0] for c in calls] == [1, 2, 3, 2]
+        assert f.cache_info()["evictions"] == 2
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr(memo_mod.time, "monotonic", lambda: now[0])
+        f, calls = counting(ttl=5.0)
+
+        f(1)
+        now[0] += 4.0
+        f(1)
+        now[0] += 2.0
+        f(1)
+
+        assert len(calls) == 2
+        assert f.cache_info()["expired"] == 1
+
+    def test_exceptions_not_cached(self):
+        attempts = []
+
+        @memoize(namespace="test.exceptions")
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise RuntimeError("boom")
+            return x
+
+        with pytest.raises(RuntimeError):
+            flaky(1)
+        assert flaky(1) == 1
+        assert flaky(1) == 1
+        assert len(attempts) == 2
+
+
+class TestSingleFlight:
+    def test_threads_share_one_computation(self):
+        calls = []
+        barrier = threading.Barrier(8)
+
+        @memoize(namespace="test.single_flight")
+        def slow(x):
+            calls.append(x)
+            time.sleep(0.05)
+            return x * 2
+
+        results = []
+
+        def worker():
+            barrier.wait()
+            results.append(slow(21))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert results == [42] * 8
+        assert calls == [21]
+        info = slow.cache_info()
+        assert info["misses"] == 1 and info["hits"] + info["waits"] == 7
+
+    def test_async_single_flight(self):
+        calls = []
+
+        @memoize(namespace="test.async_single_flight")
+        async def probe(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return {"R": x}
+
+        async def run():
+            return await asyncio.gather(*(probe(0.9) for _ in range(5)))
+
+        results = asyncio.run(run())
+
+        assert results == [{"R": 0.9}] * 5
+        assert calls == [0.9]
+        assert asyncio.run(probe(0.9)) == {"R": 0.9}
+        assert calls == [0.9]
+
+
+class TestL2Spill:
+    def test_evicted_entries_served_from_secure_cache(self, tmp_path):
+        l2 = SecureCache(cache_dir=tmp_path)
+        f, calls = counting(maxsize=1, l2=l2)
+
+        first = f(1)
+        f(2)  # evicts f(1) to L2
+        assert f(1) == first
+
+        info = f.cache_info()
+        assert len(calls) == 2
+        assert info["spills"] >= 1 and info["l2_hits"] == 1
+
+    def test_non_json_values_not_spilled(self, tmp_path):
+        l2 = SecureCache(cache_dir=tmp_path)
+
+        @memoize(maxsize=1, l2=l2, namespace="test.l2_tuple")
+        def pair(x):
+            return (x, x)
+
+        pair(1), pair(2)
+
+        assert pair.cache_info()["spills"] == 0
+        assert pair(1) == (1, 1)
+
+
+class TestIntegration:
+    def test_performance_optimizer_cached(self):
+        optimizer = PerformanceOptimizer(max_cache_size=2)
+        calls = []
+
+        @optimizer.cached()
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        square(3), square(3), square(4)
+        stats = optimizer.get_cache_stats()
+
+        assert calls == [3, 4]
+        assert stats["cache_size"] == 2
+        assert stats["cache_hit_rate"] == pytest.approx(1 / 3)
+
+        optimizer.clear_cache()
+        square(3)
+        assert calls == [3, 4, 3]
+
+    def test_performance_optimizer_shared_cap_and_ttl(self, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(memo_mod.time, "monotonic", lambda: now[0])
+        optimizer = PerformanceOptimizer(cache_ttl=60.0, max_cache_size=3)
+
+        @optimizer.cached(ttl=5.0)
+        def short(x):
+            return x
+
+        @optimizer.cached()
+        def long(x):
+            return -x
+
+        for x in range(3):
+            short(x), long(x)
+
+        # max_cache_size bounds the entries of every decorated function together
+        assert optimizer.get_cache_stats()["cache_size"] == 3
+        assert long(2) == -2 and optimizer.metrics.cache_hits == 1
+
+        now[0] = 10.0  # past short's ttl, within the default cache_ttl
+        short(2), long(2)
+        assert optimizer.metrics.cache_hits == 2
+
+        optimizer.metrics = PerformanceMetrics()
+        assert optimizer.get_cache_stats()["cache_hit_rate"] == 0.0
@@ -0,0 +1,204 @@
+"""
+Tests for PENIN P2P binary framing and transports
+"""
+
+import asyncio
+import struct
+import time
+
+import pytest
+
+from penin.omega.sr import SROmegaService
+from penin.p2p import MemoryNetwork, MemoryTransport, MessageType, PeninNode, StreamTransport
+from penin.p2p.protocol import PeninMessage, PeninProtocol
+from penin.p2p.transport import MAX_FRAME_BYTES, FrameError, encode_frame, read_frame
+
+
+class TestBinaryCodec:
+    def test_roundtrip_matches_json(self):
+        protocol = PeninProtocol("node-001")
+        message = protocol.create_metrics_broadcast(0.8, 1.5, 0.9, 0.7, 0.01, 1.02)
+        message.signature = "sig"
+        message.reply_to = "abc123"
+
+        restored = PeninMessage.from_bytes(message.to_bytes())
+
+        assert restored == message
+        assert restored == PeninMessage.from_json(message.to_json())
+        assert len(message.to_bytes()) < len(message.to_json())
+
+    def test_unset_optional_fields_stay_none(self):
+        message = PeninProtocol("n").create_heartbeat()
+
+        restored = PeninMessage.from_bytes(message.to_bytes())
+
+        assert restored.signature is None and restored.reply_to is None
+        assert restored.msg_id == message.msg_id
+
+    def test_alias_types_share_a_code(self):
+        query = PeninProtocol("n").create_status_query("peer")
+
+        assert PeninMessage.from_bytes(query.to_bytes()).msg_type is MessageType.STATUS_REQUEST
+
+    def test_identical_messages_get_distinct_ids(self):
+        kwargs = dict(msg_type=MessageType.HEARTBEAT, sender_id="n", timestamp=1.0, payload={})
+
+        assert PeninMessage(**kwargs).msg_id != PeninMessage(**kwargs).msg_id
+
+    @pytest.mark.parametrize("cut", [3, 20, -1])
+    def test_malformed_bytes_rejected(self, cut):
+        data = PeninProtocol("n").create_heartbeat().to_bytes()
+
+        with pytest.raises(ValueError):
+            PeninMessage.from_bytes(data[:cut])
+
+    def test_frames_read_back_and_limits(self):
+        async def run():
+            reader = asyncio.StreamReader()
+            messages = [PeninProtocol("n").create_heartbeat() for _ in range(3)]
+            reader.feed_data(b"".join(encode_frame(m) for m in messages))
+            reader.feed_data(struct.pack("!I", MAX_FRAME_BYTES + 1))
+            reader.feed_eof()
+            bodies = [await read_frame(reader) for _ in range(3)]
+            with pytest.raises(FrameError):
+                await read_frame(reader)
+            return messages, bodies
+
+        messages, bodies = asyncio.run(run())
+        assert [PeninMessage.from_bytes(b) for b in bodies] == messages
+
+
+async def stream_pair(a: PeninNode, b: PeninNode):
+    ta = await StreamTransport(a).start()
+    tb = await StreamTransport(b).start()
+    await ta.connect("127.0.0.1", tb.port)
+    return ta, tb
+
+
+async def memory_pair(a: PeninNode, b: PeninNode):
+    network = MemoryNetwork()
+    ta, tb = MemoryTransport(a, network), MemoryTransport(b, network)
+    await ta.connect(b.node_id)
+    return ta, tb
+
+
+@pytest.fixture(params=[stream_pair, memory_pair], ids=["tcp", "memory"])
+def connect(request):
+    return request.param
+
+
+class TestTransports:
+    def test_handshake_and_status_query(self, connect):
+        service = SROmegaService()
+        service.add_recommendation("rec-001", "task-1", 0.85)
+        a, b = PeninNode("a"), PeninNode("b", service)
+
+        async def run():
+            ta, tb = await connect(a, b)
+            try:
+                start = time.perf_counter()
+                state = await a.query_peer_status("b", timeout=2.0)
+                elapsed = time.perf_counter() - start
+                reverse = await b.query_peer_status("a", timeout=2.0)
+                return state, reverse, elapsed
+            finally:
+                await ta.close()
+                await tb.close()
+
+        state, reverse, elapsed = asyncio.run(run())
+
+        assert state["pending_recommendations"][0]["id"] == "rec-001"
+        assert reverse is not None
+        assert elapsed < 0.05  # no polling floor
+        assert set(a.peers) == {"b"} and set(b.peers) == {"a"}
+
+    def test_concurrent_requests_correlated(self, connect):
+        a, b = PeninNode("a"), PeninNode("b")
+
+        async def echo(message):
+            await asyncio.sleep(0.001 * (5 - message.payload["i"] % 5))
+            return b.protocol.create_message(MessageType.KNOWLEDGE_ACK, dict(message.payload))
+
+        b.protocol.register_handler(MessageType.KNOWLEDGE_REQUEST, echo)
+
+        async def run():
+            ta, tb = await connect(a, b)
+            try:
+                requests = [
+                    a.protocol.create_message(MessageType.KNOWLEDGE_REQUEST, {"i": i})
+                    for i in range(50)
+                ]
+                replies = await asyncio.gather(*(ta.request("b", r) for r in requests))
+                return requests, replies
+            finally:
+                await ta.close()
+                await tb.close()
+
+        requests, replies = asyncio.run(run())
+
+        assert [r.payload["i"] for r in replies] == list(range(50))
+        assert [r.reply_to for r in replies] == [r.msg_id for r in requests]
+
+    def test_handler_error_becomes_error_reply(self, connect):
+        a, b = PeninNode("a"), PeninNode("b")
+
+        async def fail(message):
+            raise RuntimeError("no such asset")
+
+        b.protocol.register_handler(MessageType.KNOWLEDGE_REQUEST, fail)
+
+        async def run():
+            ta, tb = await connect(a, b)
+            try:
+                request = a.protocol.create_knowledge_request("asset-1", {})
+                return await ta.request("b", request, timeout=2.0)
+            finally:
+                await ta.close()
+                await tb.close()
+
+        reply = asyncio.run(run())
+
+        assert reply.msg_type == MessageType.ERROR
+        assert reply.payload["error"] == "no such asset"
+
+    def test_peer_close_fails_pending_requests(self, connect):
+        a, b = PeninNode("a"), PeninNode("b")
+
+        async def hang(message):
+            await asyncio.sleep(10)
+
+        b.protocol.register_handler(MessageType.KNOWLEDGE_REQUEST, hang)
+
+        async def run():
+            ta, tb = await connect(a, b)
+            try:
+                pending = asyncio.ensure_future(
+                    ta.request("b", a.protocol.create_knowledge_request("x", {}), timeout=5.0)
+                )
+                await asyncio.sleep(0.01)
+                await tb.close()
+                with pytest.raises(ConnectionError):
+                    await pending
+                await asyncio.sleep(0.01)
+                return ta.connection("b")
+            finally:
+                await ta.close()
+
+        assert asyncio.run(run()) is None
+
+    def test_query_without_transport_waits_for_response(self):
+        a, b = PeninNode("a"), PeninNode("b")
+
+        async def run():
+            query = asyncio.ensure_future(a.query_peer_status("b", timeout=1.0))
+            await asyncio.sleep(0)
+            response = await b.handle_message(b.protocol.create_status_query("b"))
+            start = time.perf_counter()
+            await a.handle_message(response)
+            return await query, time.perf_counter() - start, await a.query_peer_status("c", timeout=0.01)
+
+        state, elapsed, missing = asyncio.run(run())
+
+        assert state is not None and "pending_recommendations" in state
+        assert elapsed < 0.05 and missing is None
+        assert a.status_responses == {}
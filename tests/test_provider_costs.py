@@ -27,7 +27,7 @@ async def test_openai_provider_cost(monkeypatch):
     monkeypatch.setattr(openai_provider, "OpenAI", DummyClient)
     monkeypatch.setattr(openai_provider.asyncio, "to_thread", _immediate_to_thread)
 
-    provider = openai_provider.OpenAIProvider(model="gpt-4o")
+    provider = openai_provider.OpenAIProvider(model="gpt-4o", native_http=False)
     response = await provider.chat([{"role": "user", "content": "hello"}])
 
     assert response.tokens_in == 120
@@ -52,7 +52,7 @@ async def test_deepseek_provider_cost(monkeypatch):
     monkeypatch.setattr(deepseek_provider, "OpenAI", DummyClient)
     monkeypatch.setattr(deepseek_provider.asyncio, "to_thread", _immediate_to_thread)
 
-    provider = deepseek_provider.DeepSeekProvider(model="deepseek-chat")
+    provider = deepseek_provider.DeepSeekProvider(model="deepseek-chat", native_http=False)
     response = await provider.chat([{"role": "user", "content": "hello"}])
 
     assert response.tokens_in == 50
@@ -80,7 +80,7 @@ async def test_anthropic_provider_cost(monkeypatch):
     monkeypatch.setattr(anthropic_provider.anthropic, "Anthropic", lambda *a, **k: DummyClient())
     monkeypatch.setattr(anthropic_provider.asyncio, "to_thread", _immediate_to_thread)
 
-    provider = anthropic_provider.AnthropicProvider(model="claude-3-5-sonnet-20241022")
+    provider = anthropic_provider.AnthropicProvider(model="claude-3-5-sonnet-20241022", native_http=False)
     response = await provider.chat([{"role": "user", "content": "hello"}])
 
     assert response.tokens_in == 200
@@ -136,7 +136,7 @@ async def test_mistral_provider_cost(monkeypatch):
     monkeypatch.setattr(mistral_provider, "Mistral", lambda *a, **k: DummyClient())
     monkeypatch.setattr(mistral_provider.asyncio, "to_thread", _immediate_to_thread)
 
-    provider = mistral_provider.MistralProvider(model="mistral-large-latest")
+    provider = mistral_provider.MistralProvider(model="mistral-large-latest", native_http=False)
     response = await provider.chat([{"role": "user", "content": "hello"}])
 
     assert response.tokens_in == 75
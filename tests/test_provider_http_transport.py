@@ -0,0 +1,124 @@
+"""
+Tests for the pooled async HTTP transport against the local mock LLM server
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from benchmarks.mock_llm_server import MockLLMServer
+from penin.providers import anthropic_provider, deepseek_provider, mistral_provider, openai_provider
+from penin.providers.http_transport import HTTPTransportConfig
+
+MESSAGES = [{"role": "user", "content": "hello there"}]
+
+
+@pytest.fixture(scope="module")
+def server():
+    with MockLLMServer() as srv:
+        yield srv
+
+
+async def chat_and_close(provider, **kwargs):
+    try:
+        return await provider.chat(MESSAGES, **kwargs)
+    finally:
+        await provider.aclose()
+
+
+class TestNativeProviders:
+    @pytest.mark.parametrize(
+        "cls", [openai_provider.OpenAIProvider, deepseek_provider.DeepSeekProvider, mistral_provider.MistralProvider]
+    )
+    def test_openai_compatible_chat(self, server, cls, monkeypatch):
+        async def no_threads(*args, **kwargs):
+            raise AssertionError("native path must not use worker threads")
+
+        monkeypatch.setattr(asyncio, "to_thread", no_threads)
+        provider = cls(base_url=server.base_url)
+
+        response = asyncio.run(chat_and_close(provider, system="be brief"))
+
+        assert provider.client is None
+        assert response.content == "echo: hello there"
+        assert (response.tokens_in, response.tokens_out) == (4, 3)
+        assert response.provider == provider.name and response.cost_usd > 0
+
+    def test_anthropic_messages_api(self, server):
+        provider = anthropic_provider.AnthropicProvider(base_url=server.base_url)
+
+        response = asyncio.run(chat_and_close(provider, system="be brief"))
+
+        assert response.content == "echo: hello there"
+        assert (response.tokens_in, response.tokens_out) == (2, 3)
+
+    def test_sse_streaming(self, server):
+        provider = openai_provider.OpenAIProvider(base_url=server.base_url)
+
+        async def run():
+            try:
+                return [d async for d in provider.chat_stream(MESSAGES)]
+            finally:
+                await provider.aclose()
+
+        deltas = asyncio.run(run())
+
+        assert "".join(d.content for d in deltas[:-1]) == "echo: hello there"
+        final = deltas[-1].response
+        assert final.content == "echo: hello there"
+        assert (final.tokens_in, final.tokens_out) == (2, 3)
+
+    def test_sdk_path_still_available(self, monkeypatch):
+        created = {}
+
+        class DummyClient:
+            def __init__(self, **kwargs):
+                created.update(kwargs)
+
+        monkeypatch.setattr(openai_provider, "OpenAI", DummyClient)
+        provider = openai_provider.OpenAIProvider(native_http=False)
+
+        assert provider.http is None and isinstance(provider.client, DummyClient)
+
+
+class TestPooling:
+    def test_connections_reused_and_bounded(self):
+        config = HTTPTransportConfig(max_connections=8, max_keepalive_connections=8)
+        with MockLLMServer(latency_s=0.01) as srv:
+            provider = openai_provider.OpenAIProvider(base_url=srv.base_url, http_config=config)
+
+            async def burst():
+                try:
+                    for _ in range(3):
+                        await asyncio.gather(*(provider.chat(MESSAGES) for _ in range(50)))
+                finally:
+                    await provider.aclose()
+
+            asyncio.run(burst())
+
+            assert srv.requests == 150
+            assert srv.max_in_flight <= 8
+            assert srv.connections <= 8
+
+    def test_one_pool_per_event_loop(self, server):
+        provider = openai_provider.OpenAIProvider(base_url=server.base_url)
+
+        first = asyncio.run(chat_and_close(provider))
+        second = asyncio.run(chat_and_close(provider))
+
+        assert first.content == second.content == "echo: hello there"
+
+    def test_http_errors_raise(self, server):
+        provider = openai_provider.OpenAIProvider(base_url=server.base_url + "/missing")
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(chat_and_close(provider))
+
+    def test_read_timeout(self):
+        config = HTTPTransportConfig(read_timeout_s=0.05)
+        with MockLLMServer(latency_s=0.5) as srv:
+            provider = openai_provider.OpenAIProvider(base_url=srv.base_url, http_config=config)
+
+            with pytest.raises(httpx.ReadTimeout):
+                asyncio.run(chat_and_close(provider))
@@ -0,0 +1,216 @@
+"""
+Tests for streaming quantile sketches and sketch-based router analytics
+"""
+
+import asyncio
+import json
+import math
+
+import numpy as np
+import pytest
+
+from penin.providers.base import LLMResponse
+from penin.router import MultiLLMRouterComplete
+from penin.router_pkg.analytics import AnalyticsTracker
+from penin.router_pkg.quantile_sketch import QuantileSketch, RollingQuantileSketch
+from penin.router_pkg.shared_state import SharedRouterState
+
+QS = [0.0, 0.1, 0.5, 0.9, 0.95, 0.99, 0.999, 1.0]
+
+
+def heavy_tailed(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.concatenate([rng.lognormal(3.0, 1.0, n - n // 10), (rng.pareto(1.5, n // 10) + 1) * 200])
+
+
+def exact(values, q):
+    ordered = np.sort(values)
+    return ordered[math.floor(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    @pytest.mark.parametrize("accuracy", [0.01, 0.005])
+    def test_relative_error_bound(self, accuracy):
+        values = heavy_tailed(20_000)
+        sketch = QuantileSketch(relative_accuracy=accuracy)
+        sketch.extend(values.tolist())
+
+        for q, estimate in zip(QS, sketch.quantiles(QS), strict=True):
+            truth = exact(values, q)
+            assert abs(estimate - truth) <= accuracy * truth + 1e-12, q
+        assert sketch.count == len(values)
+        assert sketch.mean == pytest.approx(values.mean())
+
+    def test_merge_is_exact(self):
+        values = heavy_tailed(5000, seed=1).tolist()
+        whole = QuantileSketch()
+        whole.extend(values)
+        parts = [QuantileSketch() for _ in range(4)]
+        for i, v in enumerate(values):
+            parts[i % 4].add(v)
+
+        merged = parts[0]
+        for part in parts[1:]:
+            merged.merge(part)
+
+        assert merged.to_dict()["counts"] == whole.to_dict()["counts"]
+        assert merged.quantiles(QS) == whole.quantiles(QS)
+
+    def test_json_round_trip(self):
+        sketch = QuantileSketch()
+        sketch.extend([0.0, 1.5, 20.0, 300.0])
+
+        restored = QuantileSketch.from_dict(json.loads(json.dumps(sketch.to_dict())))
+
+        assert restored.quantiles(QS) == sketch.quantiles(QS)
+        assert (restored.min, restored.max, restored.count) == (0.0, 300.0, 4)
+
+    def test_zero_bucket_and_empty(self):
+        sketch = QuantileSketch()
+        assert sketch.quantiles([0.5, 0.99]) == [0.0, 0.0]
+
+        sketch.extend([0.0] * 90 + [10.0] * 10)
+
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(0.99) == pytest.approx(10.0, rel=0.01)
+
+    def test_bins_bounded(self):
+        sketch = QuantileSketch(max_bins=64)
+        sketch.extend(np.geomspace(1e-6, 1e6, 5000).tolist())
+
+        assert len(sketch.to_dict()["keys"]) <= 64
+        # Upper tail keeps full accuracy after collapsing the low buckets
+        assert sketch.quantile(0.99) == pytest.approx(exact(np.geomspace(1e-6, 1e6, 5000), 0.99), rel=0.01)
+
+    def test_collapse_keeps_exactly_max_bins(self):
+        sketch = QuantileSketch(max_bins=8)
+        sketch.extend([1.5**k for k in range(8)])
+        assert len(sketch.to_dict()["keys"]) == 8
+
+        sketch.add(1.5**8)
+
+        assert len(sketch.to_dict()["keys"]) == 8
+        assert sketch.count == 9 and sketch.quantile(1.0) == pytest.approx(1.5**8, rel=0.01)
+
+    def test_invalid_arguments(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(relative_accuracy=0.0)
+        with pytest.raises(ValueError):
+            QuantileSketch().merge(QuantileSketch(relative_accuracy=0.05))
+        with pytest.raises(ValueError):
+            s = QuantileSketch()
+            s.add(1.0)
+            s.quantile(1.5)
+
+
+class TestRollingSketch:
+    def test_windowed_queries(self):
+        rolling = RollingQuantileSketch(window_s=10, max_windows=6)
+        for t in range(60):
+            rolling.add(100.0 if t < 50 else 1000.0, now=1000.0 + t)
+
+        assert rolling.quantiles([0.5], now=1059.0) == [pytest.approx(100.0, rel=0.01)]
+        assert rolling.quantiles([0.5], window_s=5, now=1059.0) == [pytest.approx(1000.0, rel=0.01)]
+        assert rolling.sketch(window_s=5, now=1059.0).count == 10
+
+    def test_old_windows_dropped_but_total_kept(self):
+        rolling = RollingQuantileSketch(window_s=1, max_windows=3)
+        for t in range(10):
+            rolling.add(float(t + 1), now=float(t))
+
+        assert rolling.sketch(window_s=100, now=9.0).count == 3
+        assert rolling.total.count == 10
+
+    def test_merge_and_round_trip(self):
+        a, b = RollingQuantileSketch(window_s=10), RollingQuantileSketch(window_s=10)
+        a.add(5.0, now=0.0)
+        b.add(7.0, now=5.0)
+        b.add(9.0, now=15.0)
+
+        merged = RollingQuantileSketch.from_dict(json.loads(json.dumps(a.merge(b).to_dict())))
+
+        assert merged.total.count == 3
+        assert merged.sketch(window_s=10, now=15.0).count == 3
+        assert merged.sketch(window_s=1, now=15.0).count == 1
+
+
+class TestAnalyticsSketches:
+    def test_percentiles_cover_all_history(self):
+        tracker = AnalyticsTracker(history_window=10)
+        for i in range(1000):
+            tracker.record_request("openai", latency_ms=float(i + 1), success=True, cost_usd=0.001, tokens=100)
+
+        p = tracker.get_latency_percentiles("openai")
+
+        assert set(p) == {"p50", "p90", "p95", "p99", "p999"}
+        assert p["p50"] == pytest.approx(500.0, rel=0.01)
+        assert p["p999"] == pytest.approx(999.0, rel=0.01)
+        assert tracker.get_percentiles("openai", "tokens")["p99"] == pytest.approx(100.0, rel=0.01)
+        assert len(tracker.get_provider_analytics("openai").latencies) == 10
+
+    def test_merge_workers_via_snapshot(self):
+        workers = [AnalyticsTracker() for _ in range(3)]
+        for w, tracker in enumerate(workers):
+            for i in range(100):
+                tracker.record_request("p", latency_ms=10.0 * (w + 1), success=i % 10 != 0)
+
+        merged = AnalyticsTracker.from_dict(json.loads(json.dumps(workers[0].to_dict())))
+        for tracker in workers[1:]:
+            merged.merge(AnalyticsTracker.from_dict(tracker.to_dict()))
+
+        analytics = merged.get_provider_analytics("p")
+        assert analytics.requests_total == 300
+        assert analytics.success_rate == pytest.approx(0.9)
+        assert merged.get_latency_percentiles("p")["p50"] == pytest.approx(20.0, rel=0.01)
+
+    def test_export_metrics_includes_p999(self):
+        tracker = AnalyticsTracker()
+        tracker.record_request("p", latency_ms=12.0, success=True)
+
+        metrics = tracker.export_metrics()
+
+        assert 'penin_router_analytics_{provider="p"}_latency_p999_ms' in metrics
+
+    def test_router_persists_sketches(self, tmp_path):
+        class Provider:
+            name = "mock"
+
+            async def chat(self, *args, **kwargs):
+                return LLMResponse("ok", "m", tokens_in=4, tokens_out=6, cost_usd=0.01, latency_s=0.25)
+
+        state = tmp_path / "state.json"
+        router = MultiLLMRouterComplete([Provider()], daily_budget_usd=10.0, enable_cache=False, state_path=state)
+        for i in range(3):
+            asyncio.run(router.ask([{"role": "user", "content": str(i)}]))
+        asyncio.run(router._persist_state())
+
+        reloaded = MultiLLMRouterComplete([Provider()], daily_budget_usd=10.0, enable_cache=False, state_path=state)
+        percentiles = reloaded.get_analytics()["percentiles"]["mock"]
+
+        assert reloaded.analytics.get_provider_analytics("mock").requests_total == 3
+        assert percentiles["tokens"]["p50"] == pytest.approx(10.0, rel=0.01)
+        assert percentiles["cost_usd"]["p99"] == pytest.approx(0.01, rel=0.01)
+
+    def test_router_restores_sketches_with_shared_state(self, tmp_path):
+        class Provider:
+            name = "mock"
+
+            async def chat(self, *args, **kwargs):
+                return LLMResponse("ok", "m", tokens_in=4, tokens_out=6, cost_usd=0.01, latency_s=0.25)
+
+        state, shared = tmp_path / "state.json", tmp_path / "router.state"
+        kwargs = dict(daily_budget_usd=10.0, enable_cache=False, state_path=state)
+        router = MultiLLMRouterComplete(
+            [Provider()], shared_state=SharedRouterState(shared), **kwargs
+        )
+        for i in range(3):
+            asyncio.run(router.ask([{"role": "user", "content": str(i)}]))
+        asyncio.run(router._persist_state())
+
+        reloaded = MultiLLMRouterComplete(
+            [Provider()], shared_state=SharedRouterState(shared), **kwargs
+        )
+
+        assert reloaded.analytics.get_provider_analytics("mock").requests_total == 3
+        # Budget still comes from the shared region, not the JSON snapshot
+        assert reloaded.get_budget_status()["request_count"] == 3
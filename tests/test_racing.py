@@ -0,0 +1,106 @@
+"""
+Tests for the successive-halving racing scheduler
+"""
+
+import asyncio
+import random
+
+import pytest
+
+from penin.omega.racing import RacingConfig, SuccessiveHalvingRacer, race_challengers
+
+
+def _noisy_sampler(true_means: dict[str, float], noise: float = 0.02, seed: int = 0):
+    calls = []
+
+    def evaluate_fn(cid: str, start: int, stop: int) -> list[float]:
+        calls.append((cid, start, stop))
+        return [
+            true_means[cid] + random.Random(f"{seed}:{cid}:{i}").gauss(0.0, noise)
+            for i in range(start, stop)
+        ]
+
+    return evaluate_fn, calls
+
+
+class TestSuccessiveHalvingRacer:
+    def test_budget_schedule(self):
+        racer = SuccessiveHalvingRacer(RacingConfig(eta=2.0))
+        assert racer.budget_schedule(8) == [1, 2, 4, 8]
+        assert racer.budget_schedule(3) == [1, 2, 3]
+        assert racer.budget_schedule(1) == [1]
+
+    def test_selects_best_and_saves_budget(self):
+        true_means = {f"c{i}": 0.5 + 0.03 * i for i in range(16)}
+        evaluate_fn, _ = _noisy_sampler(true_means)
+
+        race = asyncio.run(race_challengers(list(true_means), evaluate_fn, max_budget=16))
+
+        assert race.winner_id == "c15"
+        assert race.savings > 0.6
+        assert len(race.samples[race.winner_id]) == 16
+        assert race.evaluations < race.full_evaluations / 2
+
+    def test_samples_never_requested_twice(self):
+        true_means = {"a": 0.9, "b": 0.5, "c": 0.4, "d": 0.3}
+        evaluate_fn, calls = _noisy_sampler(true_means)
+
+        asyncio.run(race_challengers(list(true_means), evaluate_fn, max_budget=8))
+
+        seen = set()
+        for cid, start, stop in calls:
+            for i in range(start, stop):
+                assert (cid, i) not in seen
+                seen.add((cid, i))
+
+    def test_min_survivors_run_full_budget(self):
+        true_means = {f"c{i}": 0.1 * i for i in range(8)}
+        evaluate_fn, _ = _noisy_sampler(true_means)
+        config = RacingConfig(min_survivors=3)
+
+        race = asyncio.run(
+            race_challengers(list(true_means), evaluate_fn, max_budget=8, config=config)
+        )
+
+        assert len(race.ranking) == 3
+        assert race.ranking[0] == "c7"
+        for cid in race.ranking:
+            assert len(race.samples[cid]) == 8
+        assert set(race.eliminated) == set(true_means) - set(race.ranking)
+
+    def test_async_evaluate_fn(self):
+        async def evaluate_fn(cid: str, start: int, stop: int) -> list[float]:
+            await asyncio.sleep(0)
+            return [0.8 if cid == "best" else 0.2] * (stop - start)
+
+        race = asyncio.run(
+            race_challengers(["worst", "best", "mid"], evaluate_fn, max_budget=4)
+        )
+
+        assert race.winner_id == "best"
+
+    def test_single_candidate(self):
+        evaluate_fn, _ = _noisy_sampler({"only": 0.7})
+        race = asyncio.run(race_challengers(["only"], evaluate_fn, max_budget=5))
+
+        assert race.winner_id == "only"
+        assert len(race.samples["only"]) == 5
+        assert race.savings == 0.0
+
+    def test_dominated_candidates_dropped(self):
+        racer = SuccessiveHalvingRacer(RacingConfig(eta=1.5))
+        bounds = {
+            "a": racer.compute_bounds([0.9, 0.91, 0.89, 0.9]),
+            "b": racer.compute_bounds([0.88, 0.9, 0.89, 0.91]),
+            "c": racer.compute_bounds([0.2, 0.21, 0.19, 0.2]),
+        }
+
+        dropped = racer._select_eliminated(["a", "b", "c"], bounds)
+
+        assert dropped == ["c"]
+
+    def test_invalid_config(self):
+        with pytest.raises(ValueError, match="eta"):
+            RacingConfig(eta=1.0)
+        with pytest.raises(ValueError, match="max_budget"):
+            asyncio.run(race_challengers(["a"], lambda c, s, e: [], max_budget=0))
@@ -0,0 +1,190 @@
+"""
+Tests for streaming providers and MultiLLMRouterComplete.ask_stream
+"""
+
+import asyncio
+import types
+
+import pytest
+
+from penin.providers.base import BaseProvider, LLMResponse, StreamDelta
+from penin.router import MultiLLMRouterComplete
+
+MESSAGES = [{"role": "user", "content": "hello"}]
+
+
+class FakeStreamingProvider(BaseProvider):
+    def __init__(self, name="fake", tokens=5, delay=0.0, cost_per_token=0.01, fail_at=None):
+        self.name = name
+        self.model = "fake-model"
+        self.tokens = tokens
+        self.delay = delay
+        self.cost_per_token = cost_per_token
+        self.fail_at = fail_at
+        self.calls = 0
+
+    async def chat(self, messages, tools=None, system=None, temperature=0.7):
+        parts = [d.content async for d in self.chat_stream(messages)]
+        return LLMResponse("".join(parts), self.model, tokens_in=3, tokens_out=self.tokens,
+                           cost_usd=self.tokens * self.cost_per_token)
+
+    async def chat_stream(self, messages, tools=None, system=None, temperature=0.7):
+        self.calls += 1
+        for i in range(self.tokens):
+            if i == self.fail_at:
+                raise ConnectionError("stream dropped")
+            await asyncio.sleep(self.delay)
+            yield StreamDelta(f"t{i} ", tokens_out=1, cost_usd=self.cost_per_token)
+        # Reported usage differs from the running estimate (prompt tokens, pricing)
+        yield StreamDelta(
+            response=LLMResponse(
+                "".join(f"t{i} " for i in range(self.tokens)), self.model, tokens_in=3,
+                tokens_out=self.tokens, cost_usd=self.tokens * self.cost_per_token + 0.002,
+            )
+        )
+
+
+class NonStreamingProvider(BaseProvider):
+    name = "plain"
+    model = "plain-model"
+
+    async def chat(self, messages, tools=None, system=None, temperature=0.7):
+        return LLMResponse("whole answer", self.model, tokens_in=2, tokens_out=2, cost_usd=0.001)
+
+
+def make_router(tmp_path, providers, budget=10.0, **kwargs):
+    return MultiLLMRouterComplete(
+        providers, daily_budget_usd=budget, state_path=tmp_path / "state.json", **kwargs
+    )
+
+
+async def collect(stream):
+    return [delta async for delta in stream]
+
+
+class TestAskStream:
+    def test_streams_and_reconciles_budget(self, tmp_path):
+        router = make_router(tmp_path, [FakeStreamingProvider()])
+
+        deltas = asyncio.run(collect(router.ask_stream(MESSAGES)))
+
+        assert [d.content for d in deltas[:-1]] == ["t0 ", "t1 ", "t2 ", "t3 ", "t4 "]
+        final = deltas[-1].response
+        assert final.content == "t0 t1 t2 t3 t4 "
+        assert final.provider == "fake"
+        budget = router.get_budget_status()
+        assert budget["daily_spend_usd"] == pytest.approx(0.052)
+        assert budget["total_tokens"] == 8
+        assert budget["request_count"] == 1
+        assert router.provider_stats["fake"].successful_requests == 1
+
+    def test_final_response_is_cached(self, tmp_path):
+        provider = FakeStreamingProvider()
+        router = make_router(tmp_path, [provider])
+
+        asyncio.run(collect(router.ask_stream(MESSAGES)))
+        cached = asyncio.run(collect(router.ask_stream(MESSAGES)))
+
+        assert provider.calls == 1
+        assert len(cached) == 1 and cached[0].content == "t0 t1 t2 t3 t4 "
+        assert asyncio.run(router.ask(MESSAGES)).content == "t0 t1 t2 t3 t4 "
+
+    def test_falls_back_before_first_token(self, tmp_path):
+        broken = FakeStreamingProvider(name="broken", fail_at=0)
+        good = FakeStreamingProvider(name="good")
+        router = make_router(tmp_path, [broken, good], enable_cache=False)
+
+        deltas = asyncio.run(collect(router.ask_stream(MESSAGES)))
+
+        assert deltas[-1].response.provider == "good"
+        assert router.provider_stats["broken"].failed_requests == 1
+        # The failed provider now scores lower and is not tried first
+        asyncio.run(collect(router.ask_stream(MESSAGES)))
+        assert broken.calls == 1
+
+    def test_mid_stream_failure_propagates(self, tmp_path):
+        router = make_router(tmp_path, [FakeStreamingProvider(fail_at=2)], enable_cache=False)
+
+        with pytest.raises(ConnectionError):
+            asyncio.run(collect(router.ask_stream(MESSAGES)))
+        # Tokens already streamed stay charged
+        assert router.get_budget_status()["daily_spend_usd"] == pytest.approx(0.02)
+
+    def test_hard_cutoff_cuts_stream(self, tmp_path):
+        router = make_router(
+            tmp_path, [FakeStreamingProvider(tokens=50, cost_per_token=0.03125)], budget=0.25,
+            enable_cache=False,
+        )
+        received = []
+
+        async def consume():
+            async for delta in router.ask_stream(MESSAGES):
+                received.append(delta)
+
+        with pytest.raises(RuntimeError, match="mid-stream"):
+            asyncio.run(consume())
+        assert len(received) == 8
+        assert router.get_budget_status()["daily_spend_usd"] == pytest.approx(0.25)
+
+    def test_non_streaming_provider_uses_default(self, tmp_path):
+        router = make_router(tmp_path, [NonStreamingProvider()])
+
+        deltas = asyncio.run(collect(router.ask_stream(MESSAGES)))
+
+        assert len(deltas) == 1
+        assert deltas[0].content == "whole answer" and deltas[0].done
+        assert router.get_budget_status()["daily_spend_usd"] == pytest.approx(0.001)
+
+
+class TestOpenAICompatibleStream:
+    def test_openai_chunks_to_deltas(self, monkeypatch):
+        from penin.providers import openai_provider
+
+        def chunk(content=None, tool_calls=None, usage=None):
+            delta = types.SimpleNamespace(content=content, tool_calls=tool_calls)
+            choices = [] if usage else [types.SimpleNamespace(delta=delta)]
+            return types.SimpleNamespace(choices=choices, usage=usage)
+
+        def create(**kwargs):
+            assert kwargs["stream"] and kwargs["stream_options"] == {"include_usage": True}
+            yield chunk("Hel")
+            yield chunk("lo")
+            yield chunk(tool_calls=[{"index": 0, "id": "c1", "function": {"name": "get", "arguments": '{"a"'}}])
+            yield chunk(tool_calls=[{"index": 0, "function": {"arguments": ": 1}"}}])
+            yield chunk(usage=types.SimpleNamespace(prompt_tokens=10, completion_tokens=4))
+
+        class DummyClient:
+            def __init__(self, *_, **__):
+                self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+
+        monkeypatch.setattr(openai_provider, "OpenAI", DummyClient)
+        provider = openai_provider.OpenAIProvider(model="gpt-4o", native_http=False)
+
+        deltas = asyncio.run(collect(provider.chat_stream(MESSAGES)))
+
+        assert [d.content for d in deltas[:-1]] == ["Hel", "lo"]
+        assert deltas[0].cost_usd == pytest.approx(0.015 / 1000)
+        final = deltas[-1].response
+        assert final.content == "Hello"
+        assert (final.tokens_in, final.tokens_out) == (10, 4)
+        assert final.tool_calls[0]["function"] == {"name": "get", "arguments": '{"a": 1}'}
+        assert final.cost_usd == pytest.approx(10 / 1000 * 0.005 + 4 / 1000 * 0.015)
+
+    def test_sdk_error_raised_in_consumer(self, monkeypatch):
+        from penin.providers import deepseek_provider
+
+        def create(**kwargs):
+            yield types.SimpleNamespace(
+                choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content="x"))], usage=None
+            )
+            raise TimeoutError("read timeout")
+
+        class DummyClient:
+            def __init__(self, *_, **__):
+                self.chat = types.SimpleNamespace(completions=types.SimpleNamespace(create=create))
+
+        monkeypatch.setattr(deepseek_provider, "OpenAI", DummyClient)
+        provider = deepseek_provider.DeepSeekProvider(model="deepseek-chat", native_http=False)
+
+        with pytest.raises(TimeoutError):
+            asyncio.run(collect(provider.chat_stream(MESSAGES)))
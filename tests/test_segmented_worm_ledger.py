@@ -0,0 +1,200 @@
+"""
+Tests for the segmented, rotation-aware WORM ledger
+"""
+
+import json
+
+import pytest
+
+from penin.ledger import segmented_worm
+from penin.ledger.segmented_worm import ZSTD_AVAILABLE, SegmentedWORMLedger
+from penin.ledger.worm_ledger import WORMLedger, create_pcag, merkle_root_from_hashes
+
+
+def fill(ledger, n, start=0):
+    return [
+        ledger.append("promote" if i % 3 else "rollback", f"evt-{i}", {"cycle": i, "pad": "x" * 64})
+        for i in range(start, start + n)
+    ]
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return SegmentedWORMLedger(tmp_path / "ledger", max_segment_bytes=2048, compression="gzip")
+
+
+class TestRotation:
+    def test_size_rotation_keeps_one_chain(self, ledger):
+        events = fill(ledger, 50)
+        segments = ledger.segments()
+
+        assert len(segments) > 3
+        assert all(s.path.stat().st_size < 2048 for s in segments if not s.sealed)
+        assert all(s.path.suffix == ".gz" for s in segments if s.sealed)
+        assert [e.event_hash for e in ledger.read_all()] == [e.event_hash for e in events]
+        assert ledger.verify_chain() == (True, None)
+
+    def test_footer_links_segments(self, ledger):
+        fill(ledger, 40)
+        sealed = [s.footer for s in ledger.segments(include_active=False)]
+
+        assert sealed[0].prev_hash is None
+        for prev, cur in zip(sealed, sealed[1:], strict=False):
+            assert cur.prev_hash == prev.last_hash
+            assert cur.first_sequence == prev.last_sequence + 1
+
+    def test_age_rotation(self, tmp_path):
+        ledger = SegmentedWORMLedger(tmp_path / "aged", max_segment_age_s=0.0, compression="gzip")
+
+        fill(ledger, 4)
+
+        assert len(ledger.segments(include_active=False)) == 3
+        assert ledger.verify_chain() == (True, None)
+
+    def test_reopen_continues_chain(self, ledger):
+        fill(ledger, 30)
+        reopened = SegmentedWORMLedger(ledger.ledger_dir, max_segment_bytes=2048, compression="gzip")
+
+        event = reopened.append("promote", "after-reopen", {})
+
+        assert event.sequence_number == 31
+        assert reopened.verify_chain() == (True, None)
+
+    def test_crash_between_seal_and_unlink(self, ledger):
+        fill(ledger, 5)
+        active = ledger.active_path
+        leftover = active.read_bytes()
+        ledger.seal()
+        active.write_bytes(leftover)
+
+        reopened = SegmentedWORMLedger(ledger.ledger_dir, compression="gzip")
+
+        assert not active.exists()
+        assert reopened.get_statistics()["total_events"] == 5
+        assert reopened.append("promote", "next", {}).sequence_number == 6
+
+
+class TestReadsAndAudit:
+    def test_statistics_from_footers(self, ledger):
+        fill(ledger, 30)
+        ledger.append_pcag(create_pcag("dec-1", "promote", {"U": 0.9}, {"ok": True}, "better"))
+        stats = ledger.get_statistics(verify=False)
+
+        assert stats["total_events"] == 31
+        assert stats["event_types"] == {"promote": 20, "rollback": 10, "pcag_promote": 1}
+        assert stats["sealed_segments"] >= 3
+        assert "chain_valid" not in stats
+
+    def test_time_range_skips_unrelated_segments(self, tmp_path, monkeypatch):
+        ledger = SegmentedWORMLedger(tmp_path / "range", max_segment_age_s=0.0, compression="gzip")
+        events = fill(ledger, 10)
+        loaded = []
+        original = segmented_worm._load_segment
+
+        def spy(path, sealed):
+            loaded.append(path)
+            return original(path, sealed)
+
+        monkeypatch.setattr(segmented_worm, "_load_segment", spy)
+        selected = list(ledger.read_range(events[3].timestamp, events[5].timestamp))
+
+        assert [e.event_id for e in selected] == ["evt-3", "evt-4", "evt-5"]
+        # Only the 3 overlapping segments are decompressed
+        assert len(loaded) == 3
+
+    def test_parallel_scan_preserves_order(self, ledger):
+        events = fill(ledger, 60)
+
+        scanned = list(ledger.iter_events(workers=3))
+
+        assert [e.sequence_number for e in scanned] == [e.sequence_number for e in events]
+
+    def test_read_by_type_uses_footer_counts(self, ledger):
+        fill(ledger, 30)
+
+        assert len(list(ledger.read_by_type("rollback"))) == 10
+        assert list(ledger.read_by_type("missing")) == []
+
+    def test_merkle_root_over_segment_roots(self, ledger):
+        fill(ledger, 25)
+        roots = [s.footer.merkle_root for s in ledger.segments(include_active=False)]
+        active = [e.event_hash for e in ledger.iter_events()][sum(
+            s.footer.event_count for s in ledger.segments(include_active=False)
+        ):]
+
+        assert ledger.compute_merkle_root() == merkle_root_from_hashes(
+            roots + [merkle_root_from_hashes(active)]
+        )
+
+    def test_range_audit_report(self, tmp_path):
+        ledger = SegmentedWORMLedger(tmp_path / "audit", max_segment_age_s=0.0, compression="gzip")
+        events = fill(ledger, 8)
+        out = tmp_path / "report.json"
+
+        ledger.export_audit_report(out, start=events[2].timestamp, end=events[4].timestamp)
+        report = json.loads(out.read_text())
+
+        assert report["statistics"]["total_events"] == 3
+        assert report["statistics"]["chain_valid"] is True
+        assert len(report["statistics"]["segment_footers"]) == 3
+
+
+class TestTamperEvidence:
+    def test_modified_payload_detected(self, ledger):
+        fill(ledger, 30)
+        target = ledger.segments(include_active=False)[1].path
+        data = bytearray(target.read_bytes())
+        data[20] ^= 0xFF
+        target.write_bytes(bytes(data))
+
+        ok, error = ledger.verify_chain()
+
+        assert not ok and "Payload hash mismatch" in error
+
+    def test_removed_segment_detected(self, ledger):
+        fill(ledger, 40)
+        ledger.segments(include_active=False)[1].path.unlink()
+
+        reopened = SegmentedWORMLedger(ledger.ledger_dir, compression="gzip")
+        ok, error = reopened.verify_chain(workers=2)
+
+        assert not ok and "Chain broken between segments" in error
+
+    def test_modified_active_event_detected(self, ledger):
+        fill(ledger, 5)
+        lines = ledger.active_path.read_text().splitlines()
+        record = json.loads(lines[-1])
+        record["payload"]["cycle"] = 999
+        lines[-1] = json.dumps(record)
+        ledger.active_path.write_text("\n".join(lines) + "\n")
+
+        ok, error = ledger.verify_chain(workers=2, use_processes=False)
+
+        assert not ok and "invalid hash" in error
+
+
+class TestCompatibility:
+    def test_events_readable_by_single_file_ledger(self, tmp_path):
+        segmented = SegmentedWORMLedger(tmp_path / "seg", compression="none")
+        fill(segmented, 3)
+        segmented.seal()
+        fill(segmented, 2, start=3)
+
+        single = tmp_path / "single.jsonl"
+        header = {"ledger_version": "2.0.0", "created_at": "", "hash_algorithm": "blake2b"}
+        lines = [json.dumps(header)] + [json.dumps(e.to_dict()) for e in segmented.read_all()]
+        single.write_text("\n".join(lines) + "\n")
+
+        assert WORMLedger(single).verify_chain() == (True, None)
+        assert WORMLedger(single).compute_merkle_root() == merkle_root_from_hashes(
+            [e.event_hash for e in segmented.read_all()]
+        )
+
+    @pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard installed")
+    def test_zstd_requires_dependency(self, tmp_path):
+        with pytest.raises(RuntimeError):
+            SegmentedWORMLedger(tmp_path / "z", compression="zstd")
+
+    def test_unknown_compression(self, tmp_path):
+        with pytest.raises(ValueError):
+            SegmentedWORMLedger(tmp_path / "bad", compression="lz4")
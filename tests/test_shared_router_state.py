@@ -0,0 +1,226 @@
+"""
+Tests for cross-process budget, provider stats and circuit-breaker state
+"""
+
+import asyncio
+import multiprocessing as mp
+import os
+import random
+
+import pytest
+
+from penin.providers.base import LLMResponse
+from penin.router import BudgetTracker, MultiLLMRouterComplete, ProviderHealth
+from penin.router_pkg.shared_state import FCNTL_AVAILABLE, SharedRouterState
+
+BACKENDS = [
+    pytest.param("mmap", marks=pytest.mark.skipif(not FCNTL_AVAILABLE, reason="needs fcntl")),
+    "sqlite",
+]
+CONTEXT = mp.get_context("fork" if "fork" in mp.get_all_start_methods() else "spawn")
+
+
+def spend_until_cutoff(path, backend, seed, attempts, queue):
+    budget = SharedRouterState(path, backend=backend).budget_tracker()
+    rng = random.Random(seed)
+    accepted_cost, accepted = 0.0, 0
+    for _ in range(attempts):
+        cost = rng.uniform(0.001, 0.01)
+        if budget.try_add_usage(cost, 10):
+            accepted_cost += cost
+            accepted += 1
+    queue.put((accepted_cost, accepted))
+
+
+def add_unconditionally(path, backend, n):
+    budget = SharedRouterState(path, backend=backend).budget_tracker()
+    for _ in range(n):
+        budget.add_usage(0.001, 3)
+
+
+def trip_breaker(path, backend):
+    breaker = SharedRouterState(path, backend=backend).circuit_breaker("openai")
+    for _ in range(3):
+        breaker.record_failure()
+
+
+def run_processes(target, args_list):
+    procs = [CONTEXT.Process(target=target, args=args) for args in args_list]
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join(timeout=120)
+        assert p.exitcode == 0
+
+
+@pytest.fixture(params=BACKENDS)
+def backend(request):
+    return request.param
+
+
+class TestSharedBudget:
+    def test_hard_cutoff_never_exceeded_globally(self, tmp_path, backend):
+        path = tmp_path / "router.state"
+        SharedRouterState(path, backend=backend).budget_tracker(daily_budget_usd=2.0)
+        queue = CONTEXT.Queue()
+
+        # 4 workers x 300 attempts request ~6.6 USD against a 2 USD budget
+        run_processes(
+            spend_until_cutoff, [(path, backend, seed, 300, queue) for seed in range(4)]
+        )
+        results = [queue.get(timeout=10) for _ in range(4)]
+        budget = SharedRouterState(path, backend=backend).budget_tracker()
+
+        assert budget.current_spend_usd <= 2.0
+        assert budget.current_spend_usd > 2.0 - 0.01
+        assert budget.current_spend_usd == pytest.approx(sum(c for c, _ in results))
+        assert budget.request_count == sum(n for _, n in results)
+        assert budget.is_hard_cutoff() or budget.remaining_budget() < 0.01
+
+    def test_no_lost_updates(self, tmp_path, backend):
+        path = tmp_path / "router.state"
+        SharedRouterState(path, backend=backend).budget_tracker(daily_budget_usd=100.0)
+
+        run_processes(add_unconditionally, [(path, backend, 250)] * 4)
+        budget = SharedRouterState(path, backend=backend).budget_tracker()
+
+        assert budget.request_count == 1000
+        assert budget.total_tokens == 3000
+        assert budget.current_spend_usd == pytest.approx(1.0)
+
+    def test_reset_and_snapshot(self, tmp_path, backend):
+        state = SharedRouterState(tmp_path / "router.state", backend=backend)
+        a = state.budget_tracker(daily_budget_usd=1.0)
+        b = SharedRouterState(tmp_path / "router.state", backend=backend).budget_tracker()
+
+        a.add_usage(0.96, 100)
+        assert b.is_soft_cutoff() and not b.is_hard_cutoff()
+        assert not b.try_add_usage(0.05, 1)
+
+        b.reset(new_budget_usd=3.0)
+        snapshot = a.snapshot()
+
+        assert snapshot["daily_spend_usd"] == 0.0
+        assert snapshot["daily_budget_usd"] == 3.0
+        assert snapshot["shared_backend"] == backend
+
+    def test_zero_budget_is_hard_cutoff(self, tmp_path, backend):
+        shared = SharedRouterState(tmp_path / "router.state", backend=backend).budget_tracker(0.0)
+
+        for budget in (shared, BudgetTracker(daily_budget_usd=0.0)):
+            assert budget.is_hard_cutoff()
+            assert not budget.try_add_usage(0.0, 1)
+
+    @pytest.mark.skipif(not FCNTL_AVAILABLE, reason="needs fcntl")
+    def test_reopen_after_fork_closes_inherited_map(self, tmp_path):
+        state = SharedRouterState(tmp_path / "router.state", backend="mmap")
+        budget = state.budget_tracker(1.0)
+        region = state._region
+        inherited = region._mm
+        region._pid = -1  # as seen from a forked child
+
+        budget.add_usage(0.1, 1)
+
+        assert inherited.closed and region._pid == os.getpid()
+        assert budget.current_spend_usd == pytest.approx(0.1)
+
+
+class TestSharedCircuitBreaker:
+    def test_trip_in_one_process_opens_everywhere(self, tmp_path, backend):
+        path = tmp_path / "router.state"
+        local = SharedRouterState(path, backend=backend).circuit_breaker(
+            "openai", recovery_timeout_s=3600
+        )
+        assert local.can_call()
+
+        run_processes(trip_breaker, [(path, backend)])
+
+        assert local.state == ProviderHealth.CIRCUIT_OPEN
+        assert not local.can_call()
+
+    def test_half_open_budget_is_global(self, tmp_path, backend):
+        path = tmp_path / "router.state"
+        a = SharedRouterState(path, backend=backend).circuit_breaker("p", recovery_timeout_s=0.0)
+        b = SharedRouterState(path, backend=backend).circuit_breaker("p", recovery_timeout_s=0.0)
+        for _ in range(3):
+            a.record_failure()
+
+        # Timeout elapsed: first caller moves to half-open, one probe call allowed
+        assert a.can_call()
+        assert b.can_call()
+        assert not a.can_call()
+        b.record_success()
+        assert a.state == ProviderHealth.HEALTHY
+
+    def test_slots_are_per_provider(self, tmp_path):
+        state = SharedRouterState(tmp_path / "router.state", max_providers=2)
+        state.circuit_breaker("a").record_failure()
+
+        assert state.circuit_breaker("b").state == ProviderHealth.HEALTHY
+        with pytest.raises(RuntimeError):
+            state.circuit_breaker("c")
+        with pytest.raises(ValueError):
+            SharedRouterState(tmp_path / "router.state", max_providers=8)
+
+
+class MockProvider:
+    name = "mock"
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    async def chat(self, *args, **kwargs):
+        await asyncio.sleep(self.delay)
+        return LLMResponse("ok", "mock", tokens_in=5, tokens_out=7, cost_usd=0.4, latency_s=0.1)
+
+
+class TestRouterIntegration:
+    def test_routers_share_budget_and_stats(self, tmp_path):
+        path = tmp_path / "router.state"
+        kwargs = dict(daily_budget_usd=1.0, enable_cache=False, state_path=tmp_path / "s.json")
+        r1 = MultiLLMRouterComplete([MockProvider()], shared_state=SharedRouterState(path), **kwargs)
+        r2 = MultiLLMRouterComplete([MockProvider()], shared_state=SharedRouterState(path), **kwargs)
+
+        asyncio.run(r1.ask([{"role": "user", "content": "a"}]))
+        asyncio.run(r2.ask([{"role": "user", "content": "b"}]))
+
+        status = r2.get_budget_status()
+        assert status["request_count"] == 2
+        assert status["total_tokens"] == 24
+        assert r2.get_usage_stats()["providers"]["mock"]["successful_requests"] == 2
+        # r1 has seen a 0.4 USD call: reserving another would pass the global budget
+        with pytest.raises(RuntimeError, match=r"Daily budget exceeded \(hard cutoff\)"):
+            asyncio.run(r1.ask([{"role": "user", "content": "c"}]))
+        assert r2.get_budget_status()["daily_spend_usd"] == pytest.approx(0.8)
+        assert r2.get_budget_status()["request_count"] == 2
+
+    def test_concurrent_asks_never_overshoot_budget(self, tmp_path):
+        path = tmp_path / "router.state"
+        kwargs = dict(daily_budget_usd=4.0, enable_cache=False, state_path=tmp_path / "s.json")
+        routers = [
+            MultiLLMRouterComplete(
+                [MockProvider(delay=0.01)], shared_state=SharedRouterState(path), **kwargs
+            )
+            for _ in range(2)
+        ]
+
+        async def burst():
+            for router in routers:  # warm up the cost estimate
+                await router.ask([{"role": "user", "content": "warm"}])
+            asks = [
+                router.ask([{"role": "user", "content": str(i)}])
+                for i in range(12)
+                for router in routers
+            ]
+            return await asyncio.gather(*asks, return_exceptions=True)
+
+        results = asyncio.run(burst())
+        status = routers[0].get_budget_status()
+        refused = [r for r in results if isinstance(r, Exception)]
+
+        # Every ask passes a check-only gate before any provider returns;
+        # reservations admit 10 calls in total and refuse the rest
+        assert status["daily_spend_usd"] <= 4.0
+        assert status["request_count"] == 10
+        assert len(refused) == len(results) - 8
+        assert all(isinstance(r, RuntimeError) and "hard cutoff" in str(r) for r in refused)
@@ -0,0 +1,208 @@
+"""
+Tests for vectorized Σ-Guard batch evaluation
+"""
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from penin.guard.sigma_guard import SigmaGuard as DictSigmaGuard
+from penin.guard.sigma_guard_complete import GateMetrics, SigmaGuard
+
+
+def _random_metrics(n: int, seed: int = 0) -> list[GateMetrics]:
+    rng = random.Random(seed)
+    return [
+        GateMetrics(
+            rho=rng.uniform(0.9, 1.05),
+            ece=rng.choice([0.01, rng.uniform(0.0, 0.02)]),
+            rho_bias=rng.uniform(1.0, 1.1),
+            sr_score=rng.uniform(0.7, 1.0),
+            omega_g=rng.uniform(0.8, 1.0),
+            delta_linf=rng.uniform(-0.01, 0.05),
+            caos_plus=rng.uniform(1.0, 2.0),
+            cost_increase=rng.uniform(0.0, 0.15),
+            kappa=rng.uniform(15.0, 30.0),
+            consent=rng.random() > 0.1,
+            eco_ok=rng.random() > 0.1,
+        )
+        for _ in range(n)
+    ]
+
+
+def _assert_same_verdict(batch_verdict, scalar_verdict):
+    assert batch_verdict.passed == scalar_verdict.passed
+    assert batch_verdict.verdict == scalar_verdict.verdict
+    assert batch_verdict.reason == scalar_verdict.reason
+    assert batch_verdict.action == scalar_verdict.action
+    # Scalar sum() and the column accumulation may differ in the last ulp
+    assert batch_verdict.aggregate_score == pytest.approx(scalar_verdict.aggregate_score, rel=1e-12)
+    for b, s in zip(batch_verdict.gates, scalar_verdict.gates, strict=True):
+        assert (b.gate_name, b.status, b.value, b.threshold, b.passed, b.reason) == (
+            s.gate_name,
+            s.status,
+            s.value,
+            s.threshold,
+            s.passed,
+            s.reason,
+        )
+
+
+class TestValidateBatch:
+    def test_matches_scalar_path(self):
+        guard = SigmaGuard()
+        metrics = _random_metrics(300)
+
+        batch = guard.validate_batch(metrics)
+
+        assert len(batch) == 300
+        assert batch.passed.any() and not batch.passed.all()
+        for i, m in enumerate(metrics):
+            scalar = guard.validate(m)
+            assert bool(batch.passed[i]) == scalar.passed
+            assert batch.failed_gates(i) == [g.gate_name for g in scalar.gates if not g.passed]
+            _assert_same_verdict(batch.verdict(i), scalar)
+
+    def test_columnar_input(self):
+        guard = SigmaGuard(consent_required=False)
+        metrics = _random_metrics(50, seed=1)
+        columns = {
+            name: np.array([getattr(m, name) for m in metrics])
+            for name in (
+                "rho",
+                "ece",
+                "rho_bias",
+                "sr_score",
+                "omega_g",
+                "delta_linf",
+                "cost_increase",
+                "kappa",
+                "consent",
+                "eco_ok",
+            )
+        }
+
+        batch = guard.validate_batch(columns)
+
+        for i, m in enumerate(metrics):
+            _assert_same_verdict(batch.verdict(i), guard.validate(m))
+
+    def test_boundary_values(self):
+        guard = SigmaGuard()
+        base = _random_metrics(1)[0]
+        at_threshold = GateMetrics(
+            **{
+                **base.__dict__,
+                "rho": guard.rho_max,
+                "ece": guard.ece_max,
+                "sr_score": guard.sr_min,
+                "kappa": guard.kappa_min,
+            }
+        )
+
+        batch = guard.validate_batch([at_threshold])
+
+        assert batch.failed_gates(0)[0] == "contractividade"
+        assert bool(batch.gate_passed("calibration")[0])
+        assert bool(batch.gate_passed("kappa")[0])
+        assert batch.margins[0, 0] == 0.0
+        _assert_same_verdict(batch.verdict(0), guard.validate(at_threshold))
+
+    def test_bitmask_and_margins(self):
+        guard = SigmaGuard()
+        metrics = _random_metrics(20, seed=2)
+        batch = guard.validate_batch(metrics)
+
+        assert batch.failed_mask.dtype == np.uint16
+        assert batch.margins.shape == (20, len(batch.gate_names))
+        kappa = batch.gate_names.index("kappa")
+        np.testing.assert_array_equal(
+            batch.margins[:, kappa], [m.kappa - guard.kappa_min for m in metrics]
+        )
+
+    def test_ethical_gate_evaluated_once_per_context(self):
+        calls = []
+
+        class StubValidator:
+            def validate_all(self, decision, context):
+                calls.append(context)
+                bad = context["has_pii"]
+                return SimpleNamespace(passed=not bad, violations=["LO-04"] if bad else [])
+
+        guard = SigmaGuard()
+        guard.ethical_validator = StubValidator()
+        metrics = _random_metrics(6, seed=3)
+        for i, m in enumerate(metrics):
+            m.rho_bias = 1.01
+            m.consent = True
+            m.has_pii = i % 2 == 0
+
+        batch = guard.validate_batch(metrics)
+
+        assert len(calls) == 2
+        assert batch.gate_names[-1] == "ethical_laws"
+        calls.clear()
+        for i, m in enumerate(metrics):
+            _assert_same_verdict(batch.verdict(i), guard.validate(m))
+
+    def test_invalid_input(self):
+        guard = SigmaGuard()
+        with pytest.raises(ValueError, match="Missing metric columns"):
+            guard.validate_batch({"rho": [0.5]})
+
+        columns = {name: [1.0, 1.0] for name in ("rho", "ece", "rho_bias", "sr_score")}
+        columns.update(
+            omega_g=[1.0],
+            delta_linf=[1.0, 1.0],
+            cost_increase=[0.0, 0.0],
+            kappa=[25.0, 25.0],
+            consent=[True, True],
+            eco_ok=[True, True],
+        )
+        with pytest.raises(ValueError, match="equal length"):
+            guard.validate_batch(columns)
+
+
+class TestEvaluateBatch:
+    def test_matches_scalar_evaluate(self):
+        guard = DictSigmaGuard()
+        rng = np.random.default_rng(0)
+        n = 200
+        columns = {
+            "rho": rng.uniform(0.9, 1.0, n),
+            "ece": rng.uniform(0.0, 0.02, n),
+            "rho_bias": rng.uniform(1.0, 1.1, n),
+            "sr": rng.uniform(0.7, 1.0, n),
+            "g": rng.uniform(0.8, 1.0, n),
+            "delta_linf": rng.uniform(-0.02, 0.05, n),
+            "cost": rng.uniform(0.0, 2.0, n),
+            "budget": np.ones(n),
+            "kappa": rng.uniform(15.0, 30.0, n),
+            "consent": rng.random(n) > 0.1,
+        }
+
+        batch = guard.evaluate_batch(columns)
+
+        assert batch.all_pass.sum() == 0  # eco_ok missing → fail-closed
+        for i in range(n):
+            scalar = guard.evaluate({k: v[i].item() for k, v in columns.items()})
+            assert batch.failed_gates(i) == scalar.failed_gates
+            assert batch.evaluation(i).to_dict() == scalar.to_dict()
+
+    def test_numeric_flags_fail_like_scalar(self):
+        guard = DictSigmaGuard()
+        row = {
+            "rho": 0.5, "ece": 0.005, "rho_bias": 1.01, "sr": 0.9, "g": 0.9,
+            "delta_linf": 0.05, "cost": 0.1, "budget": 1.0, "kappa": 25.0,
+        }
+        flags = [True, 1, 1.0, np.True_]
+        columns = {k: [v] * len(flags) for k, v in row.items()}
+        columns.update(consent=flags, eco_ok=[True] * len(flags))
+
+        batch = guard.evaluate_batch(columns)
+
+        expected = [guard.evaluate({**row, "consent": f, "eco_ok": True}).all_pass for f in flags]
+        assert batch.all_pass.tolist() == expected == [True, False, False, False]
+        assert guard.evaluate_batch({**columns, "consent": np.ones(4)}).all_pass.sum() == 0
@@ -0,0 +1,177 @@
+"""
+Tests for structured tracing spans (penin.observability.tracing)
+"""
+
+import asyncio
+import json
+
+import numpy as np
+import pytest
+
+from penin.guard.sigma_guard_complete import GateMetrics, SigmaGuard
+from penin.math.penin_master_equation import MasterEquationState, master_equation_cycle
+from penin.observability import tracing
+from penin.observability.tracing import NOOP_SPAN, Tracer, span, traced
+
+
+@pytest.fixture
+def tracer():
+    tr = tracing.configure(enabled=True, sample_rate=1.0)
+    tr.clear()
+    yield tr
+    tracing.configure(enabled=False, sample_rate=1.0)
+    tr.clear()
+
+
+def by_name(records):
+    return {r.name: r for r in records}
+
+
+class TestSpans:
+    def test_disabled_returns_shared_noop(self):
+        tr = Tracer(enabled=False)
+
+        with tr.span("work") as s:
+            s.set(ignored=True)
+
+        assert s is NOOP_SPAN and not s.recording
+        assert tr.spans() == []
+
+    def test_nesting_and_attributes(self):
+        tr = Tracer()
+
+        with tr.span("outer", request="r1") as outer:
+            with tr.span("inner") as inner:
+                inner.set(hit=True)
+
+        records = by_name(tr.spans())
+        assert records["inner"].parent_id == outer.span_id
+        assert records["inner"].trace_id == records["outer"].trace_id == outer.span_id
+        assert records["outer"].parent_id is None
+        assert records["outer"].attributes == {"request": "r1"}
+        assert records["inner"].attributes == {"hit": True}
+        assert records["outer"].duration_ns >= records["inner"].duration_ns
+
+    def test_exception_recorded_and_propagated(self):
+        tr = Tracer()
+
+        with pytest.raises(KeyError), tr.span("boom"):
+            raise KeyError("x")
+
+        assert tr.spans()[0].error == "KeyError"
+
+    def test_context_propagates_into_tasks(self):
+        tr = Tracer()
+
+        async def child(i):
+            with tr.span("child", i=i):
+                await asyncio.sleep(0)
+
+        async def main():
+            with tr.span("root") as root:
+                await asyncio.gather(*(child(i) for i in range(3)))
+            return root
+
+        root = asyncio.run(main())
+
+        children = [r for r in tr.spans() if r.name == "child"]
+        assert len(children) == 3
+        assert {r.parent_id for r in children} == {root.span_id}
+        assert len({r.lane for r in children}) == 3
+
+    def test_sampling_drops_whole_traces(self):
+        tr = Tracer(sample_rate=0.0)
+
+        with tr.span("root") as root, tr.span("child") as child:
+            pass
+
+        assert not root.recording and child is NOOP_SPAN
+        assert tr.spans() == []
+
+        tr.sample_rate = 0.5
+        for _ in range(400):
+            with tr.span("root"), tr.span("child"):
+                pass
+        records = tr.spans()
+        roots = [r for r in records if r.parent_id is None]
+        assert 120 < len(roots) < 280
+        assert len(records) == 2 * len(roots)
+
+    def test_ring_buffer_keeps_newest(self):
+        tr = Tracer(capacity=5)
+
+        for i in range(12):
+            with tr.span("s", i=i):
+                pass
+
+        assert [r.attributes["i"] for r in tr.spans()] == [7, 8, 9, 10, 11]
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            Tracer(sample_rate=1.5)
+
+
+class TestDecoratorAndExport:
+    def test_traced_sync_and_async(self, tracer):
+        @traced("sync.op")
+        def double(x):
+            return 2 * x
+
+        @traced()
+        async def fetch(x):
+            return double(x)
+
+        assert asyncio.run(fetch(4)) == 8
+        assert fetch.__name__ == "fetch"
+
+        records = by_name(tracer.spans())
+        assert records["sync.op"].parent_id == records[fetch.__qualname__].span_id
+
+    def test_export_formats(self, tracer, tmp_path):
+        with span("router.ask", model="m"), span("router.cache_lookup"):
+            pass
+
+        n = tracer.export_jsonl(tmp_path / "spans.jsonl")
+        lines = [json.loads(line) for line in (tmp_path / "spans.jsonl").read_text().splitlines()]
+        assert n == 2 and {line["name"] for line in lines} == {"router.ask", "router.cache_lookup"}
+
+        n = tracer.export_chrome_trace(tmp_path / "trace.json")
+        events = json.loads((tmp_path / "trace.json").read_text())["traceEvents"]
+        assert n == 2 and [e["name"] for e in events] == ["router.ask", "router.cache_lookup"]
+        assert all(e["ph"] == "X" and e["dur"] >= 0 for e in events)
+        assert events[0]["cat"] == "router" and events[0]["args"]["model"] == "m"
+        assert events[1]["args"]["parent_id"] == events[0]["args"]["span_id"]
+
+
+class TestInstrumentation:
+    def test_guard_gate_spans(self, tracer):
+        metrics = GateMetrics(
+            rho=0.9, ece=0.005, rho_bias=1.01, sr_score=0.9, omega_g=0.9,
+            delta_linf=0.02, caos_plus=1.5, cost_increase=0.05, kappa=25,
+            consent=True, eco_ok=True,
+        )
+        traced_verdict = SigmaGuard().validate(metrics)
+        tracing.configure(enabled=False)
+        plain_verdict = SigmaGuard().validate(metrics)
+
+        records = tracer.spans()
+        (root,) = [r for r in records if r.name == "guard.validate"]
+        gates = [r for r in records if r.name == "guard.gate"]
+        assert [g.attributes["gate"] for g in gates] == [g.gate_name for g in traced_verdict.gates]
+        assert all(g.parent_id == root.span_id for g in gates)
+        assert traced_verdict.passed == plain_verdict.passed
+        assert traced_verdict.aggregate_score == plain_verdict.aggregate_score
+
+    def test_master_equation_cycle_spans(self, tracer):
+        state = MasterEquationState(
+            I=np.array([0.5, 0.3]), n=0, alpha_n=0.0, caos_plus=0.0, sr_score=0.0, Linf=0.7
+        )
+
+        master_equation_cycle(
+            state, None, {}, lambda I, E, P: float(np.sum(I**2)), alpha_0=0.1, caos_plus=1.5, sr_score=0.85
+        )
+
+        records = by_name(tracer.spans())
+        cycle = records["evolution.master_equation"]
+        assert records["evolution.gradient"].parent_id == cycle.span_id
+        assert records["evolution.update"].parent_id == cycle.span_id